@@ -0,0 +1,101 @@
+"""
+Compares concurrent product reads through the blocking adapter on a thread
+pool with the same reads through the aiosqlite adapter on one event loop.
+
+Run from the service root:
+    python -m benchmarks.bench_async_vs_sync [requests] [concurrency]
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import print_table
+from src.application.usecases.get_product_usecase import AsyncGetProductUseCase, GetProductUseCase
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.sqlite_db.async_product_repository_adapter import AsyncProductRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.async_database import to_async_url
+from src.infrastructure.secondary.sqlite_db.database import init_db
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+DEFAULT_REQUESTS = 5_000
+DEFAULT_CONCURRENCY = 100
+PRODUCT_COUNT = 10_000
+
+
+def seed(url: str) -> None:
+    engine = create_engine(url)
+    init_db(engine)
+    with sessionmaker(bind=engine)() as session:
+        ProductRepositoryAdapter(session).add_many([
+            Product(product_id=None, name=f"Product {i}", description="Seeded", price=Price(amount=9.99), category_id=i % 50)
+            for i in range(PRODUCT_COUNT)
+        ])
+    engine.dispose()
+
+
+def run_sync(url: str, product_ids, concurrency: int) -> float:
+    engine = create_engine(url, pool_size=concurrency, connect_args={"check_same_thread": False})
+    Session = sessionmaker(bind=engine)
+
+    def read(product_id):
+        with Session() as session:
+            return GetProductUseCase(ProductRepositoryAdapter(session)).get_product(product_id)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(read, product_ids))
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    return elapsed
+
+
+async def run_async(url: str, product_ids, concurrency: int) -> float:
+    engine = create_async_engine(to_async_url(url), pool_size=concurrency)
+    Session = async_sessionmaker(bind=engine)
+    limit = asyncio.Semaphore(concurrency)
+
+    async def read(product_id):
+        async with limit, Session() as session:
+            return await AsyncGetProductUseCase(AsyncProductRepositoryAdapter(session)).get_product(product_id)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(read(product_id) for product_id in product_ids))
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return elapsed
+
+
+def main(requests: int, concurrency: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        seed(url)
+        rng = random.Random(42)
+        product_ids = [rng.randint(1, PRODUCT_COUNT) for _ in range(requests)]
+
+        sync_seconds = run_sync(url, product_ids, concurrency)
+        async_seconds = asyncio.run(run_async(url, product_ids, concurrency))
+
+    print_table(
+        f"{requests:,} reads, {concurrency} in flight",
+        ("path", "seconds", "reads/s"),
+        [
+            ("sync + threads", f"{sync_seconds:.2f}", f"{requests / sync_seconds:,.0f}"),
+            ("async + aiosqlite", f"{async_seconds:.2f}", f"{requests / async_seconds:,.0f}"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REQUESTS,
+        int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CONCURRENCY,
+    )
@@ -0,0 +1,77 @@
+"""
+Measures fetching and updating a cart-sized set of products through the
+REST API: one request per product against the batch endpoints.  The test
+client skips the network, so real deployments gain the round trips on top.
+
+Run from the service root:
+    python -m benchmarks.bench_batch_endpoints
+"""
+import os
+import random
+import tempfile
+
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import print_table, time_call
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.primary.rest_api.app import app
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, init_db
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+PRODUCTS = 10_000
+SIZES = (10, 50, 200)
+
+
+def main() -> None:
+    rng = random.Random(42)
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_catalog_engine(f"sqlite:///{os.path.join(directory, 'batch.db')}")
+        init_db(engine)
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+        with session_factory() as db:
+            ProductRepositoryAdapter(db).add_many([
+                Product(product_id=None, name=f"Product {n}", description="A product", price=Price(amount=10.0),
+                        category_id=n % 50)
+                for n in range(PRODUCTS)
+            ])
+        app.config["SESSION_FACTORY"] = session_factory
+        client = app.test_client()
+        for size in SIZES:
+            ids = rng.sample(range(1, PRODUCTS + 1), size)
+            updates = [{"product_id": product_id, "price": rng.randint(100, 10_000) / 100} for product_id in ids]
+
+            def get_one_by_one():
+                for product_id in ids:
+                    client.get(f"/products/{product_id}")
+
+            def get_batch():
+                client.get("/products?ids=" + ",".join(map(str, ids)))
+
+            def update_one_by_one():
+                # There is no single-product update route yet, so a batch of one stands in for it.
+                for update in updates:
+                    client.post("/products/batch", json={"items": [update]})
+
+            def update_batch():
+                client.post("/products/batch", json={"items": updates})
+
+            single_get, batch_get = time_call(get_one_by_one), time_call(get_batch)
+            single_update, batch_update = time_call(update_one_by_one), time_call(update_batch)
+            rows.append((
+                size,
+                f"{single_get * 1e3:.1f}", f"{batch_get * 1e3:.1f}", f"{single_get / batch_get:.0f}x",
+                f"{single_update * 1e3:.1f}", f"{batch_update * 1e3:.1f}", f"{single_update / batch_update:.0f}x",
+            ))
+        app.config.pop("SESSION_FACTORY")
+        engine.dispose()
+    print_table(
+        "Fetching and repricing N products, milliseconds per set",
+        ("N", "N GETs", "multi-get", "speedup", "N batches of 1", "1 batch", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Measures the response compression middleware on product list pages: size
+and CPU time per encoding, and the cost of a page served from the
+compressed body cache.
+
+Run from the service root:
+    python -m benchmarks.bench_compression
+"""
+from flask import Flask, Response
+
+from benchmarks.bench_serialization import make_products
+from benchmarks.common import print_table, time_call
+from src.infrastructure.primary.rest_api.middlewares import compression
+from src.infrastructure.primary.rest_api.middlewares.compression import ResponseCompressor
+from src.infrastructure.primary.rest_api.serializers.encoding import encode_page, encode_product
+
+SIZES = (20, 100, 1_000)
+
+
+def main() -> None:
+    rows = []
+    for count in SIZES:
+        body = encode_page((encode_product(p) for p in make_products(count)), total=count)
+        app = Flask(__name__)
+        app.config["COMPRESSION_MIN_SIZE"] = 0
+
+        @app.route("/page")
+        def page():
+            response = Response(body, mimetype="application/json")
+            response.set_etag(f"page-{count}")
+            return response
+
+        compressor = ResponseCompressor()
+        compressor.init_app(app)
+        client = app.test_client()
+        plain = time_call(lambda: client.get("/page"), 50)
+        for encoding in compression._PREFERENCE:
+            if encoding not in compression._ENCODERS:
+                continue
+            headers = {"Accept-Encoding": encoding}
+            size = len(client.get("/page", headers=headers).get_data())
+            compress = time_call(lambda: compression._ENCODERS[encoding](body), 20)
+            cached = time_call(lambda: client.get("/page", headers=headers), 50)
+            rows.append((
+                f"{count:,}", encoding, f"{len(body):,}", f"{size:,}", f"{len(body) / size:.1f}x",
+                f"{compress * 1e3:.2f}", f"{plain * 1e3:.2f}", f"{cached * 1e3:.2f}",
+            ))
+    print_table(
+        "Compressing product list pages (milliseconds per response)",
+        ("products", "encoding", "bytes", "compressed", "ratio", "compress", "request plain", "request cached"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Measures the per-row cost of building entities through the validating
+constructors versus the trusted from_storage path used by repository adapters.
+
+Run from the service root:
+    python -m benchmarks.bench_entity_construction [rows]
+"""
+import sys
+
+from benchmarks.common import print_table, time_call
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+
+DEFAULT_ROWS = 200_000
+IMAGE_URLS = ["http://example.com/front.jpg", "http://example.com/back.jpg"]
+
+
+def build_many(factory, count: int) -> None:
+    for i in range(count):
+        factory(i)
+
+
+def main(count: int) -> None:
+    price = Price(amount=19.99)
+    cases = [
+        ("Product(...)", lambda i: Product(i, "Name", "Description", price, 1, IMAGE_URLS)),
+        ("Product.from_storage", lambda i: Product.from_storage(i, "Name", "Description", price, 1, IMAGE_URLS)),
+        ("Category(...)", lambda i: Category(i, "Name", "Description")),
+        ("Category.from_storage", lambda i: Category.from_storage(i, "Name", "Description")),
+    ]
+    rows = []
+    for label, factory in cases:
+        seconds = time_call(lambda: build_many(factory, count))
+        rows.append((label, f"{seconds / count * 1e9:.0f}"))
+    print_table(f"Entity construction, {count:,} rows", ("path", "ns/row"), rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS)
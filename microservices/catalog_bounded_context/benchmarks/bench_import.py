@@ -0,0 +1,86 @@
+"""
+Measures loading an NDJSON product feed with ImportProductsUseCase: one
+transaction per row against chunked transactions, with validation in this
+process and in a process pool.
+
+Run from the service root:
+    python -m benchmarks.bench_import [records]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import print_table
+from src.application.usecases.import_products_usecase import ImportProductsUseCase
+from src.infrastructure.primary.cli.product_import import open_input, read_records, validate_records
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, init_db
+from src.infrastructure.secondary.sqlite_db.unit_of_work import SqlAlchemyUnitOfWork
+
+DEFAULT_RECORDS = 200_000
+REJECTED_EVERY = 100  # One invalid record per hundred, as in a typical supplier feed.
+
+
+def write_feed(path: str, count: int, rng: random.Random) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        for number in range(count):
+            record = {
+                "name": f"Product {number}" if number % REJECTED_EVERY else "",
+                "description": "A reasonably long product description with a few sentences of text. " * 2,
+                "price": rng.randint(100, 100_000) / 100,
+                "category_id": rng.randint(1, 100),
+                "image_urls": [f"https://cdn.example.com/products/{number}/{n}.jpg" for n in range(2)],
+            }
+            file.write(json.dumps(record) + "\n")
+
+
+def run(directory: str, feed: str, name: str, chunk_size: int, workers: int) -> tuple:
+    engine = create_catalog_engine(f"sqlite:///{os.path.join(directory, name + '.db')}")
+    init_db(engine)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers else None
+    start = time.perf_counter()
+    try:
+        with open_input(feed) as source:
+            progress = ImportProductsUseCase(SqlAlchemyUnitOfWork(sessionmaker(bind=engine))).import_products(
+                read_records(source, "ndjson"),
+                partial(validate_records, import_format="ndjson"),
+                chunk_size=chunk_size,
+                executor=executor,
+                max_pending=2 * workers or 1,
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        engine.dispose()
+    elapsed = time.perf_counter() - start
+    return (name, f"{chunk_size:,}", workers, f"{progress.imported:,}", f"{progress.rejected:,}",
+            f"{elapsed:.1f}", f"{progress.position / elapsed:,.0f}")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECORDS
+    workers = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as directory:
+        feed = os.path.join(directory, "feed.ndjson")
+        write_feed(feed, count, random.Random(42))
+        rows = [
+            # A commit per row is slow enough that a slice of the feed shows the rate.
+            run(directory, feed, "per row", 1, 0) if count <= 20_000 else None,
+            run(directory, feed, "chunked", 5000, 0),
+            run(directory, feed, "chunked + pool", 5000, workers),
+        ]
+    print_table(
+        f"Importing {count:,} NDJSON records ({os.cpu_count()} CPUs)",
+        ("mode", "chunk", "workers", "imported", "rejected", "seconds", "records/s"),
+        [row for row in rows if row is not None],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Measures build time, memory and query latency of the in-process inverted
+index, against a plain dict-of-dicts index of the same postings.
+
+Run from the service root:
+    python -m benchmarks.bench_inverted_index [products]
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict
+
+from benchmarks.bench_product_search import QUERIES, make_words, summarize, timed, zipf_sampler
+from benchmarks.common import print_table
+from src.application.utils.search_query import parse_search_query
+from src.domain.models.inverted_index import InvertedIndex, tokenize
+
+DEFAULT_PRODUCTS = 1_000_000
+
+
+def make_documents(count: int, words, rng: random.Random):
+    sample = zipf_sampler(rng, words)
+    return [(" ".join(sample(3)), " ".join(sample(12))) for _ in range(count)]
+
+
+def build_inverted_index(documents) -> InvertedIndex:
+    index = InvertedIndex()
+    for doc_id, (name, description) in enumerate(documents, start=1):
+        index.add(doc_id, name, description)
+    return index
+
+
+def build_dict_index(documents) -> Dict[str, Dict[int, int]]:
+    index: Dict[str, Dict[int, int]] = {}
+    for doc_id, (name, description) in enumerate(documents, start=1):
+        for term in tokenize(name) + tokenize(description):
+            postings = index.setdefault(term, {})
+            postings[doc_id] = postings.get(doc_id, 0) + 1
+    return index
+
+
+def measure(build, documents):
+    # Build once for the time and once under tracemalloc, which slows
+    # allocation down and would distort the timing.
+    gc.collect()
+    start = time.perf_counter()
+    index = build(documents)
+    seconds = time.perf_counter() - start
+    del index
+    gc.collect()
+    tracemalloc.start()
+    index = build(documents)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return index, seconds, size
+
+
+def main(count: int) -> None:
+    rng = random.Random(42)
+    words = make_words(rng)
+    documents = make_documents(count, words, rng)
+    per_million = 1_000_000 / count
+
+    index, index_seconds, index_bytes = measure(build_inverted_index, documents)
+    plain, plain_seconds, plain_bytes = measure(build_dict_index, documents)
+    del plain
+    print_table(
+        f"Building an index of {count:,} products (15 words each)",
+        ("index", "build s", "s per 1M", "MiB", "MiB per 1M", "encoded MiB"),
+        [
+            ("InvertedIndex", f"{index_seconds:.1f}", f"{index_seconds * per_million:.1f}",
+             f"{index_bytes / 2**20:.0f}", f"{index_bytes * per_million / 2**20:.0f}",
+             f"{index.nbytes / 2**20:.0f}"),
+            ("dict of dicts", f"{plain_seconds:.1f}", f"{plain_seconds * per_million:.1f}",
+             f"{plain_bytes / 2**20:.0f}", f"{plain_bytes * per_million / 2**20:.0f}", "-"),
+        ],
+    )
+
+    # Skip the most frequent words; they behave like stop words.
+    queries = [
+        " ".join(rng.choice(words[20:2000]) for _ in range(rng.randint(1, 2))) for _ in range(QUERIES)
+    ]
+    alternatives = [f"{rng.choice(words[20:2000])} OR {rng.choice(words[20:2000])}" for _ in range(QUERIES)]
+    prefixes = [rng.choice(words[20:2000])[:4] for _ in range(QUERIES)]
+    print_table(
+        "Query latency (top 20)",
+        ("query", "p50 ms", "p95 ms", "max ms"),
+        [
+            (label, *summarize(timed(lambda q: index.search(parse_search_query(q)), batch)))
+            for label, batch in (("words", queries), ("a OR b", alternatives), ("prefix", prefixes))
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PRODUCTS)
@@ -0,0 +1,91 @@
+"""
+Simulates a storage backend that slows down under a write burst, and
+compares the REST app with and without the concurrency limiter: read
+latency and throughput while bulk writers hammer the service.
+
+The backend is a lock held for a fixed time per request, like SQLite's
+single writer: every request queues behind the ones in front of it.
+
+Run from the service root:
+    python -m benchmarks.bench_load_shedding
+"""
+import threading
+import time
+
+from flask import Flask
+
+from benchmarks.bench_product_search import percentile
+from benchmarks.common import print_table
+from src.infrastructure.primary.rest_api.middlewares.concurrency_limit import AimdLimiter, ConcurrencyLimiter
+
+DURATION = 3.0
+READERS = 8
+WRITERS = 32
+READ_SECONDS = 0.002
+WRITE_SECONDS = 0.01
+
+
+def make_app(limited: bool) -> Flask:
+    app = Flask(__name__)
+    storage = threading.Lock()
+
+    @app.route("/products", methods=["GET", "POST"])
+    def products():
+        from flask import request
+        with storage:
+            time.sleep(READ_SECONDS if request.method == "GET" else WRITE_SECONDS)
+        return {"ok": True}
+
+    if limited:
+        ConcurrencyLimiter(
+            read=AimdLimiter(initial_limit=8, min_limit=4, latency_target=0.05),
+            write=AimdLimiter(initial_limit=4, min_limit=1, max_limit=16, latency_target=0.05),
+        ).init_app(app)
+    return app
+
+
+def run(app: Flask):
+    deadline = time.perf_counter() + DURATION
+    latencies = {"GET": [], "POST": []}
+    shed = {"GET": 0, "POST": 0}
+
+    def client(method: str) -> None:
+        test_client = app.test_client()
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = test_client.open("/products", method=method)
+            if response.status_code == 503:
+                shed[method] += 1
+                time.sleep(float(response.headers["Retry-After"]))
+            else:
+                latencies[method].append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=client, args=("GET",)) for _ in range(READERS)]
+    threads += [threading.Thread(target=client, args=("POST",)) for _ in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, shed
+
+
+def main() -> None:
+    rows = []
+    for limited in (False, True):
+        latencies, shed = run(make_app(limited))
+        for method in ("GET", "POST"):
+            samples = sorted(latencies[method]) or [0.0]
+            rows.append((
+                "limited" if limited else "unlimited", method, f"{len(latencies[method]) / DURATION:.0f}",
+                f"{shed[method] / DURATION:.0f}", f"{percentile(samples, 0.5) * 1e3:.1f}",
+                f"{percentile(samples, 0.99) * 1e3:.1f}",
+            ))
+    print_table(
+        f"{READERS} readers and {WRITERS} writers on a serialized backend for {DURATION:.0f} s",
+        ("app", "method", "served/s", "shed/s", "p50 ms", "p99 ms"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
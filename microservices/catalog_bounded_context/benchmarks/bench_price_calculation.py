@@ -0,0 +1,46 @@
+"""
+Compares scalar and batch pricing in PriceCalculationService.
+
+Run from the service root:
+    python -m benchmarks.bench_price_calculation [lines ...]
+"""
+import random
+import sys
+
+from benchmarks.common import print_table, time_call
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.domain.services.price_calculation_service import PriceCalculationService
+
+DEFAULT_SIZES = (10_000, 1_000_000)
+
+
+def build_lines(count: int):
+    rng = random.Random(42)
+    products = [
+        Product(
+            product_id=i,
+            name=f"Product {i}",
+            description="Benchmark product",
+            price=Price(amount=round(rng.uniform(0, 500), 2)),
+            category_id=1,
+        )
+        for i in range(1, count + 1)
+    ]
+    quantities = [rng.randint(1, 20) for _ in range(count)]
+    return products, quantities
+
+
+def main(sizes) -> None:
+    service = PriceCalculationService()
+    rows = []
+    for count in sizes:
+        products, quantities = build_lines(count)
+        scalar = time_call(lambda: [service.calculate_final_price(p, q) for p, q in zip(products, quantities)], repeat=1)
+        batch = time_call(lambda: service.calculate_final_prices(products, quantities), repeat=1)
+        rows.append((f"{count:,}", f"{scalar:.3f}", f"{batch:.3f}", f"{scalar / batch:.1f}x"))
+    print_table("calculate_final_price vs calculate_final_prices", ("lines", "scalar s", "batch s", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
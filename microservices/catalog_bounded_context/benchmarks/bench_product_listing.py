@@ -0,0 +1,115 @@
+"""
+Measures category + price range listings, ordered by price, from the
+(category, price) indexes against a full scan and sort.
+
+Run from the service root:
+    python -m benchmarks.bench_product_listing [products]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.bench_product_search import make_words, seed, summarize, timed
+from benchmarks.common import print_table
+from src.domain.models.price_index import PriceIndex
+from src.domain.models.product_table import ProductTable
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, init_db
+from src.infrastructure.secondary.sqlite_db.models import ProductModel
+from src.infrastructure.secondary.sqlite_db.product_listing_adapter import ProductListingAdapter
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+DEFAULT_PRODUCTS = 1_000_000
+QUERIES = 200
+SCAN_QUERIES = 5  # Scans are slow; a few are enough to show the difference.
+PAGE_SIZE = 20
+
+
+def make_queries(rng: random.Random):
+    queries = []
+    for _ in range(QUERIES):
+        low = rng.randint(100, 90_000)
+        queries.append({
+            "category_id": rng.randint(1, 100),
+            "min_price": low / 100,
+            "max_price": rng.randint(low, 100_000) / 100,
+            "descending": rng.random() < 0.5,
+            "limit": PAGE_SIZE,
+            "offset": PAGE_SIZE * rng.randint(0, 9),
+        })
+    return queries
+
+
+def scan_listing(db, query):
+    # The same query with the indexes disabled, as before this change.
+    filters = (
+        func.coalesce(ProductModel.category_id, 0) == query["category_id"],
+        ProductModel.price_minor_units + 0 >= round(query["min_price"] * 100),
+        ProductModel.price_minor_units + 0 <= round(query["max_price"] * 100),
+    )
+    order = ProductModel.price_minor_units.desc() if query["descending"] else ProductModel.price_minor_units
+    db.execute(select(ProductModel.product_id).where(*filters).order_by(order, ProductModel.product_id)
+               .limit(query["limit"]).offset(query["offset"])).all()
+    db.execute(select(func.count()).select_from(ProductModel).where(*filters)).scalar_one()
+
+
+def table_listing(table: ProductTable, query):
+    selection = table.filter(query["category_id"], query["min_price"], query["max_price"])
+    selection = selection.sort_by_price(query["descending"])
+    page = selection[query["offset"]:query["offset"] + query["limit"]]
+    return list(page), len(selection)
+
+
+def index_listing(index: PriceIndex, query):
+    return index.select(
+        query["category_id"],
+        round(query["min_price"] * 100),
+        round(query["max_price"] * 100),
+        query["descending"],
+        query["limit"],
+        query["offset"],
+    )
+
+
+def main(count: int) -> None:
+    rng = random.Random(42)
+    words = make_words(rng)
+    queries = make_queries(rng)
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_catalog_engine(f"sqlite:///{os.path.join(directory, 'listing.db')}")
+        init_db(engine)
+        session_factory = sessionmaker(bind=engine)
+        seed(session_factory, count, words, rng)
+
+        with session_factory() as db:
+            listing = ProductListingAdapter(db)
+            sql_rows = [
+                ("sqlite composite index", *summarize(timed(lambda q: listing.list_products(**q), queries))),
+                ("sqlite scan + sort", *summarize(timed(lambda q: scan_listing(db, q), queries[:SCAN_QUERIES]))),
+            ]
+            products = list(ProductRepositoryAdapter(db).iter_all(batch_size=10_000))
+        engine.dispose()
+
+    start = time.perf_counter()
+    index = PriceIndex((product.product_id, product.category_id, product.price.minor_units) for product in products)
+    build_seconds = time.perf_counter() - start
+    table = ProductTable(products)
+    del products
+    memory_rows = [
+        ("PriceIndex.select", *summarize(timed(lambda q: index_listing(index, q), queries))),
+        ("ProductTable filter + sort", *summarize(timed(lambda q: table_listing(table, q), queries[:SCAN_QUERIES * 4]))),
+    ]
+    print_table(
+        f"Listing a category and price range by price, {count:,} products, {PAGE_SIZE} per page",
+        ("listing", "p50 ms", "p95 ms", "max ms"),
+        sql_rows + memory_rows,
+    )
+    print(f"PriceIndex built in {build_seconds:.1f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PRODUCTS)
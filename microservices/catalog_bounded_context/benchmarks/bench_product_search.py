@@ -0,0 +1,123 @@
+"""
+Measures full-text search latency on the FTS5 index against a LIKE scan.
+
+Run from the service root:
+    python -m benchmarks.bench_product_search [products]
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from itertools import accumulate, islice
+
+from sqlalchemy import func, insert, or_, select
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import print_table
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, init_db
+from src.infrastructure.secondary.sqlite_db.models import ProductModel
+from src.infrastructure.secondary.sqlite_db.product_search_adapter import ProductSearchAdapter
+
+DEFAULT_PRODUCTS = 1_000_000
+VOCABULARY_SIZE = 5_000
+QUERIES = 200
+LIKE_QUERIES = 5  # Scans are slow; a few are enough to show the difference.
+
+
+def make_words(rng: random.Random):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(4, 9))) for _ in range(VOCABULARY_SIZE)]
+
+
+def zipf_sampler(rng: random.Random, words):
+    # Word frequencies follow Zipf's law, like real product vocabularies.
+    cum_weights = list(accumulate(1 / rank for rank in range(1, len(words) + 1)))
+    return lambda k: rng.choices(words, cum_weights=cum_weights, k=k)
+
+
+def seed(session_factory, count: int, words, rng: random.Random) -> None:
+    sample = zipf_sampler(rng, words)
+    rows = (
+        {
+            "name": " ".join(sample(3)),
+            "description": " ".join(sample(12)),
+            "price_minor_units": rng.randint(100, 100_000),
+            "currency": "USD",
+            "category_id": rng.randint(1, 100),
+        }
+        for _ in range(count)
+    )
+    with session_factory() as db:
+        while chunk := list(islice(rows, 50_000)):
+            db.execute(insert(ProductModel), chunk)
+        db.commit()
+
+
+def percentile(samples, fraction: float) -> float:
+    return sorted(samples)[int(fraction * (len(samples) - 1))]
+
+
+def timed(run, queries):
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        run(query)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main(count: int) -> None:
+    rng = random.Random(42)
+    words = make_words(rng)
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_catalog_engine(f"sqlite:///{os.path.join(directory, 'search.db')}")
+        init_db(engine)
+        session_factory = sessionmaker(bind=engine)
+        start = time.perf_counter()
+        seed(session_factory, count, words, rng)
+        load_seconds = time.perf_counter() - start
+
+        # Skip the most frequent words; they behave like stop words.
+        queries = [
+            " ".join(rng.choice(words[20:2000]) for _ in range(rng.randint(1, 2))) for _ in range(QUERIES)
+        ]
+        prefixes = [rng.choice(words[20:2000])[:4] for _ in range(QUERIES)]
+
+        with session_factory() as db:
+            search = ProductSearchAdapter(db)
+            rows = [
+                ("fts5 words", *summarize(timed(lambda q: search.search(q), queries))),
+                ("fts5 prefix", *summarize(timed(lambda q: search.search(q), prefixes))),
+                ("fts5 words + category", *summarize(timed(lambda q: search.search(q, category_id=7), queries))),
+            ]
+
+            def like_scan(query):
+                pattern = f"%{query}%"
+                matches = select(ProductModel.product_id).where(
+                    or_(ProductModel.name.like(pattern), ProductModel.description.like(pattern))
+                )
+                db.execute(select(func.count()).select_from(matches.subquery())).scalar_one()
+                db.execute(matches.limit(20)).all()
+
+            rows.append(("LIKE scan", *summarize(timed(like_scan, queries[:LIKE_QUERIES]))))
+        engine.dispose()
+
+    print_table(
+        f"{count:,} products (loaded and indexed in {load_seconds:.1f}s)",
+        ("query", "p50 ms", "p95 ms", "max ms"),
+        rows,
+    )
+
+
+def summarize(samples):
+    return (
+        f"{statistics.median(samples):.2f}",
+        f"{percentile(samples, 0.95):.2f}",
+        f"{max(samples):.2f}",
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PRODUCTS)
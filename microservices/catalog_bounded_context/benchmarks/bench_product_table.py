@@ -0,0 +1,57 @@
+"""
+Compares memory and filter cost of Product objects and a columnar ProductTable.
+
+Run from the service root:
+    python -m benchmarks.bench_product_table [rows]
+"""
+import random
+import sys
+import tracemalloc
+
+from benchmarks.common import print_table, time_call
+from src.domain.models.entities.Product import Product
+from src.domain.models.product_table import ProductTable
+from src.domain.models.value_objects.Price import Price
+
+DEFAULT_ROWS = 200_000
+
+
+def build_products(count: int):
+    rng = random.Random(42)
+    for i in range(1, count + 1):
+        yield Product(
+            product_id=i,
+            name=f"Product {i % 5000}",
+            description=f"Description {i % 500}",
+            price=Price(amount=round(rng.uniform(1, 500), 2)),
+            category_id=rng.randint(1, 50),
+        )
+
+
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main(count: int) -> None:
+    products, objects_bytes = measure(lambda: list(build_products(count)))
+    table, table_bytes = measure(lambda: ProductTable(build_products(count)))
+
+    objects_filter = time_call(lambda: [p for p in products if p.category_id == 7 and 100 <= p.price.amount <= 200])
+    table_filter = time_call(lambda: table.filter(category_id=7, min_price=100, max_price=200))
+
+    print_table(
+        f"{count:,} products",
+        ("storage", "MiB", "bytes/row", "filter ms"),
+        [
+            ("List[Product]", f"{objects_bytes / 2**20:.1f}", objects_bytes // count, f"{objects_filter * 1000:.1f}"),
+            ("ProductTable", f"{table_bytes / 2**20:.1f}", table_bytes // count, f"{table_filter * 1000:.1f}"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS)
@@ -0,0 +1,64 @@
+"""
+Compares assigning products to a category one at a time with the bulk,
+set-based reassignment.
+
+Run from the service root:
+    python -m benchmarks.bench_reassign_products [products]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import print_table
+from src.application.usecases.assign_product_to_category_usecase import AssignProductToCategoryUseCase
+from src.application.usecases.reassign_products_usecase import ReassignProductsUseCase
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, init_db
+from src.infrastructure.secondary.sqlite_db.unit_of_work import SqlAlchemyUnitOfWork
+
+DEFAULT_PRODUCTS = 5_000
+
+
+def seeded_session_factory(directory: str, name: str, count: int):
+    engine = create_catalog_engine(f"sqlite:///{os.path.join(directory, name)}.db")
+    init_db(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    with SqlAlchemyUnitOfWork(session_factory) as unit_of_work:
+        unit_of_work.categories.add(Category(category_id=None, name="Target", description="Target"))
+        unit_of_work.products.add_many([
+            Product(product_id=None, name=f"Product {i}", description="Seeded", price=Price(amount=9.99), category_id=0)
+            for i in range(count)
+        ])
+        unit_of_work.commit()
+    return engine, session_factory
+
+
+def main(count: int) -> None:
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        engine, session_factory = seeded_session_factory(directory, "one_by_one", count)
+        use_case = AssignProductToCategoryUseCase(SqlAlchemyUnitOfWork(session_factory))
+        start = time.perf_counter()
+        for product_id in range(1, count + 1):
+            use_case.assign_product_to_category(product_id, 1)
+        rows.append(("one at a time", f"{time.perf_counter() - start:.2f}"))
+        engine.dispose()
+
+        engine, session_factory = seeded_session_factory(directory, "bulk", count)
+        use_case = ReassignProductsUseCase(SqlAlchemyUnitOfWork(session_factory))
+        start = time.perf_counter()
+        report = use_case.assign_products_to_category(list(range(1, count + 1)), 1)
+        rows.append(("bulk", f"{time.perf_counter() - start:.2f}"))
+        assert len(report.succeeded) == count
+        engine.dispose()
+
+    print_table(f"Assigning {count:,} products", ("path", "seconds"), rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PRODUCTS)
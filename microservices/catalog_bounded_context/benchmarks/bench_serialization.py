@@ -0,0 +1,78 @@
+"""
+Measures encoding product list responses: jsonify over dicts against the
+bytes encoder, with a cold and a warm cache of encoded products.
+
+Run from the service root:
+    python -m benchmarks.bench_serialization
+"""
+from flask import Flask, jsonify
+
+from benchmarks.common import print_table, time_call
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.primary.rest_api.serializers import encoding
+from src.infrastructure.primary.rest_api.serializers.encoding import EncodedEntityCache, encode_page, encode_product
+from src.infrastructure.primary.rest_api.serializers.product_serializer import serialize_product
+
+SIZES = (20, 100, 1_000, 10_000)
+
+
+def make_products(count: int):
+    return [
+        Product.from_storage(
+            product_id=product_id,
+            name=f"Product {product_id}",
+            description="A reasonably long product description with a few sentences of text. " * 3,
+            price=Price.from_minor_units(1999 + product_id),
+            category_id=product_id % 50,
+            image_urls=[f"https://cdn.example.com/products/{product_id}/{n}.jpg" for n in range(3)],
+            version=1,
+        )
+        for product_id in range(1, count + 1)
+    ]
+
+
+def main() -> None:
+    app = Flask(__name__)
+    rows = []
+    orjson = encoding.orjson
+    for count in SIZES:
+        products = make_products(count)
+        repeat = max(3, 20_000 // count)
+
+        def with_jsonify():
+            jsonify({"items": [serialize_product(p) for p in products], "total": count}).get_data()
+
+        def with_encoder(cache=None):
+            encode_page((encode_product(p, cache) for p in products), total=count)
+
+        def cold():
+            with_encoder(EncodedEntityCache())
+
+        warm_cache = EncodedEntityCache()
+        with_encoder(warm_cache)
+
+        with app.app_context():
+            baseline = time_call(with_jsonify, repeat) / count
+        encoding.orjson = None
+        stdlib_cold = time_call(cold, repeat) / count
+        encoding.orjson = orjson
+        fast_cold = time_call(cold, repeat) / count
+        fast_warm = time_call(lambda: with_encoder(warm_cache), repeat) / count
+        rows.append((
+            f"{count:,}",
+            f"{baseline * 1e6:.2f}",
+            f"{stdlib_cold * 1e6:.2f}",
+            f"{fast_cold * 1e6:.2f}",
+            f"{fast_warm * 1e6:.2f}",
+            f"{baseline / fast_warm:.1f}x",
+        ))
+    print_table(
+        f"Encoding a page of products, microseconds per product (orjson {'on' if orjson else 'missing'})",
+        ("products", "jsonify", "stdlib bytes", "orjson cold", "orjson warm", "speedup"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
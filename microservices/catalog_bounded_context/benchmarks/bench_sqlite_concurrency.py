@@ -0,0 +1,128 @@
+"""
+Measures product reads while a writer keeps repricing the catalog, once with
+SQLAlchemy's default SQLite engine and once with the configured engine
+profile (WAL, pragmas, pool and statement caches).
+
+Run from the service root:
+    python -m benchmarks.bench_sqlite_concurrency [seconds] [readers]
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import print_table
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, init_db
+from src.infrastructure.secondary.sqlite_db.models import ProductModel
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+DEFAULT_SECONDS = 3.0
+DEFAULT_READERS = 8
+PRODUCT_COUNT = 100_000
+READS_PER_REQUEST = 20  # Point reads made by one request.
+
+
+def seed(engine) -> None:
+    init_db(engine)
+    with sessionmaker(bind=engine)() as session:
+        ProductRepositoryAdapter(session).add_many([
+            Product(product_id=None, name=f"Product {i}", description="Seeded", price=Price(amount=9.99), category_id=i % 50)
+            for i in range(PRODUCT_COUNT)
+        ])
+
+
+def run(engine, seconds: float, readers: int):
+    """
+    Runs one writer and several readers until the deadline.  Returns the
+    completed reads, the completed repricing passes, failed operations and
+    the slowest read request.
+    """
+    Session = sessionmaker(bind=engine)
+    deadline = time.perf_counter() + seconds
+    lock = threading.Lock()
+    totals = {"reads": 0, "writes": 0, "errors": 0, "max_read": 0.0}
+
+    def record(**counts):
+        with lock:
+            for key, value in counts.items():
+                totals[key] = max(totals[key], value) if key == "max_read" else totals[key] + value
+
+    def writer():
+        # A catalog-wide price change: one statement touching every row, like a bulk repricing job.
+        reprice = update(ProductModel).values(price_minor_units=ProductModel.price_minor_units + 1)
+        while time.perf_counter() < deadline:
+            with Session() as session:
+                try:
+                    session.execute(reprice)
+                    session.commit()
+                    record(writes=1)
+                except OperationalError:
+                    session.rollback()
+                    record(errors=1)
+
+    def reader(seed_value):
+        rng = random.Random(seed_value)
+        reads, slowest = 0, 0.0
+        with Session() as session:
+            repository = ProductRepositoryAdapter(session)
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    for _ in range(READS_PER_REQUEST):
+                        repository.get_by_id(rng.randint(1, PRODUCT_COUNT))
+                    session.commit()
+                    reads += READS_PER_REQUEST
+                except OperationalError:
+                    session.rollback()
+                    record(errors=1)
+                slowest = max(slowest, time.perf_counter() - start)
+        record(reads=reads, max_read=slowest)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return totals
+
+
+def main(seconds: float, readers: int) -> None:
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for label, factory in (
+            ("default engine", lambda url: create_engine(url, connect_args={"check_same_thread": False})),
+            ("engine profile", create_catalog_engine),
+        ):
+            url = f"sqlite:///{os.path.join(directory, label.replace(' ', '_'))}.db"
+            engine = factory(url)
+            seed(engine)
+            totals = run(engine, seconds, readers)
+            engine.dispose()
+            rows.append((
+                label,
+                f"{totals['reads'] / seconds:,.0f}",
+                totals["writes"],
+                totals["errors"],
+                f"{totals['max_read'] * 1000:.1f}",
+            ))
+
+    print_table(
+        f"{readers} readers and 1 writer for {seconds:g}s",
+        ("engine", "reads/s", "repricing passes", "errors", "slowest request ms"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main(
+        float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SECONDS,
+        int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_READERS,
+    )
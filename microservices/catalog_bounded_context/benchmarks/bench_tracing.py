@@ -0,0 +1,60 @@
+"""
+Measures what request tracing costs on GET /products/<id>: an app without
+it, an app with it registered but turned off, and with it turned on (spans
+and stack sampling, no profile written).
+
+Run from the service root:
+    python -m benchmarks.bench_tracing
+"""
+from flask import Flask
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from benchmarks.bench_serialization import make_products
+from benchmarks.common import print_table, time_call
+from src.infrastructure.primary.rest_api import dependencies
+from src.infrastructure.primary.rest_api.middlewares.tracing import RequestTracing
+from src.infrastructure.primary.rest_api.routes.product_routes import product_bp
+from src.infrastructure.secondary.sqlite_db.database import init_db
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+REQUESTS = 2_000
+ROUNDS = 7
+
+
+def make_app(session_factory, tracing: bool, enabled: bool) -> Flask:
+    app = Flask(__name__)
+    app.register_blueprint(product_bp)
+    dependencies.init_app(app)
+    app.config.update(SESSION_FACTORY=session_factory, INSTRUMENTATION=enabled, SLOW_REQUEST_SECONDS=60)
+    if tracing:
+        RequestTracing().init_app(app)
+    return app
+
+
+def main() -> None:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    init_db(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    with session_factory() as db:
+        ProductRepositoryAdapter(db).add_many(make_products(100))
+
+    configurations = (("not registered", False, False), ("off", True, False), ("on", True, True))
+    clients = [make_app(session_factory, tracing, enabled).test_client() for _, tracing, enabled in configurations]
+    best = [float("inf")] * len(clients)
+    # Rounds alternate between the apps, so that drift in machine speed affects them alike.
+    for _ in range(ROUNDS):
+        for index, client in enumerate(clients):
+            run = time_call(lambda: [client.get(f"/products/{n % 100 + 1}") for n in range(REQUESTS)], 1)
+            best[index] = min(best[index], run / REQUESTS)
+    rows = [
+        (label, f"{seconds * 1e6:.0f}", f"{(seconds / best[0] - 1) * 100:+.1f}%")
+        for (label, _, _), seconds in zip(configurations, best)
+    ]
+    print_table(f"GET /products/<id>, best of {ROUNDS} runs of {REQUESTS:,} requests (microseconds per request)",
+                ("tracing", "us", "overhead"), rows)
+
+
+if __name__ == "__main__":
+    main()
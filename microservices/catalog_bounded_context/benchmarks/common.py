@@ -0,0 +1,44 @@
+import gc
+import time
+from typing import Callable, List, Tuple
+
+
+def time_call(func: Callable[[], object], repeat: int = 3) -> float:
+    """
+    Runs a callable several times and returns the best wall-clock time.
+    The garbage collector is paused while timing, as timeit does.
+
+    Args:
+        func (Callable[[], object]): The code under measurement.
+        repeat (int, optional): How many times to run it. Defaults to 3.
+
+    Returns:
+        float: The fastest run, in seconds.
+    """
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def print_table(title: str, header: Tuple[str, ...], rows: List[Tuple]) -> None:
+    """
+    Prints benchmark results as a fixed-width text table.
+
+    Args:
+        title (str): The heading printed above the table.
+        header (Tuple[str, ...]): The column names.
+        rows (List[Tuple]): One tuple of values per row.
+    """
+    print(f"\n{title}")
+    widths = [max(len(str(value)) for value in column) for column in zip(header, *rows)]
+    for row in (header, *rows):
+        print("  ".join(str(value).rjust(width) for value, width in zip(row, widths)))
@@ -0,0 +1,149 @@
+"""
+Local load test of the Flask app (threaded WSGI server, as app.run uses)
+against the ASGI app under uvicorn, on the same machine and database.
+Each server runs in its own process; the load is generated here with one
+keep-alive connection per simulated client.
+
+Run from the service root:
+    python -m benchmarks.load_test [seconds] [concurrency ...]
+"""
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.bench_product_search import percentile
+from benchmarks.common import print_table
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, init_db
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+PRODUCTS = 10_000
+DEFAULT_SECONDS = 10
+DEFAULT_CONCURRENCY = (10, 100, 500)
+MULTI_GET_SIZE = 20
+HOST = "127.0.0.1"
+
+SERVERS = {
+    "flask": [sys.executable, "-m", "benchmarks.load_test", "serve-flask"],
+    "asgi": [sys.executable, "-m", "uvicorn", "src.infrastructure.primary.asgi_api.app:app",
+             "--log-level", "warning", "--no-access-log", "--backlog", "4096"],
+}
+
+
+def serve_flask(port: int) -> None:
+    from werkzeug.serving import run_simple
+    from src.infrastructure.primary.rest_api.app import app
+    run_simple(HOST, port, app, threaded=True)
+
+
+def seed(database_url: str) -> None:
+    engine = create_catalog_engine(database_url)
+    init_db(engine)
+    rng = random.Random(42)
+    with sessionmaker(bind=engine)() as db:
+        ProductRepositoryAdapter(db).add_many([
+            Product(product_id=None, name=f"Product {n}", description="A product for the load test",
+                    price=Price(amount=rng.randint(100, 100_000) / 100), category_id=n % 50)
+            for n in range(PRODUCTS)
+        ])
+    engine.dispose()
+
+
+def start(name: str, port: int, database_url: str) -> subprocess.Popen:
+    command = SERVERS[name] + ([str(port)] if name == "flask" else ["--port", str(port)])
+    process = subprocess.Popen(command, env=dict(os.environ, DATABASE_URL=database_url),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://{HOST}:{port}/products/1") as response:
+                if response.status == 200:
+                    return process
+        except OSError:
+            pass
+        time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"The {name} server did not start.")
+
+
+async def client(port: int, path: str, deadline: float, rng: random.Random, latencies: list) -> int:
+    # A minimal keep-alive HTTP/1.1 client: general purpose clients cost more
+    # CPU per request than the servers under test.
+    reader = writer = None
+    errors = 0
+    while time.perf_counter() < deadline:
+        url = path.format(id=rng.randint(1, PRODUCTS),
+                          ids=",".join(str(rng.randint(1, PRODUCTS)) for _ in range(MULTI_GET_SIZE)))
+        started = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(HOST, port)
+            writer.write(f"GET {url} HTTP/1.1\r\nHost: {HOST}\r\n\r\n".encode())
+            head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+            headers = dict(line.lower().split(": ", 1) for line in head[1:] if line)
+            await reader.readexactly(int(headers.get("content-length", 0)))
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            errors += 1
+            writer = None
+            continue
+        latencies.append(time.perf_counter() - started)
+        if head[0].split(" ")[1] != "200":
+            errors += 1
+        if headers.get("connection") == "close" or head[0].startswith("HTTP/1.0"):
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+    return errors
+
+
+async def load(port: int, path: str, seconds: float, concurrency: int) -> tuple:
+    latencies = []
+    rng = random.Random(7)
+    started = time.perf_counter()
+    errors = await asyncio.gather(*(client(port, path, started + seconds, rng, latencies) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    if not latencies:
+        return 0.0, float("nan"), float("nan"), sum(errors)
+    return len(latencies) / elapsed, percentile(latencies, 0.5), percentile(latencies, 0.99), sum(errors)
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SECONDS
+    levels = [int(value) for value in sys.argv[2:]] or DEFAULT_CONCURRENCY
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{os.path.join(directory, 'load.db')}"
+        seed(database_url)
+        for port, name in enumerate(SERVERS, start=8701):
+            process = start(name, port, database_url)
+            try:
+                for label, path in (("GET /products/<id>", "/products/{id}"),
+                                    (f"GET /products?ids=<{MULTI_GET_SIZE}>", "/products?ids={ids}")):
+                    for concurrency in levels:
+                        rps, p50, p99, errors = asyncio.run(load(port, path, seconds, concurrency))
+                        rows.append((name, label, concurrency, f"{rps:,.0f}", f"{p50 * 1e3:.1f}",
+                                     f"{p99 * 1e3:.1f}", errors))
+            finally:
+                process.terminate()
+                process.wait()
+    print_table(
+        f"Load test, {seconds:g} s per row ({os.cpu_count()} CPUs, load generator on the same machine)",
+        ("server", "route", "clients", "req/s", "p50 ms", "p99 ms", "errors"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["serve-flask"]:
+        serve_flask(int(sys.argv[2]))
+    else:
+        main()
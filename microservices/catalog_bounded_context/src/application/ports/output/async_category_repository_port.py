@@ -0,0 +1,86 @@
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+from src.domain.models.entities.Category import Category
+
+
+class AsyncCategoryRepositoryPort:
+    """
+    Asynchronous counterpart of CategoryRepositoryPort, for adapters whose
+    storage I/O can be awaited instead of blocking a worker thread.
+    """
+
+    async def get_by_id(self, category_id: int) -> Optional[Category]:
+        """
+        Retrieves a category by its ID.
+
+        Args:
+            category_id (int): The ID of the category.
+
+        Returns:
+            Optional[Category]: The category object, or None if not found.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def get_version(self, category_id: int) -> Optional[int]:
+        """
+        Retrieves only the version of a category.
+        See CategoryRepositoryPort.get_version.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def get_many(self, category_ids: Sequence[int]) -> Dict[int, Category]:
+        """
+        Retrieves many categories by their IDs.
+
+        Args:
+            category_ids (Sequence[int]): The IDs of the categories.
+
+        Returns:
+            Dict[int, Category]: The categories found, keyed by ID.  IDs that do not exist are absent.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def get_all(self) -> List[Category]:
+        """
+        Retrieves all categories.
+
+        Returns:
+            List[Category]: A list of all category objects.
+        """
+        raise NotImplementedError  # Interface method
+
+    def iter_all(self, batch_size: int = 500, after_id: Optional[int] = None) -> AsyncIterator[Category]:
+        """
+        Streams categories in ascending ID order with keyset pagination.  See
+        CategoryRepositoryPort.iter_all.
+
+        Returns:
+            AsyncIterator[Category]: The categories.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def add(self, category: Category) -> None:
+        """
+        Adds a new category to the storage.
+
+        Args:
+            category (Category): The category object to add.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def update(self, category: Category) -> None:
+        """
+        Updates an existing category in the storage.
+
+        Args:
+            category (Category): The category object to update.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def delete(self, category_id: int) -> None:
+        """
+        Deletes a category from the storage by its ID.
+
+        Args:
+            category_id (int): The ID of the category to delete.
+        """
+        raise NotImplementedError  # Interface method
@@ -0,0 +1,93 @@
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+from src.domain.models.entities.Product import Product
+
+
+class AsyncProductRepositoryPort:
+    """
+    Asynchronous counterpart of ProductRepositoryPort, for adapters whose
+    storage I/O can be awaited instead of blocking a worker thread.
+    """
+
+    async def get_by_id(self, product_id: int) -> Optional[Product]:
+        """
+        Retrieves a product by its ID.
+
+        Args:
+            product_id (int): The ID of the product.
+
+        Returns:
+            Optional[Product]: The product object, or None if not found.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def get_version(self, product_id: int) -> Optional[int]:
+        """
+        Retrieves only the version of a product.
+        See ProductRepositoryPort.get_version.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def get_many(self, product_ids: Sequence[int]) -> Dict[int, Product]:
+        """
+        Retrieves many products by their IDs.
+
+        Args:
+            product_ids (Sequence[int]): The IDs of the products.
+
+        Returns:
+            Dict[int, Product]: The products found, keyed by ID.  IDs that do not exist are absent.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def get_all(self) -> List[Product]:
+        """
+        Retrieves all products.
+
+        Returns:
+            List[Product]: A list of all product objects.  Returns an empty list if no products exist.
+        """
+        raise NotImplementedError  # Interface method
+
+    def iter_all(
+        self,
+        batch_size: int = 500,
+        after_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> AsyncIterator[Product]:
+        """
+        Streams products in ascending ID order with keyset pagination.  See
+        ProductRepositoryPort.iter_all.
+
+        Returns:
+            AsyncIterator[Product]: The matching products.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def add(self, product: Product) -> None:
+        """
+        Adds a new product to the storage.
+
+        Args:
+            product (Product): The product object to add.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def update(self, product: Product) -> None:
+        """
+        Updates an existing product in the storage.
+
+        Args:
+            product (Product): The product object to update.
+        """
+        raise NotImplementedError  # Interface method
+
+    async def delete(self, product_id: int) -> None:
+        """
+        Deletes a product from the storage by its ID.
+
+        Args:
+            product_id (int): The ID of the product to delete.
+        """
+        raise NotImplementedError  # Interface method
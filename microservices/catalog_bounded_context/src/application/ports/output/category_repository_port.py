@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Dict, Iterator, List, Optional, Sequence
 from src.domain.models.entities.Category import Category
 
 
@@ -21,6 +21,19 @@ class CategoryRepositoryPort:
         """
         raise NotImplementedError  # Interface method
 
+    def get_version(self, category_id: int) -> Optional[int]:
+        """
+        Retrieves only the version of a category, which changes whenever the category
+        is updated.  Much cheaper than get_by_id, e.g. to revalidate a cached copy.
+
+        Args:
+            category_id (int): The ID of the category.
+
+        Returns:
+            Optional[int]: The current version, or None if the category does not exist.
+        """
+        raise NotImplementedError  # Interface method
+
     def get_all(self) -> List[Category]:
         """
         Retrieves all categories.
@@ -30,6 +43,20 @@ class CategoryRepositoryPort:
         """
         raise NotImplementedError  # Interface method
 
+    def iter_all(self, batch_size: int = 500, after_id: Optional[int] = None) -> Iterator[Category]:
+        """
+        Streams categories in ascending ID order, loading them in batches.
+        Paging is keyset based, so it can be resumed from any ID.
+
+        Args:
+            batch_size (int, optional): How many categories to load per round trip. Defaults to 500.
+            after_id (Optional[int], optional): Only categories with a greater ID. Defaults to None.
+
+        Returns:
+            Iterator[Category]: The categories.
+        """
+        raise NotImplementedError  # Interface method
+
     def add(self, category: Category) -> None:
         """
         Adds a new category to the storage.
@@ -56,3 +83,50 @@ class CategoryRepositoryPort:
             category_id (int): The ID of the category to delete.
         """
         raise NotImplementedError  # Interface method
+
+    def get_many(self, category_ids: Sequence[int]) -> Dict[int, Category]:
+        """
+        Retrieves many categories by their IDs in as few storage round trips as possible.
+
+        Args:
+            category_ids (Sequence[int]): The IDs of the categories.
+
+        Returns:
+            Dict[int, Category]: The categories found, keyed by ID.  IDs that do not exist are absent.
+        """
+        raise NotImplementedError  # Interface method
+
+    def add_many(self, categories: Sequence[Category]) -> None:
+        """
+        Adds many categories to the storage in a single transaction.  Categories
+        without an ID get one assigned.
+
+        Args:
+            categories (Sequence[Category]): The category objects to add.
+        """
+        raise NotImplementedError  # Interface method
+
+    def update_many(self, categories: Sequence[Category]) -> List[int]:
+        """
+        Updates many existing categories in a single transaction and sets the
+        new version of each updated one.
+
+        Args:
+            categories (Sequence[Category]): The category objects to update.
+
+        Returns:
+            List[int]: The IDs of the categories that were not found and therefore not updated.
+        """
+        raise NotImplementedError  # Interface method
+
+    def delete_many(self, category_ids: Sequence[int]) -> List[int]:
+        """
+        Deletes many categories in a single transaction.
+
+        Args:
+            category_ids (Sequence[int]): The IDs of the categories to delete.
+
+        Returns:
+            List[int]: The IDs that were not found and therefore not deleted.
+        """
+        raise NotImplementedError  # Interface method
@@ -0,0 +1,51 @@
+from typing import Dict, Tuple
+from src.domain.models.product_table import PriceSummary
+
+
+class CategoryStatisticsPort:
+    """
+    Interface for a store of per-category product statistics (product count
+    and min/max/total price).  The product repository keeps the store up to
+    date incrementally, in the same transaction as each product write, so
+    reads do not scan the products.
+    """
+
+    def get(self, category_id: int) -> PriceSummary:
+        """
+        Retrieves the statistics of a category.
+
+        Args:
+            category_id (int): The ID of the category.
+
+        Returns:
+            PriceSummary: The statistics; a category without products has a count of 0.
+        """
+        raise NotImplementedError  # Interface method
+
+    def get_all(self) -> Dict[int, PriceSummary]:
+        """
+        Retrieves the statistics of every category that has products.
+
+        Returns:
+            Dict[int, PriceSummary]: The statistics keyed by category ID.
+        """
+        raise NotImplementedError  # Interface method
+
+    def rebuild(self) -> int:
+        """
+        Recomputes all statistics from the products, discarding the stored ones.
+
+        Returns:
+            int: The number of categories with products.
+        """
+        raise NotImplementedError  # Interface method
+
+    def find_inconsistencies(self) -> Dict[int, Tuple[PriceSummary, PriceSummary]]:
+        """
+        Compares the stored statistics with statistics recomputed from the products.
+
+        Returns:
+            Dict[int, Tuple[PriceSummary, PriceSummary]]: (stored, actual) for every
+            category where they differ.  Empty when the store is consistent.
+        """
+        raise NotImplementedError  # Interface method
@@ -0,0 +1,29 @@
+class ImportProgressPort:
+    """
+    Interface for a store of import positions, so an interrupted import can
+    be resumed.  A unit of work writes the position in the same transaction
+    as the products of the chunk it follows, so a resumed import neither
+    skips records nor stores a chunk twice.
+    """
+
+    def get_position(self, source: str) -> int:
+        """
+        Retrieves how far an import got.
+
+        Args:
+            source (str): Identifies the import, e.g. its file and format.
+
+        Returns:
+            int: The number of input records already imported, 0 if the import never stored a chunk.
+        """
+        raise NotImplementedError  # Interface method
+
+    def set_position(self, source: str, position: int) -> None:
+        """
+        Records how far an import got.
+
+        Args:
+            source (str): Identifies the import, e.g. its file and format.
+            position (int): The number of input records imported so far.
+        """
+        raise NotImplementedError  # Interface method
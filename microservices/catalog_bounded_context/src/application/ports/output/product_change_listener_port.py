@@ -0,0 +1,59 @@
+from typing import Sequence
+from src.domain.models.entities.Product import Product
+
+
+class ProductChangeListenerPort:
+    """
+    Interface for components that keep derived data (listing and search indexes)
+    in step with the product catalog.  The product use cases call these
+    methods after the repository write has succeeded.
+    """
+
+    def product_created(self, product: Product) -> None:
+        """
+        Called after a product was added.
+
+        Args:
+            product (Product): The new product, with its assigned ID.
+        """
+        raise NotImplementedError  # Interface method
+
+    def product_updated(self, before: Product, after: Product) -> None:
+        """
+        Called after a product was changed.
+
+        Args:
+            before (Product): The product as it was before the change.
+            after (Product): The product as it is now.
+        """
+        raise NotImplementedError  # Interface method
+
+    def products_reassigned(self, before: Sequence[Product], category_id: int) -> None:
+        """
+        Called after many products were moved to a category in one bulk operation.
+
+        Args:
+            before (Sequence[Product]): The moved products as they were before the move.
+            category_id (int): The ID of the category they were moved to.
+        """
+        raise NotImplementedError  # Interface method
+
+    def category_moved(self, from_category_id: int, to_category_id: int, product_ids: Sequence[int]) -> None:
+        """
+        Called after every product of a category was moved to another one.
+
+        Args:
+            from_category_id (int): The ID of the emptied category.
+            to_category_id (int): The ID of the category that received the products.
+            product_ids (Sequence[int]): The IDs of the moved products.
+        """
+        raise NotImplementedError  # Interface method
+
+    def product_deleted(self, product: Product) -> None:
+        """
+        Called after a product was deleted.
+
+        Args:
+            product (Product): The product as it was before deletion.
+        """
+        raise NotImplementedError  # Interface method
@@ -0,0 +1,54 @@
+from typing import List, NamedTuple, Optional, Tuple
+from src.domain.models.entities.Product import Product
+
+
+class ProductPage(NamedTuple):
+    """
+    One page of a product listing.
+    """
+    products: List[Product]
+    total: Optional[int]  # Matching products across all pages; None if they were not counted.
+    next_cursor: Optional[str] = None  # Continues the listing after this page; None on the last page.
+
+
+class ProductListingPort:
+    """
+    Interface for listing products by category and price range, ordered by price.
+    Implementations answer from an index on (category, price), so a page costs
+    a lookup rather than a scan of the catalog.
+    """
+
+    def list_products(
+        self,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        descending: bool = False,
+        limit: int = 20,
+        offset: int = 0,
+        after: Optional[Tuple[int, int]] = None,
+        count_total: bool = True,
+    ) -> ProductPage:
+        """
+        Lists the products matching the filters, ordered by price and then by product ID.
+        With after, the page starts right after that position (keyset pagination),
+        so a deep page costs as much as the first one.
+
+        Args:
+            category_id (Optional[int], optional): Only list products of this category.
+            min_price (Optional[float], optional): Only list products costing at least this much.
+            max_price (Optional[float], optional): Only list products costing at most this much.
+            descending (bool, optional): List the most expensive products first. Defaults to False.
+            limit (int, optional): The most products to return. Defaults to 20.
+            offset (int, optional): How many products to skip. Defaults to 0.
+            after (Optional[Tuple[int, int]], optional): (price in minor units, product ID) of the
+                last product of the previous page, in the listing order. Defaults to None.
+            count_total (bool, optional): Count the matching products.  Unlike the page, the count
+                reads every match, so it costs time in proportion to the size of the listing.
+                Defaults to True.
+
+        Returns:
+            ProductPage: The requested page and the total number of matching products, or None
+            for the total without count_total.
+        """
+        raise NotImplementedError  # Interface method
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Dict, Iterator, List, Optional, Sequence
 from src.domain.models.entities.Product import Product
 
 
@@ -21,6 +21,19 @@ class ProductRepositoryPort:
         """
         raise NotImplementedError  # Interface method
 
+    def get_version(self, product_id: int) -> Optional[int]:
+        """
+        Retrieves only the version of a product, which changes whenever the product
+        is updated.  Much cheaper than get_by_id, e.g. to revalidate a cached copy.
+
+        Args:
+            product_id (int): The ID of the product.
+
+        Returns:
+            Optional[int]: The current version, or None if the product does not exist.
+        """
+        raise NotImplementedError  # Interface method
+
     def get_all(self) -> List[Product]:
         """
         Retrieves all products.
@@ -30,6 +43,32 @@ class ProductRepositoryPort:
         """
         raise NotImplementedError  # Interface method
 
+    def iter_all(
+        self,
+        batch_size: int = 500,
+        after_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> Iterator[Product]:
+        """
+        Streams products in ascending ID order, loading them in batches so that
+        memory use stays flat however large the catalog is.  Paging is keyset
+        based (continuing after the last ID seen), so it can be resumed from
+        any ID.
+
+        Args:
+            batch_size (int, optional): How many products to load per round trip. Defaults to 500.
+            after_id (Optional[int], optional): Only products with a greater ID. Defaults to None.
+            category_id (Optional[int], optional): Only products in this category. Defaults to None.
+            min_price (Optional[float], optional): Only products priced at or above this amount. Defaults to None.
+            max_price (Optional[float], optional): Only products priced at or below this amount. Defaults to None.
+
+        Returns:
+            Iterator[Product]: The matching products.
+        """
+        raise NotImplementedError  # Interface method
+
     def add(self, product: Product) -> None:
         """
         Adds a new product to the storage.
@@ -56,3 +95,79 @@ class ProductRepositoryPort:
             product_id (int): The ID of the product to delete.
         """
         raise NotImplementedError  # Interface method
+
+    def get_many(self, product_ids: Sequence[int]) -> Dict[int, Product]:
+        """
+        Retrieves many products by their IDs in as few storage round trips as possible.
+
+        Args:
+            product_ids (Sequence[int]): The IDs of the products.
+
+        Returns:
+            Dict[int, Product]: The products found, keyed by ID.  IDs that do not exist are absent.
+        """
+        raise NotImplementedError  # Interface method
+
+    def add_many(self, products: Sequence[Product]) -> None:
+        """
+        Adds many products to the storage in a single transaction.  Products
+        without an ID get one assigned.
+
+        Args:
+            products (Sequence[Product]): The product objects to add.
+        """
+        raise NotImplementedError  # Interface method
+
+    def update_many(self, products: Sequence[Product]) -> List[int]:
+        """
+        Updates many existing products in a single transaction and sets the
+        new version of each updated one.  A product given more than once is
+        updated once, with its last state.
+
+        Args:
+            products (Sequence[Product]): The product objects to update.
+
+        Returns:
+            List[int]: The IDs of the products that were not found and therefore not updated.
+        """
+        raise NotImplementedError  # Interface method
+
+    def reassign_category(self, product_ids: Sequence[int], category_id: int) -> List[int]:
+        """
+        Moves many products to a category with set-based updates, without
+        loading or rewriting the other product fields.
+
+        Args:
+            product_ids (Sequence[int]): The IDs of the products to move.
+            category_id (int): The ID of the new category.
+
+        Returns:
+            List[int]: The IDs of the products that were not found and therefore not moved.
+        """
+        raise NotImplementedError  # Interface method
+
+    def move_category(self, from_category_id: int, to_category_id: int) -> List[int]:
+        """
+        Moves every product of one category to another with set-based updates,
+        without loading the products.  Moving a category into itself moves nothing.
+
+        Args:
+            from_category_id (int): The ID of the category to empty.
+            to_category_id (int): The ID of the category that receives the products.
+
+        Returns:
+            List[int]: The IDs of the moved products.
+        """
+        raise NotImplementedError  # Interface method
+
+    def delete_many(self, product_ids: Sequence[int]) -> List[int]:
+        """
+        Deletes many products in a single transaction.
+
+        Args:
+            product_ids (Sequence[int]): The IDs of the products to delete.
+
+        Returns:
+            List[int]: The IDs that were not found and therefore not deleted.
+        """
+        raise NotImplementedError  # Interface method
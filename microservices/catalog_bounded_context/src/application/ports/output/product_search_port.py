@@ -0,0 +1,42 @@
+from typing import List, NamedTuple, Optional
+from src.domain.models.entities.Product import Product
+
+
+class ProductSearchResult(NamedTuple):
+    """
+    One page of search hits, best match first.
+    """
+    products: List[Product]
+    total: int  # Hits across all pages.
+
+
+class ProductSearchPort:
+    """
+    Interface for full-text search over product names and descriptions.
+    """
+
+    def search(
+        self,
+        query: str,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> ProductSearchResult:
+        """
+        Finds the products matching a query, ranked by relevance.
+
+        Args:
+            query (str): The words to look for, all of which must match.  Alternatives are
+                separated by an upper-case OR, and the last word also matches as a prefix.
+            category_id (Optional[int], optional): Only return products of this category.
+            min_price (Optional[float], optional): Only return products costing at least this much.
+            max_price (Optional[float], optional): Only return products costing at most this much.
+            limit (int, optional): The most products to return. Defaults to 20.
+            offset (int, optional): How many of the best matches to skip. Defaults to 0.
+
+        Returns:
+            ProductSearchResult: The requested page of matches and the total number of matches.
+        """
+        raise NotImplementedError  # Interface method
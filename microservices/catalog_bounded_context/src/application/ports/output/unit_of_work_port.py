@@ -0,0 +1,69 @@
+from typing import Callable, TypeVar
+from src.application.ports.output.category_repository_port import CategoryRepositoryPort
+from src.application.ports.output.import_progress_port import ImportProgressPort
+from src.application.ports.output.product_repository_port import ProductRepositoryPort
+
+T = TypeVar("T")
+
+
+class UnitOfWorkPort:
+    """
+    Interface for a transaction spanning the product and category
+    repositories and the import positions.  Changes made through `products`,
+    `categories` and `import_progress` become visible together on commit();
+    leaving the block without committing discards them.
+
+    Usage:
+        with unit_of_work:
+            unit_of_work.products.update(product)
+            unit_of_work.categories.update(category)
+            unit_of_work.commit()
+    """
+
+    products: ProductRepositoryPort
+    categories: CategoryRepositoryPort
+    import_progress: ImportProgressPort
+
+    def __enter__(self) -> "UnitOfWorkPort":
+        """
+        Starts the transaction.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Ends the transaction, rolling back anything not committed.
+        """
+        self.rollback()
+
+    def commit(self) -> None:
+        """
+        Makes every change since the transaction started permanent.
+        """
+        raise NotImplementedError  # Interface method
+
+    def rollback(self) -> None:
+        """
+        Discards every change not yet committed.
+        """
+        raise NotImplementedError  # Interface method
+
+    def run(self, work: Callable[["UnitOfWorkPort"], T]) -> T:
+        """
+        Runs work in its own transaction and commits it once.  Implementations
+        may batch the commits of concurrent callers, so work must only touch
+        storage through the unit of work it is given.
+
+        Args:
+            work (Callable[[UnitOfWorkPort], T]): The changes to make.
+
+        Returns:
+            T: Whatever work returned.
+
+        Raises:
+            Exception: Whatever work raised; none of its changes are kept.
+        """
+        with self:
+            result = work(self)
+            self.commit()
+            return result
@@ -0,0 +1,47 @@
+from typing import Optional, Sequence
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
+from src.application.ports.output.unit_of_work_port import UnitOfWorkPort
+from src.domain.models.entities.Product import Product
+from src.domain.services.product_categorization_service import ProductCategorizationService
+
+
+class AssignProductToCategoryUseCase:
+    """
+    Use case for assigning a product to a category.  The category check and
+    the product update are made in one unit of work.
+    """
+
+    def __init__(self, unit_of_work: UnitOfWorkPort, listeners: Sequence[ProductChangeListenerPort] = ()):
+        """
+        Initializes the use case with a unit of work.
+
+        Args:
+            unit_of_work (UnitOfWorkPort): The transaction over the product and category repositories.
+            listeners (Sequence[ProductChangeListenerPort], optional): Notified after the product is assigned.
+        """
+        self.unit_of_work = unit_of_work
+        self.listeners = listeners
+
+    def assign_product_to_category(self, product_id: int, category_id: int) -> None:
+        """
+        Assigns a product to a category.
+
+        Args:
+            product_id (int): The ID of the product to assign.
+            category_id (int): The ID of the category to assign the product to.
+
+        Raises:
+            ValueError: If the category or product does not exist, or the product already has a category.
+        """
+        def assign(unit_of_work: UnitOfWorkPort) -> Optional[Product]:
+            before = unit_of_work.products.get_by_id(product_id) if self.listeners else None
+            service = ProductCategorizationService(unit_of_work.categories, unit_of_work.products)
+            service.assign_product_to_category(product_id, category_id)
+            return before
+
+        before = self.unit_of_work.run(assign)
+        if before is not None:
+            after = before.copy()
+            after.assign_to_category(category_id)
+            for listener in self.listeners:
+                listener.product_updated(before, after)
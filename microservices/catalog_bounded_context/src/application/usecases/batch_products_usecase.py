@@ -0,0 +1,130 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
+from src.application.ports.output.unit_of_work_port import UnitOfWorkPort
+from src.domain.models.entities.Product import Product
+
+# Most items accepted in one batch.
+MAX_BATCH_SIZE = 250
+
+# Outcomes of a batch item.
+BATCH_CREATED = "created"
+BATCH_UPDATED = "updated"
+BATCH_INVALID = "invalid"
+BATCH_NOT_FOUND = "not_found"
+
+
+class BatchItemResult(NamedTuple):
+    """
+    The outcome of one item of a batch.
+    """
+    outcome: str  # One of the BATCH_* constants.
+    product: Optional[Product] = None  # The created or updated product.
+    message: Optional[str] = None  # Why the item failed.
+
+
+class BatchProductsUseCase:
+    """
+    Use case for creating and updating many products in one request.  Every
+    valid item is stored in the same unit of work; invalid items and unknown
+    products are reported per item instead of failing the batch.
+    """
+
+    def __init__(self, unit_of_work: UnitOfWorkPort, listeners: Sequence[ProductChangeListenerPort] = ()):
+        """
+        Initializes the use case with a unit of work.
+
+        Args:
+            unit_of_work (UnitOfWorkPort): The transaction over the product and category repositories.
+            listeners (Sequence[ProductChangeListenerPort], optional): Notified after the batch is committed.
+        """
+        self.unit_of_work = unit_of_work
+        self.listeners = listeners
+
+    def apply_changes(self, changes: Sequence[Dict[str, Any]]) -> List[BatchItemResult]:
+        """
+        Creates or updates products.  A change with a product_id updates that
+        product with the other fields it has; a change without one creates a
+        product from the arguments of CreateProductUseCase.create_product.
+        A product can be updated by one change per batch; later changes of
+        the same product are reported as invalid.
+
+        Args:
+            changes (Sequence[Dict[str, Any]]): The changes, in the order they are applied.
+
+        Returns:
+            List[BatchItemResult]: One result per change, in the same order.
+
+        Raises:
+            ValueError: If there are more than MAX_BATCH_SIZE changes.
+        """
+        # 1. Validate the request.
+        if len(changes) > MAX_BATCH_SIZE:
+            raise ValueError(f"At most {MAX_BATCH_SIZE} products can be changed at once.")
+
+        originals: Dict[int, Product] = {}
+        created: List[Product] = []
+        updated: Dict[int, Product] = {}
+        missing = set()
+
+        def apply(unit_of_work: UnitOfWorkPort) -> List[BatchItemResult]:
+            # 2. Load every product to update at once.
+            for collected in (originals, created, updated, missing):
+                collected.clear()
+            ids = [change["product_id"] for change in changes if "product_id" in change]
+            originals.update(unit_of_work.products.get_many(ids) if ids else {})
+
+            # 3. Build the new state of each product.  The entity constructor validates it.
+            results = []
+            seen = set()
+            for change in changes:
+                fields = dict(change)
+                product_id = fields.pop("product_id", None)
+                try:
+                    if product_id is None:
+                        product = Product(product_id=None, **fields)
+                        created.append(product)
+                        results.append(BatchItemResult(BATCH_CREATED, product))
+                        continue
+                    if product_id in seen:
+                        results.append(BatchItemResult(
+                            BATCH_INVALID, message=f"Product with ID {product_id} appears more than once in the batch."))
+                        continue
+                    seen.add(product_id)
+                    current = originals.get(product_id)
+                    if current is None:
+                        results.append(BatchItemResult(BATCH_NOT_FOUND, message=f"Product with ID {product_id} not found."))
+                        continue
+                    product = Product(
+                        product_id=product_id,
+                        name=fields.get("name", current.name),
+                        description=fields.get("description", current.description),
+                        price=fields.get("price", current.price),
+                        category_id=fields.get("category_id", current.category_id),
+                        image_urls=fields.get("image_urls", current.image_urls),
+                    )
+                    updated[product_id] = product
+                    results.append(BatchItemResult(BATCH_UPDATED, product))
+                except (TypeError, ValueError) as e:
+                    results.append(BatchItemResult(BATCH_INVALID, message=str(e)))
+
+            # 4. Store them in one batch each; the repository sets the new IDs and versions.
+            if created:
+                unit_of_work.products.add_many(created)
+            if updated:
+                missing.update(unit_of_work.products.update_many(list(updated.values())))
+            return [
+                BatchItemResult(BATCH_NOT_FOUND, message=f"Product with ID {result.product.product_id} not found.")
+                if result.outcome == BATCH_UPDATED and result.product.product_id in missing else result
+                for result in results
+            ]
+
+        results = self.unit_of_work.run(apply)
+
+        # 5. Notify the listeners once the batch is committed.
+        for listener in self.listeners:
+            for product in created:
+                listener.product_created(product)
+            for product_id, product in updated.items():
+                if product_id not in missing:
+                    listener.product_updated(originals[product_id], product)
+        return results
@@ -0,0 +1,65 @@
+from typing import Any, Dict, List, Sequence
+from src.domain.models.entities.Product import Product
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
+from src.application.ports.output.product_repository_port import ProductRepositoryPort
+from src.application.usecases.bulk_operation_report import BulkOperationReport
+
+
+class BulkCreateProductsUseCase:
+    """
+    Use case for creating many products in one repository transaction.
+    """
+
+    def __init__(self, product_repository: ProductRepositoryPort, listeners: Sequence[ProductChangeListenerPort] = ()):
+        """
+        Initializes the use case with a product repository.
+
+        Args:
+            product_repository (ProductRepositoryPort): The repository for managing product data.
+            listeners (Sequence[ProductChangeListenerPort], optional): Notified after the products are added.
+        """
+        self.product_repository = product_repository
+        self.listeners = listeners
+
+    def create_products(self, items: Sequence[Dict[str, Any]]) -> BulkOperationReport:
+        """
+        Validates and creates many products.  Invalid items are reported and
+        skipped; the valid ones are stored together with add_many.
+
+        Args:
+            items (Sequence[Dict[str, Any]]): One dict per product, with the same keys as the
+                arguments of CreateProductUseCase.create_product.
+
+        Returns:
+            BulkOperationReport: The created products, and an error message per invalid
+            item keyed by its position in items.
+        """
+        report = BulkOperationReport()
+
+        # 1. Validate every item by building its Product entity.
+        products: List[Product] = []
+        for index, item in enumerate(items):
+            try:
+                products.append(Product(
+                    product_id=None,  # The repository will assign the ID.
+                    name=item["name"],
+                    description=item.get("description", ""),
+                    price=item["price"],
+                    category_id=item["category_id"],
+                    image_urls=item.get("image_urls"),
+                ))
+            except KeyError as e:
+                report.add_error(index, f"Missing field: {e.args[0]}")
+            except (TypeError, ValueError) as e:
+                report.add_error(index, str(e))
+
+        # 2. Store the valid products in one batch.
+        if products:
+            self.product_repository.add_many(products)
+            for product in products:
+                report.add_success(product)
+            for listener in self.listeners:
+                for product in products:
+                    listener.product_created(product)
+
+        return report
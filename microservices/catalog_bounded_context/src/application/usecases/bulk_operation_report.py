@@ -0,0 +1,39 @@
+from typing import Any, Dict, List
+
+
+class BulkOperationReport:
+    """
+    Outcome of a bulk use case.  Items that failed are reported individually
+    instead of aborting the whole batch.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty report.
+        """
+        self.succeeded: List[Any] = []
+        self.errors: Dict[Any, str] = {}
+
+    def add_success(self, item: Any) -> None:
+        """
+        Records an item that was processed successfully.
+
+        Args:
+            item (Any): The resulting entity.
+        """
+        self.succeeded.append(item)
+
+    def add_error(self, key: Any, message: str) -> None:
+        """
+        Records an item that failed.
+
+        Args:
+            key (Any): Identifies the item, e.g. its position in the input or its ID.
+            message (str): Why the item failed.
+        """
+        self.errors[key] = message
+
+    @property
+    def ok(self) -> bool:
+        """True if no item failed."""
+        return not self.errors
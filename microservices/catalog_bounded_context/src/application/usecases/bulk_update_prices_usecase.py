@@ -0,0 +1,70 @@
+from typing import Dict, Mapping, Sequence
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
+from src.application.ports.output.product_repository_port import ProductRepositoryPort
+from src.application.usecases.bulk_operation_report import BulkOperationReport
+
+
+class BulkUpdatePricesUseCase:
+    """
+    Use case for repricing many products in one repository transaction.
+    """
+
+    def __init__(self, product_repository: ProductRepositoryPort, listeners: Sequence[ProductChangeListenerPort] = ()):
+        """
+        Initializes the use case with a product repository.
+
+        Args:
+            product_repository (ProductRepositoryPort): The repository for managing product data.
+            listeners (Sequence[ProductChangeListenerPort], optional): Notified after the products are updated.
+        """
+        self.product_repository = product_repository
+        self.listeners = listeners
+
+    def update_prices(self, prices: Mapping[int, Price]) -> BulkOperationReport:
+        """
+        Changes the price of many products.  Unknown products and invalid
+        prices are reported and skipped; the rest are saved with update_many.
+
+        Args:
+            prices (Mapping[int, Price]): The new price of each product, keyed by product ID.
+
+        Returns:
+            BulkOperationReport: The updated products, and an error message per failed
+            product ID.
+        """
+        report = BulkOperationReport()
+
+        # 1. Load all affected products at once.
+        products = self.product_repository.get_many(list(prices))
+
+        # 2. Apply the new prices.
+        changed = []
+        before: Dict[int, Product] = {}
+        for product_id, price in prices.items():
+            product = products.get(product_id)
+            if product is None:
+                report.add_error(product_id, f"Product with ID {product_id} not found.")
+                continue
+            if self.listeners:
+                before[product_id] = product.copy()
+            try:
+                product.change_price(price)
+            except TypeError as e:
+                report.add_error(product_id, str(e))
+                continue
+            changed.append(product)
+
+        # 3. Save them in one batch.  Products deleted in the meantime are reported.
+        if changed:
+            missing = set(self.product_repository.update_many(changed))
+            for product in changed:
+                if product.product_id in missing:
+                    report.add_error(product.product_id, f"Product with ID {product.product_id} not found.")
+                else:
+                    report.add_success(product)
+                    for listener in self.listeners:
+                        listener.product_updated(before[product.product_id], product)
+
+        return report
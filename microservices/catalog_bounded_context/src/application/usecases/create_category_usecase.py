@@ -1,5 +1,6 @@
 from src.domain.models.entities.Category import Category
 from src.application.ports.output.category_repository_port import CategoryRepositoryPort  # Import the repository port
+from src.application.ports.output.async_category_repository_port import AsyncCategoryRepositoryPort
 
 
 class CreateCategoryUseCase:
@@ -39,3 +40,31 @@ class CreateCategoryUseCase:
 
         # 3. Return the created category.
         return category
+
+
+class AsyncCreateCategoryUseCase:
+    """
+    Asynchronous variant of CreateCategoryUseCase.
+    """
+
+    def __init__(self, category_repository: AsyncCategoryRepositoryPort):
+        """
+        Initializes the use case with an asynchronous category repository.
+
+        Args:
+            category_repository (AsyncCategoryRepositoryPort): The repository for managing category data.
+        """
+        self.category_repository = category_repository
+
+    async def create_category(self, name: str, description: str) -> Category:
+        """
+        Creates a new category and persists it using the category repository.
+        See CreateCategoryUseCase.create_category.
+        """
+        category = Category(
+            category_id=None,  # The repository will assign the ID.
+            name=name,
+            description=description,
+        )
+        await self.category_repository.add(category)
+        return category
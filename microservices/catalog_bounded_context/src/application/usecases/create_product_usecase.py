@@ -1,8 +1,10 @@
-from typing import Optional
+from typing import Optional, Sequence
 from src.domain.models.entities.Product import Product
 from src.domain.models.value_objects.Price import Price
 from src.application.ports.input.product_management_port import ProductManagementPort  # Import the interface
 from src.application.ports.output.product_repository_port import ProductRepositoryPort  # Import the repository port
+from src.application.ports.output.async_product_repository_port import AsyncProductRepositoryPort
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
 
 
 class CreateProductUseCase:
@@ -11,14 +13,16 @@ class CreateProductUseCase:
     ProductManagementPort interface.
     """
 
-    def __init__(self, product_repository: ProductRepositoryPort):
+    def __init__(self, product_repository: ProductRepositoryPort, listeners: Sequence[ProductChangeListenerPort] = ()):
         """
         Initializes the use case with a product repository.
 
         Args:
             product_repository (ProductRepositoryPort): The repository for managing product data.
+            listeners (Sequence[ProductChangeListenerPort], optional): Notified after the product is added.
         """
         self.product_repository = product_repository
+        self.listeners = listeners
 
     def create_product(
         self,
@@ -53,6 +57,46 @@ class CreateProductUseCase:
 
         # 2. Add the product to the repository.
         self.product_repository.add(product)  # Changed to add
+        for listener in self.listeners:
+            listener.product_created(product)
 
         # 3. Return the created product.  The repository might modify the product.
         return product
+
+
+class AsyncCreateProductUseCase:
+    """
+    Asynchronous variant of CreateProductUseCase.
+    """
+
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        """
+        Initializes the use case with an asynchronous product repository.
+
+        Args:
+            product_repository (AsyncProductRepositoryPort): The repository for managing product data.
+        """
+        self.product_repository = product_repository
+
+    async def create_product(
+        self,
+        name: str,
+        description: str,
+        price: Price,
+        category_id: int,
+        image_urls: Optional[list[str]] = None,
+    ) -> Product:
+        """
+        Creates a new product and persists it using the product repository.
+        See CreateProductUseCase.create_product.
+        """
+        product = Product(
+            product_id=None,  # The repository will assign the ID.
+            name=name,
+            description=description,
+            price=price,
+            category_id=category_id,
+            image_urls=image_urls,
+        )
+        await self.product_repository.add(product)
+        return product
@@ -1,4 +1,7 @@
+from typing import Optional
 from src.application.ports.output.category_repository_port import CategoryRepositoryPort
+from src.application.ports.output.category_statistics_port import CategoryStatisticsPort
+from src.application.ports.output.async_category_repository_port import AsyncCategoryRepositoryPort
 
 
 class DeleteCategoryUseCase:
@@ -6,14 +9,17 @@ class DeleteCategoryUseCase:
     Use case for deleting a category.
     """
 
-    def __init__(self, category_repository: CategoryRepositoryPort):
+    def __init__(self, category_repository: CategoryRepositoryPort, statistics: Optional[CategoryStatisticsPort] = None):
         """
         Initializes the use case with a category repository.
 
         Args:
             category_repository (CategoryRepositoryPort): The repository for managing category data.
+            statistics (Optional[CategoryStatisticsPort], optional): Supplies product counts, so that
+                categories that still have products are not deleted. Defaults to None (no check).
         """
         self.category_repository = category_repository
+        self.statistics = statistics
 
     def delete_category(self, category_id: int) -> None:
         """
@@ -21,5 +27,35 @@ class DeleteCategoryUseCase:
 
         Args:
             category_id (int): The ID of the category to delete.
+
+        Raises:
+            ValueError: If the category still has products.
         """
+        if self.statistics is not None:
+            category = self.category_repository.get_by_id(category_id)
+            product_count = self.statistics.get(category_id).count
+            if category is not None and not category.can_be_deleted(product_count):
+                raise ValueError(f"Category with ID {category_id} still has {product_count} products.")
         self.category_repository.delete(category_id)
+
+
+class AsyncDeleteCategoryUseCase:
+    """
+    Asynchronous variant of DeleteCategoryUseCase.
+    """
+
+    def __init__(self, category_repository: AsyncCategoryRepositoryPort):
+        """
+        Initializes the use case with an asynchronous category repository.
+
+        Args:
+            category_repository (AsyncCategoryRepositoryPort): The repository for managing category data.
+        """
+        self.category_repository = category_repository
+
+    async def delete_category(self, category_id: int) -> None:
+        """
+        Deletes a category from the repository by its ID.
+        See DeleteCategoryUseCase.delete_category.
+        """
+        await self.category_repository.delete(category_id)
@@ -1,4 +1,7 @@
+from typing import Sequence
 from src.application.ports.output.product_repository_port import ProductRepositoryPort  # Import the repository port
+from src.application.ports.output.async_product_repository_port import AsyncProductRepositoryPort
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
 
 
 class DeleteProductUseCase:
@@ -7,14 +10,16 @@ class DeleteProductUseCase:
     part of the ProductManagementPort interface.
     """
 
-    def __init__(self, product_repository: ProductRepositoryPort):
+    def __init__(self, product_repository: ProductRepositoryPort, listeners: Sequence[ProductChangeListenerPort] = ()):
         """
         Initializes the use case with a product repository.
 
         Args:
             product_repository (ProductRepositoryPort): The repository for managing product data.
+            listeners (Sequence[ProductChangeListenerPort], optional): Notified after the product is deleted.
         """
         self.product_repository = product_repository
+        self.listeners = listeners
 
     def delete_product(self, product_id: int) -> None:
         """
@@ -23,4 +28,31 @@ class DeleteProductUseCase:
         Args:
             product_id (int): The ID of the product to delete.
         """
+        # Listeners need the deleted product's category and price.
+        product = self.product_repository.get_by_id(product_id) if self.listeners else None
         self.product_repository.delete(product_id)
+        if product is not None:
+            for listener in self.listeners:
+                listener.product_deleted(product)
+
+
+class AsyncDeleteProductUseCase:
+    """
+    Asynchronous variant of DeleteProductUseCase.
+    """
+
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        """
+        Initializes the use case with an asynchronous product repository.
+
+        Args:
+            product_repository (AsyncProductRepositoryPort): The repository for managing product data.
+        """
+        self.product_repository = product_repository
+
+    async def delete_product(self, product_id: int) -> None:
+        """
+        Deletes a product from the repository by its ID.
+        See DeleteProductUseCase.delete_product.
+        """
+        await self.product_repository.delete(product_id)
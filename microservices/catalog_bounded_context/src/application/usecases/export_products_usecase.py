@@ -0,0 +1,57 @@
+from itertools import islice
+from typing import Iterator, List, Optional
+from src.application.ports.output.product_repository_port import ProductRepositoryPort
+from src.application.utils.validation import validate_integer
+from src.domain.models.entities.Product import Product
+
+
+class ExportProductsUseCase:
+    """
+    Use case for dumping the whole catalog, e.g. for search, feed or analytics
+    systems.  Products are streamed in batches, so memory use does not grow
+    with the size of the catalog.
+    """
+
+    def __init__(self, product_repository: ProductRepositoryPort):
+        """
+        Initializes the use case with a product repository.
+
+        Args:
+            product_repository (ProductRepositoryPort): The repository for managing product data.
+        """
+        self.product_repository = product_repository
+
+    def export_products(
+        self,
+        batch_size: int = 1000,
+        after_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+    ) -> Iterator[List[Product]]:
+        """
+        Streams products in ascending ID order, one batch at a time.  The
+        repository pages with keyset pagination (ID > last ID seen), so every
+        batch costs the same however deep into the catalog it is, and
+        products written during the export do not shift the pages.
+
+        Args:
+            batch_size (int, optional): How many products to load and yield at once. Defaults to 1000.
+            after_id (Optional[int], optional): Resume after this product ID. Defaults to None.
+            category_id (Optional[int], optional): Only export products of this category. Defaults to None.
+
+        Returns:
+            Iterator[List[Product]]: The batches of products.
+
+        Raises:
+            TypeError: If batch_size is not an integer.
+            ValueError: If batch_size is not positive.
+        """
+        # 1. Validate the request before the first batch is requested.
+        validate_integer(batch_size, min_value=1)
+        products = self.product_repository.iter_all(batch_size=batch_size, after_id=after_id, category_id=category_id)
+
+        # 2. Regroup the stream into batches.
+        def batches() -> Iterator[List[Product]]:
+            while batch := list(islice(products, batch_size)):
+                yield batch
+
+        return batches()
@@ -1,6 +1,7 @@
 from typing import Optional
 from src.domain.models.entities.Category import Category
 from src.application.ports.output.category_repository_port import CategoryRepositoryPort
+from src.application.ports.output.async_category_repository_port import AsyncCategoryRepositoryPort
 
 
 class GetCategoryUseCase:
@@ -28,3 +29,45 @@ class GetCategoryUseCase:
             Optional[Category]: The category object, or None if found.
         """
         return self.category_repository.get_by_id(category_id)
+
+    def get_category_version(self, category_id: int) -> Optional[int]:
+        """
+        Retrieves only the current version of a category, so a client's cached
+        copy can be revalidated without loading the category.
+
+        Args:
+            category_id (int): The ID of the category.
+
+        Returns:
+            Optional[int]: The version, or None if the category does not exist.
+        """
+        return self.category_repository.get_version(category_id)
+
+
+class AsyncGetCategoryUseCase:
+    """
+    Asynchronous variant of GetCategoryUseCase.
+    """
+
+    def __init__(self, category_repository: AsyncCategoryRepositoryPort):
+        """
+        Initializes the use case with an asynchronous category repository.
+
+        Args:
+            category_repository (AsyncCategoryRepositoryPort): The repository for managing category data.
+        """
+        self.category_repository = category_repository
+
+    async def get_category(self, category_id: int) -> Optional[Category]:
+        """
+        Retrieves a category from the repository by its ID.
+        See GetCategoryUseCase.get_category.
+        """
+        return await self.category_repository.get_by_id(category_id)
+
+    async def get_category_version(self, category_id: int) -> Optional[int]:
+        """
+        Retrieves only the current version of a category.
+        See GetCategoryUseCase.get_category_version.
+        """
+        return await self.category_repository.get_version(category_id)
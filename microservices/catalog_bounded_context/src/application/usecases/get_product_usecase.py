@@ -1,6 +1,11 @@
-from typing import Optional
+from typing import List, Optional, Sequence
+from src.application.utils.validation import validate_integer
 from src.domain.models.entities.Product import Product
 from src.application.ports.output.product_repository_port import ProductRepositoryPort  # Import the repository port
+from src.application.ports.output.async_product_repository_port import AsyncProductRepositoryPort
+
+# Most products that can be fetched by ID in one call.
+MAX_PRODUCTS_PER_GET = 250
 
 
 class GetProductUseCase:
@@ -29,3 +34,82 @@ class GetProductUseCase:
             Optional[Product]: The product object, or None if found.
         """
         return self.product_repository.get_by_id(product_id)
+
+    def get_products(self, product_ids: Sequence[int]) -> List[Optional[Product]]:
+        """
+        Retrieves many products by their IDs with a single repository call.
+
+        Args:
+            product_ids (Sequence[int]): The IDs of the products.  Duplicates are allowed.
+
+        Returns:
+            List[Optional[Product]]: The products in the order of product_ids, with None for
+            IDs that do not exist.
+
+        Raises:
+            TypeError: If an ID is not an integer.
+            ValueError: If more than MAX_PRODUCTS_PER_GET IDs are requested.
+        """
+        # 1. Validate the request.
+        if len(product_ids) > MAX_PRODUCTS_PER_GET:
+            raise ValueError(f"At most {MAX_PRODUCTS_PER_GET} products can be fetched at once.")
+        for product_id in product_ids:
+            validate_integer(product_id)
+
+        # 2. Load them in one batch and put them back in request order.
+        products = self.product_repository.get_many(product_ids) if product_ids else {}
+        return [products.get(product_id) for product_id in product_ids]
+
+    def get_product_version(self, product_id: int) -> Optional[int]:
+        """
+        Retrieves only the current version of a product, so a client's cached
+        copy can be revalidated without loading the product.
+
+        Args:
+            product_id (int): The ID of the product.
+
+        Returns:
+            Optional[int]: The version, or None if the product does not exist.
+        """
+        return self.product_repository.get_version(product_id)
+
+
+class AsyncGetProductUseCase:
+    """
+    Asynchronous variant of GetProductUseCase.
+    """
+
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        """
+        Initializes the use case with an asynchronous product repository.
+
+        Args:
+            product_repository (AsyncProductRepositoryPort): The repository for managing product data.
+        """
+        self.product_repository = product_repository
+
+    async def get_product(self, product_id: int) -> Optional[Product]:
+        """
+        Retrieves a product from the repository by its ID.
+        See GetProductUseCase.get_product.
+        """
+        return await self.product_repository.get_by_id(product_id)
+
+    async def get_products(self, product_ids: Sequence[int]) -> List[Optional[Product]]:
+        """
+        Retrieves many products by their IDs with a single repository call.
+        See GetProductUseCase.get_products.
+        """
+        if len(product_ids) > MAX_PRODUCTS_PER_GET:
+            raise ValueError(f"At most {MAX_PRODUCTS_PER_GET} products can be fetched at once.")
+        for product_id in product_ids:
+            validate_integer(product_id)
+        products = await self.product_repository.get_many(product_ids) if product_ids else {}
+        return [products.get(product_id) for product_id in product_ids]
+
+    async def get_product_version(self, product_id: int) -> Optional[int]:
+        """
+        Retrieves only the current version of a product.
+        See GetProductUseCase.get_product_version.
+        """
+        return await self.product_repository.get_version(product_id)
@@ -0,0 +1,168 @@
+from collections import deque
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Any, Callable, Deque, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
+from src.application.ports.output.unit_of_work_port import UnitOfWorkPort
+from src.application.utils.validation import validate_integer
+from src.domain.models.entities.Product import Product
+
+
+class RejectedRecord(NamedTuple):
+    """
+    An input record that did not pass validation.
+    """
+    number: int  # Position of the record in the input, starting at 1.
+    record: Any
+    message: str
+
+
+class ValidatedChunk(NamedTuple):
+    """
+    The outcome of validating one chunk of input records.
+    """
+    products: List[Product]
+    rejected: List[RejectedRecord]
+
+
+class ImportProgress:
+    """
+    Running totals of an import.  position is the number of the last input
+    record whose chunk has been committed, so an import can be resumed from it.
+    """
+
+    def __init__(self, position: int = 0):
+        """
+        Initializes the totals of an import that starts after the given record.
+
+        Args:
+            position (int, optional): The number of records already imported. Defaults to 0.
+        """
+        self.position = position
+        self.imported = 0
+        self.rejected = 0
+
+
+class ImportProductsUseCase:
+    """
+    Use case for loading a large product feed.  Records are validated in
+    chunks, optionally in parallel, and each chunk is stored in its own
+    transaction, so a failure loses at most the chunk in flight.  The
+    position of a named import is stored in the transaction of each chunk,
+    so resuming it never stores a chunk twice.
+    """
+
+    def __init__(self, unit_of_work: UnitOfWorkPort, listeners: Sequence[ProductChangeListenerPort] = ()):
+        """
+        Initializes the use case with a unit of work.
+
+        Args:
+            unit_of_work (UnitOfWorkPort): The transaction over the products and the import positions.
+            listeners (Sequence[ProductChangeListenerPort], optional): Notified after each chunk is committed.
+        """
+        self.unit_of_work = unit_of_work
+        self.listeners = listeners
+
+    def get_position(self, source: str) -> int:
+        """
+        Returns how far an earlier run of a named import got, to resume it.
+
+        Args:
+            source (str): The name the import was run with.
+
+        Returns:
+            int: The number of input records already imported, 0 if no chunk was stored.
+        """
+        return self.unit_of_work.run(lambda unit_of_work: unit_of_work.import_progress.get_position(source))
+
+    def import_products(
+        self,
+        records: Iterable[Any],
+        validate_chunk: Callable[[Sequence[Tuple[int, Any]]], ValidatedChunk],
+        chunk_size: int = 5000,
+        start: int = 0,
+        source: Optional[str] = None,
+        executor: Optional[Executor] = None,
+        max_pending: int = 4,
+        on_chunk: Optional[Callable[[ImportProgress, List[RejectedRecord]], None]] = None,
+    ) -> ImportProgress:
+        """
+        Validates and stores a stream of records, chunk by chunk and in input order.
+
+        Args:
+            records (Iterable[Any]): The raw input records, e.g. CSV rows or NDJSON lines.
+            validate_chunk (Callable[[Sequence[Tuple[int, Any]]], ValidatedChunk]): Turns numbered
+                records into products and rejections.  It must be picklable to run in a process pool.
+            chunk_size (int, optional): Records validated and stored together. Defaults to 5000.
+            start (int, optional): Skip this many records, to resume an import. Defaults to 0.
+            source (Optional[str], optional): Names the import; its position is stored with each
+                chunk, for get_position(). Defaults to None.
+            executor (Optional[Executor], optional): Where chunks are validated; None validates them
+                in the calling thread. Defaults to None.
+            max_pending (int, optional): Chunks submitted to the executor ahead of the one being
+                stored, which bounds memory use. Defaults to 4.
+            on_chunk (Optional[Callable[[ImportProgress, List[RejectedRecord]], None]], optional): Called
+                after each chunk is committed, e.g. to report progress. Defaults to None.
+
+        Returns:
+            ImportProgress: The totals of this run.
+
+        Raises:
+            TypeError: If chunk_size, start or max_pending is not an integer.
+            ValueError: If chunk_size or max_pending is not positive, or start is negative.
+        """
+        # 1. Validate the request.
+        validate_integer(chunk_size, min_value=1)
+        validate_integer(start, min_value=0)
+        validate_integer(max_pending, min_value=1)
+
+        # 2. Cut the input into numbered chunks, skipping what was imported before.
+        numbered = islice(enumerate(records, 1), start, None)
+        chunks = iter(lambda: list(islice(numbered, chunk_size)), [])
+
+        # 3. Store every validated chunk, and the position after it, in its own transaction.
+        progress = ImportProgress(position=start)
+        for position, chunk in self._validate(chunks, validate_chunk, executor, max_pending):
+            if chunk.products or source is not None:
+                self.unit_of_work.run(lambda unit_of_work: self._store(unit_of_work, chunk, source, position))
+            if chunk.products:
+                for listener in self.listeners:
+                    for product in chunk.products:
+                        listener.product_created(product)
+            progress.position = position
+            progress.imported += len(chunk.products)
+            progress.rejected += len(chunk.rejected)
+            if on_chunk is not None:
+                on_chunk(progress, chunk.rejected)
+        return progress
+
+    @staticmethod
+    def _store(unit_of_work: UnitOfWorkPort, chunk: ValidatedChunk, source: Optional[str], position: int) -> None:
+        if chunk.products:
+            unit_of_work.products.add_many(chunk.products)
+        if source is not None:
+            unit_of_work.import_progress.set_position(source, position)
+
+    @staticmethod
+    def _validate(
+        chunks: Iterator[List[Tuple[int, Any]]],
+        validate_chunk: Callable[[Sequence[Tuple[int, Any]]], ValidatedChunk],
+        executor: Optional[Executor],
+        max_pending: int,
+    ) -> Iterator[Tuple[int, ValidatedChunk]]:
+        # Yields (number of the last record, validated chunk) in input order.
+        # Executor.map would read the whole input up front, so chunks are
+        # submitted by hand with at most max_pending in flight.
+        if executor is None:
+            for chunk in chunks:
+                yield chunk[-1][0], validate_chunk(chunk)
+            return
+        pending: Deque = deque()
+        for chunk in chunks:
+            pending.append((chunk[-1][0], executor.submit(validate_chunk, chunk)))
+            if len(pending) > max_pending:
+                position, future = pending.popleft()
+                yield position, future.result()
+        while pending:
+            position, future = pending.popleft()
+            yield position, future.result()
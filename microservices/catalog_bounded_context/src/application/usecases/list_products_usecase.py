@@ -0,0 +1,117 @@
+from typing import Optional, Tuple
+from src.application.ports.output.product_listing_port import ProductListingPort, ProductPage
+from src.application.utils.validation import MAX_STORED_INTEGER, validate_integer
+from src.domain.models.entities.Product import Product
+
+MAX_PAGE_SIZE = 100
+
+# Accepted values of the sort argument: by price, cheapest or most expensive first.
+SORT_PRICE_ASCENDING = "price"
+SORT_PRICE_DESCENDING = "-price"
+
+
+def encode_cursor(product: Product) -> str:
+    """
+    Returns the cursor of the page that follows a product: its price in minor
+    units and its ID, e.g. "69900:3".
+    """
+    return f"{product.price.minor_units}:{product.product_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """
+    Parses a cursor made by encode_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        price_minor_units, product_id = (int(part) for part in cursor.split(":"))
+    except ValueError:
+        raise ValueError(f"Invalid cursor {cursor!r}.") from None
+    if not (0 <= price_minor_units <= MAX_STORED_INTEGER and 0 <= product_id <= MAX_STORED_INTEGER):
+        raise ValueError(f"Invalid cursor {cursor!r}.")
+    return price_minor_units, product_id
+
+
+class ListProductsUseCase:
+    """
+    Use case for browsing products by category and price range, with pagination.
+    Every full page carries a cursor to the next one; following cursors
+    seeks through the index, while page numbers skip the earlier rows.
+    Counting the matches reads all of them, so only pages by number carry
+    the total; a page after a cursor costs the same at any depth.
+    """
+
+    def __init__(self, product_listing: ProductListingPort):
+        """
+        Initializes the use case with a listing port.
+
+        Args:
+            product_listing (ProductListingPort): The (category, price) index over the products.
+        """
+        self.product_listing = product_listing
+
+    def list_products(
+        self,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        sort: str = SORT_PRICE_ASCENDING,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: Optional[str] = None,
+    ) -> ProductPage:
+        """
+        Lists the products of a category and price range, ordered by price.
+
+        Args:
+            category_id (Optional[int], optional): Only list products of this category.
+            min_price (Optional[float], optional): Only list products costing at least this much.
+            max_price (Optional[float], optional): Only list products costing at most this much.
+            sort (str, optional): "price" for cheapest first or "-price" for most expensive first.
+                Defaults to "price".
+            page (int, optional): The page to return, starting at 1. Defaults to 1.
+            page_size (int, optional): The number of products per page, at most 100. Defaults to 20.
+            cursor (Optional[str], optional): The next_cursor of the previous page, instead of a page
+                number. Defaults to None.
+
+        Returns:
+            ProductPage: The products on the page, the total number of matching products (None after
+            a cursor) and the cursor of the next page.
+
+        Raises:
+            TypeError: If page or page_size are not integers.
+            ValueError: If page or page_size is out of range, sort is unknown, min_price exceeds
+                max_price, or the cursor is invalid or combined with a page number.
+        """
+        # 1. Validate the request.
+        # The offset of the page must fit in storage.
+        validate_integer(page, min_value=1, max_value=MAX_STORED_INTEGER // MAX_PAGE_SIZE)
+        validate_integer(page_size, min_value=1, max_value=MAX_PAGE_SIZE)
+        if sort not in (SORT_PRICE_ASCENDING, SORT_PRICE_DESCENDING):
+            raise ValueError(f"Unknown sort order {sort!r}; use 'price' or '-price'.")
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise ValueError("min_price must not be greater than max_price.")
+        after = None
+        if cursor is not None:
+            if page != 1:
+                raise ValueError("Use either a cursor or a page number.")
+            after = decode_cursor(cursor)
+
+        # 2. Read the requested page from the index.
+        result = self.product_listing.list_products(
+            category_id=category_id,
+            min_price=min_price,
+            max_price=max_price,
+            descending=sort == SORT_PRICE_DESCENDING,
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            after=after,
+            count_total=after is None,
+        )
+
+        # 3. Point to the next page while pages are full.
+        if len(result.products) == page_size:
+            result = result._replace(next_cursor=encode_cursor(result.products[-1]))
+        return result
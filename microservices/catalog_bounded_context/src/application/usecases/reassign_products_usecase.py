@@ -0,0 +1,94 @@
+from typing import Callable, Sequence
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
+from src.application.ports.output.unit_of_work_port import UnitOfWorkPort
+from src.application.usecases.bulk_operation_report import BulkOperationReport
+from src.domain.services.product_categorization_service import ProductCategorizationService, ReassignmentResult
+
+
+class ReassignProductsUseCase:
+    """
+    Use case for moving many products between categories at once, e.g.
+    during a merchandising reorganization.  Each call is one unit of work.
+    """
+
+    def __init__(self, unit_of_work: UnitOfWorkPort, listeners: Sequence[ProductChangeListenerPort] = ()):
+        """
+        Initializes the use case with a unit of work.
+
+        Args:
+            unit_of_work (UnitOfWorkPort): The transaction over the product and category repositories.
+            listeners (Sequence[ProductChangeListenerPort], optional): Notified after products are moved.
+        """
+        self.unit_of_work = unit_of_work
+        self.listeners = listeners
+
+    def assign_products_to_category(self, product_ids: Sequence[int], category_id: int) -> BulkOperationReport:
+        """
+        Assigns many products that have no category yet to a category.
+
+        Args:
+            product_ids (Sequence[int]): The IDs of the products to assign.
+            category_id (int): The ID of the category to assign them to.
+
+        Returns:
+            BulkOperationReport: The IDs of the moved products, and an error message per
+            product ID that was not moved.
+
+        Raises:
+            ValueError: If the category does not exist.
+        """
+        return self._reassign(
+            lambda service: service.assign_products_to_category(product_ids, category_id), category_id
+        )
+
+    def move_all(self, from_category_id: int, to_category_id: int) -> BulkOperationReport:
+        """
+        Moves every product of one category to another.
+
+        Args:
+            from_category_id (int): The ID of the category to empty.
+            to_category_id (int): The ID of the category that receives the products.
+
+        Returns:
+            BulkOperationReport: The IDs of the moved products.
+
+        Raises:
+            ValueError: If both IDs are the same or the target category does not exist.
+        """
+        # 1. Check the rules and move the products in one transaction.
+        moved = self.unit_of_work.run(
+            lambda unit_of_work: ProductCategorizationService(unit_of_work.categories, unit_of_work.products)
+            .move_all(from_category_id, to_category_id)
+        )
+
+        # 2. Update derived data such as listing and search indexes.
+        if moved:
+            for listener in self.listeners:
+                listener.category_moved(from_category_id, to_category_id, moved)
+
+        # 3. Report the moved product IDs.
+        report = BulkOperationReport()
+        for product_id in moved:
+            report.add_success(product_id)
+        return report
+
+    def _reassign(
+        self, operation: Callable[[ProductCategorizationService], ReassignmentResult], category_id: int
+    ) -> BulkOperationReport:
+        # 1. Check the rules and move the products in one transaction.
+        result = self.unit_of_work.run(
+            lambda unit_of_work: operation(ProductCategorizationService(unit_of_work.categories, unit_of_work.products))
+        )
+
+        # 2. Update derived data such as listing and search indexes.
+        if result.moved:
+            for listener in self.listeners:
+                listener.products_reassigned(result.moved, category_id)
+
+        # 3. Report the outcome per product ID.
+        report = BulkOperationReport()
+        for product in result.moved:
+            report.add_success(product.product_id)
+        for product_id, message in result.errors.items():
+            report.add_error(product_id, message)
+        return report
@@ -0,0 +1,70 @@
+from typing import Optional
+from src.application.ports.output.product_search_port import ProductSearchPort, ProductSearchResult
+from src.application.utils.validation import MAX_STORED_INTEGER, validate_integer
+
+MAX_PAGE_SIZE = 100
+
+
+class SearchProductsUseCase:
+    """
+    Use case for full-text product search with pagination.
+    """
+
+    def __init__(self, product_search: ProductSearchPort):
+        """
+        Initializes the use case with a search port.
+
+        Args:
+            product_search (ProductSearchPort): The full-text index over the products.
+        """
+        self.product_search = product_search
+
+    def search_products(
+        self,
+        query: str,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> ProductSearchResult:
+        """
+        Searches product names and descriptions, best match first.
+
+        Args:
+            query (str): The words to look for.
+            category_id (Optional[int], optional): Only return products of this category.
+            min_price (Optional[float], optional): Only return products costing at least this much.
+            max_price (Optional[float], optional): Only return products costing at most this much.
+            page (int, optional): The page to return, starting at 1. Defaults to 1.
+            page_size (int, optional): The number of products per page, at most 100. Defaults to 20.
+
+        Returns:
+            ProductSearchResult: The products on the page and the total number of matches.
+
+        Raises:
+            TypeError: If query is not a string or page/page_size are not integers.
+            ValueError: If page or page_size is out of range, or min_price exceeds max_price.
+        """
+        # 1. Validate the request.
+        if not isinstance(query, str):
+            raise TypeError("Query must be a string.")
+        # The offset of the page must fit in storage.
+        validate_integer(page, min_value=1, max_value=MAX_STORED_INTEGER // MAX_PAGE_SIZE)
+        validate_integer(page_size, min_value=1, max_value=MAX_PAGE_SIZE)
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise ValueError("min_price must not be greater than max_price.")
+
+        # 2. Blank queries match nothing.
+        if not query.strip():
+            return ProductSearchResult([], 0)
+
+        # 3. Run the ranked search for the requested page.
+        return self.product_search.search(
+            query,
+            category_id=category_id,
+            min_price=min_price,
+            max_price=max_price,
+            limit=page_size,
+            offset=(page - 1) * page_size,
+        )
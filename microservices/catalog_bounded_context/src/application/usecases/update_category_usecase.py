@@ -1,6 +1,7 @@
 from typing import Optional
 from src.domain.models.entities.Category import Category
 from src.application.ports.output.category_repository_port import CategoryRepositoryPort
+from src.application.ports.output.async_category_repository_port import AsyncCategoryRepositoryPort
 
 
 class UpdateCategoryUseCase:
@@ -50,3 +51,40 @@ class UpdateCategoryUseCase:
 
         # 4. Return the updated category.
         return existing_category
+
+
+class AsyncUpdateCategoryUseCase:
+    """
+    Asynchronous variant of UpdateCategoryUseCase.
+    """
+
+    def __init__(self, category_repository: AsyncCategoryRepositoryPort):
+        """
+        Initializes the use case with an asynchronous category repository.
+
+        Args:
+            category_repository (AsyncCategoryRepositoryPort): The repository for managing category data.
+        """
+        self.category_repository = category_repository
+
+    async def update_category(
+        self,
+        category_id: int,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Category:
+        """
+        Updates an existing category in the repository.
+        See UpdateCategoryUseCase.update_category.
+        """
+        existing_category = await self.category_repository.get_by_id(category_id)
+        if existing_category is None:
+            raise ValueError(f"Category with ID {category_id} not found.")
+
+        if name is not None:
+            existing_category.name = name
+        if description is not None:
+            existing_category.description = description
+
+        await self.category_repository.update(existing_category)
+        return existing_category
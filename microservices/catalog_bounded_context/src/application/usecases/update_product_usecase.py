@@ -1,7 +1,9 @@
-from typing import Optional
+from typing import Optional, Sequence
 from src.domain.models.entities.Product import Product
 from src.domain.models.value_objects.Price import Price
 from src.application.ports.output.product_repository_port import ProductRepositoryPort  # Import the repository port
+from src.application.ports.output.async_product_repository_port import AsyncProductRepositoryPort
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
 
 
 class UpdateProductUseCase:
@@ -10,14 +12,16 @@ class UpdateProductUseCase:
     part of the ProductManagementPort interface.
     """
 
-    def __init__(self, product_repository: ProductRepositoryPort):
+    def __init__(self, product_repository: ProductRepositoryPort, listeners: Sequence[ProductChangeListenerPort] = ()):
         """
         Initializes the use case with a product repository.
 
         Args:
             product_repository (ProductRepositoryPort): The repository for managing product data.
+            listeners (Sequence[ProductChangeListenerPort], optional): Notified after the product is updated.
         """
         self.product_repository = product_repository
+        self.listeners = listeners
 
     def update_product(
         self,
@@ -49,6 +53,7 @@ class UpdateProductUseCase:
         existing_product = self.product_repository.get_by_id(product_id)
         if existing_product is None:
             raise ValueError(f"Product with ID {product_id} not found.")
+        before = existing_product.copy() if self.listeners else None
 
         # 2. Update the product's attributes if new values are provided.
         if name is not None:
@@ -64,6 +69,54 @@ class UpdateProductUseCase:
 
         # 3. Update the product in the repository.
         self.product_repository.update(existing_product) # Changed to update
+        for listener in self.listeners:
+            listener.product_updated(before, existing_product)
 
         # 4. Return the updated product.
         return existing_product
+
+
+class AsyncUpdateProductUseCase:
+    """
+    Asynchronous variant of UpdateProductUseCase.
+    """
+
+    def __init__(self, product_repository: AsyncProductRepositoryPort):
+        """
+        Initializes the use case with an asynchronous product repository.
+
+        Args:
+            product_repository (AsyncProductRepositoryPort): The repository for managing product data.
+        """
+        self.product_repository = product_repository
+
+    async def update_product(
+        self,
+        product_id: int,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        price: Optional[Price] = None,
+        category_id: Optional[int] = None,
+        image_urls: Optional[list[str]] = None,
+    ) -> Product:
+        """
+        Updates an existing product in the repository.
+        See UpdateProductUseCase.update_product.
+        """
+        existing_product = await self.product_repository.get_by_id(product_id)
+        if existing_product is None:
+            raise ValueError(f"Product with ID {product_id} not found.")
+
+        if name is not None:
+            existing_product.name = name
+        if description is not None:
+            existing_product.description = description
+        if price is not None:
+            existing_product.price = price
+        if category_id is not None:
+            existing_product.category_id = category_id
+        if image_urls is not None:
+            existing_product.image_urls = image_urls
+
+        await self.product_repository.update(existing_product)
+        return existing_product
@@ -0,0 +1,39 @@
+import re
+from typing import List
+
+# Longer queries are cut off; they only make the match slower.
+MAX_QUERY_TERMS = 16
+
+# Separates alternatives in a query.  Only the upper-case word is an operator,
+# so "or" typed in lower case is searched for like any other word.
+OR_OPERATOR = "OR"
+
+
+def parse_search_query(query: str) -> List[List[str]]:
+    """
+    Splits a free-text search query into alternatives.
+
+    Words are lower-cased and punctuation is ignored.  A product matches an
+    alternative when it contains every word of it, and matches the query
+    when it matches any alternative.  The last word of the query also
+    matches as a prefix, so partially typed queries find results.
+
+    Args:
+        query (str): The text typed by the user, e.g. "gaming laptop OR notebook".
+
+    Returns:
+        List[List[str]]: The alternatives, each a non-empty list of words.
+        An empty list if the query has no words.
+    """
+    groups: List[List[str]] = [[]]
+    terms = 0
+    for word in re.findall(r"\w+", query):
+        if word == OR_OPERATOR:
+            if groups[-1]:
+                groups.append([])
+            continue
+        if terms == MAX_QUERY_TERMS:
+            break
+        groups[-1].append(word.lower())
+        terms += 1
+    return [group for group in groups if group]
@@ -1,6 +1,10 @@
 import re
 from typing import Optional
 
+# The largest integer storage can hold (a signed 64-bit SQLite INTEGER).  IDs, positions
+# and prices in minor units beyond it cannot exist, and binding them fails.
+MAX_STORED_INTEGER = 2**63 - 1
+
 def validate_string(value: str, min_length: int = 1, max_length: Optional[int] = None, can_be_empty: bool = False) -> None:
     """
     Validates that a value is a string and meets certain length requirements.
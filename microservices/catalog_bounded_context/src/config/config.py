@@ -4,4 +4,22 @@ class Config:
     DEBUG = os.getenv('DEBUG', True)
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./catalog.db')
 
+    # SQLite pragmas applied to every new connection.
+    SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))  # Bytes
+    SQLITE_CACHE_SIZE = int(os.getenv('SQLITE_CACHE_SIZE', -64 * 1024))  # Negative values are KiB
+    SQLITE_TEMP_STORE = os.getenv('SQLITE_TEMP_STORE', 'MEMORY')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))
+
+    # Connection pooling: "queue", "thread" (one connection per thread), "null" or "static".
+    DB_POOL = os.getenv('DB_POOL', 'queue')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 8))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 8))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 30))
+
+    # Statement caches: prepared statements per sqlite3 connection and compiled SQL per engine.
+    SQLITE_CACHED_STATEMENTS = int(os.getenv('SQLITE_CACHED_STATEMENTS', 256))
+    SQL_COMPILED_CACHE_SIZE = int(os.getenv('SQL_COMPILED_CACHE_SIZE', 1000))
+
 config = Config()
@@ -1,10 +1,14 @@
+from typing import Optional
+
 class Category:
-    def __init__(self, category_id: int, name: str, description: str):
+    __slots__ = ("category_id", "name", "description", "version")
+
+    def __init__(self, category_id: Optional[int], name: str, description: str):
         """
         Initializes a new instance of the Category class.
 
         Args:
-            category_id (int): The unique identifier for the category.
+            category_id (Optional[int]): The unique identifier for the category, or None if it has not been stored yet.
             name (str): The name of the category.
             description (str): The description of the category.
 
@@ -12,7 +16,7 @@ class Category:
             TypeError: If category_id is not an integer, or name/description are not strings.
             ValueError: If the name is empty.
         """
-        if not isinstance(category_id, int):
+        if category_id is not None and not isinstance(category_id, int):
             raise TypeError("Category ID must be an integer.")
         if not isinstance(name, str):
             raise TypeError("Category name must be a string.")
@@ -24,6 +28,48 @@ class Category:
         self.category_id = category_id
         self.name = name
         self.description = description
+        # Assigned by the repository, which increments it on every stored change.
+        self.version: Optional[int] = None
+
+    @classmethod
+    def from_storage(cls, category_id: int, name: str, description: str, version: Optional[int] = None) -> "Category":
+        """
+        Rebuilds a Category from persisted data without validating it.
+
+        Only use this for data that was validated when it was written, such as
+        rows loaded by a repository adapter.  Everything else must go through
+        the regular constructor.
+
+        Args:
+            category_id (int): The unique identifier for the category.
+            name (str): The name of the category.
+            description (str): The description of the category.
+            version (Optional[int]): The stored version of the category, if the storage keeps one.
+
+        Returns:
+            Category: The rebuilt category.
+        """
+        category = cls.__new__(cls)
+        category.category_id = category_id
+        category.name = name
+        category.description = description
+        category.version = version
+        return category
+
+    def copy(self) -> "Category":
+        """
+        Returns an independent copy of the category, for example to keep its
+        state from before a change.
+
+        Returns:
+            Category: The copy.
+        """
+        return Category.from_storage(
+            category_id=self.category_id,
+            name=self.name,
+            description=self.description,
+            version=self.version,
+        )
 
     def update_description(self, new_description: str):
         """
@@ -3,12 +3,14 @@ from urllib.parse import urlparse
 from src.domain.models.value_objects.Price import Price
 
 class Product:
-    def __init__(self, product_id: int, name: str, description: str, price: Price, category_id: int, image_urls: Optional[List[str]] = None):
+    __slots__ = ("product_id", "name", "description", "price", "category_id", "image_urls", "version")
+
+    def __init__(self, product_id: Optional[int], name: str, description: str, price: Price, category_id: int, image_urls: Optional[List[str]] = None):
         """
         Initializes a new instance of the Product class.
 
         Args:
-            product_id (int): The unique identifier for the product.
+            product_id (Optional[int]): The unique identifier for the product, or None if it has not been stored yet.
             name (str): The name of the product.
             description (str): The description of the product.
             price (Price): The price of the product.
@@ -19,7 +21,7 @@ class Product:
             TypeError: If product_id, category_id are not integers, or name/description are not strings, or price is not a Price object.
             ValueError: If the name is empty.
         """
-        if not isinstance(product_id, int):
+        if product_id is not None and not isinstance(product_id, int):
             raise TypeError("Product ID must be an integer.")
         if not isinstance(name, str):
             raise TypeError("Product name must be a string.")
@@ -46,6 +48,57 @@ class Product:
         self.price = price
         self.category_id = category_id
         self.image_urls = image_urls if image_urls is not None else []
+        # Assigned by the repository, which increments it on every stored change.
+        self.version: Optional[int] = None
+
+    @classmethod
+    def from_storage(cls, product_id: int, name: str, description: str, price: Price, category_id: int, image_urls: Optional[List[str]] = None, version: Optional[int] = None) -> "Product":
+        """
+        Rebuilds a Product from persisted data without validating it.
+
+        Only use this for data that was validated when it was written, such as
+        rows loaded by a repository adapter.  Everything else must go through
+        the regular constructor.
+
+        Args:
+            product_id (int): The unique identifier for the product.
+            name (str): The name of the product.
+            description (str): The description of the product.
+            price (Price): The price of the product.
+            category_id (int): The ID of the category to which the product belongs.
+            image_urls (Optional[List[str]]): A list of URLs for the product's images.
+            version (Optional[int]): The stored version of the product, if the storage keeps one.
+
+        Returns:
+            Product: The rebuilt product.
+        """
+        product = cls.__new__(cls)
+        product.product_id = product_id
+        product.name = name
+        product.description = description
+        product.price = price
+        product.category_id = category_id
+        product.image_urls = image_urls if image_urls is not None else []
+        product.version = version
+        return product
+
+    def copy(self) -> "Product":
+        """
+        Returns an independent copy of the product, for example to keep its
+        state from before a change.
+
+        Returns:
+            Product: The copy.
+        """
+        return Product.from_storage(
+            product_id=self.product_id,
+            name=self.name,
+            description=self.description,
+            price=self.price,
+            category_id=self.category_id,
+            image_urls=list(self.image_urls),
+            version=self.version,
+        )
 
     def change_price(self, new_price: Price):
         """
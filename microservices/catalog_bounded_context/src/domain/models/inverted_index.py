@@ -0,0 +1,391 @@
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# A word in the name counts as this many words in the description, both for
+# ranking and for the length of the document.
+NAME_WEIGHT = 3
+# BM25 parameters: term frequency saturation and length normalization.
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Upper bound for a document length; lengths are stored as unsigned shorts.
+_MAX_LENGTH = 0xFFFF
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize_term(word: str) -> str:
+    """
+    Reduces a lower-case word to the form stored in the index.  Only plural
+    "s" endings are stripped ("laptops" -> "laptop", but "glass" is kept),
+    which is enough for product names without a full stemmer.
+
+    Args:
+        word (str): A lower-case word.
+
+    Returns:
+        str: The indexed form of the word.
+    """
+    if len(word) > 3 and word[-1] == "s" and word[-2] not in "su":
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits text into lower-case, normalized terms.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        List[str]: The terms, in the order they appear.
+    """
+    return [normalize_term(word) for word in _WORD.findall(text.lower())]
+
+
+def _encode(value: int, out: bytearray) -> None:
+    # Little-endian base-128: seven bits per byte, the high bit marks "more".
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class PostingList:
+    """
+    The documents containing one term, with the term's frequency in each.
+
+    Postings are kept sorted by document ID in a bytearray as varint-encoded
+    (gap to the previous ID, frequency) pairs, so a typical posting takes two
+    bytes instead of two Python ints.  Appending a higher ID is done in place;
+    out-of-order additions and removals are buffered and folded back into
+    the encoded data once the buffers grow.
+    """
+    __slots__ = ("_data", "_last_id", "_size", "_pending", "_removed")
+
+    def __init__(self):
+        self._data = bytearray()
+        self._last_id = 0
+        self._size = 0
+        self._pending: Optional[Dict[int, int]] = None
+        self._removed: Optional[set] = None
+
+    def add(self, doc_id: int, frequency: int) -> None:
+        """
+        Adds a document that is not in the list yet.
+
+        Args:
+            doc_id (int): The document ID, at least 1.
+            frequency (int): How often the term occurs in the document, at least 1.
+        """
+        if doc_id > self._last_id and not self._pending and not self._removed:
+            _encode(doc_id - self._last_id, self._data)
+            _encode(frequency, self._data)
+            self._last_id = doc_id
+        else:
+            if self._pending is None:
+                self._pending = {}
+            self._pending[doc_id] = frequency
+            self._maybe_compact()
+        self._size += 1
+
+    def remove(self, doc_id: int) -> None:
+        """
+        Removes a document that is in the list.
+
+        Args:
+            doc_id (int): The document ID.
+        """
+        if self._pending and doc_id in self._pending:
+            del self._pending[doc_id]
+        else:
+            if self._removed is None:
+                self._removed = set()
+            self._removed.add(doc_id)
+            self._maybe_compact()
+        self._size -= 1
+
+    def _maybe_compact(self) -> None:
+        buffered = len(self._pending or ()) + len(self._removed or ())
+        if buffered > 64 and buffered * 8 > self._size:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Folds the buffered changes into the encoded postings.
+        """
+        if not self._pending and not self._removed:
+            return
+        data, last_id = bytearray(), 0
+        for doc_id, frequency in self:
+            _encode(doc_id - last_id, data)
+            _encode(frequency, data)
+            last_id = doc_id
+        self._data, self._last_id = data, last_id
+        self._pending = self._removed = None
+
+    def _decoded(self) -> Iterator[Tuple[int, int]]:
+        removed = self._removed or ()
+        doc_id = value = shift = 0
+        gap = None
+        for byte in self._data:
+            value |= (byte & 0x7F) << shift
+            if byte & 0x80:
+                shift += 7
+                continue
+            if gap is None:
+                gap = value
+            else:
+                doc_id += gap
+                if doc_id not in removed:
+                    yield doc_id, value
+                gap = None
+            value = shift = 0
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """
+        Yields (document ID, frequency) pairs in ascending ID order.
+        """
+        if not self._pending:
+            return self._decoded()
+        return heapq.merge(self._decoded(), sorted(self._pending.items()))
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the encoded postings, not counting the buffers.
+        """
+        return len(self._data)
+
+
+class InvertedIndex:
+    """
+    In-memory full-text index over documents made of a name and a description.
+
+    Documents are identified by positive integer IDs.  Queries are lists of
+    alternatives (see parse_search_query): a document matches an alternative
+    when it contains every term of it, and the best matches by BM25 are
+    selected with a heap, so ranking k results out of n hits costs
+    O(n log k) rather than a full sort.
+
+    The index is not thread-safe; callers that share it must lock around it.
+    """
+
+    def __init__(self, name_weight: int = NAME_WEIGHT):
+        """
+        Initializes an empty index.
+
+        Args:
+            name_weight (int, optional): How much more a word in the name counts than one in the
+                description. Defaults to NAME_WEIGHT.
+        """
+        self.name_weight = name_weight
+        self._postings: Dict[str, PostingList] = {}
+        self._lengths = array("H")  # Weighted document length by document ID; 0 if absent.
+        self._count = 0
+        self._total_length = 0
+        self._vocabulary: Optional[List[str]] = None  # Sorted terms, rebuilt lazily for prefixes.
+
+    def _frequencies(self, name: str, description: str) -> Dict[str, int]:
+        frequencies: Dict[str, int] = {}
+        for term in tokenize(name):
+            frequencies[term] = frequencies.get(term, 0) + self.name_weight
+        for term in tokenize(description):
+            frequencies[term] = frequencies.get(term, 0) + 1
+        return frequencies
+
+    def add(self, doc_id: int, name: str, description: str) -> None:
+        """
+        Indexes a document.
+
+        Args:
+            doc_id (int): The document ID, at least 1.
+            name (str): The name of the document.
+            description (str): The description of the document.
+
+        Raises:
+            ValueError: If the ID is not positive or the document is already indexed.
+        """
+        if doc_id < 1:
+            raise ValueError("Document IDs must be positive.")
+        if doc_id in self:
+            raise ValueError(f"Document {doc_id} is already indexed.")
+        frequencies = self._frequencies(name, description)
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = PostingList()
+                self._vocabulary = None
+            postings.add(doc_id, frequency)
+        length = max(1, min(sum(frequencies.values()), _MAX_LENGTH))
+        if doc_id >= len(self._lengths):
+            self._lengths.extend(bytes(2 * (doc_id + 1 - len(self._lengths))))
+        self._lengths[doc_id] = length
+        self._count += 1
+        self._total_length += length
+
+    def remove(self, doc_id: int, name: str, description: str) -> None:
+        """
+        Removes a document.  The index keeps no copy of the text, so the caller
+        passes the name and description the document was indexed with.
+
+        Args:
+            doc_id (int): The document ID.
+            name (str): The name the document was indexed with.
+            description (str): The description the document was indexed with.
+
+        Raises:
+            KeyError: If the document is not indexed.
+        """
+        if doc_id not in self:
+            raise KeyError(doc_id)
+        for term in self._frequencies(name, description):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.remove(doc_id)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary = None
+        self._total_length -= self._lengths[doc_id]
+        self._lengths[doc_id] = 0
+        self._count -= 1
+
+    def __contains__(self, doc_id: int) -> bool:
+        return 0 < doc_id < len(self._lengths) and self._lengths[doc_id] != 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        """
+        Removes every document.
+        """
+        self._postings.clear()
+        self._lengths = array("H")
+        self._count = self._total_length = 0
+        self._vocabulary = None
+
+    def compact(self) -> None:
+        """
+        Folds all buffered changes into the encoded posting lists, e.g. after a bulk load.
+        """
+        for postings in self._postings.values():
+            postings.compact()
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the encoded postings and the length table.
+        """
+        postings = sum(postings.nbytes for postings in self._postings.values())
+        return postings + self._lengths.itemsize * len(self._lengths)
+
+    def terms_with_prefix(self, prefix: str) -> List[str]:
+        """
+        Returns the indexed terms starting with a prefix, in sorted order.
+
+        Args:
+            prefix (str): The normalized prefix.
+
+        Returns:
+            List[str]: The matching terms.
+        """
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        terms = []
+        for position in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            if not vocabulary[position].startswith(prefix):
+                break
+            terms.append(vocabulary[position])
+        return terms
+
+    def _score_terms(self, terms: Sequence[str], candidates: Optional[Dict[int, float]]) -> Dict[int, float]:
+        # Scores the documents containing any of the terms, restricted to the
+        # candidates if given, and adds the candidates' previous scores.
+        lengths, count = self._lengths, self._count
+        average_length = self._total_length / count
+        scores: Dict[int, float] = {}
+        for term in terms:
+            postings = self._postings[term]
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings:
+                if candidates is not None and doc_id not in candidates:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / average_length)
+                score = idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+        if candidates is not None:
+            for doc_id in scores:
+                scores[doc_id] += candidates[doc_id]
+        return scores
+
+    def _match_all(self, words: Sequence[str], prefix_last: bool) -> Dict[int, float]:
+        # Each word becomes a list of alternative terms: itself, or every
+        # term it is a prefix of.  Rare words are intersected first.
+        choices = []
+        for position, word in enumerate(words):
+            if prefix_last and position == len(words) - 1:
+                terms = self.terms_with_prefix(word)
+                stem = normalize_term(word)
+                if stem != word and stem in self._postings and stem not in terms:
+                    terms.append(stem)
+            else:
+                term = normalize_term(word)
+                terms = [term] if term in self._postings else []
+            if not terms:
+                return {}
+            choices.append(terms)
+        choices.sort(key=lambda terms: sum(len(self._postings[term]) for term in terms))
+        scores: Optional[Dict[int, float]] = None
+        for terms in choices:
+            scores = self._score_terms(terms, scores)
+            if not scores:
+                return {}
+        return scores
+
+    def search(
+        self,
+        groups: Sequence[Sequence[str]],
+        limit: int = 20,
+        offset: int = 0,
+        accept: Optional[Callable[[int], bool]] = None,
+    ) -> Tuple[List[int], int]:
+        """
+        Finds and ranks the documents matching a query.
+
+        Args:
+            groups (Sequence[Sequence[str]]): The alternatives of the query, each a list of
+                lower-case words that must all match.  The last word of the last alternative
+                also matches as a prefix.
+            limit (int, optional): The most document IDs to return. Defaults to 20.
+            offset (int, optional): How many of the best matches to skip. Defaults to 0.
+            accept (Optional[Callable[[int], bool]], optional): A filter on document IDs, applied
+                before ranking and counting.
+
+        Returns:
+            Tuple[List[int], int]: The IDs of the requested page of matches, best first, and
+            the total number of matches.
+        """
+        if not self._count:
+            return [], 0
+        scores: Dict[int, float] = {}
+        for position, words in enumerate(groups):
+            if not words:
+                continue
+            matched = self._match_all(words, prefix_last=position == len(groups) - 1)
+            for doc_id, score in matched.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+        hits = scores.items()
+        if accept is not None:
+            hits = [(doc_id, score) for doc_id, score in hits if accept(doc_id)]
+        best = heapq.nsmallest(offset + limit, hits, key=lambda hit: (-hit[1], hit[0]))
+        return [doc_id for doc_id, _ in best[offset:]], len(hits)
@@ -0,0 +1,165 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Each entry is one unsigned 64-bit key: the price in the high bits and the
+# product ID in the low bits, so sorting keys sorts by price, then by ID.
+_ID_BITS = 32
+_ID_MASK = (1 << _ID_BITS) - 1
+_MAX_PRICE = (1 << (64 - _ID_BITS)) - 1
+
+
+def _key(product_id: int, price_minor_units: int) -> int:
+    if not 0 <= product_id <= _ID_MASK:
+        raise ValueError(f"Product ID {product_id} is out of range for the price index.")
+    if not 0 <= price_minor_units <= _MAX_PRICE:
+        raise ValueError(f"Price {price_minor_units} is out of range for the price index.")
+    return (price_minor_units << _ID_BITS) | product_id
+
+
+class PriceIndex:
+    """
+    Products ordered by price, per category and over the whole catalog.
+
+    Each list is a sorted array of packed (price, product ID) keys, so a
+    price range is found with two binary searches: counting the matches
+    costs O(log n) and a page of k products O(log n + k), wherever the page
+    is.  Inserting and removing move the tail of one array, which is a fast
+    memmove even for large categories.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[int, int, int]] = ()):
+        """
+        Initializes the index.
+
+        Args:
+            entries (Iterable[Tuple[int, int, int]], optional): (product ID, category ID, price in
+                minor units) triples to start with.
+        """
+        self._by_category: Dict[int, array] = {}
+        keys_by_category: Dict[int, List[int]] = {}
+        keys = []
+        for product_id, category_id, price_minor_units in entries:
+            key = _key(product_id, price_minor_units)
+            keys.append(key)
+            keys_by_category.setdefault(category_id, []).append(key)
+        # Sorting once is much faster than inserting one by one.
+        self._all = array("Q", sorted(keys))
+        for category_id, category_keys in keys_by_category.items():
+            self._by_category[category_id] = array("Q", sorted(category_keys))
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def add(self, product_id: int, category_id: int, price_minor_units: int) -> None:
+        """
+        Adds a product.
+
+        Args:
+            product_id (int): The ID of the product.
+            category_id (int): The category of the product.
+            price_minor_units (int): The price of the product, in minor units.
+
+        Raises:
+            ValueError: If the ID or the price does not fit in the index.
+        """
+        key = _key(product_id, price_minor_units)
+        insort(self._all, key)
+        insort(self._by_category.setdefault(category_id, array("Q")), key)
+
+    def remove(self, product_id: int, category_id: int, price_minor_units: int) -> None:
+        """
+        Removes a product, as it was added.
+
+        Args:
+            product_id (int): The ID of the product.
+            category_id (int): The category the product was added with.
+            price_minor_units (int): The price the product was added with.
+
+        Raises:
+            KeyError: If the product is not in the index with this category and price.
+        """
+        key = _key(product_id, price_minor_units)
+        keys = self._by_category.get(category_id)
+        if keys is None or not _discard(keys, key):
+            raise KeyError(product_id)
+        if not keys:
+            del self._by_category[category_id]
+        _discard(self._all, key)
+
+    def move_category(self, from_category_id: int, to_category_id: int) -> None:
+        """
+        Moves every product of one category to another.  The prices do not
+        change, so only the two category lists are merged.
+
+        Args:
+            from_category_id (int): The ID of the category to empty.
+            to_category_id (int): The ID of the category that receives the products.
+        """
+        moved = self._by_category.pop(from_category_id, None)
+        if moved is None:
+            return
+        keys = self._by_category.get(to_category_id)
+        # Both arrays are sorted, which the sort detects as two runs and merges in linear time.
+        self._by_category[to_category_id] = array("Q", sorted(keys + moved)) if keys else moved
+
+    def select(
+        self,
+        category_id: Optional[int] = None,
+        min_price_minor_units: Optional[int] = None,
+        max_price_minor_units: Optional[int] = None,
+        descending: bool = False,
+        limit: int = 20,
+        offset: int = 0,
+        after: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[List[int], int]:
+        """
+        Returns a page of the products in a category and price range, ordered by price.
+
+        Args:
+            category_id (Optional[int], optional): Only products of this category.
+            min_price_minor_units (Optional[int], optional): The lowest price, inclusive.
+            max_price_minor_units (Optional[int], optional): The highest price, inclusive.
+            descending (bool, optional): Most expensive first. Defaults to False.
+            limit (int, optional): The most product IDs to return. Defaults to 20.
+            offset (int, optional): How many products to skip. Defaults to 0.
+            after (Optional[Tuple[int, int]], optional): Start after this (price in minor units,
+                product ID) position, in the direction of the listing. Defaults to None.
+
+        Returns:
+            Tuple[List[int], int]: The product IDs of the page and the total number of matches.
+        """
+        keys = self._all if category_id is None else self._by_category.get(category_id)
+        if not keys:
+            return [], 0
+        low = 0
+        if min_price_minor_units is not None:
+            low = bisect_left(keys, max(min_price_minor_units, 0) << _ID_BITS)
+        high = len(keys)
+        if max_price_minor_units is not None:
+            if max_price_minor_units < 0:
+                return [], 0
+            high = bisect_left(keys, min(max_price_minor_units + 1, _MAX_PRICE + 1) << _ID_BITS)
+        total = max(high - low, 0)
+        if after is not None:
+            price_minor_units, product_id = after
+            key = _key(product_id, price_minor_units)
+            if descending:
+                high = min(high, bisect_left(keys, key))
+            else:
+                low = max(low, bisect_right(keys, key))
+        if descending:
+            stop = max(high - offset, low)
+            page = keys[max(stop - limit, low):stop][::-1]
+        else:
+            start = min(low + offset, high)
+            page = keys[start:min(start + limit, high)]
+        return [key & _ID_MASK for key in page], total
+
+
+def _discard(keys: array, key: int) -> bool:
+    position = bisect_left(keys, key)
+    if position < len(keys) and keys[position] == key:
+        del keys[position]
+        return True
+    return False
@@ -0,0 +1,542 @@
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import MINOR_UNITS_PER_MAJOR, Price, to_minor_units
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only where NumPy is not installed
+    np = None
+
+# Image URLs of one product are pooled as a single string joined with this separator.
+_IMAGE_URL_SEPARATOR = "\n"
+
+
+class StringPool:
+    """
+    Interns strings and hands out compact integer references to them, so that
+    repeated values (names, descriptions, currencies) are stored only once.
+    """
+    __slots__ = ("_strings", "_refs")
+
+    def __init__(self):
+        self._strings: List[str] = []
+        self._refs: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        """
+        Returns the reference for a string, adding it to the pool if needed.
+
+        Args:
+            value (str): The string to intern.
+
+        Returns:
+            int: The reference of the string in the pool.
+        """
+        ref = self._refs.get(value)
+        if ref is None:
+            ref = len(self._strings)
+            self._strings.append(value)
+            self._refs[value] = ref
+        return ref
+
+    def __getitem__(self, ref: int) -> str:
+        return self._strings[ref]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+class PriceSummary(NamedTuple):
+    """
+    Aggregate of a set of prices, in minor units.
+    """
+    count: int
+    min_minor_units: Optional[int]
+    max_minor_units: Optional[int]
+    total_minor_units: int
+
+    @property
+    def average(self) -> Optional[float]:
+        """The average price in major units, or None for an empty set."""
+        if self.count == 0:
+            return None
+        return self.total_minor_units / self.count / MINOR_UNITS_PER_MAJOR
+
+
+class ProductTable:
+    """
+    Columnar (struct-of-arrays) in-memory store for products.
+
+    Each attribute is kept in its own typed array, and strings are interned in
+    pools, so a row costs a few dozen bytes instead of a full Product object.
+    Rows are kept sorted by product ID; Product entities are only built when a
+    row is accessed.  Deleted rows are tombstoned and reclaimed by compact().
+    Versions are drawn from one counter for the whole table and assigned IDs
+    are never handed out twice, so an (ID, version) pair identifies the
+    contents of a row even across deletes.
+
+    Prices are assumed to share one currency for filtering and aggregation.
+    """
+
+    def __init__(self, products: Optional[Iterable[Product]] = None):
+        """
+        Initializes a new, optionally pre-populated, product table.
+
+        Args:
+            products (Optional[Iterable[Product]]): Products to load into the table.
+        """
+        self._ids = array("q")
+        self._category_ids = array("q")
+        self._price_minor_units = array("q")
+        self._currencies = array("H")
+        self._names = array("I")
+        self._descriptions = array("I")
+        self._image_urls = array("I")
+        self._versions = array("q")  # Set from a table-wide counter by every change of the row.
+        self._alive = array("b")
+        self._live_count = 0
+        # Never decrease, so that a deleted product's ID and versions are not handed out again.
+        self._last_id = 0
+        self._last_version = 0
+
+        self._currency_pool = StringPool()
+        self._text_pool = StringPool()
+
+        if products is not None:
+            self.extend(products)
+
+    # --- Row access ---
+
+    def __len__(self) -> int:
+        return self._live_count
+
+    def __contains__(self, product_id: int) -> bool:
+        return self._row_of(product_id) is not None
+
+    def __iter__(self) -> Iterator[Product]:
+        alive = self._alive
+        for row in range(len(self._ids)):
+            if alive[row]:
+                yield self._materialize(row)
+
+    def get(self, product_id: int) -> Optional[Product]:
+        """
+        Retrieves a product by its ID.
+
+        Args:
+            product_id (int): The ID of the product.
+
+        Returns:
+            Optional[Product]: The product, or None if it is not in the table.
+        """
+        row = self._row_of(product_id)
+        if row is None:
+            return None
+        return self._materialize(row)
+
+    def version(self, product_id: int) -> Optional[int]:
+        """
+        Returns the version of a product without materializing it.
+
+        Args:
+            product_id (int): The ID of the product.
+
+        Returns:
+            Optional[int]: The version, or None if the product is not in the table.
+        """
+        row = self._row_of(product_id)
+        return self._versions[row] if row is not None else None
+
+    def iter_products(
+        self,
+        after_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        batch_size: int = 500,
+    ) -> Iterator[Product]:
+        """
+        Streams the matching products in ascending ID order.
+
+        Unlike a ProductSelection this is safe to use while the table is being
+        modified: every batch resumes after the last ID seen, like keyset
+        pagination in a database.
+
+        Args:
+            after_id (Optional[int], optional): Only products with a greater ID. Defaults to None.
+            category_id (Optional[int], optional): Only products in this category. Defaults to None.
+            min_price (Optional[float], optional): Only products priced at or above this amount. Defaults to None.
+            max_price (Optional[float], optional): Only products priced at or below this amount. Defaults to None.
+            batch_size (int, optional): How many rows to scan between re-positionings. Defaults to 500.
+
+        Returns:
+            Iterator[Product]: The matching products.
+        """
+        min_minor = to_minor_units(min_price) if min_price is not None else None
+        max_minor = to_minor_units(max_price) if max_price is not None else None
+        last_id = after_id
+        while True:
+            ids = self._ids
+            start = 0 if last_id is None else bisect_left(ids, last_id + 1)
+            end = min(start + batch_size, len(ids))
+            if start >= end:
+                return
+            batch = []
+            for row in range(start, end):
+                if not self._alive[row]:
+                    continue
+                if category_id is not None and self._category_ids[row] != category_id:
+                    continue
+                price = self._price_minor_units[row]
+                if (min_minor is not None and price < min_minor) or (max_minor is not None and price > max_minor):
+                    continue
+                batch.append(self._materialize(row))
+            last_id = ids[end - 1]
+            yield from batch
+
+    def product_ids(self) -> List[int]:
+        """
+        Returns the IDs of all products in the table, in ascending order.
+        """
+        return [product_id for product_id, alive in zip(self._ids, self._alive) if alive]
+
+    # --- Mutation ---
+
+    def add(self, product: Product) -> None:
+        """
+        Adds a product to the table, assigning the next free ID if it has none.
+
+        Args:
+            product (Product): The product to add.
+
+        Raises:
+            ValueError: If a product with the same ID is already in the table.
+        """
+        if product.product_id is None:
+            product.product_id = self._last_id + 1
+        self._insert(product)
+
+    def extend(self, products: Iterable[Product]) -> None:
+        """
+        Adds many products to the table.
+
+        Args:
+            products (Iterable[Product]): The products to add.
+        """
+        for product in products:
+            self.add(product)
+
+    def update(self, product: Product) -> None:
+        """
+        Replaces the stored values of an existing product.
+
+        Args:
+            product (Product): The product with its new values.
+
+        Raises:
+            ValueError: If the product is not in the table.
+        """
+        row = self._row_of(product.product_id)
+        if row is None:
+            raise ValueError(f"Product with ID {product.product_id} not found.")
+        self._write_row(row, product)
+        self._versions[row] = product.version = self._next_version()
+
+    def set_category(self, product_ids: Iterable[int], category_id: int) -> List[int]:
+        """
+        Moves many products to a category by writing the category column only.
+
+        Args:
+            product_ids (Iterable[int]): The IDs of the products to move.
+            category_id (int): The ID of the new category.
+
+        Returns:
+            List[int]: The IDs that are not in the table.
+        """
+        missing = []
+        for product_id in product_ids:
+            row = self._row_of(product_id)
+            if row is None:
+                missing.append(product_id)
+            else:
+                self._category_ids[row] = category_id
+                self._versions[row] = self._next_version()
+        return missing
+
+    def move_category(self, from_category_id: int, to_category_id: int) -> List[int]:
+        """
+        Moves every product of one category to another by writing the category column only.
+
+        Args:
+            from_category_id (int): The ID of the category to empty.
+            to_category_id (int): The ID of the category that receives the products.
+
+        Returns:
+            List[int]: The IDs of the moved products.
+        """
+        if from_category_id == to_category_id:
+            return []
+        moved = []
+        for row in self.filter(category_id=from_category_id)._rows:
+            row = int(row)
+            self._category_ids[row] = to_category_id
+            self._versions[row] = self._next_version()
+            moved.append(self._ids[row])
+        return moved
+
+    def delete(self, product_id: int) -> None:
+        """
+        Removes a product from the table.
+
+        Args:
+            product_id (int): The ID of the product to remove.
+
+        Raises:
+            ValueError: If the product is not in the table.
+        """
+        row = self._row_of(product_id)
+        if row is None:
+            raise ValueError(f"Product with ID {product_id} not found.")
+        self._alive[row] = 0
+        self._live_count -= 1
+        if self._live_count < len(self._ids) // 2:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Drops tombstoned rows so their space can be reused.
+        """
+        live_rows = [row for row, alive in enumerate(self._alive) if alive]
+        if len(live_rows) == len(self._ids):
+            return
+        for name in ("_ids", "_category_ids", "_price_minor_units", "_currencies",
+                     "_names", "_descriptions", "_image_urls", "_versions"):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, [column[row] for row in live_rows]))
+        self._alive = array("b", [1]) * len(live_rows)
+
+    # --- Vectorized queries ---
+
+    def filter(
+        self,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> "ProductSelection":
+        """
+        Selects the products matching all of the given criteria.
+
+        Args:
+            category_id (Optional[int], optional): Only products in this category. Defaults to None.
+            min_price (Optional[float], optional): Only products priced at or above this amount. Defaults to None.
+            max_price (Optional[float], optional): Only products priced at or below this amount. Defaults to None.
+
+        Returns:
+            ProductSelection: The matching rows, in product ID order.
+        """
+        min_minor = to_minor_units(min_price) if min_price is not None else None
+        max_minor = to_minor_units(max_price) if max_price is not None else None
+
+        if np is not None:
+            mask = np.frombuffer(self._alive, dtype=np.int8).astype(bool)
+            if category_id is not None:
+                mask &= np.frombuffer(self._category_ids, dtype=np.int64) == category_id
+            if min_minor is not None or max_minor is not None:
+                prices = np.frombuffer(self._price_minor_units, dtype=np.int64)
+                if min_minor is not None:
+                    mask &= prices >= min_minor
+                if max_minor is not None:
+                    mask &= prices <= max_minor
+            return ProductSelection(self, np.flatnonzero(mask))
+
+        rows = []
+        for row, (alive, row_category_id, price) in enumerate(zip(self._alive, self._category_ids, self._price_minor_units)):
+            if not alive:
+                continue
+            if category_id is not None and row_category_id != category_id:
+                continue
+            if min_minor is not None and price < min_minor:
+                continue
+            if max_minor is not None and price > max_minor:
+                continue
+            rows.append(row)
+        return ProductSelection(self, rows)
+
+    def all(self) -> "ProductSelection":
+        """
+        Selects every product in the table.
+        """
+        return self.filter()
+
+    def summarize_by_category(self) -> Dict[int, PriceSummary]:
+        """
+        Aggregates product count and min/max/total price per category.
+
+        Returns:
+            Dict[int, PriceSummary]: The price summary of every non-empty category.
+        """
+        if np is not None:
+            alive = np.frombuffer(self._alive, dtype=np.int8).astype(bool)
+            categories = np.frombuffer(self._category_ids, dtype=np.int64)[alive]
+            prices = np.frombuffer(self._price_minor_units, dtype=np.int64)[alive]
+            if categories.size == 0:
+                return {}
+            order = np.lexsort((prices, categories))
+            categories, prices = categories[order], prices[order]
+            starts = np.flatnonzero(np.r_[True, categories[1:] != categories[:-1]])
+            ends = np.r_[starts[1:], categories.size]
+            totals = np.add.reduceat(prices, starts)
+            return {
+                category_id: PriceSummary(count, min_price, max_price, total)
+                for category_id, count, min_price, max_price, total in zip(
+                    categories[starts].tolist(),
+                    (ends - starts).tolist(),
+                    prices[starts].tolist(),
+                    prices[ends - 1].tolist(),
+                    totals.tolist(),
+                )
+            }
+
+        summaries: Dict[int, PriceSummary] = {}
+        for alive, category_id, price in zip(self._alive, self._category_ids, self._price_minor_units):
+            if not alive:
+                continue
+            summary = summaries.get(category_id)
+            if summary is None:
+                summaries[category_id] = PriceSummary(1, price, price, price)
+            else:
+                summaries[category_id] = PriceSummary(
+                    summary.count + 1,
+                    min(summary.min_minor_units, price),
+                    max(summary.max_minor_units, price),
+                    summary.total_minor_units + price,
+                )
+        return summaries
+
+    # --- Internals ---
+
+    def _row_of(self, product_id: Optional[int]) -> Optional[int]:
+        if product_id is None:
+            return None
+        ids = self._ids
+        row = bisect_left(ids, product_id)
+        if row < len(ids) and ids[row] == product_id and self._alive[row]:
+            return row
+        return None
+
+    def _insert(self, product: Product) -> None:
+        ids = self._ids
+        product_id = product.product_id
+        if not ids or product_id > ids[-1]:
+            # Fast path: IDs are normally assigned in ascending order.
+            for column in (ids, self._category_ids, self._price_minor_units, self._currencies,
+                           self._names, self._descriptions, self._image_urls, self._versions):
+                column.append(0)
+            self._alive.append(1)
+            row = len(ids) - 1
+        else:
+            row = bisect_left(ids, product_id)
+            if row < len(ids) and ids[row] == product_id:
+                if self._alive[row]:
+                    raise ValueError(f"Product with ID {product_id} already exists.")
+                self._alive[row] = 1
+            else:
+                for column in (ids, self._category_ids, self._price_minor_units, self._currencies,
+                               self._names, self._descriptions, self._image_urls, self._versions):
+                    column.insert(row, 0)
+                self._alive.insert(row, 1)
+        self._write_row(row, product)
+        self._versions[row] = product.version = self._next_version()
+        self._last_id = max(self._last_id, product_id)
+        self._live_count += 1
+
+    def _next_version(self) -> int:
+        self._last_version += 1
+        return self._last_version
+
+    def _write_row(self, row: int, product: Product) -> None:
+        self._ids[row] = product.product_id
+        self._category_ids[row] = product.category_id
+        self._price_minor_units[row] = product.price.minor_units
+        self._currencies[row] = self._currency_pool.intern(product.price.currency)
+        self._names[row] = self._text_pool.intern(product.name)
+        self._descriptions[row] = self._text_pool.intern(product.description)
+        self._image_urls[row] = self._text_pool.intern(_IMAGE_URL_SEPARATOR.join(product.image_urls or ()))
+
+    def _materialize(self, row: int) -> Product:
+        image_urls = self._text_pool[self._image_urls[row]]
+        return Product.from_storage(
+            product_id=self._ids[row],
+            name=self._text_pool[self._names[row]],
+            description=self._text_pool[self._descriptions[row]],
+            price=Price.from_minor_units(self._price_minor_units[row], self._currency_pool[self._currencies[row]]),
+            category_id=self._category_ids[row],
+            image_urls=image_urls.split(_IMAGE_URL_SEPARATOR) if image_urls else None,
+            version=self._versions[row],
+        )
+
+
+class ProductSelection:
+    """
+    An ordered set of rows of a ProductTable.  Products are materialized only
+    when iterated or indexed.  A selection is a snapshot of row positions and
+    must not be used after the table has been modified.
+    """
+
+    def __init__(self, table: ProductTable, rows: Sequence[int]):
+        self._table = table
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[Product]:
+        materialize = self._table._materialize
+        for row in self._rows:
+            yield materialize(int(row))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ProductSelection(self._table, self._rows[index])
+        return self._table._materialize(int(self._rows[index]))
+
+    def product_ids(self) -> List[int]:
+        """
+        Returns the IDs of the selected products, in selection order.
+        """
+        ids = self._table._ids
+        return [ids[int(row)] for row in self._rows]
+
+    def sort_by_price(self, descending: bool = False) -> "ProductSelection":
+        """
+        Orders the selection by price; ties keep their current order.
+
+        Args:
+            descending (bool, optional): Sort from most to least expensive. Defaults to False.
+
+        Returns:
+            ProductSelection: A new, sorted selection.
+        """
+        prices = self._table._price_minor_units
+        if np is not None:
+            rows = np.asarray(self._rows, dtype=np.int64)
+            keys = np.frombuffer(prices, dtype=np.int64)[rows]
+            if descending:
+                keys = -keys
+            return ProductSelection(self._table, rows[np.argsort(keys, kind="stable")])
+        return ProductSelection(self._table, sorted(self._rows, key=prices.__getitem__, reverse=descending))
+
+    def price_summary(self) -> PriceSummary:
+        """
+        Aggregates the count and min/max/total price of the selection.
+        """
+        if len(self._rows) == 0:
+            return PriceSummary(0, None, None, 0)
+        prices = self._table._price_minor_units
+        if np is not None:
+            selected = np.frombuffer(prices, dtype=np.int64)[np.asarray(self._rows, dtype=np.int64)]
+            return PriceSummary(int(selected.size), int(selected.min()), int(selected.max()), int(selected.sum()))
+        selected = [prices[row] for row in self._rows]
+        return PriceSummary(len(selected), min(selected), max(selected), sum(selected))
@@ -1,10 +1,33 @@
+import sys
 from typing import Optional
 from src.domain.models.value_objects.Value_Object import ValueObject  # Import the ValueObject base class
 
+# Prices are stored as an integer number of minor units (e.g. cents).
+MINOR_UNITS_PER_MAJOR = 100
+
+
+def to_minor_units(amount: float) -> int:
+    """
+    Converts an amount in major units (e.g. 19.99) to integer minor units (e.g. 1999).
+
+    Args:
+        amount (float): The amount in major units.
+
+    Returns:
+        int: The amount rounded to the nearest minor unit.
+    """
+    return round(amount * MINOR_UNITS_PER_MAJOR)
+
+
 class Price(ValueObject):
     """
     Represents a price with an amount and currency.
+
+    The amount is kept as integer minor units, so arithmetic is exact and two
+    prices are equal whenever they round to the same number of cents.
     """
+    __slots__ = ("_minor_units", "_currency", "_hash")
+
     def __init__(self, amount: float, currency: str = "USD"):
         """
         Initializes a new instance of the Price class.
@@ -24,8 +47,60 @@ class Price(ValueObject):
         if not isinstance(currency, str):
             raise TypeError("Currency must be a string.")
 
-        self.amount = amount
-        self.currency = currency
+        self._minor_units = to_minor_units(amount)
+        self._currency = sys.intern(currency)
+        self._hash = hash((self._minor_units, self._currency))
+
+    @classmethod
+    def from_minor_units(cls, minor_units: int, currency: str = "USD") -> "Price":
+        """
+        Creates a Price from an integer amount of minor units.
+
+        Args:
+            minor_units (int): The amount in minor units (e.g. cents).
+            currency (str, optional): The currency of the price (default: "USD").
+
+        Returns:
+            Price: The new Price object.
+
+        Raises:
+            TypeError: If minor_units is not an integer, or currency is not a string.
+            ValueError: If minor_units is negative.
+        """
+        if not isinstance(minor_units, int):
+            raise TypeError("Minor units must be an integer.")
+        if minor_units < 0:
+            raise ValueError("Amount cannot be negative.")
+        if not isinstance(currency, str):
+            raise TypeError("Currency must be a string.")
+        return cls._trusted(minor_units, sys.intern(currency))
+
+    @classmethod
+    def _trusted(cls, minor_units: int, currency: str) -> "Price":
+        """
+        Builds a Price without validation.  Only for values that are already
+        known to be valid, such as the result of arithmetic on two Prices.
+        """
+        price = object.__new__(cls)
+        price._minor_units = minor_units
+        price._currency = currency
+        price._hash = hash((minor_units, currency))
+        return price
+
+    @property
+    def amount(self) -> float:
+        """The amount of the price in major units."""
+        return self._minor_units / MINOR_UNITS_PER_MAJOR
+
+    @property
+    def minor_units(self) -> int:
+        """The amount of the price in minor units."""
+        return self._minor_units
+
+    @property
+    def currency(self) -> str:
+        """The currency of the price."""
+        return self._currency
 
     def add(self, other: "Price") -> "Price":
         """
@@ -43,9 +118,9 @@ class Price(ValueObject):
         """
         if not isinstance(other, Price):
             raise TypeError("Other must be a Price object.")
-        if self.currency != other.currency:
+        if self._currency != other._currency:
             raise ValueError("Currencies must match for addition.")
-        return Price(amount=self.amount + other.amount, currency=self.currency)
+        return Price._trusted(self._minor_units + other._minor_units, self._currency)
 
     def subtract(self, other: "Price") -> "Price":
         """
@@ -63,12 +138,20 @@ class Price(ValueObject):
         """
         if not isinstance(other, Price):
             raise TypeError("Other must be a Price object.")
-        if self.currency != other.currency:
+        if self._currency != other._currency:
             raise ValueError("Currencies must match for subtraction.")
-        result_amount = self.amount - other.amount
-        if result_amount < 0:
+        result_minor_units = self._minor_units - other._minor_units
+        if result_minor_units < 0:
             raise ValueError("Resulting amount cannot be negative.")
-        return Price(amount=result_amount, currency=self.currency)
+        return Price._trusted(result_minor_units, self._currency)
+
+    def __eq__(self, other):
+        if other is None or type(self) != type(other):
+            return False
+        return self._minor_units == other._minor_units and self._currency == other._currency
+
+    def __hash__(self):
+        return self._hash
 
     def __repr__(self):
         return f"Price(amount={self.amount}, currency='{self.currency}')"
@@ -1,11 +1,15 @@
 class ValueObject:
     """
     Base class for value objects.  Provides equality based on attributes.
+
+    Subclasses that declare __slots__ must override __eq__ and __hash__.
     """
+    __slots__ = ()
+
     def __eq__(self, other):
         if other is None or type(self) != type(other):
             return False
         return self.__dict__ == other.__dict__
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
\ No newline at end of file
+        return hash(tuple(sorted(self.__dict__.items())))
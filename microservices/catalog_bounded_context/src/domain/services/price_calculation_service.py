@@ -2,8 +2,17 @@ from src.domain.models.entities.Product import Product
 from src.domain.models.entities.Category import Category
 # Assuming we have a Customer entity
 # from entities.customer import Customer
-from domain.models.value_objects.Price import Price
-from typing import Optional
+from src.domain.models.value_objects.Price import MINOR_UNITS_PER_MAJOR, Price
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only where NumPy is not installed
+    np = None
+
+# Quantity discount rule shared by the scalar and the batch pricing paths.
+BULK_QUANTITY_THRESHOLD = 10
+BULK_DISCOUNT_RATE = 0.1
 
 class PriceCalculationService:
     """
@@ -26,8 +35,8 @@ class PriceCalculationService:
         final_price: Price = base_price
 
         # 2. Apply quantity discounts.
-        if quantity > 10:
-            final_price = final_price.subtract(Price(amount=base_price.amount * 0.1))  # 10% discount
+        if quantity > BULK_QUANTITY_THRESHOLD:
+            final_price = final_price.subtract(Price(amount=base_price.amount * BULK_DISCOUNT_RATE, currency=base_price.currency))  # 10% discount
 
         # 3. Apply customer-specific discounts.
         # customer_discount = customer.get_discount()  # Example:  Customer has a get_discount() method.
@@ -40,4 +49,69 @@ class PriceCalculationService:
         # 5.  Ensure the final price is not negative
         if final_price.amount < 0:
             final_price = Price(amount = 0)
-        return final_price
\ No newline at end of file
+        return final_price
+
+    def calculate_final_prices(self, products: Sequence[Product], quantities: Sequence[int]) -> List[Price]:
+        """
+        Calculates the final prices of many (product, quantity) lines in one pass.
+
+        Produces the same results as calling calculate_final_price for every line,
+        but applies the discount rules to whole arrays of amounts and quantities
+        instead of building intermediate Price objects per line.
+
+        Args:
+            products (Sequence[Product]): The products to price.
+            quantities (Sequence[int]): The quantity purchased for each product, in the same order.
+
+        Returns:
+            List[Price]: The final price of every line, in input order.
+
+        Raises:
+            ValueError: If products and quantities do not have the same length.
+        """
+        if len(products) != len(quantities):
+            raise ValueError("Products and quantities must have the same length.")
+        if np is None:
+            return [self.calculate_final_price(product, quantity) for product, quantity in zip(products, quantities)]
+
+        minor_units = np.fromiter((product.price.minor_units for product in products), dtype=np.int64, count=len(products))
+        final_minor_units = self.calculate_final_minor_units(minor_units, quantities)
+
+        # Lines whose amount did not change keep the product's own Price, as in the scalar path.
+        changed = (final_minor_units != minor_units).tolist()
+        return [
+            Price._trusted(amount, product.price.currency) if is_changed else product.price
+            for amount, is_changed, product in zip(final_minor_units.tolist(), changed, products)
+        ]
+
+    def calculate_final_minor_units(self, minor_units, quantities):
+        """
+        Applies the pricing rules to arrays of base prices and quantities.
+
+        This is the vectorized core of calculate_final_prices, exposed for callers
+        that already hold prices as arrays (e.g. a whole-catalog repricing job).
+        Discounts are rounded to whole minor units exactly as Price does.
+
+        Args:
+            minor_units (numpy.ndarray): The base price of every line, in minor units.
+            quantities (numpy.ndarray): The quantity purchased for every line.
+
+        Returns:
+            numpy.ndarray: The final price of every line, in minor units (int64).
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        if np is None:
+            raise RuntimeError("NumPy is required for array-based price calculation.")
+        minor_units = np.asarray(minor_units, dtype=np.int64)
+        quantities = np.asarray(quantities, dtype=np.int64)
+
+        # 1. Apply quantity discounts.
+        amounts = minor_units / MINOR_UNITS_PER_MAJOR
+        discounts = np.rint(amounts * BULK_DISCOUNT_RATE * MINOR_UNITS_PER_MAJOR).astype(np.int64)
+        final_minor_units = np.where(quantities > BULK_QUANTITY_THRESHOLD, minor_units - discounts, minor_units)
+
+        # 2. Ensure no final price is negative.
+        np.maximum(final_minor_units, 0, out=final_minor_units)
+        return final_minor_units
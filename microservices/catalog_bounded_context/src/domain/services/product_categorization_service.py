@@ -4,7 +4,16 @@ from src.domain.models.entities.Category import Category  # Corrected import
 # Assuming we have a Customer entity
 # from entities.customer import Customer
 
-from typing import Optional
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+
+class ReassignmentResult(NamedTuple):
+    """
+    Outcome of a bulk category assignment.
+    """
+    moved: List[Product]  # The moved products, as they were before the move.
+    errors: Dict[int, str]  # Why each remaining product ID was not moved.
+
 
 class ProductCategorizationService:
     """
@@ -42,8 +51,67 @@ class ProductCategorizationService:
             raise ValueError(f"Product with ID {product_id} already belongs to a category.")
 
         product.assign_to_category(category_id)
-        self.product_repository.save(product)
+        self.product_repository.update(product)
+
+        # Category statistics (e.g., product count) are updated by the product
+        # repository in the same transaction as the product.
+
+    def assign_products_to_category(self, product_ids: Sequence[int], category_id: int) -> ReassignmentResult:
+        """
+        Assigns many products to a category.  The business rules are checked
+        on all products at once; products that break them are reported and
+        the rest are moved with a single bulk update.
+
+        Args:
+            product_ids (Sequence[int]): The IDs of the products to assign.
+            category_id (int): The ID of the category to assign the products to.
+
+        Returns:
+            ReassignmentResult: The moved products and an error per product that was not moved.
+
+        Raises:
+            ValueError: If the category does not exist.
+        """
+        if self.category_repository.get_by_id(category_id) is None:
+            raise ValueError(f"Category with ID {category_id} does not exist.")
+
+        products = self.product_repository.get_many(product_ids)
+        errors = {}
+        eligible = []
+        for product_id in dict.fromkeys(product_ids):
+            product = products.get(product_id)
+            if product is None:
+                errors[product_id] = f"Product with ID {product_id} does not exist."
+            elif product.category_id != 0:  # Business rule: A product can only belong to one category.
+                errors[product_id] = f"Product with ID {product_id} already belongs to a category."
+            else:
+                eligible.append(product)
+        return self._move(eligible, category_id, errors)
+
+    def move_all(self, from_category_id: int, to_category_id: int) -> List[int]:
+        """
+        Moves every product of one category to another, e.g. when merging
+        categories, without loading the products.
+
+        Args:
+            from_category_id (int): The ID of the category to empty.
+            to_category_id (int): The ID of the category that receives the products.
+
+        Returns:
+            List[int]: The IDs of the moved products.
+
+        Raises:
+            ValueError: If both IDs are the same or the target category does not exist.
+        """
+        if from_category_id == to_category_id:
+            raise ValueError("Products must be moved to a different category.")
+        if self.category_repository.get_by_id(to_category_id) is None:
+            raise ValueError(f"Category with ID {to_category_id} does not exist.")
+
+        return self.product_repository.move_category(from_category_id, to_category_id)
 
-        # Update category statistics (e.g., product count) if needed.
-        # category.increment_product_count()
-        # self.category_repository.save(category)
+    def _move(self, products: List[Product], category_id: int, errors: Dict[int, str]) -> ReassignmentResult:
+        missing = set(self.product_repository.reassign_category([p.product_id for p in products], category_id))
+        for product_id in missing:
+            errors[product_id] = f"Product with ID {product_id} does not exist."
+        return ReassignmentResult([p for p in products if p.product_id not in missing], errors)
@@ -0,0 +1,93 @@
+from typing import Callable
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.routing import Route
+from src.application.ports.output.async_category_repository_port import AsyncCategoryRepositoryPort
+from src.application.ports.output.async_product_repository_port import AsyncProductRepositoryPort
+from src.infrastructure.primary.asgi_api.compression import CompressionMiddleware
+from src.infrastructure.primary.asgi_api.controllers import category_controller, product_controller
+from src.infrastructure.primary.asgi_api.tracing import RequestTracingMiddleware
+from src.infrastructure.primary.rest_api.middlewares.compression import ResponseCompressor
+from src.infrastructure.primary.rest_api.serializers.encoding import EncodedEntityCache
+from src.infrastructure.primary.tracing import DEFAULT_PROFILE_DIR, DEFAULT_SLOW_REQUEST_SECONDS
+from src.infrastructure.secondary.sqlite_db.async_category_repository_adapter import AsyncCategoryRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.async_database import AsyncSessionLocal
+from src.infrastructure.secondary.sqlite_db.async_product_repository_adapter import AsyncProductRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.database import SessionLocal
+
+ROUTES = [
+    Route('/products', product_controller.list_products, methods=['GET']),
+    Route('/products/', product_controller.list_products, methods=['GET']),
+    Route('/products/', product_controller.create_product, methods=['POST']),
+    Route('/products/batch', product_controller.batch_products, methods=['POST']),
+    Route('/products/export', product_controller.export_products, methods=['GET']),
+    Route('/products/search', product_controller.search_products, methods=['GET']),
+    Route('/products/{product_id:int}', product_controller.get_product, methods=['GET']),
+    Route('/categories/', category_controller.create_category, methods=['POST']),
+    Route('/categories/{category_id:int}', category_controller.get_category, methods=['GET']),
+]
+
+
+def create_app(
+    async_session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    session_factory: Callable[[], Session] = SessionLocal,
+    product_repository: Callable[[AsyncSession], AsyncProductRepositoryPort] = AsyncProductRepositoryAdapter,
+    category_repository: Callable[[AsyncSession], AsyncCategoryRepositoryPort] = AsyncCategoryRepositoryAdapter,
+    instrumentation: bool = False,
+    slow_request_seconds: float = DEFAULT_SLOW_REQUEST_SECONDS,
+    profile_dir: str = DEFAULT_PROFILE_DIR,
+) -> Starlette:
+    """
+    Builds the ASGI variant of the REST API, for serving many concurrent,
+    slow clients from one process.  It has the same product and category
+    routes as the Flask app, with the same serializers and responses.
+    Routes backed by an asynchronous repository port (single and multi-get,
+    categories) await their storage I/O on the event loop; routes whose
+    ports only have blocking adapters (listing, search, batch, export) run
+    them on Starlette's thread pool.
+
+    Args:
+        async_session_factory (Callable[[], AsyncSession], optional): Opens the session of the async routes.
+            Defaults to AsyncSessionLocal.
+        session_factory (Callable[[], Session], optional): Opens the session of the routes that run on
+            the thread pool. Defaults to SessionLocal.
+        product_repository (Callable[[AsyncSession], AsyncProductRepositoryPort], optional): Builds the
+            product repository for a session. Defaults to AsyncProductRepositoryAdapter.
+        category_repository (Callable[[AsyncSession], AsyncCategoryRepositoryPort], optional): Builds the
+            category repository for a session. Defaults to AsyncCategoryRepositoryAdapter.
+        instrumentation (bool, optional): Trace every request and report the time per layer in a
+            Server-Timing header, as the INSTRUMENTATION setting of the Flask app does. Defaults to False.
+        slow_request_seconds (float, optional): With instrumentation, slower requests are profiled to
+            disk. Defaults to DEFAULT_SLOW_REQUEST_SECONDS.
+        profile_dir (str, optional): Where the profiles of slow requests are written.
+            Defaults to DEFAULT_PROFILE_DIR.
+
+    Returns:
+        Starlette: The app.
+    """
+    # Streams, like the export, are passed through; the export compresses itself.
+    compressor = ResponseCompressor()
+    middleware = [Middleware(CompressionMiddleware, compressor=compressor)]
+    if instrumentation:
+        middleware.insert(0, Middleware(
+            RequestTracingMiddleware, slow_request_seconds=slow_request_seconds, profile_dir=profile_dir))
+    app = Starlette(routes=ROUTES, middleware=middleware)
+    app.state.async_session_factory = async_session_factory
+    app.state.session_factory = session_factory
+    app.state.product_repository = product_repository
+    app.state.category_repository = category_repository
+    app.state.encoded_entity_cache = EncodedEntityCache()
+    app.state.compression = compressor
+    return app
+
+
+# Serve with: uvicorn src.infrastructure.primary.asgi_api.app:app
+app = create_app()
+
+if __name__ == '__main__':
+    import uvicorn
+    from src.infrastructure.secondary.sqlite_db.database import init_db
+    init_db()
+    uvicorn.run(app)
@@ -0,0 +1,82 @@
+from typing import Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from werkzeug.http import parse_accept_header, quote_etag, unquote_etag
+from src.infrastructure.primary.rest_api.middlewares.compression import (
+    COMPRESSIBLE_MIMETYPES,
+    DEFAULT_MIN_SIZE,
+    ResponseCompressor,
+)
+from src.infrastructure.primary.rest_api.middlewares.http_caching import encoded_etag
+
+
+class CompressionMiddleware:
+    """
+    Response compression for the ASGI app, the counterpart of the Flask
+    ResponseCompressor, whose encoders and cache it shares: a compressed
+    body is sent with the ETag of its encoding, e.g. "product-1-v1-gzip",
+    so the identity and compressed representations never share a strong
+    ETag.  Streamed responses, bodies that already have a Content-Encoding
+    and bodies below the size threshold are sent as they are.
+    """
+
+    def __init__(self, app: ASGIApp, compressor: Optional[ResponseCompressor] = None, minimum_size: int = DEFAULT_MIN_SIZE):
+        """
+        Initializes the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped app.
+            compressor (Optional[ResponseCompressor], optional): Compresses and caches the bodies.
+                Defaults to a new one.
+            minimum_size (int, optional): Smaller bodies are sent uncompressed. Defaults to DEFAULT_MIN_SIZE.
+        """
+        self.app = app
+        self.compressor = compressor or ResponseCompressor()
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self.compressor.negotiate(parse_accept_header(Headers(scope=scope).get("accept-encoding")))
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            passthrough = True  # Only the first body message is looked at.
+            if message.get("more_body", False) or not self._compressible(start):
+                await send(start)
+                await send(message)
+                return
+            headers = MutableHeaders(raw=start["headers"])
+            # Whether or not this body gets compressed, the representation depends on Accept-Encoding.
+            headers.add_vary_header("Accept-Encoding")
+            body = message.get("body", b"")
+            if encoding is not None and len(body) >= self.minimum_size:
+                etag, weak = unquote_etag(headers.get("etag"))
+                endpoint = getattr(scope.get("endpoint"), "__name__", "unknown")
+                body = self.compressor.encode(body, encoding, etag, endpoint)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                if etag is not None:
+                    headers["ETag"] = quote_etag(encoded_etag(etag, encoding), weak)
+                message = {**message, "body": body}
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+    @staticmethod
+    def _compressible(start: Message) -> bool:
+        headers = Headers(raw=start["headers"])
+        status = start["status"]
+        return (200 <= status < 300 and status != 204 and "content-encoding" not in headers
+                and headers.get("content-type", "").split(";")[0].strip() in COMPRESSIBLE_MIMETYPES
+                and "no-transform" not in headers.get("cache-control", ""))
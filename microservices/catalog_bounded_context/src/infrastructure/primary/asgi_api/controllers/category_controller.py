@@ -0,0 +1,37 @@
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from src.application.usecases.get_category_usecase import AsyncGetCategoryUseCase
+from src.application.utils.validation import MAX_STORED_INTEGER
+from src.infrastructure.primary.asgi_api.responses import error_response, json_response, not_modified
+from src.infrastructure.primary.rest_api.middlewares.http_caching import entity_etag
+from src.infrastructure.primary.rest_api.serializers.encoding import encode_category
+from src.infrastructure.primary.tracing import instrument
+
+CATEGORY_CACHE_CONTROL = 'public, max-age=300, must-revalidate'
+
+async def create_category(request: Request):
+    # Implement the logic to create a category using the data
+    return JSONResponse({'message': 'Category created successfully'}, status_code=201)
+
+async def get_category(request: Request):
+    category_id = request.path_params['category_id']
+    # No stored category has an ID beyond the storage range; binding one would fail.
+    if category_id > MAX_STORED_INTEGER:
+        return error_response(f'Category with ID {category_id} not found.', 404)
+    state = request.app.state
+    async with state.async_session_factory() as db:
+        use_case = instrument(AsyncGetCategoryUseCase(instrument(state.category_repository(db), "repository")), "usecase")
+        # A revalidation only needs the version; the category is not loaded or serialized.
+        if 'if-none-match' in request.headers:
+            version = await use_case.get_category_version(category_id)
+            response = not_modified(request, 'category', category_id, version, CATEGORY_CACHE_CONTROL)
+            if response is not None:
+                return response
+        category = await use_case.get_category(category_id)
+    if category is None:
+        return error_response(f'Category with ID {category_id} not found.', 404)
+    return json_response(
+        encode_category(category, state.encoded_entity_cache),
+        etag=entity_etag('category', category.category_id, category.version),
+        cache_control=CATEGORY_CACHE_CONTROL,
+    )
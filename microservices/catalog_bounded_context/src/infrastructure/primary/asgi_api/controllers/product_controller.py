@@ -0,0 +1,174 @@
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from werkzeug.http import parse_accept_header
+from src.application.usecases.batch_products_usecase import BatchProductsUseCase
+from src.application.usecases.export_products_usecase import ExportProductsUseCase
+from src.application.usecases.get_product_usecase import AsyncGetProductUseCase
+from src.application.usecases.list_products_usecase import ListProductsUseCase
+from src.application.usecases.search_products_usecase import SearchProductsUseCase
+from src.application.utils.validation import MAX_STORED_INTEGER
+from src.infrastructure.primary.asgi_api.responses import error_response, json_response, not_modified, run_blocking
+from src.infrastructure.primary.rest_api.middlewares.http_caching import entity_etag
+from src.infrastructure.primary.rest_api.serializers.encoding import dumps, encode_page, encode_product
+from src.infrastructure.primary.rest_api.serializers.export import EXPORT_MEDIA_TYPES, encode_export, gzip_stream
+from src.infrastructure.primary.rest_api.serializers.product_serializer import (
+    deserialize_batch,
+    deserialize_product_ids,
+    deserialize_query_arg,
+    serialize_batch,
+)
+from src.infrastructure.primary.tracing import instrument
+from src.infrastructure.secondary.sqlite_db.product_listing_adapter import ProductListingAdapter
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.product_search_adapter import ProductSearchAdapter
+from src.infrastructure.secondary.sqlite_db.unit_of_work import SqlAlchemyUnitOfWork
+
+PRODUCT_CACHE_CONTROL = 'public, max-age=60, must-revalidate'
+# Products loaded per keyset page while exporting.
+EXPORT_BATCH_SIZE = 1000
+
+def _arg(request: Request, name: str, type=str, default=None):
+    # A value that does not convert raises ValueError, which the views answer with 400.
+    return deserialize_query_arg(request.query_params, name, type, default)
+
+def _encode_products(request: Request, products, **fields) -> bytes:
+    cache = request.app.state.encoded_entity_cache
+    return encode_page((encode_product(product, cache) for product in products), **fields)
+
+async def create_product(request: Request):
+    # Implement the logic to create a product using the data
+    return JSONResponse({'message': 'Product created successfully'}, status_code=201)
+
+async def get_product(request: Request):
+    product_id = request.path_params['product_id']
+    # No stored product has an ID beyond the storage range; binding one would fail.
+    if product_id > MAX_STORED_INTEGER:
+        return error_response(f'Product with ID {product_id} not found.', 404)
+    state = request.app.state
+    async with state.async_session_factory() as db:
+        use_case = instrument(AsyncGetProductUseCase(instrument(state.product_repository(db), "repository")), "usecase")
+        # A revalidation only needs the version; the product is not loaded or serialized.
+        if 'if-none-match' in request.headers:
+            version = await use_case.get_product_version(product_id)
+            response = not_modified(request, 'product', product_id, version, PRODUCT_CACHE_CONTROL)
+            if response is not None:
+                return response
+        product = await use_case.get_product(product_id)
+    if product is None:
+        return error_response(f'Product with ID {product_id} not found.', 404)
+    return json_response(
+        encode_product(product, state.encoded_entity_cache),
+        etag=entity_etag('product', product.product_id, product.version),
+        cache_control=PRODUCT_CACHE_CONTROL,
+    )
+
+async def list_products(request: Request):
+    if 'ids' in request.query_params:
+        return await get_products_by_ids(request)
+    try:
+        page = _arg(request, 'page', int, 1)
+        page_size = _arg(request, 'page_size', int, 20)
+        filters = {
+            'category_id': _arg(request, 'category_id', int),
+            'min_price': _arg(request, 'min_price', float),
+            'max_price': _arg(request, 'max_price', float),
+        }
+
+        def list_page(db):
+            use_case = instrument(ListProductsUseCase(instrument(ProductListingAdapter(db), "repository")), "usecase")
+            return use_case.list_products(
+                **filters,
+                sort=_arg(request, 'sort', default='price'),
+                page=page,
+                page_size=page_size,
+                cursor=_arg(request, 'cursor'),
+            )
+
+        result = await run_blocking(request, list_page)
+    except (TypeError, ValueError) as e:
+        return error_response(str(e), 400)
+    return json_response(_encode_products(
+        request, result.products, total=result.total, page=page, page_size=page_size, next_cursor=result.next_cursor,
+    ))
+
+async def get_products_by_ids(request: Request):
+    # ?ids=1,2,3 or ?ids=1&ids=2; IDs that do not exist are null in items and listed in not_found.
+    state = request.app.state
+    try:
+        product_ids = deserialize_product_ids(request.query_params.getlist('ids'))
+        async with state.async_session_factory() as db:
+            use_case = instrument(AsyncGetProductUseCase(instrument(state.product_repository(db), "repository")), "usecase")
+            products = await use_case.get_products(product_ids)
+    except (TypeError, ValueError) as e:
+        return error_response(str(e), 400)
+    cache = state.encoded_entity_cache
+    return json_response(encode_page(
+        (b'null' if product is None else encode_product(product, cache) for product in products),
+        not_found=[product_id for product_id, product in zip(product_ids, products) if product is None],
+    ))
+
+async def search_products(request: Request):
+    try:
+        page = _arg(request, 'page', int, 1)
+        page_size = _arg(request, 'page_size', int, 20)
+        filters = {
+            'category_id': _arg(request, 'category_id', int),
+            'min_price': _arg(request, 'min_price', float),
+            'max_price': _arg(request, 'max_price', float),
+        }
+
+        def search(db):
+            use_case = instrument(SearchProductsUseCase(instrument(ProductSearchAdapter(db), "repository")), "usecase")
+            return use_case.search_products(
+                _arg(request, 'q', default=''), **filters, page=page, page_size=page_size,
+            )
+
+        result = await run_blocking(request, search)
+    except (TypeError, ValueError) as e:
+        return error_response(str(e), 400)
+    return json_response(_encode_products(request, result.products, total=result.total, page=page, page_size=page_size))
+
+async def batch_products(request: Request):
+    try:
+        changes, responses = deserialize_batch(await request.json())
+    except ValueError as e:  # Includes a body that is not JSON.
+        return error_response(str(e), 400)
+    # Items that could not be parsed are already answered; the rest are applied in one transaction.
+    # The unit of work opens its own session on the thread pool.
+    unit_of_work = instrument(SqlAlchemyUnitOfWork(request.app.state.session_factory), "unit_of_work")
+    use_case = instrument(BatchProductsUseCase(unit_of_work), "usecase")
+    results = await run_in_threadpool(use_case.apply_changes, changes)
+    return json_response(dumps(serialize_batch(responses, results)))
+
+async def export_products(request: Request):
+    export_format = _arg(request, 'format', default='ndjson')
+    if export_format not in EXPORT_MEDIA_TYPES:
+        return error_response(f"Unknown export format {export_format!r}; use ndjson or csv.", 400)
+    db = request.app.state.session_factory()
+    try:
+        use_case = instrument(ExportProductsUseCase(instrument(ProductRepositoryAdapter(db), "repository")), "usecase")
+        batches = use_case.export_products(
+            batch_size=EXPORT_BATCH_SIZE,
+            category_id=_arg(request, 'category_id', int),
+        )
+    except (TypeError, ValueError) as e:
+        db.close()
+        return error_response(str(e), 400)
+
+    def stream(chunks):
+        # Starlette pulls a blocking iterator on the thread pool, one chunk at a time.
+        try:
+            yield from chunks
+        finally:
+            db.close()
+
+    chunks = encode_export(batches, export_format)
+    headers = {
+        'Content-Disposition': f'attachment; filename="products.{export_format}"',
+        'Vary': 'Accept-Encoding',
+    }
+    if parse_accept_header(request.headers.get('accept-encoding'))['gzip']:
+        chunks = gzip_stream(chunks)
+        headers['Content-Encoding'] = 'gzip'
+    return StreamingResponse(stream(chunks), media_type=EXPORT_MEDIA_TYPES[export_format], headers=headers)
@@ -0,0 +1,71 @@
+from typing import Callable, Optional, TypeVar
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from werkzeug.http import parse_etags
+from src.infrastructure.primary.rest_api.middlewares.http_caching import entity_etag, matching_etag
+from src.infrastructure.primary.rest_api.serializers.encoding import JSON_MIMETYPE
+
+T = TypeVar("T")
+
+
+def json_response(body: bytes, status: int = 200, etag: Optional[str] = None, cache_control: Optional[str] = None) -> Response:
+    """
+    Wraps an encoded JSON document in a response.
+
+    Args:
+        body (bytes): The JSON document.
+        status (int, optional): The HTTP status. Defaults to 200.
+        etag (Optional[str], optional): The unquoted strong entity tag. Defaults to None.
+        cache_control (Optional[str], optional): The Cache-Control header. Defaults to None.
+
+    Returns:
+        Response: The response.
+    """
+    headers = {}
+    if etag is not None:
+        headers["ETag"] = f'"{etag}"'
+    if cache_control is not None:
+        headers["Cache-Control"] = cache_control
+    return Response(body, status_code=status, media_type=JSON_MIMETYPE, headers=headers)
+
+
+def error_response(message: str, status: int) -> Response:
+    """
+    Builds an error response with the same body as the Flask API, {"message": ...}.
+    """
+    return JSONResponse({"message": message}, status_code=status)
+
+
+def not_modified(request: Request, kind: str, entity_id: int, version: Optional[int], cache_control: str) -> Optional[Response]:
+    """
+    Answers a conditional GET from the current version of an entity.
+    See rest_api.middlewares.http_caching.not_modified.
+
+    Returns:
+        Optional[Response]: A 304 response if the client's copy is current, otherwise None.
+    """
+    if version is None:
+        return None
+    etag = matching_etag(parse_etags(request.headers.get("if-none-match")), entity_etag(kind, entity_id, version))
+    if etag is None:
+        return None
+    return Response(status_code=304, headers={"ETag": f'"{etag}"', "Cache-Control": cache_control})
+
+
+async def run_blocking(request: Request, work: Callable[..., T]) -> T:
+    """
+    Runs work on the thread pool with a blocking session from the app's
+    session factory, for the routes whose ports only have blocking adapters.
+
+    Args:
+        request (Request): The current request.
+        work (Callable[..., T]): Called with the session.
+
+    Returns:
+        T: Whatever work returned.
+    """
+    def run() -> T:
+        with request.app.state.session_factory() as db:
+            return work(db)
+    return await run_in_threadpool(run)
@@ -0,0 +1,74 @@
+import time
+from typing import Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.infrastructure.primary.tracing import (
+    DEFAULT_PROFILE_DIR,
+    DEFAULT_SLOW_REQUEST_SECONDS,
+    SlowRequestProfiler,
+    server_timing,
+    trace_calls,
+)
+
+
+class RequestTracingMiddleware:
+    """
+    Request tracing for the ASGI app, the counterpart of the Flask
+    RequestTracing: while it is installed, the use cases and adapters the
+    controllers wrap with instrument() record their calls, and the time per
+    layer is sent in a Server-Timing header.  Streamed bodies are produced
+    after the headers, so their time is not included.
+
+    Requests slower than slow_request_seconds are saved as JSON in
+    profile_dir, with their spans and call counts.  Their stacks are not
+    sampled: the requests of the event loop share its thread, so a sample
+    cannot be attributed to one of them.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        slow_request_seconds: float = DEFAULT_SLOW_REQUEST_SECONDS,
+        profile_dir: str = DEFAULT_PROFILE_DIR,
+        max_profiles: int = 100,
+    ):
+        """
+        Initializes the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped app.
+            slow_request_seconds (float, optional): Slower requests are profiled to disk.
+                Defaults to DEFAULT_SLOW_REQUEST_SECONDS.
+            profile_dir (str, optional): Where profiles are written. Defaults to DEFAULT_PROFILE_DIR.
+            max_profiles (int, optional): The most profiles written per process. Defaults to 100.
+        """
+        self.app = app
+        self.slow_request_seconds = slow_request_seconds
+        self.profile_dir = profile_dir
+        self.profiler = SlowRequestProfiler(max_profiles=max_profiles)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        exception: Optional[BaseException] = None
+        with trace_calls() as trace:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start" and trace.layer_seconds:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", server_timing(trace).encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            except BaseException as error:
+                exception = error
+                raise
+            finally:
+                duration = time.perf_counter() - trace.started
+                if duration >= self.slow_request_seconds:
+                    query = scope.get("query_string", b"").decode("latin-1")
+                    self.profiler.profile(
+                        self.profile_dir, trace, duration, scope["method"],
+                        f"{scope['path']}?{query}", getattr(scope.get("endpoint"), "__name__", None), exception,
+                    )
@@ -1,8 +1,38 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import click
+from src.application.usecases.export_products_usecase import ExportProductsUseCase
+from src.application.usecases.import_products_usecase import ImportProductsUseCase
+from src.infrastructure.primary.cli.product_import import (
+    IMPORT_FORMATS,
+    import_source,
+    open_input,
+    read_records,
+    validate_records,
+    write_rejected,
+)
+from src.infrastructure.primary.rest_api.serializers.export import EXPORT_MEDIA_TYPES, encode_export, gzip_stream, write_export
+from src.infrastructure.primary.tracing import RequestTrace, instrument, trace_calls
+from src.infrastructure.secondary.sqlite_db.category_statistics_adapter import CategoryStatisticsAdapter
+from src.infrastructure.secondary.sqlite_db.database import SessionLocal, init_db
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.unit_of_work import SqlAlchemyUnitOfWork
 
 @click.group()
-def cli():
-    pass
+@click.option('--trace', is_flag=True, help='Report the time spent per layer when the command finishes.')
+@click.pass_context
+def cli(ctx, trace):
+    if trace:
+        # Use cases and adapters the command wraps with instrument() record their calls into the trace.
+        ctx.call_on_close(partial(report_trace, ctx.with_resource(trace_calls())))
+
+def report_trace(trace: RequestTrace) -> None:
+    for layer, seconds in trace.layer_seconds.items():
+        click.echo(f"{layer}: {seconds:.3f}s", err=True)
+    for name, count in sorted(trace.calls.items()):
+        click.echo(f"  {name}: {count} calls", err=True)
 
 @cli.command()
 def create_product():
@@ -12,5 +42,103 @@ def create_product():
 def create_category():
     click.echo("Creating a category...")
 
+@cli.command()
+def rebuild_category_statistics():
+    """Recompute the per-category statistics from the products."""
+    init_db()
+    with SessionLocal() as db:
+        count = instrument(CategoryStatisticsAdapter(db), "repository").rebuild()
+    click.echo(f"Rebuilt statistics for {count} categories.")
+
+@cli.command()
+def check_category_statistics():
+    """Compare the stored per-category statistics with the products."""
+    init_db()
+    with SessionLocal() as db:
+        inconsistencies = instrument(CategoryStatisticsAdapter(db), "repository").find_inconsistencies()
+    for category_id, (stored, actual) in sorted(inconsistencies.items()):
+        click.echo(f"Category {category_id}: stored {tuple(stored)}, actual {tuple(actual)}")
+    if inconsistencies:
+        raise click.ClickException(
+            f"{len(inconsistencies)} categories are inconsistent; run rebuild-category-statistics."
+        )
+    click.echo("Category statistics are consistent.")
+
+@cli.command()
+@click.option('--format', 'export_format', type=click.Choice(list(EXPORT_MEDIA_TYPES)), default='ndjson',
+              show_default=True, help='Output format.')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), required=True,
+              help='The file to write.')
+@click.option('--gzip', 'compress', is_flag=True, help='Compress the output with gzip.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=5000, show_default=True,
+              help='Products loaded per keyset page.')
+def export_products(export_format, output, compress, batch_size):
+    """Write every product to a file as NDJSON or CSV."""
+    init_db()
+    exported = 0
+
+    def counted(batches):
+        nonlocal exported
+        for batch in batches:
+            exported += len(batch)
+            yield batch
+
+    with SessionLocal() as db, open(output, 'wb') as file:
+        use_case = instrument(ExportProductsUseCase(instrument(ProductRepositoryAdapter(db), "repository")), "usecase")
+        batches = use_case.export_products(batch_size=batch_size)
+        chunks = encode_export(counted(batches), export_format)
+        written = write_export(gzip_stream(chunks) if compress else chunks, file)
+    click.echo(f"Exported {exported} products to {output} ({written} bytes).")
+
+@cli.command()
+@click.argument('input_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'import_format', type=click.Choice(IMPORT_FORMATS), default='ndjson',
+              show_default=True, help='Input format; .gz files are decompressed.')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=5000, show_default=True,
+              help='Records validated and committed together.')
+@click.option('--workers', type=click.IntRange(min=0), default=os.cpu_count() or 1, show_default=True,
+              help='Validation processes; 0 validates in this process.')
+@click.option('--errors', 'errors_path', type=click.Path(dir_okay=False),
+              help='Where rejected records are written as NDJSON.  [default: INPUT_PATH.rejected.ndjson]')
+@click.option('--resume', is_flag=True, help='Continue after the last chunk stored by an earlier import of the file.')
+def import_products(input_path, import_format, chunk_size, workers, errors_path, resume):
+    """Load products from a CSV or NDJSON file in chunked transactions."""
+    errors_path = errors_path or f"{input_path}.rejected.ndjson"
+    source = import_source(input_path, import_format)
+    init_db()
+    # The position is stored in the transaction of each chunk, so a resumed import never stores a chunk twice.
+    use_case = instrument(ImportProductsUseCase(instrument(SqlAlchemyUnitOfWork(SessionLocal), "unit_of_work")), "usecase")
+    start = use_case.get_position(source) if resume else 0
+    started = time.perf_counter()
+
+    def on_chunk(progress, rejected):
+        # The chunk is committed: record its rejections.
+        write_rejected(rejected, errors)
+        rate = (progress.position - start) / max(time.perf_counter() - started, 1e-9)
+        click.echo(f"\r{progress.position:,} records: {progress.imported:,} imported, "
+                   f"{progress.rejected:,} rejected, {rate:,.0f} records/s", nl=False, err=True)
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers else None
+    try:
+        with open_input(input_path) as records, open(errors_path, 'a' if resume else 'w', encoding='utf-8') as errors:
+            progress = use_case.import_products(
+                read_records(records, import_format),
+                partial(validate_records, import_format=import_format),
+                chunk_size=chunk_size,
+                start=start,
+                source=source,
+                executor=executor,
+                max_pending=2 * workers or 1,
+                on_chunk=on_chunk,
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    click.echo(err=True)
+    click.echo(f"Imported {progress.imported} products, rejected {progress.rejected} records "
+               f"in {time.perf_counter() - started:.1f}s.")
+    if progress.rejected:
+        click.echo(f"Rejected records were written to {errors_path}.")
+
 if __name__ == '__main__':
     cli()
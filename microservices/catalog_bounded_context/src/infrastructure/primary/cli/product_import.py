@@ -0,0 +1,129 @@
+import csv
+import gzip
+import json
+import os
+from typing import Any, Dict, IO, Iterator, Optional, Sequence, Tuple
+from src.application.usecases.import_products_usecase import RejectedRecord, ValidatedChunk
+from src.domain.models.entities.Product import Product
+from src.infrastructure.primary.rest_api.serializers.product_serializer import deserialize_product
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+
+def open_input(path: str) -> IO[str]:
+    """
+    Opens an import file as text, decompressing it if its name ends in .gz.
+
+    Args:
+        path (str): The file to read.
+
+    Returns:
+        IO[str]: The open file.
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def read_records(file: IO[str], import_format: str) -> Iterator[Any]:
+    """
+    Reads the raw records of an import file: a dict of strings per CSV row,
+    or the text of each non-blank NDJSON line.  Records are only parsed when
+    they are validated, so that work can run in the worker processes.
+
+    Args:
+        file (IO[str]): The open import file.
+        import_format (str): "ndjson" or "csv".
+
+    Returns:
+        Iterator[Any]: The records, in file order.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if import_format == "csv":
+        return csv.DictReader(file)
+    if import_format == "ndjson":
+        return (line.strip() for line in file if line.strip())
+    raise ValueError(f"Unknown import format {import_format!r}; use one of {', '.join(IMPORT_FORMATS)}.")
+
+
+def _parse_csv_record(row: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    # Accepts the columns written by export-products; product_id is ignored.
+    if None in row:
+        raise ValueError("Row has more fields than the header.")
+    payload: Dict[str, Any] = {
+        field: row[field] for field in ("name", "description", "currency") if row.get(field) is not None
+    }
+    if row.get("price") is not None:
+        try:
+            payload["price"] = float(row["price"])
+        except ValueError:
+            raise ValueError(f"Invalid price: {row['price']!r}") from None
+    if row.get("category_id") is not None:
+        try:
+            payload["category_id"] = int(row["category_id"])
+        except ValueError:
+            raise ValueError(f"Invalid category_id: {row['category_id']!r}") from None
+    if row.get("image_urls"):
+        payload["image_urls"] = row["image_urls"].split()
+    return payload
+
+
+def _parse_ndjson_record(line: str) -> Dict[str, Any]:
+    return json.loads(line)
+
+
+_PARSERS = {"csv": _parse_csv_record, "ndjson": _parse_ndjson_record}
+
+
+def validate_records(records: Sequence[Tuple[int, Any]], import_format: str) -> ValidatedChunk:
+    """
+    Parses and validates numbered records with the same rules as the REST
+    API.  Runs in the worker processes of import-products, so it must stay a
+    module-level function.
+
+    Args:
+        records (Sequence[Tuple[int, Any]]): (record number, raw record) pairs.
+        import_format (str): "ndjson" or "csv".
+
+    Returns:
+        ValidatedChunk: The products built from the valid records and the rejected records.
+    """
+    parse = _PARSERS[import_format]
+    products = []
+    rejected = []
+    for number, record in records:
+        try:
+            products.append(Product(product_id=None, **deserialize_product(parse(record))))
+        except (TypeError, ValueError, OverflowError) as e:  # OverflowError: an infinite price.
+            rejected.append(RejectedRecord(number, record, str(e)))
+    return ValidatedChunk(products, rejected)
+
+
+def write_rejected(rejected: Sequence[RejectedRecord], file: IO[str]) -> None:
+    """
+    Appends rejected records to the error file, one JSON object per line.
+
+    Args:
+        rejected (Sequence[RejectedRecord]): The records to write.
+        file (IO[str]): The open error file.
+    """
+    for item in rejected:
+        file.write(json.dumps({"record": item.number, "error": item.message, "data": item.record}) + "\n")
+    file.flush()
+
+
+def import_source(path: str, import_format: str) -> str:
+    """
+    Names an import of a file, for storing its position: the same file read
+    in another format is another import.
+
+    Args:
+        path (str): The import file.
+        import_format (str): The format of the import file.
+
+    Returns:
+        str: The name of the import.
+    """
+    return f"{import_format}:{os.path.abspath(path)}"
@@ -1,4 +1,9 @@
 from flask import Flask
+from src.infrastructure.primary.rest_api import dependencies
+from src.infrastructure.primary.rest_api.middlewares.compression import ResponseCompressor
+from src.infrastructure.primary.rest_api.middlewares.concurrency_limit import ConcurrencyLimiter
+from src.infrastructure.primary.rest_api.middlewares.metrics import RequestMetrics
+from src.infrastructure.primary.rest_api.middlewares.tracing import RequestTracing
 from src.infrastructure.primary.rest_api.routes.product_routes import product_bp
 from src.infrastructure.primary.rest_api.routes.category_routes import category_bp
 
@@ -6,6 +11,13 @@ app = Flask(__name__)
 
 app.register_blueprint(product_bp)
 app.register_blueprint(category_bp)
+dependencies.init_app(app)
+RequestMetrics().init_app(app)
+ConcurrencyLimiter().init_app(app)
+RequestTracing().init_app(app)
+ResponseCompressor().init_app(app)
 
 if __name__ == '__main__':
+    from src.infrastructure.secondary.sqlite_db.database import init_db
+    init_db()
     app.run(debug=True)
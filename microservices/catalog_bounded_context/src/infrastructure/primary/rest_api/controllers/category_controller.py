@@ -1,4 +1,8 @@
 from flask import request, jsonify
+from src.application.utils.validation import MAX_STORED_INTEGER
+from src.infrastructure.primary.rest_api.dependencies import get_category_use_case, get_encoded_entity_cache
+from src.infrastructure.primary.rest_api.middlewares.http_caching import entity_etag, not_modified
+from src.infrastructure.primary.rest_api.serializers.encoding import encode_category, json_response
 
 def create_category():
     data = request.get_json()
@@ -6,5 +10,18 @@ def create_category():
     return jsonify({'message': 'Category created successfully'}), 201
 
 def get_category(category_id):
-    # Implement the logic to retrieve a category by ID
-    return jsonify({'category_id': category_id, 'name': 'Example Category'}), 200
+    # No stored category has an ID beyond the storage range; binding one would fail.
+    if category_id > MAX_STORED_INTEGER:
+        return jsonify({'message': f'Category with ID {category_id} not found.'}), 404
+    use_case = get_category_use_case()
+    # A revalidation only needs the version; the category is not loaded or serialized.
+    if request.if_none_match:
+        response = not_modified('category', category_id, use_case.get_category_version(category_id))
+        if response is not None:
+            return response
+    category = use_case.get_category(category_id)
+    if category is None:
+        return jsonify({'message': f'Category with ID {category_id} not found.'}), 404
+    response = json_response(encode_category(category, get_encoded_entity_cache()))
+    response.set_etag(entity_etag('category', category.category_id, category.version))
+    return response
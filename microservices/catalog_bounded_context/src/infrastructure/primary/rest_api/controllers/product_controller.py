@@ -1,4 +1,25 @@
-from flask import request, jsonify
+from flask import Response, request, jsonify, stream_with_context
+from src.application.utils.validation import MAX_STORED_INTEGER
+from src.infrastructure.primary.rest_api.dependencies import (
+    get_batch_products_use_case,
+    get_encoded_entity_cache,
+    get_export_products_use_case,
+    get_list_products_use_case,
+    get_product_use_case,
+    get_search_products_use_case,
+)
+from src.infrastructure.primary.rest_api.middlewares.http_caching import entity_etag, not_modified
+from src.infrastructure.primary.rest_api.serializers.encoding import dumps, encode_page, encode_product, json_response
+from src.infrastructure.primary.rest_api.serializers.export import EXPORT_MEDIA_TYPES, encode_export, gzip_stream
+from src.infrastructure.primary.rest_api.serializers.product_serializer import (
+    deserialize_batch,
+    deserialize_product_ids,
+    deserialize_query_arg,
+    serialize_batch,
+)
+
+# Products loaded per keyset page while exporting.
+EXPORT_BATCH_SIZE = 1000
 
 def create_product():
     data = request.get_json()
@@ -6,5 +27,111 @@ def create_product():
     return jsonify({'message': 'Product created successfully'}), 201
 
 def get_product(product_id):
-    # Implement the logic to retrieve a product by ID
-    return jsonify({'product_id': product_id, 'name': 'Example Product'}), 200
+    # No stored product has an ID beyond the storage range; binding one would fail.
+    if product_id > MAX_STORED_INTEGER:
+        return jsonify({'message': f'Product with ID {product_id} not found.'}), 404
+    use_case = get_product_use_case()
+    # A revalidation only needs the version; the product is not loaded or serialized.
+    if request.if_none_match:
+        response = not_modified('product', product_id, use_case.get_product_version(product_id))
+        if response is not None:
+            return response
+    product = use_case.get_product(product_id)
+    if product is None:
+        return jsonify({'message': f'Product with ID {product_id} not found.'}), 404
+    response = json_response(encode_product(product, get_encoded_entity_cache()))
+    response.set_etag(entity_etag('product', product.product_id, product.version))
+    return response
+
+def list_products():
+    args = request.args
+    if 'ids' in args:
+        return get_products_by_ids()
+    try:
+        page = deserialize_query_arg(args, 'page', int, 1)
+        page_size = deserialize_query_arg(args, 'page_size', int, 20)
+        result = get_list_products_use_case().list_products(
+            category_id=deserialize_query_arg(args, 'category_id', int),
+            min_price=deserialize_query_arg(args, 'min_price', float),
+            max_price=deserialize_query_arg(args, 'max_price', float),
+            sort=args.get('sort', 'price'),
+            page=page,
+            page_size=page_size,
+            cursor=args.get('cursor'),
+        )
+    except (TypeError, ValueError) as e:
+        return jsonify({'message': str(e)}), 400
+    cache = get_encoded_entity_cache()
+    return json_response(encode_page(
+        (encode_product(product, cache) for product in result.products),
+        total=result.total,
+        page=page,
+        page_size=page_size,
+        next_cursor=result.next_cursor,
+    ))
+
+def get_products_by_ids():
+    # ?ids=1,2,3 or ?ids=1&ids=2; IDs that do not exist are null in items and listed in not_found.
+    try:
+        product_ids = deserialize_product_ids(request.args.getlist('ids'))
+        products = get_product_use_case().get_products(product_ids)
+    except (TypeError, ValueError) as e:
+        return jsonify({'message': str(e)}), 400
+    cache = get_encoded_entity_cache()
+    return json_response(encode_page(
+        (b'null' if product is None else encode_product(product, cache) for product in products),
+        not_found=[product_id for product_id, product in zip(product_ids, products) if product is None],
+    ))
+
+def batch_products():
+    try:
+        changes, responses = deserialize_batch(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    # Items that could not be parsed are already answered; the rest are applied in one transaction.
+    return json_response(dumps(serialize_batch(responses, get_batch_products_use_case().apply_changes(changes))))
+
+def export_products():
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_MEDIA_TYPES:
+        return jsonify({'message': f"Unknown export format {export_format!r}; use ndjson or csv."}), 400
+    try:
+        batches = get_export_products_use_case().export_products(
+            batch_size=EXPORT_BATCH_SIZE,
+            category_id=deserialize_query_arg(request.args, 'category_id', int),
+        )
+    except (TypeError, ValueError) as e:
+        return jsonify({'message': str(e)}), 400
+    chunks = encode_export(batches, export_format)
+    headers = {
+        'Content-Disposition': f'attachment; filename="products.{export_format}"',
+        'Vary': 'Accept-Encoding',
+    }
+    if request.accept_encodings['gzip']:
+        chunks = gzip_stream(chunks)
+        headers['Content-Encoding'] = 'gzip'
+    # The request context, and with it the database session, stays open until the stream ends.
+    return Response(stream_with_context(chunks), mimetype=EXPORT_MEDIA_TYPES[export_format], headers=headers)
+
+def search_products():
+    args = request.args
+    try:
+        page = deserialize_query_arg(args, 'page', int, 1)
+        page_size = deserialize_query_arg(args, 'page_size', int, 20)
+        result = get_search_products_use_case().search_products(
+            args.get('q', ''),
+            category_id=deserialize_query_arg(args, 'category_id', int),
+            min_price=deserialize_query_arg(args, 'min_price', float),
+            max_price=deserialize_query_arg(args, 'max_price', float),
+            page=page,
+            page_size=page_size,
+        )
+    except (TypeError, ValueError) as e:
+        return jsonify({'message': str(e)}), 400
+    cache = get_encoded_entity_cache()
+    return json_response(encode_page(
+        (encode_product(product, cache) for product in result.products),
+        total=result.total,
+        page=page,
+        page_size=page_size,
+    ))
@@ -0,0 +1,77 @@
+from weakref import WeakKeyDictionary
+from flask import current_app, g
+from sqlalchemy.orm import Session
+from src.application.usecases.batch_products_usecase import BatchProductsUseCase
+from src.application.usecases.export_products_usecase import ExportProductsUseCase
+from src.application.usecases.get_category_usecase import GetCategoryUseCase
+from src.application.usecases.get_product_usecase import GetProductUseCase
+from src.application.usecases.list_products_usecase import ListProductsUseCase
+from src.application.usecases.search_products_usecase import SearchProductsUseCase
+from src.infrastructure.primary.rest_api.serializers.encoding import EncodedEntityCache
+from src.infrastructure.primary.tracing import instrument
+from src.infrastructure.secondary.sqlite_db.category_repository_adapter import CategoryRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.database import SessionLocal
+from src.infrastructure.secondary.sqlite_db.product_listing_adapter import ProductListingAdapter
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.product_search_adapter import ProductSearchAdapter
+from src.infrastructure.secondary.sqlite_db.unit_of_work import SqlAlchemyUnitOfWork
+
+
+# Encoded entities per session factory: versions are only unique within one database.
+_encoded_entity_caches = WeakKeyDictionary()
+
+
+def get_session() -> Session:
+    """
+    Returns the database session of the current request, opening it on first
+    use.  Set app.config["SESSION_FACTORY"] to use another database.
+    """
+    if "db" not in g:
+        g.db = current_app.config.get("SESSION_FACTORY", SessionLocal)()
+    return g.db
+
+def close_session(exception=None) -> None:
+    """
+    Closes the session of the current request, if one was opened.
+    """
+    db = g.pop("db", None)
+    if db is not None:
+        db.close()
+
+def get_encoded_entity_cache() -> EncodedEntityCache:
+    """
+    Returns the cache of encoded entities for the database of the current app.
+    """
+    session_factory = current_app.config.get("SESSION_FACTORY", SessionLocal)
+    cache = _encoded_entity_caches.get(session_factory)
+    if cache is None:
+        cache = _encoded_entity_caches.setdefault(session_factory, EncodedEntityCache())
+    return cache
+
+def init_app(app) -> None:
+    """
+    Registers the per-request resource cleanup on the app.
+    """
+    app.teardown_appcontext(close_session)
+
+# Use cases and adapters are wrapped with instrument(), which only proxies them while the request is traced.
+
+def get_product_use_case() -> GetProductUseCase:
+    return instrument(GetProductUseCase(instrument(ProductRepositoryAdapter(get_session()), "repository")), "usecase")
+
+def get_category_use_case() -> GetCategoryUseCase:
+    return instrument(GetCategoryUseCase(instrument(CategoryRepositoryAdapter(get_session()), "repository")), "usecase")
+
+def get_batch_products_use_case() -> BatchProductsUseCase:
+    # The unit of work opens its own session, so the batch commits independently of the request session.
+    unit_of_work = SqlAlchemyUnitOfWork(current_app.config.get("SESSION_FACTORY", SessionLocal))
+    return instrument(BatchProductsUseCase(instrument(unit_of_work, "unit_of_work")), "usecase")
+
+def get_export_products_use_case() -> ExportProductsUseCase:
+    return instrument(ExportProductsUseCase(instrument(ProductRepositoryAdapter(get_session()), "repository")), "usecase")
+
+def get_search_products_use_case() -> SearchProductsUseCase:
+    return instrument(SearchProductsUseCase(instrument(ProductSearchAdapter(get_session()), "repository")), "usecase")
+
+def get_list_products_use_case() -> ListProductsUseCase:
+    return instrument(ListProductsUseCase(instrument(ProductListingAdapter(get_session()), "repository")), "usecase")
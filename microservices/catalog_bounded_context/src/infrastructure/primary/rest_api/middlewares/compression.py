@@ -0,0 +1,191 @@
+import gzip
+import threading
+import time
+import zlib
+from typing import Callable, Dict, NamedTuple, Optional
+from flask import Flask, Response, current_app, request
+from src.infrastructure.primary.rest_api.middlewares.http_caching import encoded_etag
+from src.utils.lru_ttl_cache import CacheStats, LruTtlCache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised only where brotli is not installed
+    brotli = None
+
+# Bodies smaller than this are sent as they are; override with the COMPRESSION_MIN_SIZE app setting.
+DEFAULT_MIN_SIZE = 1024
+
+COMPRESSIBLE_MIMETYPES = frozenset({
+    "application/json",
+    "application/x-ndjson",
+    "text/csv",
+    "text/html",
+    "text/plain",
+})
+
+# Levels that suit dynamic responses: most of the size reduction for a fraction of the CPU of the maximum.
+GZIP_LEVEL = 6
+DEFLATE_LEVEL = 6
+BROTLI_QUALITY = 5
+
+_ENCODERS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": lambda body: gzip.compress(body, GZIP_LEVEL, mtime=0),
+    "deflate": lambda body: zlib.compress(body, DEFLATE_LEVEL),
+}
+if brotli is not None:
+    _ENCODERS["br"] = lambda body: brotli.compress(body, quality=BROTLI_QUALITY)
+
+# Preferred encoding when the client rates several equally.
+_PREFERENCE = ("br", "gzip", "deflate")
+
+
+class CompressionStats(NamedTuple):
+    """
+    What compression did for one endpoint.
+    """
+    responses: int  # Responses sent compressed.
+    bytes_in: int
+    bytes_out: int
+    cpu_seconds: float  # Spent compressing; cache hits cost none.
+    cache_hits: int
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_in - self.bytes_out
+
+
+class ResponseCompressor:
+    """
+    after_request hook that compresses response bodies with the best
+    encoding the client accepts (brotli if installed, gzip or deflate).
+
+    Responses with an ETag are compressed once per encoding and served from
+    a cache afterwards, with the tag of the encoding, e.g. "product-1-v1-gzip",
+    so every representation keeps a strong ETag of its own.  A checksum of the body is kept with each entry, so
+    a response whose ETag is reused for other content is never served stale.
+    Streamed responses, bodies that already have a Content-Encoding and
+    bodies below the size threshold are left alone.
+    """
+
+    def __init__(self, max_cached: int = 10_000, ttl_seconds: float = 3600.0):
+        """
+        Initializes the compressor with an empty cache.
+
+        Args:
+            max_cached (int, optional): The maximum number of compressed bodies kept. Defaults to 10000.
+            ttl_seconds (float, optional): How long a compressed body is kept. Defaults to one hour.
+        """
+        self.cache = LruTtlCache(max_entries=max_cached, ttl_seconds=ttl_seconds, negative_ttl_seconds=None)
+        self._stats: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Registers the compressor on an app.  It is available afterwards as
+        app.extensions["compression"].
+        """
+        app.after_request(self.compress_response)
+        app.extensions["compression"] = self
+
+    @staticmethod
+    def negotiate(accept_encodings) -> Optional[str]:
+        """
+        Picks the encoding the client rates highest among the available ones.
+
+        Args:
+            accept_encodings: The parsed Accept-Encoding header of the request.
+
+        Returns:
+            Optional[str]: The encoding, or None to send the body uncompressed.
+        """
+        best, best_quality = None, 0.0
+        for encoding in _PREFERENCE:
+            if encoding in _ENCODERS:
+                quality = accept_encodings[encoding]
+                if quality > best_quality:
+                    best, best_quality = encoding, quality
+        return best
+
+    def compress_response(self, response: Response) -> Response:
+        """
+        Compresses a response in place if it is worth it.
+
+        Args:
+            response (Response): The response of the view.
+
+        Returns:
+            Response: The same response.
+        """
+        if (response.is_streamed or response.direct_passthrough or not 200 <= response.status_code < 300
+                or response.status_code == 204 or "Content-Encoding" in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES
+                or "no-transform" in response.headers.get("Cache-Control", "")):
+            return response
+        # Whether or not this body gets compressed, the representation depends on Accept-Encoding.
+        response.vary.add("Accept-Encoding")
+        body = response.get_data()
+        if len(body) < current_app.config.get("COMPRESSION_MIN_SIZE", DEFAULT_MIN_SIZE):
+            return response
+        encoding = self.negotiate(request.accept_encodings)
+        if encoding is None:
+            return response
+
+        etag, weak = response.get_etag()
+        response.set_data(self.encode(body, encoding, etag, request.endpoint or "unknown"))
+        response.headers["Content-Encoding"] = encoding
+        if etag is not None:
+            response.set_etag(encoded_etag(etag, encoding), weak=weak)
+        return response
+
+    def encode(self, body: bytes, encoding: str, etag: Optional[str] = None, endpoint: str = "unknown") -> bytes:
+        """
+        Compresses a body and records it in the statistics of its endpoint.
+        Bodies with an ETag come from the cache when the same body was
+        compressed before.
+
+        Args:
+            body (bytes): The uncompressed body.
+            encoding (str): The content coding, as returned by negotiate().
+            etag (Optional[str], optional): The unquoted entity tag of the uncompressed body. Defaults to None.
+            endpoint (str, optional): The endpoint the statistics are kept for. Defaults to "unknown".
+
+        Returns:
+            bytes: The compressed body.
+        """
+        compressed, cpu_seconds = None, 0.0
+        if etag is not None:
+            checksum = zlib.crc32(body)
+            found, entry = self.cache.get((encoding, etag))
+            if found and entry[0] == checksum:
+                compressed = entry[1]
+        hit = compressed is not None
+        if not hit:
+            started = time.process_time()
+            compressed = _ENCODERS[encoding](body)
+            cpu_seconds = time.process_time() - started
+            if etag is not None:
+                self.cache.put((encoding, etag), (checksum, compressed))
+        self._record(endpoint, len(body), len(compressed), cpu_seconds, hit)
+        return compressed
+
+    def _record(self, endpoint: str, bytes_in: int, bytes_out: int, cpu_seconds: float, hit: bool) -> None:
+        with self._lock:
+            totals = self._stats.setdefault(endpoint, [0, 0, 0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += bytes_in
+            totals[2] += bytes_out
+            totals[3] += cpu_seconds
+            totals[4] += hit
+
+    def stats(self) -> Dict[str, CompressionStats]:
+        """
+        Returns the compression totals of each endpoint since the app started.
+        """
+        with self._lock:
+            return {endpoint: CompressionStats(*totals) for endpoint, totals in self._stats.items()}
+
+    def cache_stats(self) -> CacheStats:
+        """
+        Returns the hit, miss and eviction counters of the compressed body cache.
+        """
+        return self.cache.stats()
@@ -0,0 +1,243 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
+from flask import Flask, g, jsonify, request
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+
+# Methods served from the read budget; every other method uses the write budget.
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Sent with 503 responses.  Shed requests cost almost nothing, so clients may come back soon.
+RETRY_AFTER_SECONDS = 1
+
+# Statuses by which a handler reports that a dependency was unavailable or timed out.
+OVERLOAD_STATUSES = frozenset({503, 504})
+
+# Fragments of the SQLite errors raised when another connection holds the database.
+BUSY_DATABASE_ERRORS = ("database is locked", "database table is locked", "database is busy")
+
+
+def is_overload_error(exception: Optional[BaseException]) -> bool:
+    """
+    Tells whether an exception means the service is overloaded, rather than
+    that a request hit a bug: a timeout, an exhausted connection pool, or a
+    locked or busy database.
+
+    Args:
+        exception (Optional[BaseException]): The exception a request ended with, if any.
+
+    Returns:
+        bool: True if the exception is an overload signal.
+    """
+    if isinstance(exception, (TimeoutError, PoolTimeoutError)):
+        return True
+    if isinstance(exception, OperationalError):
+        message = str(exception.orig).lower()
+        return any(fragment in message for fragment in BUSY_DATABASE_ERRORS)
+    return False
+
+
+class LimiterStats(NamedTuple):
+    """
+    Current state and counters of a concurrency limiter.
+    """
+    limit: int
+    in_flight: int
+    accepted: int
+    rejected: int
+
+
+class AimdLimiter:
+    """
+    Thread-safe concurrency limit that adapts to latency with additive
+    increase, multiplicative decrease (AIMD), as TCP congestion control does.
+
+    A request that finishes within the latency target, while the limit is
+    actually in use, raises the limit by 1/limit, i.e. by one per full round
+    of requests.  A slow or failed request multiplies it by the backoff
+    factor, at most once per round: requests that started before the last
+    decrease already ran at the old limit and do not count again.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        latency_target: float = 0.1,
+        backoff: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes the limiter.
+
+        Args:
+            initial_limit (int, optional): The starting number of concurrent requests. Defaults to 20.
+            min_limit (int, optional): The limit never drops below this. Defaults to 1.
+            max_limit (int, optional): The limit never grows above this. Defaults to 200.
+            latency_target (float, optional): Requests slower than this, in seconds, lower the limit.
+                Defaults to 0.1.
+            backoff (float, optional): The factor applied to the limit on a slow request. Defaults to 0.9.
+            clock (Callable[[], float], optional): Source of the current time. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If the limits are not ordered or the backoff is not between 0 and 1.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit.")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1.")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._accepted = 0
+        self._rejected = 0
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> Optional[float]:
+        """
+        Admits a request if the limit allows it.
+
+        Returns:
+            Optional[float]: The start time of the admitted request, to pass to release(),
+            or None if the request must be shed.
+        """
+        with self._lock:
+            if self._in_flight >= int(self._limit):
+                self._rejected += 1
+                return None
+            self._in_flight += 1
+            self._accepted += 1
+            return self._clock()
+
+    def release(self, started: float, overloaded: bool = False) -> None:
+        """
+        Records the end of an admitted request and adapts the limit.
+
+        Args:
+            started (float): What try_acquire() returned.
+            overloaded (bool, optional): The request failed in a way that suggests overload,
+                e.g. it timed out or found the database locked. Defaults to False.
+        """
+        now = self._clock()
+        with self._lock:
+            in_flight = self._in_flight
+            self._in_flight -= 1
+            if overloaded or now - started > self.latency_target:
+                if started >= self._last_decrease:
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                    self._last_decrease = now
+            elif 2 * in_flight >= int(self._limit):
+                # Only grow while at least half the limit is in use; an idle service proves nothing.
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+    @property
+    def limit(self) -> int:
+        """The number of concurrent requests currently allowed."""
+        return int(self._limit)
+
+    def stats(self) -> LimiterStats:
+        """
+        Returns the current limit, the requests in flight and the admission counters.
+        """
+        with self._lock:
+            return LimiterStats(int(self._limit), self._in_flight, self._accepted, self._rejected)
+
+
+class ConcurrencyLimiter:
+    """
+    Load shedding for a Flask app.  Reads and writes are admitted by separate
+    AIMD limiters, so a burst of bulk writes cannot take the capacity that
+    storefront reads need.  A request over its limit is answered at once
+    with 503 and Retry-After instead of queueing behind slow ones.
+
+    Streamed endpoints, such as the export, hold their slot until the stream
+    ends, which says nothing about how loaded the service is.  They are
+    admitted by a budget of their own without a latency target, so a long
+    download neither takes a read slot nor lowers the read limit.
+
+    Besides latency, only overload signals lower a limit: 503 and 504
+    responses, timeouts and a locked or busy database.  Other errors,
+    such as a bug answered with 500, say nothing about load.
+    """
+
+    def __init__(
+        self,
+        read: Optional[AimdLimiter] = None,
+        write: Optional[AimdLimiter] = None,
+        stream: Optional[AimdLimiter] = None,
+        exempt_endpoints: Iterable[str] = ("metrics",),
+        stream_endpoints: Iterable[str] = ("products.export_products_route",),
+    ):
+        """
+        Initializes the budgets.
+
+        Args:
+            read (Optional[AimdLimiter], optional): The limiter of GET, HEAD and OPTIONS requests.
+                Defaults to one starting at 32 requests with a 100 ms target.
+            write (Optional[AimdLimiter], optional): The limiter of the other requests.
+                Defaults to one starting at 8 requests with a 250 ms target.
+            stream (Optional[AimdLimiter], optional): The limiter of the stream endpoints.
+                Defaults to at most 4 streams, lowered only by failed ones.
+            exempt_endpoints (Iterable[str], optional): Endpoints that are never shed, so that the
+                service can still be observed while overloaded. Defaults to ("metrics",).
+            stream_endpoints (Iterable[str], optional): Endpoints admitted by the stream budget.
+                Defaults to ("products.export_products_route",).
+        """
+        self.budgets: Dict[str, AimdLimiter] = {
+            "read": read or AimdLimiter(initial_limit=32, min_limit=4, max_limit=256, latency_target=0.1),
+            "write": write or AimdLimiter(initial_limit=8, min_limit=1, max_limit=64, latency_target=0.25),
+            "stream": stream or AimdLimiter(initial_limit=4, min_limit=1, max_limit=4, latency_target=float("inf")),
+        }
+        self.exempt_endpoints = frozenset(exempt_endpoints)
+        self.stream_endpoints = frozenset(stream_endpoints)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Registers the limiter on an app.  It is available afterwards as
+        app.extensions["concurrency_limiter"].
+        """
+        app.before_request(self._admit)
+        app.after_request(self._record_status)
+        app.teardown_request(self._release)
+        app.extensions["concurrency_limiter"] = self
+
+    def _admit(self):
+        if request.endpoint in self.exempt_endpoints:
+            return None
+        if request.endpoint in self.stream_endpoints:
+            budget = "stream"
+        else:
+            budget = "read" if request.method in READ_METHODS else "write"
+        started = self.budgets[budget].try_acquire()
+        if started is None:
+            response = jsonify({"message": f"Too many concurrent {budget} requests; retry shortly."})
+            response.status_code = 503
+            response.headers["Retry-After"] = str(RETRY_AFTER_SECONDS)
+            return response
+        g.concurrency_admission = (budget, started)
+        return None
+
+    @staticmethod
+    def _record_status(response):
+        g.concurrency_overloaded = response.status_code in OVERLOAD_STATUSES
+        return response
+
+    def _release(self, exception=None) -> None:
+        # Runs after the response is sent, so streamed bodies count until the stream ends.
+        admission = g.pop("concurrency_admission", None)
+        if admission is not None:
+            budget, started = admission
+            overloaded = is_overload_error(exception) or g.pop("concurrency_overloaded", False)
+            self.budgets[budget].release(started, overloaded=overloaded)
+
+    def stats(self) -> Dict[str, LimiterStats]:
+        """
+        Returns the state of the read, write and stream budgets.
+        """
+        return {budget: limiter.stats() for budget, limiter in self.budgets.items()}
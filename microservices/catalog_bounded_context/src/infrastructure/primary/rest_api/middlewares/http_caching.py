@@ -0,0 +1,104 @@
+from functools import wraps
+from typing import Optional
+from werkzeug.datastructures import ETags
+from flask import Response, current_app, make_response, request
+
+
+def entity_etag(kind: str, entity_id: int, version: int) -> str:
+    """
+    Builds the strong ETag of an entity from its stored version, so it can
+    be compared without loading or serializing the entity.
+
+    Args:
+        kind (str): The kind of entity, e.g. "product".
+        entity_id (int): The ID of the entity.
+        version (int): The stored version of the entity.
+
+    Returns:
+        str: The unquoted entity tag.
+    """
+    return f"{kind}-{entity_id}-v{version}"
+
+
+# Content codings the compression middleware may apply; each gets its own entity tag.
+CONTENT_CODINGS = ("br", "gzip", "deflate")
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    Builds the strong ETag of a content-coded representation, e.g.
+    "product-1-v1-gzip".  The compressed bytes differ from the identity ones,
+    so they need a tag of their own to stay strong.
+
+    Args:
+        etag (str): The unquoted tag of the identity representation.
+        encoding (str): The Content-Encoding of the representation.
+
+    Returns:
+        str: The unquoted entity tag.
+    """
+    return f"{etag}-{encoding}"
+
+
+def matching_etag(if_none_match: ETags, etag: str) -> Optional[str]:
+    """
+    Finds which representation of an entity version the client has cached:
+    the identity one or one of its content-coded ones.
+
+    Args:
+        if_none_match (ETags): The parsed If-None-Match header.
+        etag (str): The unquoted tag of the identity representation.
+
+    Returns:
+        Optional[str]: The matching unquoted tag, or None if the client's copy is stale.
+    """
+    # If-None-Match uses the weak comparison, so W/ tags from other caches match as well.
+    for candidate in (etag, *(encoded_etag(etag, encoding) for encoding in CONTENT_CODINGS)):
+        if if_none_match.contains_weak(candidate):
+            return candidate
+    return None
+
+
+def not_modified(kind: str, entity_id: int, version: Optional[int]) -> Optional[Response]:
+    """
+    Answers a conditional GET from the current version of an entity.
+
+    Args:
+        kind (str): The kind of entity, e.g. "product".
+        entity_id (int): The ID of the entity.
+        version (Optional[int]): The current version, or None if the entity does not exist.
+
+    Returns:
+        Optional[Response]: A 304 response with the tag of the client's copy if it is current,
+        otherwise None.
+    """
+    if version is None:
+        return None
+    etag = matching_etag(request.if_none_match, entity_etag(kind, entity_id, version))
+    if etag is None:
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def cache_control(default: str):
+    """
+    Route decorator that sets the Cache-Control header of successful and 304
+    responses.  The value can be overridden per endpoint with the
+    CACHE_CONTROL app setting, e.g.
+    app.config["CACHE_CONTROL"] = {"products.get_product_route": "no-cache"}.
+
+    Args:
+        default (str): The header value used when the app setting has none for the route.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            response = make_response(view(*args, **kwargs))
+            if response.status_code in (200, 304):
+                overrides = current_app.config.get("CACHE_CONTROL", {})
+                response.headers["Cache-Control"] = overrides.get(request.endpoint, default)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,261 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Tuple
+from flask import Flask, Response, current_app, g, request
+from src.infrastructure.primary.rest_api.dependencies import get_encoded_entity_cache
+
+PROMETHEUS_MIMETYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds of the latency buckets, in seconds; fine below 100 ms, where the p99 of reads should be.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds of the payload size buckets, in bytes.
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# Route label of requests that matched no route, so that scanners cannot create a series per URL.
+UNMATCHED_ROUTE = "unmatched"
+
+_HISTOGRAMS = {
+    "http_request_duration_seconds": ("Time from routing to the end of the response body.", LATENCY_BUCKETS),
+    "http_request_size_bytes": ("Size of the request bodies.", SIZE_BUCKETS),
+    "http_response_size_bytes": ("Size of the response bodies as sent, after compression.", SIZE_BUCKETS),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class _Shard:
+    """
+    The counters of one thread.  Only the owning thread writes to it, so
+    updates need no lock; readers copy it, which is atomic under the GIL.
+    """
+
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.histograms: Dict[Tuple[str, Labels], List[float]] = {}
+
+
+class RequestMetrics:
+    """
+    Request instrumentation for a Flask app, exposed at GET /metrics in the
+    Prometheus text format: request counts by status, in-flight requests,
+    and latency and payload size histograms per blueprint, route and method.
+
+    Each thread counts into its own shard, so recording a request takes no
+    lock; a scrape sums the shards.  Shards of finished threads are folded
+    into a shared total, which keeps memory flat on servers that start a
+    thread per request.
+
+    The scrape also reports the concurrency limiter, the compression
+    middleware and the encoded entity cache when they are installed.
+    """
+
+    def __init__(self, path: str = "/metrics"):
+        """
+        Initializes empty metrics.
+
+        Args:
+            path (str, optional): Where the metrics are served. Defaults to "/metrics".
+        """
+        self.path = path
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._retired = _Shard()
+        self._lock = threading.Lock()  # Guards the shard list and the retired total, not the counters.
+        self._fold_at = 64
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Registers the hooks and the metrics route on an app.  Register it
+        before other middleware, so that requests they answer early (e.g.
+        load shedding) are counted too.  It is available afterwards as
+        app.extensions["metrics"].
+        """
+        app.before_request(self._start)
+        app.after_request(self._record_response)
+        app.teardown_request(self._finish)
+        app.add_url_rule(self.path, "metrics", self.render)
+        app.extensions["metrics"] = self
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+                if len(self._shards) >= self._fold_at:
+                    self._fold_finished_threads()
+                    self._fold_at = max(64, 2 * len(self._shards))
+        return shard
+
+    def _fold_finished_threads(self) -> None:
+        # Called with the lock held.  A finished thread no longer writes to its shard.
+        live = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                live.append(shard)
+            else:
+                _merge(self._retired, shard)
+        self._shards = live
+
+    def _labels(self) -> Labels:
+        rule = request.url_rule
+        return (
+            ("blueprint", request.blueprint or ""),
+            ("route", rule.rule if rule is not None else UNMATCHED_ROUTE),
+            ("method", request.method),
+        )
+
+    def _start(self) -> None:
+        labels = self._labels()
+        counters = self._shard().counters
+        key = ("http_requests_in_flight", labels)
+        counters[key] = counters.get(key, 0) + 1
+        g.metrics_request = (labels, time.perf_counter())
+
+    @staticmethod
+    def _record_response(response: Response) -> Response:
+        g.metrics_response = (response.status_code, response.content_length)
+        return response
+
+    def _finish(self, exception=None) -> None:
+        started = g.pop("metrics_request", None)
+        if started is None:
+            return
+        labels, start = started
+        status, size = g.pop("metrics_response", (500, None))
+        shard = self._shard()
+        counters = shard.counters
+        if exception is not None:
+            status, size = 500, None
+            key = ("http_request_exceptions_total", labels + (("exception", type(exception).__name__),))
+            counters[key] = counters.get(key, 0) + 1
+        counters[("http_requests_in_flight", labels)] -= 1
+        key = ("http_requests_total", labels + (("status", str(status)),))
+        counters[key] = counters.get(key, 0) + 1
+        self._observe(shard, "http_request_duration_seconds", labels, time.perf_counter() - start)
+        self._observe(shard, "http_request_size_bytes", labels, request.content_length or 0)
+        if size is not None:  # Unknown for streamed bodies.
+            self._observe(shard, "http_response_size_bytes", labels, size)
+
+    @staticmethod
+    def _observe(shard: _Shard, name: str, labels: Labels, value: float) -> None:
+        buckets = _HISTOGRAMS[name][1]
+        values = shard.histograms.get((name, labels))
+        if values is None:
+            # One count per bucket, then +Inf, the sum and the count.
+            values = shard.histograms[(name, labels)] = [0] * (len(buckets) + 3)
+        values[bisect_left(buckets, value)] += 1
+        values[-2] += value
+        values[-1] += 1
+
+    def snapshot(self) -> _Shard:
+        """
+        Returns the totals of all threads so far.
+        """
+        total = _Shard()
+        # Merged under the lock: a fold moves a shard into the retired total, and a
+        # snapshot taken across it would count that shard twice.
+        with self._lock:
+            for shard in [self._retired] + self._shards:
+                _merge(total, shard)
+        return total
+
+    def render(self) -> Response:
+        """
+        The metrics view: the current totals in the Prometheus text format.
+        """
+        lines = list(_render_requests(self.snapshot()))
+        lines.extend(_render_extensions())
+        return Response("\n".join(lines) + "\n", mimetype=PROMETHEUS_MIMETYPE)
+
+
+def _merge(total: _Shard, shard: _Shard) -> None:
+    # dict() and list() copy in one step under the GIL, so the owner can keep writing meanwhile.
+    for key, value in dict(shard.counters).items():
+        total.counters[key] = total.counters.get(key, 0) + value
+    for key, values in dict(shard.histograms).items():
+        values = list(values)
+        sums = total.histograms.get(key)
+        if sums is None:
+            total.histograms[key] = values
+        else:
+            for index, value in enumerate(values):
+                sums[index] += value
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _family(name: str, kind: str, description: str, samples) -> Iterator[str]:
+    yield f"# HELP {name} {description}"
+    yield f"# TYPE {name} {kind}"
+    for labels, value in samples:
+        yield f"{name}{_format_labels(labels)} {_format_value(value)}"
+
+
+def _render_requests(total: _Shard) -> Iterator[str]:
+    def counters(name: str):
+        return sorted((labels, value) for (metric, labels), value in total.counters.items() if metric == name)
+
+    yield from _family("http_requests_total", "counter", "Requests answered, by status.",
+                       counters("http_requests_total"))
+    yield from _family("http_request_exceptions_total", "counter", "Unhandled exceptions, by type.",
+                       counters("http_request_exceptions_total"))
+    yield from _family("http_requests_in_flight", "gauge", "Requests being processed.",
+                       counters("http_requests_in_flight"))
+    for name, (description, buckets) in _HISTOGRAMS.items():
+        yield f"# HELP {name} {description}"
+        yield f"# TYPE {name} histogram"
+        series = sorted((labels, values) for (metric, labels), values in total.histograms.items() if metric == name)
+        for labels, values in series:
+            cumulative = 0
+            for bound, count in zip(buckets + ("+Inf",), values):
+                cumulative += count
+                le = bound if isinstance(bound, str) else _format_value(bound)
+                yield f"{name}_bucket{_format_labels(labels + (('le', le),))} {_format_value(cumulative)}"
+            yield f"{name}_sum{_format_labels(labels)} {_format_value(values[-2])}"
+            yield f"{name}_count{_format_labels(labels)} {_format_value(values[-1])}"
+
+
+def _render_extensions() -> Iterator[str]:
+    extensions = current_app.extensions
+    limiter = extensions.get("concurrency_limiter")
+    if limiter is not None:
+        budgets = sorted(limiter.stats().items())
+        yield from _family("catalog_concurrency_limit", "gauge", "Concurrent requests the limiter allows.",
+                           [((("budget", budget),), s.limit) for budget, s in budgets])
+        yield from _family("catalog_concurrency_in_flight", "gauge", "Requests admitted by the limiter.",
+                           [((("budget", budget),), s.in_flight) for budget, s in budgets])
+        yield from _family("catalog_concurrency_requests_total", "counter", "Admission decisions of the limiter.",
+                           [((("budget", budget), ("decision", decision)), value)
+                            for budget, s in budgets
+                            for decision, value in (("accepted", s.accepted), ("rejected", s.rejected))])
+    caches = [("encoded_entity", get_encoded_entity_cache().stats())]
+    compressor = extensions.get("compression")
+    if compressor is not None:
+        endpoints = sorted(compressor.stats().items())
+        yield from _family("catalog_compression_bytes_total", "counter", "Bytes before and after compression.",
+                           [((("endpoint", endpoint), ("stage", stage)), value)
+                            for endpoint, s in endpoints
+                            for stage, value in (("in", s.bytes_in), ("out", s.bytes_out))])
+        yield from _family("catalog_compression_cpu_seconds_total", "counter", "CPU time spent compressing.",
+                           [((("endpoint", endpoint),), s.cpu_seconds) for endpoint, s in endpoints])
+        caches.append(("compressed_body", compressor.cache_stats()))
+    for field, kind in (("hits", "counter"), ("misses", "counter"), ("evictions", "counter"),
+                        ("expirations", "counter"), ("size", "gauge")):
+        name = f"catalog_cache_{field}" + ("_total" if kind == "counter" else "")
+        yield from _family(name, kind, f"Cache {field}.",
+                           [((("cache", cache),), getattr(stats, field)) for cache, stats in caches])
@@ -0,0 +1,63 @@
+import time
+from flask import Flask, Response, current_app, g, request
+from src.infrastructure.primary.tracing import (
+    DEFAULT_PROFILE_DIR,
+    DEFAULT_SLOW_REQUEST_SECONDS,
+    RequestTrace,
+    SlowRequestProfiler,
+    server_timing,
+    set_current_trace,
+)
+
+
+class RequestTracing(SlowRequestProfiler):
+    """
+    Opt-in request tracing for a Flask app, turned on with the
+    INSTRUMENTATION app setting.
+
+    While it is on, the use cases and port adapters that the dependencies
+    module builds are wrapped with instrument(), every call to them is
+    recorded as a span, the time per layer is sent in a Server-Timing
+    header, and a StackSampler samples the request.  Requests slower than
+    SLOW_REQUEST_SECONDS are saved as JSON in PROFILE_DIR: their spans,
+    call counts and sampled stacks, which flame graph tools can render.
+
+    While it is off, each request costs a configuration lookup and the
+    dependencies are returned unwrapped.
+    """
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Registers the tracing on an app.  It is available afterwards as
+        app.extensions["tracing"].
+        """
+        app.before_request(self._start)
+        app.after_request(self._add_server_timing)
+        app.teardown_request(self._finish)
+        app.extensions["tracing"] = self
+
+    def _start(self) -> None:
+        if not current_app.config.get("INSTRUMENTATION", False):
+            return
+        trace = RequestTrace()
+        set_current_trace(trace)
+        g.request_trace = trace
+        self.sampler.watch(trace)
+
+    @staticmethod
+    def _add_server_timing(response: Response) -> Response:
+        trace = g.get("request_trace")
+        if trace is not None:
+            response.headers["Server-Timing"] = server_timing(trace)
+        return response
+
+    def _finish(self, exception=None) -> None:
+        trace = g.pop("request_trace", None)
+        if trace is None:
+            return
+        duration = time.perf_counter() - trace.started
+        self.sampler.unwatch()
+        set_current_trace(None)
+        if duration >= current_app.config.get("SLOW_REQUEST_SECONDS", DEFAULT_SLOW_REQUEST_SECONDS):
+            self.profile(current_app.config.get("PROFILE_DIR", DEFAULT_PROFILE_DIR), trace, duration,
+                         request.method, request.full_path, request.endpoint, exception)
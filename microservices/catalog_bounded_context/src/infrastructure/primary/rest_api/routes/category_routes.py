@@ -1,5 +1,6 @@
 from flask import Blueprint
 from src.infrastructure.primary.rest_api.controllers.category_controller import create_category, get_category
+from src.infrastructure.primary.rest_api.middlewares.http_caching import cache_control
 
 category_bp = Blueprint('categories', __name__, url_prefix='/categories')
 
@@ -8,5 +9,6 @@ def create_category_route():
     return create_category()
 
 @category_bp.route('/<int:category_id>', methods=['GET'])
+@cache_control('public, max-age=300, must-revalidate')
 def get_category_route(category_id):
     return get_category(category_id)
@@ -1,5 +1,6 @@
 from flask import Blueprint
-from src.infrastructure.primary.rest_api.controllers.product_controller import create_product, get_product
+from src.infrastructure.primary.rest_api.controllers.product_controller import batch_products, create_product, export_products, get_product, list_products, search_products
+from src.infrastructure.primary.rest_api.middlewares.http_caching import cache_control
 
 product_bp = Blueprint('products', __name__, url_prefix='/products')
 
@@ -7,6 +8,23 @@ product_bp = Blueprint('products', __name__, url_prefix='/products')
 def create_product_route():
     return create_product()
 
+@product_bp.route('/', methods=['GET'], strict_slashes=False)
+def list_products_route():
+    return list_products()
+
+@product_bp.route('/batch', methods=['POST'])
+def batch_products_route():
+    return batch_products()
+
+@product_bp.route('/export', methods=['GET'])
+def export_products_route():
+    return export_products()
+
+@product_bp.route('/search', methods=['GET'])
+def search_products_route():
+    return search_products()
+
 @product_bp.route('/<int:product_id>', methods=['GET'])
+@cache_control('public, max-age=60, must-revalidate')
 def get_product_route(product_id):
     return get_product(product_id)
@@ -1,3 +1,5 @@
+from src.application.utils.validation import validate_string
+
 def serialize_category(category):
     return {
         'category_id': category.category_id,
@@ -6,5 +8,27 @@ def serialize_category(category):
     }
 
 def deserialize_category(data):
-    #Implement deserialization logic here.
-    pass
+    """
+    Validates a category payload from a client and converts it into the
+    arguments of CreateCategoryUseCase.create_category.
+
+    Client input is untrusted, so it always goes through full validation and
+    the regular entity constructors, never the from_storage path.
+
+    Raises:
+        TypeError: If a field has the wrong type.
+        ValueError: If a field is missing or invalid.
+    """
+    if not isinstance(data, dict):
+        raise TypeError("Category payload must be a JSON object.")
+    if 'name' not in data:
+        raise ValueError("Missing field: name")
+
+    validate_string(data['name'], max_length=255)
+    description = data.get('description', '')
+    validate_string(description, min_length=0, can_be_empty=True)
+
+    return {
+        'name': data['name'],
+        'description': description,
+    }
@@ -0,0 +1,168 @@
+import json
+from typing import Any, Callable, Hashable, Iterable, Optional
+from flask import Response
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.primary.rest_api.serializers.category_serializer import serialize_category
+from src.infrastructure.primary.rest_api.serializers.product_serializer import serialize_product
+from src.utils.lru_ttl_cache import CacheStats, LruTtlCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only where orjson is not installed
+    orjson = None
+
+JSON_MIMETYPE = "application/json"
+
+
+def _default(value: Any) -> Any:
+    # Called by the encoder for values it does not know.
+    if isinstance(value, Price):
+        return {"amount": value.amount, "currency": value.currency}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Built once: json.dumps with non-default options creates a new encoder per call.
+_STDLIB_ENCODER = json.JSONEncoder(default=_default, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encodes a value as compact UTF-8 JSON, with orjson when it is installed.
+    Price objects are encoded as {"amount": ..., "currency": ...}.
+
+    Args:
+        value (Any): The value to encode.
+
+    Returns:
+        bytes: The JSON document.
+
+    Raises:
+        TypeError: If the value contains something that cannot be encoded.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+    return _STDLIB_ENCODER.encode(value).encode()
+
+
+class EncodedEntityCache:
+    """
+    Encoded JSON of entities, keyed by kind, ID and version.  A new version is
+    a new key, so writes need no invalidation; old versions simply age out of
+    the LRU.  Each entry also keeps a fingerprint of the fields it was encoded
+    from and is only served to an entity with the same fingerprint, so an ID
+    and version that come back with other content (after a delete and
+    re-create, or from another database) are encoded again.
+    """
+
+    def __init__(self, max_entries: int = 50_000, ttl_seconds: float = 3600.0):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int, optional): The maximum number of encoded entities kept. Defaults to 50000.
+            ttl_seconds (float, optional): How long an entry is kept. Defaults to one hour.
+        """
+        self.cache = LruTtlCache(max_entries=max_entries, ttl_seconds=ttl_seconds, negative_ttl_seconds=None)
+
+    def get_or_encode(
+        self, key: Hashable, version: Optional[int], fingerprint: Hashable, encode: Callable[[], bytes]
+    ) -> bytes:
+        """
+        Returns the cached encoding of an entity version, encoding it on a miss
+        or when the cached entry was encoded from other content.
+
+        Args:
+            key (Hashable): The kind and ID of the entity, e.g. ("product", 12).
+            version (Optional[int]): The version of the entity.  Entities without one are not cached.
+            fingerprint (Hashable): The encoded fields of the entity, compared on every hit.
+            encode (Callable[[], bytes]): Encodes the entity.
+
+        Returns:
+            bytes: The encoded entity.
+        """
+        if version is None:
+            return encode()
+        found, entry = self.cache.get((key, version))
+        if found and entry[0] == fingerprint:
+            return entry[1]
+        body = encode()
+        self.cache.put((key, version), (fingerprint, body))
+        return body
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the hit, miss and eviction counters of the cache.
+        """
+        return self.cache.stats()
+
+
+def encode_product(product: Product, cache: Optional[EncodedEntityCache] = None) -> bytes:
+    """
+    Encodes a product as JSON, reusing the cached bytes of its version if possible.
+
+    Args:
+        product (Product): The product to encode.
+        cache (Optional[EncodedEntityCache], optional): Where encoded products are kept.
+
+    Returns:
+        bytes: The JSON object of the product.
+    """
+    if cache is None:
+        return dumps(serialize_product(product))
+    image_urls = None if product.image_urls is None else tuple(product.image_urls)
+    fingerprint = (product.name, product.description, product.price.minor_units, product.price.currency,
+                   product.category_id, image_urls)
+    return cache.get_or_encode(("product", product.product_id), product.version, fingerprint,
+                               lambda: dumps(serialize_product(product)))
+
+
+def encode_category(category: Category, cache: Optional[EncodedEntityCache] = None) -> bytes:
+    """
+    Encodes a category as JSON, reusing the cached bytes of its version if possible.
+
+    Args:
+        category (Category): The category to encode.
+        cache (Optional[EncodedEntityCache], optional): Where encoded categories are kept.
+
+    Returns:
+        bytes: The JSON object of the category.
+    """
+    if cache is None:
+        return dumps(serialize_category(category))
+    return cache.get_or_encode(("category", category.category_id), category.version,
+                               (category.name, category.description), lambda: dumps(serialize_category(category)))
+
+
+def encode_page(items: Iterable[bytes], **fields: Any) -> bytes:
+    """
+    Builds a page document {"items": [...], **fields} by joining already
+    encoded items, so the items are neither decoded nor copied into a dict.
+
+    Args:
+        items (Iterable[bytes]): The encoded items, in order.
+        **fields (Any): Further members of the page, e.g. total=41, page=1.
+
+    Returns:
+        bytes: The JSON object of the page.
+    """
+    parts = [b'{"items":[', b",".join(items), b"]"]
+    for name, value in fields.items():
+        parts.append(b"," + dumps(name) + b":" + dumps(value))
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+def json_response(body: bytes, status: int = 200) -> Response:
+    """
+    Wraps an encoded JSON document in a response.
+
+    Args:
+        body (bytes): The JSON document.
+        status (int, optional): The HTTP status. Defaults to 200.
+
+    Returns:
+        Response: The response.
+    """
+    return Response(body, status=status, mimetype=JSON_MIMETYPE)
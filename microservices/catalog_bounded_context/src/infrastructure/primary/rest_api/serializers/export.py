@@ -0,0 +1,106 @@
+import csv
+import io
+import zlib
+from typing import BinaryIO, Iterable, Iterator, List
+from src.domain.models.entities.Product import Product
+from src.infrastructure.primary.rest_api.serializers.encoding import dumps
+from src.infrastructure.primary.rest_api.serializers.product_serializer import serialize_product
+
+# Export formats and their media types.
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+CSV_COLUMNS = ("product_id", "name", "description", "price", "currency", "category_id", "image_urls")
+# Image URLs cannot contain spaces, so they are joined with one in a single CSV cell.
+_CSV_URL_SEPARATOR = " "
+
+# Writes to the output file are gathered into blocks of this size.
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def encode_export(batches: Iterable[List[Product]], export_format: str) -> Iterator[bytes]:
+    """
+    Encodes batches of products as NDJSON (one JSON object per line) or CSV
+    with a header row.  Each batch becomes one chunk, so the output can be
+    streamed while only one batch is in memory.
+
+    Args:
+        batches (Iterable[List[Product]]): The products to export.
+        export_format (str): "ndjson" or "csv".
+
+    Returns:
+        Iterator[bytes]: The encoded chunks.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if export_format == "ndjson":
+        return _encode_ndjson(batches)
+    if export_format == "csv":
+        return _encode_csv(batches)
+    raise ValueError(f"Unknown export format {export_format!r}; use one of {', '.join(EXPORT_MEDIA_TYPES)}.")
+
+
+def _encode_ndjson(batches: Iterable[List[Product]]) -> Iterator[bytes]:
+    for batch in batches:
+        yield b"".join(dumps(serialize_product(product)) + b"\n" for product in batch)
+
+
+def _encode_csv(batches: Iterable[List[Product]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(CSV_COLUMNS)
+    for batch in batches:
+        writer.writerows(
+            (product.product_id, product.name, product.description, f"{product.price.amount:.2f}",
+             product.price.currency, product.category_id, _CSV_URL_SEPARATOR.join(product.image_urls))
+            for product in batch
+        )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()  # Only the header, for an empty export.
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Compresses a stream of chunks into one gzip stream, chunk by chunk.
+
+    Args:
+        chunks (Iterable[bytes]): The data to compress.
+        level (int, optional): The compression level, from 1 (fastest) to 9 (smallest). Defaults to 6.
+
+    Returns:
+        Iterator[bytes]: The compressed chunks; empty ones are skipped.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # 16+: gzip header and trailer.
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def write_export(chunks: Iterable[bytes], output: BinaryIO) -> int:
+    """
+    Writes a stream of chunks to a binary file in large blocks.
+
+    Args:
+        chunks (Iterable[bytes]): The data to write.
+        output (BinaryIO): The file to write to.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    written = 0
+    pending: List[bytes] = []
+    pending_size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= WRITE_BUFFER_SIZE:
+            written += output.write(b"".join(pending))
+            pending, pending_size = [], 0
+    if pending:
+        written += output.write(b"".join(pending))
+    return written
@@ -1,12 +1,204 @@
+import math
+from src.application.usecases.batch_products_usecase import (
+    BATCH_CREATED,
+    BATCH_INVALID,
+    BATCH_NOT_FOUND,
+    BATCH_UPDATED,
+    MAX_BATCH_SIZE,
+)
+from src.application.utils.validation import (
+    MAX_STORED_INTEGER,
+    validate_integer,
+    validate_price,
+    validate_string,
+    validate_url,
+)
+from src.domain.models.value_objects.Price import MINOR_UNITS_PER_MAJOR, Price
+
+# Status code reported for each outcome of a batch item.
+BATCH_STATUS_CODES = {BATCH_CREATED: 201, BATCH_UPDATED: 200, BATCH_INVALID: 400, BATCH_NOT_FOUND: 404}
+
 def serialize_product(product):
     return {
         'product_id': product.product_id,
         'name': product.name,
         'description': product.description,
-        'price': product.price,
-        'category_id': product.category_id
+        'price': product.price.amount,
+        'currency': product.price.currency,
+        'category_id': product.category_id,
+        'image_urls': product.image_urls,
     }
 
 def deserialize_product(data):
-    #Implement deserialization logic here. 
-    pass
+    """
+    Validates a product payload from a client and converts it into the
+    arguments of CreateProductUseCase.create_product.
+
+    Client input is untrusted, so it always goes through full validation and
+    the regular entity constructors, never the from_storage path.
+
+    Raises:
+        TypeError: If a field has the wrong type.
+        ValueError: If a field is missing or invalid.
+    """
+    if not isinstance(data, dict):
+        raise TypeError("Product payload must be a JSON object.")
+    for field in ('name', 'price', 'category_id'):
+        if field not in data:
+            raise ValueError(f"Missing field: {field}")
+
+    validate_string(data['name'], max_length=255)
+    description = data.get('description', '')
+    validate_string(description, min_length=0, can_be_empty=True)
+    validate_price(data['price'])
+    validate_integer(data['category_id'], min_value=0, max_value=MAX_STORED_INTEGER)
+    image_urls = data.get('image_urls')
+    if image_urls is not None:
+        if not isinstance(image_urls, list):
+            raise TypeError("image_urls must be a list.")
+        for url in image_urls:
+            validate_url(url)
+
+    return {
+        'name': data['name'],
+        'description': description,
+        'price': Price(amount=data['price'], currency=data.get('currency', 'USD')),
+        'category_id': data['category_id'],
+        'image_urls': image_urls,
+    }
+
+def deserialize_product_update(data):
+    """
+    Validates a partial product payload, as sent to update a product, and
+    converts it into the arguments of UpdateProductUseCase.update_product.
+    Only the fields present in the payload are returned.
+
+    Raises:
+        TypeError: If a field has the wrong type.
+        ValueError: If a field is invalid.
+    """
+    if not isinstance(data, dict):
+        raise TypeError("Product payload must be a JSON object.")
+    fields = {}
+    if 'name' in data:
+        validate_string(data['name'], max_length=255)
+        fields['name'] = data['name']
+    if 'description' in data:
+        validate_string(data['description'], min_length=0, can_be_empty=True)
+        fields['description'] = data['description']
+    if 'price' in data:
+        validate_price(data['price'])
+        fields['price'] = Price(amount=data['price'], currency=data.get('currency', 'USD'))
+    elif 'currency' in data:
+        raise ValueError("currency can only be changed together with price.")
+    if 'category_id' in data:
+        validate_integer(data['category_id'], min_value=0, max_value=MAX_STORED_INTEGER)
+        fields['category_id'] = data['category_id']
+    if 'image_urls' in data:
+        if not isinstance(data['image_urls'], list):
+            raise TypeError("image_urls must be a list.")
+        for url in data['image_urls']:
+            validate_url(url)
+        fields['image_urls'] = data['image_urls']
+    return fields
+
+def deserialize_batch_item(data):
+    """
+    Validates one item of a product batch: an update if it has a product_id,
+    otherwise a new product.  Returns a change for
+    BatchProductsUseCase.apply_changes.
+
+    Raises:
+        TypeError: If a field has the wrong type.
+        ValueError: If a field is missing or invalid.
+    """
+    if isinstance(data, dict) and 'product_id' in data:
+        validate_integer(data['product_id'], min_value=1, max_value=MAX_STORED_INTEGER)
+        return dict(deserialize_product_update(data), product_id=data['product_id'])
+    return deserialize_product(data)
+
+def deserialize_batch(data):
+    """
+    Validates a product batch request, {"items": [...]}.  Items that cannot
+    be parsed are answered right away; the others become changes for
+    BatchProductsUseCase.apply_changes.
+
+    Returns:
+        tuple: (changes, responses), where responses has one entry per item: the
+        400 response of an invalid item, or None where a change is pending.
+
+    Raises:
+        ValueError: If the request has no items list or too many items.
+    """
+    items = data.get('items') if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        raise ValueError('Expected a JSON object with an items list.')
+    if len(items) > MAX_BATCH_SIZE:
+        raise ValueError(f'At most {MAX_BATCH_SIZE} products can be changed at once.')
+    changes, responses = [], []
+    for item in items:
+        try:
+            changes.append(deserialize_batch_item(item))
+            responses.append(None)
+        except (TypeError, ValueError) as e:
+            responses.append({'status': 400, 'message': str(e)})
+    return changes, responses
+
+def serialize_batch(responses, results):
+    """
+    Builds the response of a product batch by filling the pending entries of
+    responses with the results of BatchProductsUseCase.apply_changes, in order.
+    """
+    results = iter(results)
+    for position, response in enumerate(responses):
+        if response is None:
+            result = next(results)
+            response = {'status': BATCH_STATUS_CODES[result.outcome]}
+            if result.product is not None:
+                response['product'] = serialize_product(result.product)
+            else:
+                response['message'] = result.message
+            responses[position] = response
+    return {'items': responses}
+
+def deserialize_query_arg(args, name, type=str, default=None):
+    """
+    Reads an optional query argument.  Unlike args.get(name, type=...), a
+    value that does not convert is an error instead of the default, so a
+    mistyped filter is not silently dropped.
+
+    Integers must fit in storage, and numbers must be finite and fit in
+    storage as minor units, so that no filter fails in the database.
+
+    Raises:
+        ValueError: If the value does not convert to the type or is out of range.
+    """
+    value = args.get(name)
+    if value is None:
+        return default
+    try:
+        converted = type(value)
+    except ValueError:
+        raise ValueError(f'{name} must be {"an integer" if type is int else "a number"}, got {value!r}.') from None
+    if type is int and abs(converted) > MAX_STORED_INTEGER:
+        raise ValueError(f'{name} is out of range, got {value!r}.')
+    if type is float and not (math.isfinite(converted) and abs(converted) * MINOR_UNITS_PER_MAJOR < MAX_STORED_INTEGER):
+        raise ValueError(f'{name} is out of range, got {value!r}.')
+    return converted
+
+def deserialize_product_ids(values):
+    """
+    Parses the ids query argument of a multi-get: comma-separated lists,
+    possibly repeated, e.g. ids=1,2&ids=3.
+
+    Raises:
+        ValueError: If an ID is not an integer, or does not fit in storage.
+    """
+    try:
+        product_ids = [int(raw) for value in values for raw in value.split(',') if raw.strip()]
+    except ValueError:
+        raise ValueError('ids must be a comma-separated list of integers.') from None
+    for product_id in product_ids:
+        if abs(product_id) > MAX_STORED_INTEGER:
+            raise ValueError(f'ids is out of range, got {product_id}.')
+    return product_ids
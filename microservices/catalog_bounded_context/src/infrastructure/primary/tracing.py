@@ -0,0 +1,299 @@
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+# Requests slower than this are profiled to disk.
+DEFAULT_SLOW_REQUEST_SECONDS = 0.5
+# Where profiles are written.
+DEFAULT_PROFILE_DIR = "profiles"
+
+# Spans kept per request; calls beyond it are still counted and timed per layer.
+MAX_SPANS = 1000
+# Frames kept per sampled stack, counted from the innermost one.
+MAX_STACK_DEPTH = 128
+
+_current_trace: ContextVar[Optional["RequestTrace"]] = ContextVar("request_trace", default=None)
+
+
+class Span(NamedTuple):
+    """
+    One call to an instrumented object.
+    """
+    layer: str  # e.g. "usecase" or "repository".
+    name: str  # e.g. "GetProductUseCase.get_product".
+    start: float  # Seconds since the start of the request.
+    duration: float
+    depth: int  # 0 for calls made by the controller.
+
+
+class RequestTrace:
+    """
+    The spans, call counts and stack samples of one request.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans: List[Span] = []
+        self.calls: Counter = Counter()
+        self.layer_seconds: Dict[str, float] = {}
+        self.stacks: Counter = Counter()
+        self.open_layers: List[str] = []
+
+    def record(self, layer: str, name: str, start: float, duration: float) -> None:
+        """
+        Adds a finished call.  Time spent in a layer is counted once, even
+        when calls of that layer are nested.
+        """
+        self.calls[name] += 1
+        if len(self.spans) < MAX_SPANS:
+            self.spans.append(Span(layer, name, start - self.started, duration, len(self.open_layers)))
+        if layer not in self.open_layers:
+            self.layer_seconds[layer] = self.layer_seconds.get(layer, 0.0) + duration
+
+
+class Traced:
+    """
+    Proxy that times every public method call of an object into the trace
+    of the current request.  Calls made outside a traced request go
+    straight through.  Coroutine methods are timed until they are awaited;
+    generators are timed until they are returned, not until they are
+    exhausted.
+    """
+
+    def __init__(self, target: Any, layer: str):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_layer", layer)
+        object.__setattr__(self, "_prefix", type(target).__name__)
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if name.startswith("_") or not callable(value):
+            return value
+        layer, qualified_name = self._layer, f"{self._prefix}.{name}"
+
+        if inspect.iscoroutinefunction(value):
+            async def traced_async(*args, **kwargs):
+                trace = _current_trace.get()
+                if trace is None:
+                    return await value(*args, **kwargs)
+                trace.open_layers.append(layer)
+                start = time.perf_counter()
+                try:
+                    return await value(*args, **kwargs)
+                finally:
+                    duration = time.perf_counter() - start
+                    trace.open_layers.pop()
+                    trace.record(layer, qualified_name, start, duration)
+
+            object.__setattr__(self, name, traced_async)
+            return traced_async
+
+        def traced(*args, **kwargs):
+            trace = _current_trace.get()
+            if trace is None:
+                return value(*args, **kwargs)
+            trace.open_layers.append(layer)
+            start = time.perf_counter()
+            try:
+                return value(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                trace.open_layers.pop()
+                trace.record(layer, qualified_name, start, duration)
+
+        object.__setattr__(self, name, traced)  # Later lookups find it without __getattr__.
+        return traced
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._target, name, value)
+
+
+def instrument(target: Any, layer: str) -> Any:
+    """
+    Wraps a use case or a port adapter in a Traced proxy if the current
+    request is traced, and returns it unchanged otherwise, so that
+    instrumentation costs nothing while it is turned off.
+
+    Args:
+        target (Any): The object to instrument.
+        layer (str): The name its calls are reported under, e.g. "usecase".
+
+    Returns:
+        Any: The proxy or the object itself.
+    """
+    if _current_trace.get() is None:
+        return target
+    return Traced(target, layer)
+
+
+@contextmanager
+def trace_calls() -> Iterator[RequestTrace]:
+    """
+    Traces a block, e.g. a CLI command or an ASGI request: objects passed to instrument() inside it are wrapped, and
+    their calls are recorded into the yielded trace.
+
+    Yields:
+        RequestTrace: The trace of the block.
+    """
+    trace = RequestTrace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def set_current_trace(trace: Optional[RequestTrace]) -> None:
+    """
+    Makes trace the one instrument() records into, for frameworks whose
+    request hooks cannot wrap the request in trace_calls(); None stops tracing.
+    """
+    _current_trace.set(trace)
+
+
+def server_timing(trace: RequestTrace) -> str:
+    """
+    Formats the time per layer of a trace as a Server-Timing header value,
+    e.g. "usecase;dur=12.5, repository;dur=11.0".
+    """
+    return ", ".join(f"{layer};dur={seconds * 1000:.1f}" for layer, seconds in trace.layer_seconds.items())
+
+
+class StackSampler:
+    """
+    Background thread that periodically records the call stack of every
+    thread serving a traced request.  Unlike a deterministic profiler it
+    does not slow the request down, so it can run on every request and the
+    samples are kept only for the slow ones.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Initializes the sampler; its thread starts with the first watched request.
+
+        Args:
+            interval (float, optional): Seconds between samples. Defaults to 0.005.
+        """
+        self.interval = interval
+        self._watched: Dict[int, RequestTrace] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, trace: RequestTrace) -> None:
+        """
+        Samples the current thread into a trace until unwatch() is called.
+        """
+        with self._lock:
+            self._watched[threading.get_ident()] = trace
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+                self._thread.start()
+
+    def unwatch(self) -> None:
+        """
+        Stops sampling the current thread.
+        """
+        with self._lock:
+            self._watched.pop(threading.get_ident(), None)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._watched:
+                    self._thread = None  # Stops when idle; the next watch() starts a new thread.
+                    return
+                watched = list(self._watched.items())
+            frames = sys._current_frames()
+            for ident, trace in watched:
+                frame = frames.get(ident)
+                if frame is not None:
+                    trace.stacks[_folded_stack(frame)] += 1
+
+
+def _folded_stack(frame) -> str:
+    # The "folded" format of flame graph tools: frames from the outermost, separated by semicolons.
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class SlowRequestProfiler:
+    """
+    Writes the profiles of slow requests as JSON: their spans, call counts
+    and sampled stacks, which flame graph tools can render.  At most
+    max_profiles are written per process, so that a slow backend cannot
+    fill the disk.
+    """
+
+    def __init__(self, sample_interval: float = 0.005, max_profiles: int = 100):
+        """
+        Initializes the profiler.
+
+        Args:
+            sample_interval (float, optional): Seconds between stack samples. Defaults to 0.005.
+            max_profiles (int, optional): The most profiles written per process. Defaults to 100.
+        """
+        self.sampler = StackSampler(sample_interval)
+        self.max_profiles = max_profiles
+        self.profiles_written = 0
+        self._lock = threading.Lock()
+
+    def profile(
+        self,
+        directory: str,
+        trace: RequestTrace,
+        duration: float,
+        method: str,
+        path: str,
+        endpoint: Optional[str],
+        exception=None,
+    ) -> Optional[str]:
+        """
+        Writes the profile of a slow request, unless max_profiles were written already.
+
+        Args:
+            directory (str): Where the profile is written; it is created if needed.
+            trace (RequestTrace): The trace of the request.
+            duration (float): How long the request took, in seconds.
+            method (str): The HTTP method of the request.
+            path (str): The path and query string of the request.
+            endpoint (Optional[str]): The name of the route, None if no route matched.
+            exception (optional): The exception the request ended with, if any.
+
+        Returns:
+            Optional[str]: The path of the profile, or None if none was written.
+        """
+        with self._lock:
+            if self.profiles_written >= self.max_profiles:
+                return None
+            self.profiles_written += 1
+        os.makedirs(directory, exist_ok=True)
+        name = (f"{time.strftime('%Y%m%dT%H%M%S')}-{method}-{endpoint or 'unmatched'}"
+                f"-{duration * 1000:.0f}ms-{uuid.uuid4().hex[:8]}.json")
+        profile_path = os.path.join(directory, name)
+        profile = {
+            "method": method,
+            "path": path,
+            "endpoint": endpoint,
+            "duration": duration,
+            "exception": repr(exception) if exception is not None else None,
+            "layers": trace.layer_seconds,
+            "calls": dict(trace.calls),
+            "spans": [span._asdict() for span in trace.spans],
+            "stacks": dict(trace.stacks.most_common()),
+        }
+        with open(profile_path, "w", encoding="utf-8") as file:
+            json.dump(profile, file, indent=1)
+        return profile_path
@@ -0,0 +1,112 @@
+from typing import Dict, Iterator, List, Optional, Sequence
+from src.application.ports.output.category_repository_port import CategoryRepositoryPort
+from src.domain.models.entities.Category import Category
+from src.utils.lru_ttl_cache import CacheStats, LruTtlCache
+
+
+def _copy(category: Category) -> Category:
+    """
+    Returns a private copy of a cached category, so callers that mutate the
+    entity they get back cannot change the cached one.
+    """
+    return category.copy()
+
+
+class CachingCategoryRepository(CategoryRepositoryPort):
+    """
+    Read-through cache in front of any CategoryRepositoryPort.
+
+    get_by_id is served from a bounded LRU/TTL cache, including remembered
+    misses.  Writes go to the wrapped repository and invalidate the affected
+    entries, so the use cases can use it as a drop-in replacement.
+    """
+
+    def __init__(self, repository: CategoryRepositoryPort, cache: Optional[LruTtlCache] = None):
+        """
+        Initializes the caching repository.
+
+        Args:
+            repository (CategoryRepositoryPort): The repository to wrap.
+            cache (Optional[LruTtlCache], optional): The cache to use. Defaults to a new LruTtlCache.
+        """
+        self.repository = repository
+        self.cache = cache if cache is not None else LruTtlCache()
+
+    def get_by_id(self, category_id: int) -> Optional[Category]:
+        found, category = self.cache.get(category_id)
+        if not found:
+            epoch = self.cache.epoch()
+            category = self.repository.get_by_id(category_id)
+            self.cache.put(category_id, category, epoch)
+        return _copy(category) if category is not None else None
+
+    def get_version(self, category_id: int) -> Optional[int]:
+        # Not cached: a version is as cheap to read as the cache entry, and always current.
+        return self.repository.get_version(category_id)
+
+    def get_all(self) -> List[Category]:
+        return self.repository.get_all()
+
+    def iter_all(self, batch_size: int = 500, after_id: Optional[int] = None) -> Iterator[Category]:
+        # Scans are not cached; they would only evict the hot entries.
+        return self.repository.iter_all(batch_size, after_id)
+
+    def add(self, category: Category) -> None:
+        self.repository.add(category)
+        self.cache.invalidate(category.category_id)
+
+    def update(self, category: Category) -> None:
+        try:
+            self.repository.update(category)
+        finally:
+            self.cache.invalidate(category.category_id)
+
+    def delete(self, category_id: int) -> None:
+        try:
+            self.repository.delete(category_id)
+        finally:
+            self.cache.invalidate(category_id)
+
+    def get_many(self, category_ids: Sequence[int]) -> Dict[int, Category]:
+        categories = {}
+        misses = []
+        for category_id in dict.fromkeys(category_ids):
+            found, category = self.cache.get(category_id)
+            if not found:
+                misses.append(category_id)
+            elif category is not None:
+                categories[category_id] = _copy(category)
+        if misses:
+            epoch = self.cache.epoch()
+            loaded = self.repository.get_many(misses)
+            for category_id in misses:
+                category = loaded.get(category_id)
+                self.cache.put(category_id, category, epoch)
+                if category is not None:
+                    categories[category_id] = _copy(category)
+        return categories
+
+    def add_many(self, categories: Sequence[Category]) -> None:
+        self.repository.add_many(categories)
+        for category in categories:
+            self.cache.invalidate(category.category_id)
+
+    def update_many(self, categories: Sequence[Category]) -> List[int]:
+        try:
+            return self.repository.update_many(categories)
+        finally:
+            for category in categories:
+                self.cache.invalidate(category.category_id)
+
+    def delete_many(self, category_ids: Sequence[int]) -> List[int]:
+        try:
+            return self.repository.delete_many(category_ids)
+        finally:
+            for category_id in category_ids:
+                self.cache.invalidate(category_id)
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the hit, miss and eviction counters of the cache.
+        """
+        return self.cache.stats()
@@ -0,0 +1,132 @@
+from typing import Dict, Iterator, List, Optional, Sequence
+from src.application.ports.output.product_repository_port import ProductRepositoryPort
+from src.domain.models.entities.Product import Product
+from src.utils.lru_ttl_cache import CacheStats, LruTtlCache
+
+
+def _copy(product: Product) -> Product:
+    """
+    Returns a private copy of a cached product, so callers that mutate the
+    entity they get back cannot change the cached one.
+    """
+    return product.copy()
+
+
+class CachingProductRepository(ProductRepositoryPort):
+    """
+    Read-through cache in front of any ProductRepositoryPort.
+
+    get_by_id is served from a bounded LRU/TTL cache, including remembered
+    misses.  Writes go to the wrapped repository and invalidate the affected
+    entries, so the use cases can use it as a drop-in replacement.
+    """
+
+    def __init__(self, repository: ProductRepositoryPort, cache: Optional[LruTtlCache] = None):
+        """
+        Initializes the caching repository.
+
+        Args:
+            repository (ProductRepositoryPort): The repository to wrap.
+            cache (Optional[LruTtlCache], optional): The cache to use. Defaults to a new LruTtlCache.
+        """
+        self.repository = repository
+        self.cache = cache if cache is not None else LruTtlCache()
+
+    def get_by_id(self, product_id: int) -> Optional[Product]:
+        found, product = self.cache.get(product_id)
+        if not found:
+            epoch = self.cache.epoch()
+            product = self.repository.get_by_id(product_id)
+            self.cache.put(product_id, product, epoch)
+        return _copy(product) if product is not None else None
+
+    def get_version(self, product_id: int) -> Optional[int]:
+        # Not cached: a version is as cheap to read as the cache entry, and always current.
+        return self.repository.get_version(product_id)
+
+    def get_all(self) -> List[Product]:
+        return self.repository.get_all()
+
+    def iter_all(
+        self,
+        batch_size: int = 500,
+        after_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> Iterator[Product]:
+        # Scans are not cached; they would only evict the hot entries.
+        return self.repository.iter_all(batch_size, after_id, category_id, min_price, max_price)
+
+    def add(self, product: Product) -> None:
+        self.repository.add(product)
+        self.cache.invalidate(product.product_id)
+
+    def update(self, product: Product) -> None:
+        try:
+            self.repository.update(product)
+        finally:
+            self.cache.invalidate(product.product_id)
+
+    def delete(self, product_id: int) -> None:
+        try:
+            self.repository.delete(product_id)
+        finally:
+            self.cache.invalidate(product_id)
+
+    def get_many(self, product_ids: Sequence[int]) -> Dict[int, Product]:
+        products = {}
+        misses = []
+        for product_id in dict.fromkeys(product_ids):
+            found, product = self.cache.get(product_id)
+            if not found:
+                misses.append(product_id)
+            elif product is not None:
+                products[product_id] = _copy(product)
+        if misses:
+            epoch = self.cache.epoch()
+            loaded = self.repository.get_many(misses)
+            for product_id in misses:
+                product = loaded.get(product_id)
+                self.cache.put(product_id, product, epoch)
+                if product is not None:
+                    products[product_id] = _copy(product)
+        return products
+
+    def add_many(self, products: Sequence[Product]) -> None:
+        self.repository.add_many(products)
+        for product in products:
+            self.cache.invalidate(product.product_id)
+
+    def update_many(self, products: Sequence[Product]) -> List[int]:
+        try:
+            return self.repository.update_many(products)
+        finally:
+            for product in products:
+                self.cache.invalidate(product.product_id)
+
+    def reassign_category(self, product_ids: Sequence[int], category_id: int) -> List[int]:
+        try:
+            return self.repository.reassign_category(product_ids, category_id)
+        finally:
+            for product_id in product_ids:
+                self.cache.invalidate(product_id)
+
+    def move_category(self, from_category_id: int, to_category_id: int) -> List[int]:
+        moved = self.repository.move_category(from_category_id, to_category_id)
+        for product_id in moved:
+            self.cache.invalidate(product_id)
+        return moved
+
+    def delete_many(self, product_ids: Sequence[int]) -> List[int]:
+        try:
+            return self.repository.delete_many(product_ids)
+        finally:
+            for product_id in product_ids:
+                self.cache.invalidate(product_id)
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the hit, miss and eviction counters of the cache.
+        """
+        return self.cache.stats()
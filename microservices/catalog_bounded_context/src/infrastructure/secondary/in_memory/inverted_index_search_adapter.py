@@ -0,0 +1,123 @@
+import threading
+from array import array
+from typing import Optional, Sequence
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
+from src.application.ports.output.product_repository_port import ProductRepositoryPort
+from src.application.ports.output.product_search_port import ProductSearchPort, ProductSearchResult
+from src.application.utils.search_query import parse_search_query
+from src.domain.models.entities.Product import Product
+from src.domain.models.inverted_index import InvertedIndex
+from src.domain.models.value_objects.Price import to_minor_units
+
+
+class InvertedIndexSearchAdapter(ProductSearchPort, ProductChangeListenerPort):
+    """
+    Product search on an in-process InvertedIndex, for deployments without
+    SQLite full-text search.  It works with any ProductRepositoryPort: the
+    index is built from the repository's products and kept up to date by
+    registering the adapter as a listener of the product use cases.
+
+    Category and price are kept in arrays next to the index, so filtered
+    searches do not load products; only the returned page is read from the
+    repository.
+    """
+
+    def __init__(self, repository: ProductRepositoryPort, index: Optional[InvertedIndex] = None):
+        """
+        Initializes the adapter.  Call rebuild() to index existing products.
+
+        Args:
+            repository (ProductRepositoryPort): The repository the hits are loaded from.
+            index (Optional[InvertedIndex], optional): The index to use. Defaults to a new, empty one.
+        """
+        self.repository = repository
+        self.index = index if index is not None else InvertedIndex()
+        self._category_ids = array("q")
+        self._prices = array("q")
+        self._lock = threading.Lock()
+
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """
+        Indexes every product of the repository, replacing the current index.
+
+        Args:
+            batch_size (int, optional): How many products to read per batch. Defaults to 1000.
+
+        Returns:
+            int: The number of indexed products.
+        """
+        with self._lock:
+            self.index.clear()
+            self._category_ids = array("q")
+            self._prices = array("q")
+            for product in self.repository.iter_all(batch_size=batch_size):
+                self._add(product)
+            self.index.compact()
+            return len(self.index)
+
+    def _add(self, product: Product) -> None:
+        product_id = product.product_id
+        self.index.add(product_id, product.name, product.description)
+        if product_id >= len(self._prices):
+            grow = bytes(8 * (product_id + 1 - len(self._prices)))
+            self._category_ids.frombytes(grow)
+            self._prices.frombytes(grow)
+        self._category_ids[product_id] = product.category_id
+        self._prices[product_id] = product.price.minor_units
+
+    def product_created(self, product: Product) -> None:
+        with self._lock:
+            self._add(product)
+
+    def product_updated(self, before: Product, after: Product) -> None:
+        with self._lock:
+            if (before.name, before.description) != (after.name, after.description):
+                self.index.remove(before.product_id, before.name, before.description)
+                self.index.add(after.product_id, after.name, after.description)
+            self._category_ids[after.product_id] = after.category_id
+            self._prices[after.product_id] = after.price.minor_units
+
+    def products_reassigned(self, before: Sequence[Product], category_id: int) -> None:
+        with self._lock:
+            for product in before:
+                self._category_ids[product.product_id] = category_id
+
+    def category_moved(self, from_category_id: int, to_category_id: int, product_ids: Sequence[int]) -> None:
+        with self._lock:
+            for product_id in product_ids:
+                self._category_ids[product_id] = to_category_id
+
+    def product_deleted(self, product: Product) -> None:
+        with self._lock:
+            self.index.remove(product.product_id, product.name, product.description)
+
+    def search(
+        self,
+        query: str,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> ProductSearchResult:
+        groups = parse_search_query(query)
+        if not groups:
+            return ProductSearchResult([], 0)
+
+        low = to_minor_units(min_price) if min_price is not None else None
+        high = to_minor_units(max_price) if max_price is not None else None
+
+        def accept(product_id: int) -> bool:
+            if category_id is not None and category_ids[product_id] != category_id:
+                return False
+            if low is not None and prices[product_id] < low:
+                return False
+            return high is None or prices[product_id] <= high
+
+        filtered = category_id is not None or low is not None or high is not None
+        with self._lock:
+            category_ids, prices = self._category_ids, self._prices
+            product_ids, total = self.index.search(groups, limit, offset, accept if filtered else None)
+        products = self.repository.get_many(product_ids)
+        # A product deleted since the search is left out of the page.
+        return ProductSearchResult([products[i] for i in product_ids if i in products], total)
@@ -0,0 +1,97 @@
+import threading
+from typing import Optional, Sequence, Tuple
+from src.application.ports.output.product_change_listener_port import ProductChangeListenerPort
+from src.application.ports.output.product_listing_port import ProductListingPort, ProductPage
+from src.application.ports.output.product_repository_port import ProductRepositoryPort
+from src.domain.models.entities.Product import Product
+from src.domain.models.price_index import PriceIndex
+from src.domain.models.value_objects.Price import to_minor_units
+
+
+class PriceIndexListingAdapter(ProductListingPort, ProductChangeListenerPort):
+    """
+    Product listings from an in-process PriceIndex, for any ProductRepositoryPort.
+    The index is built from the repository's products and kept up to date by
+    registering the adapter as a listener of the product use cases; only the
+    returned page is read from the repository.
+    """
+
+    def __init__(self, repository: ProductRepositoryPort, index: Optional[PriceIndex] = None):
+        """
+        Initializes the adapter.  Call rebuild() to index existing products.
+
+        Args:
+            repository (ProductRepositoryPort): The repository the listed products are loaded from.
+            index (Optional[PriceIndex], optional): The index to use. Defaults to a new, empty one.
+        """
+        self.repository = repository
+        self.index = index if index is not None else PriceIndex()
+        self._lock = threading.Lock()
+
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """
+        Indexes every product of the repository, replacing the current index.
+
+        Args:
+            batch_size (int, optional): How many products to read per batch. Defaults to 1000.
+
+        Returns:
+            int: The number of indexed products.
+        """
+        index = PriceIndex(
+            (product.product_id, product.category_id, product.price.minor_units)
+            for product in self.repository.iter_all(batch_size=batch_size)
+        )
+        with self._lock:
+            self.index = index
+        return len(index)
+
+    def product_created(self, product: Product) -> None:
+        with self._lock:
+            self.index.add(product.product_id, product.category_id, product.price.minor_units)
+
+    def product_updated(self, before: Product, after: Product) -> None:
+        if (before.category_id, before.price) == (after.category_id, after.price):
+            return
+        with self._lock:
+            self.index.remove(before.product_id, before.category_id, before.price.minor_units)
+            self.index.add(after.product_id, after.category_id, after.price.minor_units)
+
+    def products_reassigned(self, before: Sequence[Product], category_id: int) -> None:
+        with self._lock:
+            for product in before:
+                self.index.remove(product.product_id, product.category_id, product.price.minor_units)
+                self.index.add(product.product_id, category_id, product.price.minor_units)
+
+    def category_moved(self, from_category_id: int, to_category_id: int, product_ids: Sequence[int]) -> None:
+        with self._lock:
+            self.index.move_category(from_category_id, to_category_id)
+
+    def product_deleted(self, product: Product) -> None:
+        with self._lock:
+            self.index.remove(product.product_id, product.category_id, product.price.minor_units)
+
+    def list_products(
+        self,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        descending: bool = False,
+        limit: int = 20,
+        offset: int = 0,
+        after: Optional[Tuple[int, int]] = None,
+        count_total: bool = True,
+    ) -> ProductPage:
+        with self._lock:
+            product_ids, total = self.index.select(
+                category_id,
+                to_minor_units(min_price) if min_price is not None else None,
+                to_minor_units(max_price) if max_price is not None else None,
+                descending,
+                limit,
+                offset,
+                after,
+            )
+        products = self.repository.get_many(product_ids)
+        # A product deleted since the lookup is left out of the page.
+        return ProductPage([products[i] for i in product_ids if i in products], total if count_total else None)
@@ -0,0 +1,80 @@
+from typing import Dict, Iterator, List, Optional, Sequence
+from src.application.ports.output.product_repository_port import ProductRepositoryPort
+from src.domain.models.entities.Product import Product
+from src.domain.models.product_table import ProductTable
+
+
+class ProductTableRepositoryAdapter(ProductRepositoryPort):
+    """
+    In-memory product repository backed by a columnar ProductTable.
+    """
+
+    def __init__(self, table: Optional[ProductTable] = None):
+        self.table = table if table is not None else ProductTable()
+
+    def get_by_id(self, product_id: int) -> Optional[Product]:
+        return self.table.get(product_id)
+
+    def get_version(self, product_id: int) -> Optional[int]:
+        return self.table.version(product_id)
+
+    def get_all(self) -> List[Product]:
+        return list(self.table)
+
+    def iter_all(
+        self,
+        batch_size: int = 500,
+        after_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> Iterator[Product]:
+        return self.table.iter_products(after_id, category_id, min_price, max_price, batch_size)
+
+    def add(self, product: Product) -> None:
+        self.table.add(product)
+
+    def update(self, product: Product) -> None:
+        self.table.update(product)
+
+    def delete(self, product_id: int) -> None:
+        self.table.delete(product_id)
+
+    def get_many(self, product_ids: Sequence[int]) -> Dict[int, Product]:
+        products = {}
+        for product_id in product_ids:
+            product = self.table.get(product_id)
+            if product is not None:
+                products[product_id] = product
+        return products
+
+    def add_many(self, products: Sequence[Product]) -> None:
+        # Reject the whole batch up front, as a failed transaction would.
+        for product in products:
+            if product.product_id is not None and product.product_id in self.table:
+                raise ValueError(f"Product with ID {product.product_id} already exists.")
+        self.table.extend(products)
+
+    def update_many(self, products: Sequence[Product]) -> List[int]:
+        missing = []
+        for product in products:
+            if product.product_id in self.table:
+                self.table.update(product)
+            else:
+                missing.append(product.product_id)
+        return missing
+
+    def reassign_category(self, product_ids: Sequence[int], category_id: int) -> List[int]:
+        return self.table.set_category(dict.fromkeys(product_ids), category_id)
+
+    def move_category(self, from_category_id: int, to_category_id: int) -> List[int]:
+        return self.table.move_category(from_category_id, to_category_id)
+
+    def delete_many(self, product_ids: Sequence[int]) -> List[int]:
+        missing = []
+        for product_id in product_ids:
+            if product_id in self.table:
+                self.table.delete(product_id)
+            else:
+                missing.append(product_id)
+        return missing
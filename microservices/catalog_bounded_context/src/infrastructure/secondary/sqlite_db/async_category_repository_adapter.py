@@ -0,0 +1,80 @@
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.ports.output.async_category_repository_port import AsyncCategoryRepositoryPort
+from src.domain.models.entities.Category import Category
+from src.infrastructure.secondary.sqlite_db.models import CategoryModel
+from src.infrastructure.secondary.sqlite_db.row_mapping import CATEGORY_COLUMNS, category_to_values, row_to_category
+from src.utils.utils import chunked
+
+# Bulk reads bind at most this many IDs per statement, well below SQLite's variable limit.
+_CHUNK_SIZE = 500
+
+
+class AsyncCategoryRepositoryAdapter(AsyncCategoryRepositoryPort):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_id(self, category_id: int) -> Optional[Category]:
+        result = await self.db.execute(select(*CATEGORY_COLUMNS).where(CategoryModel.category_id == category_id))
+        row = result.first()
+        return row_to_category(row) if row is not None else None
+
+    async def get_version(self, category_id: int) -> Optional[int]:
+        result = await self.db.execute(select(CategoryModel.version).where(CategoryModel.category_id == category_id))
+        return result.scalar_one_or_none()
+
+    async def get_many(self, category_ids: Sequence[int]) -> Dict[int, Category]:
+        categories = {}
+        for chunk in chunked(dict.fromkeys(category_ids), _CHUNK_SIZE):
+            result = await self.db.execute(select(*CATEGORY_COLUMNS).where(CategoryModel.category_id.in_(chunk)))
+            for row in result:
+                categories[row[0]] = row_to_category(row)
+        return categories
+
+    async def get_all(self) -> List[Category]:
+        result = await self.db.execute(select(*CATEGORY_COLUMNS).order_by(CategoryModel.category_id))
+        return [row_to_category(row) for row in result]
+
+    async def iter_all(self, batch_size: int = 500, after_id: Optional[int] = None) -> AsyncIterator[Category]:
+        query = select(*CATEGORY_COLUMNS).order_by(CategoryModel.category_id).limit(batch_size)
+        last_id = after_id
+        while True:
+            page = query if last_id is None else query.where(CategoryModel.category_id > last_id)
+            rows = (await self.db.execute(page)).all()
+            for row in rows:
+                yield row_to_category(row)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
+    async def add(self, category: Category) -> None:
+        values = category_to_values(category)
+        if category.category_id is not None:
+            values["category_id"] = category.category_id
+        result = await self.db.execute(
+            insert(CategoryModel).values(**values).returning(CategoryModel.category_id, CategoryModel.version)
+        )
+        category.category_id, category.version = result.one()
+        await self.db.commit()
+
+    async def update(self, category: Category) -> None:
+        result = await self.db.execute(
+            update(CategoryModel)
+            .where(CategoryModel.category_id == category.category_id)
+            .values(**category_to_values(category), version=CategoryModel.version + 1)
+            .returning(CategoryModel.version)
+        )
+        version = result.scalar_one_or_none()
+        if version is None:
+            await self.db.rollback()
+            raise ValueError(f"Category with ID {category.category_id} not found.")
+        category.version = version
+        await self.db.commit()
+
+    async def delete(self, category_id: int) -> None:
+        result = await self.db.execute(delete(CategoryModel).where(CategoryModel.category_id == category_id))
+        if result.rowcount == 0:
+            await self.db.rollback()
+            raise ValueError(f"Category with ID {category_id} not found.")
+        await self.db.commit()
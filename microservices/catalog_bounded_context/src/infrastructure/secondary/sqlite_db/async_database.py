@@ -0,0 +1,58 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, SingletonThreadPool
+from src.config.config import config
+from src.infrastructure.secondary.sqlite_db.database import Base, apply_sqlite_pragmas, engine_options, sqlite_pragmas
+
+
+def to_async_url(database_url: str) -> str:
+    """
+    Converts a synchronous SQLite URL into its aiosqlite equivalent.
+    URLs that already name an async driver are returned unchanged.
+    """
+    if database_url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + database_url[len("sqlite://"):]
+    return database_url
+
+
+def create_async_catalog_engine(database_url: Optional[str] = None, settings=config) -> AsyncEngine:
+    """
+    Async counterpart of create_catalog_engine.  Every aiosqlite connection
+    already runs on its own thread, so the "thread" pool falls back to the
+    async queue pool.
+
+    Args:
+        database_url (Optional[str], optional): The database URL. Defaults to settings.DATABASE_URL.
+        settings (Config, optional): Where the values are read from. Defaults to the application config.
+
+    Returns:
+        AsyncEngine: The new engine.
+    """
+    database_url = to_async_url(database_url or settings.DATABASE_URL)
+    options = engine_options(database_url, settings)
+    if options.get("poolclass") in (QueuePool, SingletonThreadPool):
+        options.update(poolclass=AsyncAdaptedQueuePool, pool_size=settings.DB_POOL_SIZE,
+                       max_overflow=settings.DB_MAX_OVERFLOW, pool_timeout=settings.DB_POOL_TIMEOUT)
+    new_engine = create_async_engine(database_url, **options)
+    if new_engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(new_engine.sync_engine, sqlite_pragmas(settings))
+    return new_engine
+
+
+async_engine = create_async_catalog_engine()
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Dependency
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def init_async_db(bind=async_engine):
+    """
+    Creates the catalog tables if they do not exist yet.
+    """
+    from src.infrastructure.secondary.sqlite_db import models  # noqa: F401  Registers the tables on Base.
+    from src.infrastructure.secondary.sqlite_db.search_index import create_search_index
+    async with bind.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.run_sync(create_search_index)
@@ -0,0 +1,133 @@
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.ports.output.async_product_repository_port import AsyncProductRepositoryPort
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import to_minor_units
+from src.infrastructure.secondary.sqlite_db.category_statistics_adapter import CategoryStatisticsAdapter
+from src.infrastructure.secondary.sqlite_db.models import ProductModel
+from src.infrastructure.secondary.sqlite_db.row_mapping import PRODUCT_COLUMNS, product_to_values, row_to_product
+from src.utils.utils import chunked
+
+# Bulk reads bind at most this many IDs per statement, well below SQLite's variable limit.
+_CHUNK_SIZE = 500
+
+
+class AsyncProductRepositoryAdapter(AsyncProductRepositoryPort):
+    def __init__(self, db: AsyncSession, maintain_statistics: bool = True):
+        """
+        Args:
+            db (AsyncSession): The session to run statements on.
+            maintain_statistics (bool, optional): Update the category statistics with every write,
+                in the same transaction. Defaults to True.
+        """
+        self.db = db
+        self.maintain_statistics = maintain_statistics
+
+    async def _record(self, removed: Iterable[Tuple[int, int]] = (), added: Iterable[Tuple[int, int]] = ()) -> None:
+        if self.maintain_statistics:
+            await self.db.run_sync(
+                lambda session: CategoryStatisticsAdapter(session, autocommit=False).record_changes(removed, added)
+            )
+
+    async def get_by_id(self, product_id: int) -> Optional[Product]:
+        result = await self.db.execute(select(*PRODUCT_COLUMNS).where(ProductModel.product_id == product_id))
+        row = result.first()
+        return row_to_product(row) if row is not None else None
+
+    async def get_version(self, product_id: int) -> Optional[int]:
+        result = await self.db.execute(select(ProductModel.version).where(ProductModel.product_id == product_id))
+        return result.scalar_one_or_none()
+
+    async def get_many(self, product_ids: Sequence[int]) -> Dict[int, Product]:
+        products = {}
+        for chunk in chunked(dict.fromkeys(product_ids), _CHUNK_SIZE):
+            result = await self.db.execute(select(*PRODUCT_COLUMNS).where(ProductModel.product_id.in_(chunk)))
+            for row in result:
+                products[row[0]] = row_to_product(row)
+        return products
+
+    async def get_all(self) -> List[Product]:
+        result = await self.db.execute(select(*PRODUCT_COLUMNS).order_by(ProductModel.product_id))
+        return [row_to_product(row) for row in result]
+
+    async def iter_all(
+        self,
+        batch_size: int = 500,
+        after_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> AsyncIterator[Product]:
+        query = select(*PRODUCT_COLUMNS).order_by(ProductModel.product_id).limit(batch_size)
+        if category_id is not None:
+            query = query.where(ProductModel.category_id == category_id)
+        if min_price is not None:
+            query = query.where(ProductModel.price_minor_units >= to_minor_units(min_price))
+        if max_price is not None:
+            query = query.where(ProductModel.price_minor_units <= to_minor_units(max_price))
+
+        last_id = after_id
+        while True:
+            page = query if last_id is None else query.where(ProductModel.product_id > last_id)
+            rows = (await self.db.execute(page)).all()
+            for row in rows:
+                yield row_to_product(row)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
+    async def add(self, product: Product) -> None:
+        values = product_to_values(product)
+        if product.product_id is not None:
+            values["product_id"] = product.product_id
+        try:
+            result = await self.db.execute(
+                insert(ProductModel).values(**values).returning(ProductModel.product_id, ProductModel.version)
+            )
+            product_id, version = result.one()
+            await self._record(added=[(product.category_id, product.price.minor_units)])
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        product.product_id, product.version = product_id, version
+
+    async def update(self, product: Product) -> None:
+        try:
+            result = await self.db.execute(
+                select(ProductModel.category_id, ProductModel.price_minor_units)
+                .where(ProductModel.product_id == product.product_id)
+            )
+            before = result.first()
+            result = await self.db.execute(
+                update(ProductModel)
+                .where(ProductModel.product_id == product.product_id)
+                .values(**product_to_values(product), version=ProductModel.version + 1)
+                .returning(ProductModel.version)
+            )
+            version = result.scalar_one_or_none()
+            if version is None:
+                raise ValueError(f"Product with ID {product.product_id} not found.")
+            await self._record([tuple(before)], [(product.category_id, product.price.minor_units)])
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        product.version = version
+
+    async def delete(self, product_id: int) -> None:
+        try:
+            result = await self.db.execute(
+                delete(ProductModel)
+                .where(ProductModel.product_id == product_id)
+                .returning(ProductModel.category_id, ProductModel.price_minor_units)
+            )
+            row = result.first()
+            if row is None:
+                raise ValueError(f"Product with ID {product_id} not found.")
+            await self._record(removed=[tuple(row)])
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
@@ -1,29 +1,165 @@
+from typing import Dict, Iterator, List, Optional, Sequence
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.orm import Session
 from src.application.ports.output.category_repository_port import CategoryRepositoryPort
-from domain.models.entities.Category import Category
+from src.domain.models.entities.Category import Category
+from src.infrastructure.secondary.sqlite_db.models import CategoryModel
+from src.infrastructure.secondary.sqlite_db.row_mapping import CATEGORY_COLUMNS, category_to_values, row_to_category
+from src.utils.utils import chunked
+
+# Bulk operations bind at most this many IDs per statement, well below SQLite's variable limit.
+_CHUNK_SIZE = 500
+_CATEGORIES = CategoryModel.__table__
+
 
 class CategoryRepositoryAdapter(CategoryRepositoryPort):
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, autocommit: bool = True):
+        """
+        Args:
+            db (Session): The session to run statements on.
+            autocommit (bool, optional): Commit after every write.  A unit of work passes False
+                and commits the session itself. Defaults to True.
+        """
         self.db = db
+        self.autocommit = autocommit
 
-    def create_category(self, category: Category):
-        self.db.add(category)
-        self.db.commit()
-        self.db.refresh(category)
-        return category
+    def _commit(self) -> None:
+        if self.autocommit:
+            self.db.commit()
 
-    def get_category(self, category_id: int):
-        return self.db.query(Category).filter(Category.category_id == category_id).first()
+    def _rollback(self) -> None:
+        # Inside a unit of work the failure propagates and the unit of work rolls back.
+        if self.autocommit:
+            self.db.rollback()
 
-    def update_category(self, category: Category):
-        self.db.commit()
-        self.db.refresh(category)
-        return category
+    def get_by_id(self, category_id: int) -> Optional[Category]:
+        row = self.db.execute(select(*CATEGORY_COLUMNS).where(CategoryModel.category_id == category_id)).first()
+        return row_to_category(row) if row is not None else None
 
-    def delete_category(self, category_id: int):
-        category = self.get_category(category_id)
-        if category:
-            self.db.delete(category)
-            self.db.commit()
-            return True
-        return False
+    def get_all(self) -> List[Category]:
+        rows = self.db.execute(select(*CATEGORY_COLUMNS).order_by(CategoryModel.category_id))
+        return [row_to_category(row) for row in rows]
+
+    def iter_all(self, batch_size: int = 500, after_id: Optional[int] = None) -> Iterator[Category]:
+        query = select(*CATEGORY_COLUMNS).order_by(CategoryModel.category_id).limit(batch_size)
+        last_id = after_id
+        while True:
+            page = query if last_id is None else query.where(CategoryModel.category_id > last_id)
+            rows = self.db.execute(page).all()
+            for row in rows:
+                yield row_to_category(row)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
+    def add(self, category: Category) -> None:
+        values = category_to_values(category)
+        if category.category_id is not None:
+            values["category_id"] = category.category_id
+        category.category_id, category.version = self.db.execute(
+            insert(CategoryModel).values(**values).returning(CategoryModel.category_id, CategoryModel.version)
+        ).one()
+        self._commit()
+
+    def update(self, category: Category) -> None:
+        version = self.db.execute(
+            update(CategoryModel)
+            .where(CategoryModel.category_id == category.category_id)
+            .values(**category_to_values(category), version=CategoryModel.version + 1)
+            .returning(CategoryModel.version)
+        ).scalar_one_or_none()
+        if version is None:
+            self._rollback()
+            raise ValueError(f"Category with ID {category.category_id} not found.")
+        category.version = version
+        self._commit()
+
+    def get_version(self, category_id: int) -> Optional[int]:
+        return self.db.execute(
+            select(CategoryModel.version).where(CategoryModel.category_id == category_id)
+        ).scalar_one_or_none()
+
+    def delete(self, category_id: int) -> None:
+        result = self.db.execute(delete(CategoryModel).where(CategoryModel.category_id == category_id))
+        if result.rowcount == 0:
+            self._rollback()
+            raise ValueError(f"Category with ID {category_id} not found.")
+        self._commit()
+
+    def get_many(self, category_ids: Sequence[int]) -> Dict[int, Category]:
+        categories = {}
+        for chunk in chunked(dict.fromkeys(category_ids), _CHUNK_SIZE):
+            for row in self.db.execute(select(*CATEGORY_COLUMNS).where(CategoryModel.category_id.in_(chunk))):
+                categories[row[0]] = row_to_category(row)
+        return categories
+
+    def add_many(self, categories: Sequence[Category]) -> None:
+        if not categories:
+            return
+        rows = [
+            dict(category_to_values(category), category_id=category.category_id)
+            for category in categories
+        ]
+        try:
+            keys = self.db.execute(
+                insert(_CATEGORIES).returning(_CATEGORIES.c.category_id, _CATEGORIES.c.version, sort_by_parameter_order=True),
+                rows,
+            ).all()
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        for category, (category_id, version) in zip(categories, keys):
+            category.category_id, category.version = category_id, version
+
+    def update_many(self, categories: Sequence[Category]) -> List[int]:
+        try:
+            existing = self._existing_ids([category.category_id for category in categories])
+            rows = [
+                dict(category_to_values(category), b_category_id=category.category_id)
+                for category in categories
+                if category.category_id in existing
+            ]
+            if rows:
+                self.db.execute(
+                    update(_CATEGORIES)
+                    .where(_CATEGORIES.c.category_id == bindparam("b_category_id"))
+                    .values(version=_CATEGORIES.c.version + 1),
+                    rows,
+                )
+                # executemany cannot return rows, so the new versions are read back in the same transaction.
+                versions = self._versions([row["b_category_id"] for row in rows])
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        for category in categories:
+            if category.category_id in existing:
+                category.version = versions[category.category_id]
+        return [category.category_id for category in categories if category.category_id not in existing]
+
+    def delete_many(self, category_ids: Sequence[int]) -> List[int]:
+        deleted = set()
+        try:
+            for chunk in chunked(dict.fromkeys(category_ids), _CHUNK_SIZE):
+                deleted.update(self.db.execute(
+                    delete(_CATEGORIES).where(_CATEGORIES.c.category_id.in_(chunk)).returning(_CATEGORIES.c.category_id)
+                ).scalars())
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        return [category_id for category_id in category_ids if category_id not in deleted]
+
+    def _versions(self, category_ids: Sequence[int]) -> Dict[int, int]:
+        versions = {}
+        for chunk in chunked(dict.fromkeys(category_ids), _CHUNK_SIZE):
+            for category_id, version in self.db.execute(select(CategoryModel.category_id, CategoryModel.version).where(CategoryModel.category_id.in_(chunk))):
+                versions[category_id] = version
+        return versions
+
+    def _existing_ids(self, category_ids: Sequence[int]) -> set:
+        existing = set()
+        for chunk in chunked(dict.fromkeys(category_ids), _CHUNK_SIZE):
+            existing.update(self.db.execute(select(CategoryModel.category_id).where(CategoryModel.category_id.in_(chunk))).scalars())
+        return existing
@@ -0,0 +1,182 @@
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence, Tuple
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from src.application.ports.output.category_statistics_port import CategoryStatisticsPort
+from src.domain.models.product_table import PriceSummary
+from src.infrastructure.secondary.sqlite_db.models import CategoryStatisticsModel, ProductModel
+
+_STATISTICS = CategoryStatisticsModel.__table__
+_EMPTY = PriceSummary(0, None, None, 0)
+_STATISTICS_COLUMNS = (
+    CategoryStatisticsModel.category_id,
+    CategoryStatisticsModel.product_count,
+    CategoryStatisticsModel.min_price_minor_units,
+    CategoryStatisticsModel.max_price_minor_units,
+    CategoryStatisticsModel.total_price_minor_units,
+)
+_ACTUAL_COLUMNS = (
+    ProductModel.category_id,
+    func.count(),
+    func.min(ProductModel.price_minor_units),
+    func.max(ProductModel.price_minor_units),
+    func.sum(ProductModel.price_minor_units),
+)
+
+
+def _summarize(prices: Sequence[int]) -> PriceSummary:
+    return PriceSummary(len(prices), min(prices), max(prices), sum(prices))
+
+
+def _prices_by_category(changes: Counter) -> Dict[int, List[int]]:
+    prices_by_category: Dict[int, List[int]] = {}
+    for (category_id, price_minor_units), count in changes.items():
+        prices_by_category.setdefault(category_id, []).extend([price_minor_units] * count)
+    return prices_by_category
+
+
+def _row_values(summary: PriceSummary) -> dict:
+    return {
+        "product_count": summary.count,
+        "min_price_minor_units": summary.min_minor_units,
+        "max_price_minor_units": summary.max_minor_units,
+        "total_price_minor_units": summary.total_minor_units,
+    }
+
+
+class CategoryStatisticsAdapter(CategoryStatisticsPort):
+    """
+    Category statistics kept in the category_statistics table.
+
+    The SQLite product repositories call record_changes() in the same
+    transaction as every product write, so the statistics cannot drift from
+    the products.  Count and total are adjusted arithmetically.  Min and max
+    only widen on insert; removing the current min or max re-reads that one
+    category's extremes through the category_id index.  Prices are
+    aggregated in minor units regardless of currency.
+    """
+
+    def __init__(self, db: Session, autocommit: bool = True):
+        """
+        Args:
+            db (Session): The session to run statements on.
+            autocommit (bool, optional): Commit after rebuild().  A unit of work passes False
+                and commits the session itself. Defaults to True.
+        """
+        self.db = db
+        self.autocommit = autocommit
+
+    def get(self, category_id: int) -> PriceSummary:
+        row = self.db.execute(
+            select(*_STATISTICS_COLUMNS[1:]).where(CategoryStatisticsModel.category_id == category_id)
+        ).first()
+        return PriceSummary(*row) if row is not None else _EMPTY
+
+    def get_all(self) -> Dict[int, PriceSummary]:
+        rows = self.db.execute(select(*_STATISTICS_COLUMNS).order_by(CategoryStatisticsModel.category_id))
+        return {row[0]: PriceSummary(*row[1:]) for row in rows}
+
+    def record_changes(self, removed: Iterable[Tuple[int, int]] = (), added: Iterable[Tuple[int, int]] = ()) -> None:
+        """
+        Applies product writes that were already made in the session, without
+        committing, so that the statistics commit or roll back together with
+        the products.  A product that is in both lists unchanged is ignored.
+
+        Args:
+            removed (Iterable[Tuple[int, int]], optional): (category ID, price in minor units) of the
+                products as they were before the write.
+            added (Iterable[Tuple[int, int]], optional): (category ID, price in minor units) of the
+                products as they are after it.
+        """
+        removed, added = Counter(removed), Counter(added)
+        unchanged = removed & added
+        for category_id, prices in _prices_by_category(removed - unchanged).items():
+            self._remove(category_id, _summarize(prices))
+        for category_id, prices in _prices_by_category(added - unchanged).items():
+            self._add(category_id, _summarize(prices))
+
+    def merge_categories(self, from_category_id: int, to_category_id: int) -> None:
+        """
+        Adds the statistics of one category to another and drops them from the
+        first, after all of its products were moved, without committing.
+
+        Args:
+            from_category_id (int): The ID of the emptied category.
+            to_category_id (int): The ID of the category that received the products.
+        """
+        row = self.db.execute(
+            delete(_STATISTICS)
+            .where(_STATISTICS.c.category_id == from_category_id)
+            .returning(*_STATISTICS_COLUMNS[1:])
+        ).first()
+        if row is not None:
+            self._add(to_category_id, PriceSummary(*row))
+
+    def rebuild(self) -> int:
+        self.db.execute(delete(_STATISTICS))
+        result = self.db.execute(
+            insert(_STATISTICS).from_select(
+                [column.key for column in _STATISTICS_COLUMNS],
+                select(*_ACTUAL_COLUMNS).group_by(ProductModel.category_id),
+            )
+        )
+        self._commit()
+        return result.rowcount
+
+    def find_inconsistencies(self) -> Dict[int, Tuple[PriceSummary, PriceSummary]]:
+        stored = self.get_all()
+        actual = {
+            row[0]: PriceSummary(*row[1:])
+            for row in self.db.execute(select(*_ACTUAL_COLUMNS).group_by(ProductModel.category_id))
+        }
+        return {
+            category_id: (stored.get(category_id, _EMPTY), actual.get(category_id, _EMPTY))
+            for category_id in stored.keys() | actual.keys()
+            if stored.get(category_id, _EMPTY) != actual.get(category_id, _EMPTY)
+        }
+
+    def _add(self, category_id: int, added: PriceSummary) -> None:
+        statement = sqlite_insert(_STATISTICS).values(category_id=category_id, **_row_values(added))
+        self.db.execute(statement.on_conflict_do_update(
+            index_elements=[_STATISTICS.c.category_id],
+            set_={
+                "product_count": _STATISTICS.c.product_count + added.count,
+                "min_price_minor_units": func.min(_STATISTICS.c.min_price_minor_units, added.min_minor_units),
+                "max_price_minor_units": func.max(_STATISTICS.c.max_price_minor_units, added.max_minor_units),
+                "total_price_minor_units": _STATISTICS.c.total_price_minor_units + added.total_minor_units,
+            },
+        ))
+
+    def _remove(self, category_id: int, removed: PriceSummary) -> None:
+        row = self.db.execute(
+            update(_STATISTICS)
+            .where(_STATISTICS.c.category_id == category_id)
+            .values(
+                product_count=_STATISTICS.c.product_count - removed.count,
+                total_price_minor_units=_STATISTICS.c.total_price_minor_units - removed.total_minor_units,
+            )
+            .returning(_STATISTICS.c.product_count, _STATISTICS.c.min_price_minor_units, _STATISTICS.c.max_price_minor_units)
+        ).first()
+        if row is None:
+            return  # Nothing recorded for the category; rebuild() will repair it.
+        count, min_minor_units, max_minor_units = row
+        if count <= 0:
+            self.db.execute(delete(_STATISTICS).where(_STATISTICS.c.category_id == category_id))
+        elif removed.min_minor_units <= min_minor_units or removed.max_minor_units >= max_minor_units:
+            # A removed price may have been the only one at an extreme.
+            new_min, new_max = self.db.execute(
+                select(func.min(ProductModel.price_minor_units), func.max(ProductModel.price_minor_units))
+                .where(ProductModel.category_id == category_id)
+            ).one()
+            if new_min is None:
+                return  # The products disagree with the recorded count; rebuild() will repair it.
+            self.db.execute(
+                update(_STATISTICS)
+                .where(_STATISTICS.c.category_id == category_id)
+                .values(min_price_minor_units=new_min, max_price_minor_units=new_max)
+            )
+
+    def _commit(self) -> None:
+        if self.autocommit:
+            self.db.commit()
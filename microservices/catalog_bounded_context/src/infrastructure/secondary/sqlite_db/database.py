@@ -1,9 +1,104 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+from typing import Dict, Optional
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool, SingletonThreadPool, StaticPool
+from sqlalchemy.schema import CreateColumn
 from src.config.config import config
 
-engine = create_engine(config.DATABASE_URL)
+_POOL_CLASSES = {"queue": QueuePool, "thread": SingletonThreadPool, "null": NullPool, "static": StaticPool}
+
+
+def sqlite_pragmas(settings=config) -> Dict[str, object]:
+    """
+    Returns the pragmas to run on every new SQLite connection, in order.
+
+    Args:
+        settings (Config, optional): Where the values are read from. Defaults to the application config.
+
+    Returns:
+        Dict[str, object]: The pragma values keyed by pragma name.
+    """
+    return {
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,  # First, so the journal_mode switch can wait for locks.
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: Dict[str, object]) -> None:
+    """
+    Registers a connect hook that runs the given pragmas on every new DBAPI
+    connection of the engine.  Pass async_engine.sync_engine for async engines.
+    """
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def engine_options(database_url: str, settings=config) -> dict:
+    """
+    Builds the create_engine keyword arguments for the configured profile.
+
+    Args:
+        database_url (str): The database URL the engine will connect to.
+        settings (Config, optional): Where the values are read from. Defaults to the application config.
+
+    Returns:
+        dict: Keyword arguments for create_engine.
+
+    Raises:
+        ValueError: If DB_POOL does not name a known pool.
+    """
+    options = {"query_cache_size": settings.SQL_COMPILED_CACHE_SIZE}
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return options
+
+    options["connect_args"] = {"check_same_thread": False, "cached_statements": settings.SQLITE_CACHED_STATEMENTS}
+    if url.database in (None, "", ":memory:"):
+        return options  # Each connection would get its own in-memory database; keep SQLAlchemy's choice.
+
+    pool_class = _POOL_CLASSES.get(settings.DB_POOL)
+    if pool_class is None:
+        raise ValueError(f"Unknown DB_POOL {settings.DB_POOL!r}; expected one of {', '.join(_POOL_CLASSES)}.")
+    options["poolclass"] = pool_class
+    if pool_class is QueuePool:
+        options.update(pool_size=settings.DB_POOL_SIZE, max_overflow=settings.DB_MAX_OVERFLOW,
+                       pool_timeout=settings.DB_POOL_TIMEOUT)
+    elif pool_class is SingletonThreadPool:
+        options["pool_size"] = settings.DB_POOL_SIZE
+    return options
+
+
+def create_catalog_engine(database_url: Optional[str] = None, settings=config) -> Engine:
+    """
+    Creates an engine using the configured pool, statement caches and, for
+    SQLite, the configured pragmas.
+
+    Args:
+        database_url (Optional[str], optional): The database URL. Defaults to settings.DATABASE_URL.
+        settings (Config, optional): Where the values are read from. Defaults to the application config.
+
+    Returns:
+        Engine: The new engine.
+    """
+    database_url = database_url or settings.DATABASE_URL
+    new_engine = create_engine(database_url, **engine_options(database_url, settings))
+    if new_engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(new_engine, sqlite_pragmas(settings))
+    return new_engine
+
+
+engine = create_catalog_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -15,3 +110,23 @@ def get_db():
     finally:
         db.close()
 
+def init_db(bind=engine):
+    """
+    Creates the catalog tables, and any columns or indexes added since, if
+    they do not exist yet.  Added columns must have a server default.
+    """
+    from src.infrastructure.secondary.sqlite_db import models  # noqa: F401  Registers the tables on Base.
+    from src.infrastructure.secondary.sqlite_db.search_index import create_search_index
+    with bind.begin() as connection:
+        Base.metadata.create_all(bind=connection)
+        # create_all skips existing tables, including their new columns and indexes.
+        existing = inspect(connection)
+        for table in Base.metadata.sorted_tables:
+            columns = {column["name"] for column in existing.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in columns:
+                    ddl = CreateColumn(column).compile(dialect=connection.dialect)
+                    connection.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {ddl}")
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+        create_search_index(connection)
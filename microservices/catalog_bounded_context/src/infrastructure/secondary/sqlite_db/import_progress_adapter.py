@@ -0,0 +1,35 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from src.application.ports.output.import_progress_port import ImportProgressPort
+from src.infrastructure.secondary.sqlite_db.models import ImportProgressModel
+
+_IMPORT_PROGRESS = ImportProgressModel.__table__
+
+
+class ImportProgressAdapter(ImportProgressPort):
+    """
+    Import positions kept in the import_progress table, one row per source.
+    """
+
+    def __init__(self, db: Session, autocommit: bool = True):
+        """
+        Args:
+            db (Session): The session to run statements on.
+            autocommit (bool, optional): Commit after set_position().  A unit of work passes False
+                and commits the session itself. Defaults to True.
+        """
+        self.db = db
+        self.autocommit = autocommit
+
+    def get_position(self, source: str) -> int:
+        position = self.db.execute(
+            select(ImportProgressModel.position).where(ImportProgressModel.source == source)
+        ).scalar_one_or_none()
+        return position or 0
+
+    def set_position(self, source: str, position: int) -> None:
+        statement = sqlite_insert(_IMPORT_PROGRESS).values(source=source, position=position)
+        self.db.execute(statement.on_conflict_do_update(index_elements=["source"], set_={"position": position}))
+        if self.autocommit:
+            self.db.commit()
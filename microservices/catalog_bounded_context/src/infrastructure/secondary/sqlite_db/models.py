@@ -0,0 +1,70 @@
+from sqlalchemy import Column, Index, Integer, String, Text, text
+from src.infrastructure.secondary.sqlite_db.database import Base
+
+
+class CategoryModel(Base):
+    """
+    Table mapping for categories.  AUTOINCREMENT keeps SQLite from reusing
+    the ID of a deleted category, so (ID, version) never names two bodies.
+    """
+    __tablename__ = "categories"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    category_id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False)
+    description = Column(Text, nullable=False, default="")
+    version = Column(Integer, nullable=False, server_default=text("1"))  # Incremented on every update.
+
+
+class ProductModel(Base):
+    """
+    Table mapping for products.  Prices are stored as integer minor units and
+    image URLs as a JSON array (NULL when the product has no images).
+
+    Listings by category and price range, ordered by price, are answered from
+    the composite index; SQLite appends the rowid (product_id) to every index
+    entry, so ties are already ordered by ID and no sort step is needed.
+    AUTOINCREMENT keeps SQLite from reusing the ID of a deleted product, so an
+    ETag built from (ID, version) never matches a re-created product.
+    """
+    __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_category_id_price", "category_id", "price_minor_units"),
+        Index("ix_products_price", "price_minor_units"),
+        {"sqlite_autoincrement": True},
+    )
+
+    product_id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False)
+    description = Column(Text, nullable=False, default="")
+    price_minor_units = Column(Integer, nullable=False)
+    currency = Column(String(3), nullable=False, default="USD")
+    category_id = Column(Integer, nullable=False)
+    image_urls = Column(Text, nullable=True)
+    version = Column(Integer, nullable=False, server_default=text("1"))  # Incremented on every update.
+
+
+class CategoryStatisticsModel(Base):
+    """
+    Table mapping for the per-category product statistics, maintained
+    incrementally by CategoryStatisticsAdapter.  Categories without products
+    have no row.
+    """
+    __tablename__ = "category_statistics"
+
+    category_id = Column(Integer, primary_key=True, autoincrement=False)
+    product_count = Column(Integer, nullable=False)
+    min_price_minor_units = Column(Integer, nullable=False)
+    max_price_minor_units = Column(Integer, nullable=False)
+    total_price_minor_units = Column(Integer, nullable=False)
+
+
+class ImportProgressModel(Base):
+    """
+    Table mapping for the position of each import, written in the same
+    transaction as the products of every chunk.
+    """
+    __tablename__ = "import_progress"
+
+    source = Column(Text, primary_key=True)
+    position = Column(Integer, nullable=False)
@@ -0,0 +1,62 @@
+from typing import Optional, Tuple
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session
+from src.application.ports.output.product_listing_port import ProductListingPort, ProductPage
+from src.domain.models.value_objects.Price import to_minor_units
+from src.infrastructure.secondary.sqlite_db.models import ProductModel
+from src.infrastructure.secondary.sqlite_db.row_mapping import PRODUCT_COLUMNS, row_to_product
+
+
+class ProductListingAdapter(ProductListingPort):
+    """
+    Product listings on the products table.  The filters and the ordering
+    match ix_products_category_id_price (or ix_products_price without a
+    category), so SQLite reads the page straight from the index, and a
+    keyset page seeks to its first row instead of skipping the rows before it.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def list_products(
+        self,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        descending: bool = False,
+        limit: int = 20,
+        offset: int = 0,
+        after: Optional[Tuple[int, int]] = None,
+        count_total: bool = True,
+    ) -> ProductPage:
+        filters = []
+        if category_id is not None:
+            filters.append(ProductModel.category_id == category_id)
+        if min_price is not None:
+            filters.append(ProductModel.price_minor_units >= to_minor_units(min_price))
+        if max_price is not None:
+            filters.append(ProductModel.price_minor_units <= to_minor_units(max_price))
+
+        page_filters = list(filters)
+        position = tuple_(ProductModel.price_minor_units, ProductModel.product_id)
+        if descending:
+            order = (ProductModel.price_minor_units.desc(), ProductModel.product_id.desc())
+            if after is not None:
+                page_filters.append(position < tuple_(*after))
+        else:
+            order = (ProductModel.price_minor_units, ProductModel.product_id)
+            if after is not None:
+                page_filters.append(position > tuple_(*after))
+        query = select(*PRODUCT_COLUMNS).where(*page_filters).order_by(*order).limit(limit)
+        rows = self.db.execute(query.offset(offset) if offset else query).all()
+
+        if not count_total:
+            total = None
+        elif after is None and offset == 0 and len(rows) < limit:
+            total = len(rows)  # The whole listing fits on the first page.
+        else:
+            # A COUNT(*) over every matching index entry, however deep the page.
+            total = self.db.execute(
+                select(func.count()).select_from(ProductModel).where(*filters)
+            ).scalar_one()
+        return ProductPage([row_to_product(row) for row in rows], total)
@@ -1,29 +1,272 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.orm import Session
 from src.application.ports.output.product_repository_port import ProductRepositoryPort
-from domain.models.entities.Product import Product
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import to_minor_units
+from src.infrastructure.secondary.sqlite_db.category_statistics_adapter import CategoryStatisticsAdapter
+from src.infrastructure.secondary.sqlite_db.models import ProductModel
+from src.infrastructure.secondary.sqlite_db.row_mapping import PRODUCT_COLUMNS, product_to_values, row_to_product
+from src.utils.utils import chunked
+
+# Bulk operations bind at most this many IDs per statement, well below SQLite's variable limit.
+_CHUNK_SIZE = 500
+_PRODUCTS = ProductModel.__table__
+
 
 class ProductRepositoryAdapter(ProductRepositoryPort):
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, autocommit: bool = True, maintain_statistics: bool = True):
+        """
+        Args:
+            db (Session): The session to run statements on.
+            autocommit (bool, optional): Commit after every write.  A unit of work passes False
+                and commits the session itself. Defaults to True.
+            maintain_statistics (bool, optional): Update the category statistics with every write,
+                in the same transaction. Defaults to True.
+        """
         self.db = db
+        self.autocommit = autocommit
+        self.statistics = CategoryStatisticsAdapter(db, autocommit=False) if maintain_statistics else None
 
-    def create_product(self, product: Product):
-        self.db.add(product)
-        self.db.commit()
-        self.db.refresh(product)
-        return product
+    def _commit(self) -> None:
+        if self.autocommit:
+            self.db.commit()
 
-    def get_product(self, product_id: int):
-        return self.db.query(Product).filter(Product.product_id == product_id).first()
+    def _rollback(self) -> None:
+        # Inside a unit of work the failure propagates and the unit of work rolls back.
+        if self.autocommit:
+            self.db.rollback()
 
-    def update_product(self, product: Product):
-        self.db.commit()
-        self.db.refresh(product)
-        return product
+    def get_by_id(self, product_id: int) -> Optional[Product]:
+        row = self.db.execute(select(*PRODUCT_COLUMNS).where(ProductModel.product_id == product_id)).first()
+        return row_to_product(row) if row is not None else None
 
-    def delete_product(self, product_id: int):
-        product = self.get_product(product_id)
-        if product:
-            self.db.delete(product)
-            self.db.commit()
-            return True
-        return False
+    def get_all(self) -> List[Product]:
+        rows = self.db.execute(select(*PRODUCT_COLUMNS).order_by(ProductModel.product_id))
+        return [row_to_product(row) for row in rows]
+
+    def iter_all(
+        self,
+        batch_size: int = 500,
+        after_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> Iterator[Product]:
+        query = select(*PRODUCT_COLUMNS).order_by(ProductModel.product_id).limit(batch_size)
+        if category_id is not None:
+            query = query.where(ProductModel.category_id == category_id)
+        if min_price is not None:
+            query = query.where(ProductModel.price_minor_units >= to_minor_units(min_price))
+        if max_price is not None:
+            query = query.where(ProductModel.price_minor_units <= to_minor_units(max_price))
+
+        last_id = after_id
+        while True:
+            page = query if last_id is None else query.where(ProductModel.product_id > last_id)
+            rows = self.db.execute(page).all()
+            for row in rows:
+                yield row_to_product(row)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+
+    def _record(self, removed: Iterable[Tuple[int, int]] = (), added: Iterable[Tuple[int, int]] = ()) -> None:
+        if self.statistics is not None:
+            self.statistics.record_changes(removed, added)
+
+    def add(self, product: Product) -> None:
+        values = product_to_values(product)
+        if product.product_id is not None:
+            values["product_id"] = product.product_id
+        try:
+            product_id, version = self.db.execute(
+                insert(ProductModel).values(**values).returning(ProductModel.product_id, ProductModel.version)
+            ).one()
+            self._record(added=[(product.category_id, product.price.minor_units)])
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        product.product_id, product.version = product_id, version
+
+    def update(self, product: Product) -> None:
+        try:
+            before = self._stored_prices([product.product_id]) if self.statistics is not None else {}
+            version = self.db.execute(
+                update(ProductModel)
+                .where(ProductModel.product_id == product.product_id)
+                .values(**product_to_values(product), version=ProductModel.version + 1)
+                .returning(ProductModel.version)
+            ).scalar_one_or_none()
+            if version is None:
+                raise ValueError(f"Product with ID {product.product_id} not found.")
+            self._record(before.values(), [(product.category_id, product.price.minor_units)])
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        product.version = version
+
+    def get_version(self, product_id: int) -> Optional[int]:
+        return self.db.execute(
+            select(ProductModel.version).where(ProductModel.product_id == product_id)
+        ).scalar_one_or_none()
+
+    def delete(self, product_id: int) -> None:
+        try:
+            row = self.db.execute(
+                delete(ProductModel)
+                .where(ProductModel.product_id == product_id)
+                .returning(ProductModel.category_id, ProductModel.price_minor_units)
+            ).first()
+            if row is None:
+                raise ValueError(f"Product with ID {product_id} not found.")
+            self._record(removed=[tuple(row)])
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+
+    def get_many(self, product_ids: Sequence[int]) -> Dict[int, Product]:
+        products = {}
+        for chunk in chunked(dict.fromkeys(product_ids), _CHUNK_SIZE):
+            for row in self.db.execute(select(*PRODUCT_COLUMNS).where(ProductModel.product_id.in_(chunk))):
+                products[row[0]] = row_to_product(row)
+        return products
+
+    def add_many(self, products: Sequence[Product]) -> None:
+        if not products:
+            return
+        rows = [dict(product_to_values(product), product_id=product.product_id) for product in products]
+        try:
+            keys = self.db.execute(
+                insert(_PRODUCTS).returning(_PRODUCTS.c.product_id, _PRODUCTS.c.version, sort_by_parameter_order=True),
+                rows,
+            ).all()
+            self._record(added=[(product.category_id, product.price.minor_units) for product in products])
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        for product, (product_id, version) in zip(products, keys):
+            product.product_id, product.version = product_id, version
+
+    def update_many(self, products: Sequence[Product]) -> List[int]:
+        # A product given more than once is written once, with its last state, so its
+        # statistics change is recorded once.
+        latest = {product.product_id: product for product in products}
+        try:
+            existing = self._stored_prices(list(latest))
+            updated = [product for product in latest.values() if product.product_id in existing]
+            if updated:
+                self.db.execute(
+                    update(_PRODUCTS)
+                    .where(_PRODUCTS.c.product_id == bindparam("b_product_id"))
+                    .values(version=_PRODUCTS.c.version + 1),
+                    [dict(product_to_values(product), b_product_id=product.product_id) for product in updated],
+                )
+                self._record(
+                    [existing[product.product_id] for product in updated],
+                    [(product.category_id, product.price.minor_units) for product in updated],
+                )
+                # executemany cannot return rows, so the new versions are read back in the same transaction.
+                versions = self._versions([product.product_id for product in updated])
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        for product in products:
+            if product.product_id in existing:
+                product.version = versions[product.product_id]
+        return [product_id for product_id in latest if product_id not in existing]
+
+    def reassign_category(self, product_ids: Sequence[int], category_id: int) -> List[int]:
+        moved = set()
+        try:
+            for chunk in chunked(dict.fromkeys(product_ids), _CHUNK_SIZE):
+                before = self._stored_prices(chunk) if self.statistics is not None else {}
+                moved_chunk = self.db.execute(
+                    update(_PRODUCTS)
+                    .where(_PRODUCTS.c.product_id.in_(chunk))
+                    .values(category_id=category_id, version=_PRODUCTS.c.version + 1)
+                    .returning(_PRODUCTS.c.product_id)
+                ).scalars().all()
+                moved.update(moved_chunk)
+                if before:
+                    self._record(
+                        [before[product_id] for product_id in moved_chunk],
+                        [(category_id, before[product_id][1]) for product_id in moved_chunk],
+                    )
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        return [product_id for product_id in product_ids if product_id not in moved]
+
+    def move_category(self, from_category_id: int, to_category_id: int) -> List[int]:
+        if from_category_id == to_category_id:
+            # Nothing to move; the loop below would find the same rows forever.
+            return []
+        moved = []
+        # Chunked so that each statement binds and returns a bounded number of rows.
+        to_move = (
+            select(_PRODUCTS.c.product_id)
+            .where(_PRODUCTS.c.category_id == from_category_id)
+            .limit(_CHUNK_SIZE)
+            .scalar_subquery()
+        )
+        statement = (
+            update(_PRODUCTS)
+            .where(_PRODUCTS.c.product_id.in_(to_move))
+            .values(category_id=to_category_id, version=_PRODUCTS.c.version + 1)
+            .returning(_PRODUCTS.c.product_id)
+        )
+        try:
+            while True:
+                chunk = self.db.execute(statement).scalars().all()
+                moved.extend(chunk)
+                if len(chunk) < _CHUNK_SIZE:
+                    break
+            if moved and self.statistics is not None:
+                self.statistics.merge_categories(from_category_id, to_category_id)
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        return sorted(moved)
+
+    def delete_many(self, product_ids: Sequence[int]) -> List[int]:
+        deleted = set()
+        try:
+            for chunk in chunked(dict.fromkeys(product_ids), _CHUNK_SIZE):
+                rows = self.db.execute(
+                    delete(_PRODUCTS)
+                    .where(_PRODUCTS.c.product_id.in_(chunk))
+                    .returning(_PRODUCTS.c.product_id, _PRODUCTS.c.category_id, _PRODUCTS.c.price_minor_units)
+                ).all()
+                deleted.update(row[0] for row in rows)
+                self._record(removed=[(category_id, price_minor_units) for _, category_id, price_minor_units in rows])
+            self._commit()
+        except Exception:
+            self._rollback()
+            raise
+        return [product_id for product_id in product_ids if product_id not in deleted]
+
+    def _versions(self, product_ids: Sequence[int]) -> Dict[int, int]:
+        versions = {}
+        for chunk in chunked(dict.fromkeys(product_ids), _CHUNK_SIZE):
+            for product_id, version in self.db.execute(select(ProductModel.product_id, ProductModel.version).where(ProductModel.product_id.in_(chunk))):
+                versions[product_id] = version
+        return versions
+
+    def _stored_prices(self, product_ids: Sequence[int]) -> Dict[int, Tuple[int, int]]:
+        # (category ID, price in minor units) of the stored products, keyed by product ID.
+        stored = {}
+        for chunk in chunked(dict.fromkeys(product_ids), _CHUNK_SIZE):
+            for product_id, category_id, price_minor_units in self.db.execute(
+                select(ProductModel.product_id, ProductModel.category_id, ProductModel.price_minor_units)
+                .where(ProductModel.product_id.in_(chunk))
+            ):
+                stored[product_id] = (category_id, price_minor_units)
+        return stored
@@ -0,0 +1,101 @@
+from typing import Optional
+from sqlalchemy import column, func, literal_column, select, table
+from sqlalchemy.orm import Session
+from src.application.ports.output.product_search_port import ProductSearchPort, ProductSearchResult
+from src.application.utils.search_query import parse_search_query
+from src.domain.models.value_objects.Price import to_minor_units
+from src.infrastructure.secondary.sqlite_db.models import ProductModel
+from src.infrastructure.secondary.sqlite_db.row_mapping import PRODUCT_COLUMNS, row_to_product
+
+# bm25 column weights: a hit in the name counts ten times a hit in the description.
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+_FTS = table("products_fts", column("rowid"))
+_FTS_TABLE = literal_column("products_fts")
+
+
+def to_match_expression(query: str) -> Optional[str]:
+    """
+    Turns free text into an FTS5 query: every word of an alternative is
+    required, alternatives are joined with OR, and the last word matches as
+    a prefix, so partially typed queries find results.  Words are quoted, so
+    other FTS5 operators in the input are taken literally.
+
+    Args:
+        query (str): The text typed by the user.
+
+    Returns:
+        Optional[str]: The MATCH expression, or None if the text has no words.
+    """
+    groups = parse_search_query(query)
+    if not groups:
+        return None
+    expressions = [" ".join(f'"{term}"' for term in group) for group in groups]
+    expressions[-1] += "*"
+    if len(expressions) == 1:
+        return expressions[0]
+    return " OR ".join(f"({expression})" for expression in expressions)
+
+
+def _hits(match_expression: str, *columns):
+    # The hits are materialized first.  Otherwise SQLite may drive the join
+    # from the category index and re-run the MATCH for every product row.
+    return (
+        select(_FTS.c.rowid.label("product_id"), *columns)
+        .where(_FTS_TABLE.op("MATCH")(match_expression))
+        .cte("hits")
+        .prefix_with("MATERIALIZED")
+    )
+
+
+class ProductSearchAdapter(ProductSearchPort):
+    """
+    Product search on the products_fts FTS5 index, ranked with bm25.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        query: str,
+        category_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> ProductSearchResult:
+        match_expression = to_match_expression(query)
+        if match_expression is None:
+            return ProductSearchResult([], 0)
+
+        filters = []
+        if category_id is not None:
+            filters.append(ProductModel.category_id == category_id)
+        if min_price is not None:
+            filters.append(ProductModel.price_minor_units >= to_minor_units(min_price))
+        if max_price is not None:
+            filters.append(ProductModel.price_minor_units <= to_minor_units(max_price))
+
+        rank = func.bm25(_FTS_TABLE, NAME_WEIGHT, DESCRIPTION_WEIGHT)
+        hits = _hits(match_expression, rank.label("rank"))
+        rows = self.db.execute(
+            select(*PRODUCT_COLUMNS)
+            .select_from(hits.join(ProductModel, ProductModel.product_id == hits.c.product_id))
+            .where(*filters)
+            .order_by(hits.c.rank, ProductModel.product_id)
+            .limit(limit)
+            .offset(offset)
+        ).all()
+
+        if offset == 0 and len(rows) < limit:
+            total = len(rows)  # The whole result fits on the first page.
+        else:
+            hits = _hits(match_expression)  # Counting needs no ranking.
+            total = self.db.execute(
+                select(func.count())
+                .select_from(hits.join(ProductModel, ProductModel.product_id == hits.c.product_id))
+                .where(*filters)
+            ).scalar_one()
+        return ProductSearchResult([row_to_product(row) for row in rows], total)
@@ -0,0 +1,72 @@
+import json
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.sqlite_db.models import CategoryModel, ProductModel
+
+# Columns loaded for every product, in the order row_to_product expects them.
+PRODUCT_COLUMNS = (
+    ProductModel.product_id,
+    ProductModel.name,
+    ProductModel.description,
+    ProductModel.price_minor_units,
+    ProductModel.currency,
+    ProductModel.category_id,
+    ProductModel.image_urls,
+    ProductModel.version,
+)
+
+# Columns loaded for every category, in the order row_to_category expects them.
+CATEGORY_COLUMNS = (
+    CategoryModel.category_id,
+    CategoryModel.name,
+    CategoryModel.description,
+    CategoryModel.version,
+)
+
+
+def row_to_product(row) -> Product:
+    """
+    Rebuilds a Product from a products row.  Rows were validated on write, so
+    the trusted construction path is used.
+    """
+    product_id, name, description, price_minor_units, currency, category_id, image_urls, version = row
+    return Product.from_storage(
+        product_id=product_id,
+        name=name,
+        description=description,
+        price=Price.from_minor_units(price_minor_units, currency),
+        category_id=category_id,
+        image_urls=json.loads(image_urls) if image_urls else None,
+        version=version,
+    )
+
+
+def product_to_values(product: Product) -> dict:
+    """
+    Converts a Product into column values for the products table.
+    """
+    return {
+        "name": product.name,
+        "description": product.description,
+        "price_minor_units": product.price.minor_units,
+        "currency": product.price.currency,
+        "category_id": product.category_id,
+        "image_urls": json.dumps(product.image_urls) if product.image_urls else None,
+    }
+
+
+def row_to_category(row) -> Category:
+    """
+    Rebuilds a Category from a categories row.  Rows were validated on write,
+    so the trusted construction path is used.
+    """
+    category_id, name, description, version = row
+    return Category.from_storage(category_id=category_id, name=name, description=description, version=version)
+
+
+def category_to_values(category: Category) -> dict:
+    """
+    Converts a Category into column values for the categories table.
+    """
+    return {"name": category.name, "description": category.description}
@@ -0,0 +1,62 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# External-content FTS5 index: it stores only the index, and reads the text
+# back from the products table.  Porter stemming lets "laptops" find "laptop".
+_CREATE_STATEMENTS = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+        name, description,
+        content='products', content_rowid='product_id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_insert AFTER INSERT ON products BEGIN
+        INSERT INTO products_fts(rowid, name, description) VALUES (new.product_id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_delete AFTER DELETE ON products BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, description)
+        VALUES ('delete', old.product_id, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_update AFTER UPDATE OF name, description ON products BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, description)
+        VALUES ('delete', old.product_id, old.name, old.description);
+        INSERT INTO products_fts(rowid, name, description) VALUES (new.product_id, new.name, new.description);
+    END
+    """,
+)
+
+
+def create_search_index(connection: Connection) -> None:
+    """
+    Creates the products_fts index and the triggers that keep it in step
+    with the products table.  An index created for existing products is
+    filled from them.  Does nothing for databases other than SQLite.
+
+    Args:
+        connection (Connection): A connection inside a transaction.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'products_fts'")
+    ).first()
+    for statement in _CREATE_STATEMENTS:
+        connection.execute(text(statement))
+    if not exists:
+        rebuild_search_index(connection)
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """
+    Re-reads every product into the search index.
+
+    Args:
+        connection (Connection): A connection inside a transaction.
+    """
+    connection.execute(text("INSERT INTO products_fts(products_fts) VALUES ('rebuild')"))
@@ -0,0 +1,156 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional, TypeVar
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from src.application.ports.output.unit_of_work_port import UnitOfWorkPort
+from src.infrastructure.secondary.sqlite_db.category_repository_adapter import CategoryRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.database import SessionLocal
+from src.infrastructure.secondary.sqlite_db.import_progress_adapter import ImportProgressAdapter
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+T = TypeVar("T")
+
+# Tells the group commit thread to stop.
+_STOP = object()
+
+
+class SqlAlchemyUnitOfWork(UnitOfWorkPort):
+    """
+    Unit of work over one SQLAlchemy session.  The repositories it hands out
+    never commit on their own, so the whole block costs a single commit.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        """
+        Args:
+            session_factory (Callable[[], Session], optional): Creates the session. Defaults to SessionLocal.
+        """
+        self.session_factory = session_factory
+        self.session: Optional[Session] = None
+
+    def __enter__(self) -> "SqlAlchemyUnitOfWork":
+        self.session = self.session_factory()
+        if self.session.get_bind().dialect.name == "sqlite":
+            # Take the write lock up front: a deferred transaction that reads
+            # first cannot wait for the lock when it later writes, and fails instead.
+            self.session.execute(text("BEGIN IMMEDIATE"))
+        self.products = ProductRepositoryAdapter(self.session, autocommit=False)
+        self.categories = CategoryRepositoryAdapter(self.session, autocommit=False)
+        self.import_progress = ImportProgressAdapter(self.session, autocommit=False)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self.rollback()
+        finally:
+            self.session.close()
+            self.session = None
+
+    def commit(self) -> None:
+        self.session.commit()
+
+    def rollback(self) -> None:
+        self.session.rollback()
+
+
+class GroupCommitUnitOfWork(SqlAlchemyUnitOfWork):
+    """
+    Unit of work whose run() merges the work of concurrent callers into one
+    transaction.  The first caller opens a batch; work arriving within
+    window_seconds joins it, up to max_batch items.  Each item runs inside
+    its own savepoint, so a failing item is undone without affecting the
+    others, and the batch is committed once.
+
+    Share one instance between request threads for run(); used as a context
+    manager it behaves like a per-request SqlAlchemyUnitOfWork.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        window_seconds: float = 0.002,
+        max_batch: int = 64,
+    ):
+        """
+        Args:
+            session_factory (Callable[[], Session], optional): Creates the sessions. Defaults to SessionLocal.
+            window_seconds (float, optional): How long a batch waits for more work. Defaults to 2 ms.
+            max_batch (int, optional): The most items committed together. Defaults to 64.
+        """
+        super().__init__(session_factory)
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    def run(self, work: Callable[[UnitOfWorkPort], T]) -> T:
+        future: Future = Future()
+        with self._start_lock:
+            if self._closed:
+                raise RuntimeError("GroupCommitUnitOfWork is closed.")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._commit_loop, name="group-commit", daemon=True)
+                self._thread.start()
+            self._queue.put((work, future))
+        return future.result()
+
+    def close(self) -> None:
+        """
+        Commits the work already submitted and stops the group commit thread.
+        """
+        with self._start_lock:
+            self._closed = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(_STOP)
+        if thread is not None:
+            thread.join()
+
+    def _commit_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.window_seconds
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch) -> None:
+        outcomes = []
+        try:
+            with SqlAlchemyUnitOfWork(self.session_factory) as unit_of_work:
+                for work, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with unit_of_work.session.begin_nested():
+                            outcomes.append((future, work(unit_of_work), None))
+                    except Exception as error:
+                        outcomes.append((future, None, error))
+                unit_of_work.commit()
+        except Exception as error:
+            # Nothing in the batch was kept, so every caller sees the failure.
+            for work, future in batch:
+                if future.running():
+                    future.set_exception(error)
+            return
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple
+
+# Stored in place of a value to remember that a key does not exist.
+_MISSING = object()
+
+# Invalidations are tracked per stripe of keys, so that invalidating one key
+# rarely drops the read-through puts of others.
+_EPOCH_STRIPES = 256
+
+
+class CacheStats(NamedTuple):
+    """
+    Counters describing how a cache has been used.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+
+class LruTtlCache:
+    """
+    Thread-safe bounded cache with least-recently-used eviction and a
+    time-to-live per entry.  It can also remember keys that do not exist
+    (negative caching), usually with a shorter time-to-live.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 60.0,
+        negative_ttl_seconds: Optional[float] = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int, optional): The maximum number of entries kept. Defaults to 10000.
+            ttl_seconds (float, optional): How long a value stays valid. Defaults to 60 seconds.
+            negative_ttl_seconds (Optional[float], optional): How long a missing key is remembered,
+                or None to disable negative caching. Defaults to 5 seconds.
+            clock (Callable[[], float], optional): Source of the current time. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._epoch = 0  # Counts invalidations.
+        self._invalidated_at = [0] * _EPOCH_STRIPES  # The epoch of the last invalidation per stripe.
+        self._cleared_at = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Looks up a key.
+
+        Args:
+            key (Hashable): The key to look up.
+
+        Returns:
+            Tuple[bool, Any]: (True, value) on a hit, where value is None for a
+            cached missing key, or (False, None) on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, (None if value is _MISSING else value)
+
+    def epoch(self) -> int:
+        """
+        Returns a token to pass to put() when loading a value after a miss.
+        A put made with a token taken before an invalidation of the same key
+        (or of a key in the same stripe, or a clear()) is dropped, so a slow
+        reader cannot overwrite a newer write with stale data.
+        """
+        return self._epoch
+
+    def put(self, key: Hashable, value: Any, epoch: Optional[int] = None) -> None:
+        """
+        Stores a value, or remembers that the key does not exist if value is None.
+
+        Args:
+            key (Hashable): The key to store.
+            value (Any): The value, or None for a missing key.
+            epoch (Optional[int], optional): The token returned by epoch() before loading the value.
+        """
+        if value is None:
+            if self.negative_ttl_seconds is None:
+                return
+            value, ttl = _MISSING, self.negative_ttl_seconds
+        else:
+            ttl = self.ttl_seconds
+        with self._lock:
+            if epoch is not None and (epoch < self._cleared_at or epoch < self._invalidated_at[_stripe(key)]):
+                return
+            self._entries[key] = (value, self._clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Removes a key from the cache.
+
+        Args:
+            key (Hashable): The key to remove.
+        """
+        with self._lock:
+            self._epoch += 1
+            self._invalidated_at[_stripe(key)] = self._epoch
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.  Counters are kept.
+        """
+        with self._lock:
+            self._epoch += 1
+            self._cleared_at = self._epoch
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the current hit, miss, eviction and expiration counters.
+        """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, self._expirations, len(self._entries))
+
+
+def _stripe(key: Hashable) -> int:
+    return hash(key) % _EPOCH_STRIPES
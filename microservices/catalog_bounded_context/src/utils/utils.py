@@ -1,2 +1,10 @@
 def log_message(message):
     print(f"Log: {message}")
+
+def chunked(items, size):
+    """
+    Splits a sequence into consecutive lists of at most `size` items.
+    """
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
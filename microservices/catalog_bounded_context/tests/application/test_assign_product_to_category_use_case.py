@@ -0,0 +1,63 @@
+import pytest
+from typing import Optional
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.application.ports.output.unit_of_work_port import UnitOfWorkPort
+from src.application.usecases.assign_product_to_category_usecase import AssignProductToCategoryUseCase
+
+# Mock repository keyed by an ID attribute, for products and categories
+class MockRepository:
+    def __init__(self, id_attribute: str):
+        self.items = {}
+        self.id_attribute = id_attribute
+
+    def get_by_id(self, item_id: int) -> Optional[object]:
+        return self.items.get(item_id)
+
+    def update(self, item) -> None:
+        self.items[getattr(item, self.id_attribute)] = item
+
+# Mock UnitOfWorkPort that records commits and rollbacks
+class MockUnitOfWork(UnitOfWorkPort):
+    def __init__(self):
+        self.products = MockRepository("product_id")
+        self.categories = MockRepository("category_id")
+        self.commits = 0
+        self.rollbacks = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def unit_of_work():
+    unit_of_work = MockUnitOfWork()
+    unit_of_work.categories.items[1] = Category(category_id=1, name="Electronics", description="Gadgets")
+    unit_of_work.products.items[101] = Product(product_id=101, name="Laptop", description="A laptop",
+                                               price=Price(amount=999.99), category_id=0)
+    return unit_of_work
+
+
+def test_assign_product_to_category_commits_once(unit_of_work):
+    """Test that a successful assignment is committed in one unit of work."""
+    AssignProductToCategoryUseCase(unit_of_work).assign_product_to_category(product_id=101, category_id=1)
+    assert unit_of_work.products.items[101].category_id == 1
+    assert unit_of_work.commits == 1
+
+def test_assign_product_to_category_missing_category(unit_of_work):
+    """Test that a failed assignment is not committed."""
+    with pytest.raises(ValueError, match="Category with ID 2 does not exist"):
+        AssignProductToCategoryUseCase(unit_of_work).assign_product_to_category(product_id=101, category_id=2)
+    assert unit_of_work.commits == 0
+    assert unit_of_work.rollbacks == 1
+
+def test_assign_product_to_category_already_assigned(unit_of_work):
+    """Test that a product with a category cannot be reassigned."""
+    unit_of_work.products.items[101].assign_to_category(1)
+    with pytest.raises(ValueError, match="already belongs to a category"):
+        AssignProductToCategoryUseCase(unit_of_work).assign_product_to_category(product_id=101, category_id=1)
+    assert unit_of_work.commits == 0
@@ -0,0 +1,109 @@
+import asyncio
+import pytest
+from typing import Optional
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.application.usecases.create_product_usecase import AsyncCreateProductUseCase
+from src.application.usecases.get_product_usecase import AsyncGetProductUseCase
+from src.application.usecases.update_product_usecase import AsyncUpdateProductUseCase
+from src.application.usecases.delete_product_usecase import AsyncDeleteProductUseCase
+from src.application.usecases.create_category_usecase import AsyncCreateCategoryUseCase
+from src.application.usecases.get_category_usecase import AsyncGetCategoryUseCase
+from src.application.usecases.update_category_usecase import AsyncUpdateCategoryUseCase
+from src.application.usecases.delete_category_usecase import AsyncDeleteCategoryUseCase
+
+# Mock async repositories for testing; one class serves products and categories.
+class MockAsyncRepository:
+    def __init__(self, id_attribute: str, label: str):
+        self.items = {}
+        self.last_id = 0
+        self.id_attribute = id_attribute
+        self.label = label
+
+    async def get_by_id(self, item_id: int) -> Optional[object]:
+        await asyncio.sleep(0)
+        return self.items.get(item_id)
+
+    async def add(self, item) -> None:
+        await asyncio.sleep(0)
+        if getattr(item, self.id_attribute) is None:
+            self.last_id += 1
+            setattr(item, self.id_attribute, self.last_id)
+        self.items[getattr(item, self.id_attribute)] = item
+
+    async def update(self, item) -> None:
+        await asyncio.sleep(0)
+        item_id = getattr(item, self.id_attribute)
+        if item_id not in self.items:
+            raise ValueError(f"{self.label} with ID {item_id} not found")
+        self.items[item_id] = item
+
+    async def delete(self, item_id: int) -> None:
+        await asyncio.sleep(0)
+        if item_id not in self.items:
+            raise ValueError(f"{self.label} with ID {item_id} not found")
+        del self.items[item_id]
+
+
+# --- Async product use case Tests ---
+def test_async_product_lifecycle():
+    """Test creating, reading, updating and deleting a product asynchronously."""
+    repo = MockAsyncRepository("product_id", "Product")
+
+    async def scenario():
+        product = await AsyncCreateProductUseCase(repo).create_product(
+            name="Laptop", description="A laptop", price=Price(amount=999.99), category_id=1
+        )
+        assert product.product_id == 1
+        assert await AsyncGetProductUseCase(repo).get_product(1) is product
+
+        updated = await AsyncUpdateProductUseCase(repo).update_product(1, price=Price(amount=899.00))
+        assert updated.price == Price(amount=899.00)
+
+        await AsyncDeleteProductUseCase(repo).delete_product(1)
+        assert await AsyncGetProductUseCase(repo).get_product(1) is None
+
+    asyncio.run(scenario())
+
+def test_async_update_product_not_found():
+    """Test that updating a missing product raises ValueError."""
+    repo = MockAsyncRepository("product_id", "Product")
+    with pytest.raises(ValueError, match="Product with ID 5 not found"):
+        asyncio.run(AsyncUpdateProductUseCase(repo).update_product(5, name="New"))
+
+def test_async_get_product_concurrently():
+    """Test that many reads can be awaited together."""
+    repo = MockAsyncRepository("product_id", "Product")
+    repo.items = {
+        i: Product(product_id=i, name=f"P{i}", description="D", price=Price(amount=1.0), category_id=1)
+        for i in range(1, 101)
+    }
+    use_case = AsyncGetProductUseCase(repo)
+
+    async def read_all():
+        return await asyncio.gather(*(use_case.get_product(i) for i in range(1, 101)))
+
+    products = asyncio.run(read_all())
+    assert [product.product_id for product in products] == list(range(1, 101))
+
+
+# --- Async category use case Tests ---
+def test_async_category_lifecycle():
+    """Test creating, reading, updating and deleting a category asynchronously."""
+    repo = MockAsyncRepository("category_id", "Category")
+
+    async def scenario():
+        category = await AsyncCreateCategoryUseCase(repo).create_category(name="Electronics", description="Gadgets")
+        assert category.category_id == 1
+        assert await AsyncGetCategoryUseCase(repo).get_category(1) is category
+
+        updated = await AsyncUpdateCategoryUseCase(repo).update_category(1, name="Devices")
+        assert updated.name == "Devices"
+
+        await AsyncDeleteCategoryUseCase(repo).delete_category(1)
+        assert await AsyncGetCategoryUseCase(repo).get_category(1) is None
+        with pytest.raises(ValueError, match="Category with ID 1 not found"):
+            await AsyncDeleteCategoryUseCase(repo).delete_category(1)
+
+    asyncio.run(scenario())
@@ -0,0 +1,170 @@
+import pytest
+from typing import Dict, List, Optional, Sequence
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.application.usecases.bulk_create_products_usecase import BulkCreateProductsUseCase
+from src.application.usecases.bulk_update_prices_usecase import BulkUpdatePricesUseCase
+from src.application.ports.output.unit_of_work_port import UnitOfWorkPort
+from src.application.usecases.batch_products_usecase import MAX_BATCH_SIZE, BatchProductsUseCase
+from src.application.usecases.get_product_usecase import MAX_PRODUCTS_PER_GET, GetProductUseCase
+
+# Mock ProductRepositoryPort with bulk operations for testing
+class MockBulkProductRepository:
+    def __init__(self):
+        self.products = {}
+        self.last_id = 0
+        self.add_many_calls = 0
+        self.update_many_calls = 0
+
+    def get_by_id(self, product_id: int) -> Optional[Product]:
+        return self.products.get(product_id)
+
+    def get_many(self, product_ids: Sequence[int]) -> Dict[int, Product]:
+        return {pid: self.products[pid] for pid in product_ids if pid in self.products}
+
+    def add_many(self, products: Sequence[Product]) -> None:
+        self.add_many_calls += 1
+        for product in products:
+            self.last_id += 1
+            product.product_id = self.last_id
+            self.products[product.product_id] = product
+
+    def update_many(self, products: Sequence[Product]) -> List[int]:
+        self.update_many_calls += 1
+        missing = []
+        for product in products:
+            if product.product_id in self.products:
+                self.products[product.product_id] = product
+            else:
+                missing.append(product.product_id)
+        return missing
+
+# Mock UnitOfWorkPort over the bulk repository that records commits
+class MockUnitOfWork(UnitOfWorkPort):
+    def __init__(self, products: MockBulkProductRepository):
+        self.products = products
+        self.commits = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        pass
+
+# Mock ProductChangeListenerPort that records the notifications
+class RecordingListener:
+    def __init__(self):
+        self.events = []
+
+    def product_created(self, product):
+        self.events.append(("created", product.product_id))
+
+    def product_updated(self, before, after):
+        self.events.append(("updated", before.name, after.name))
+
+
+# --- BulkCreateProductsUseCase Tests ---
+def test_bulk_create_products_success():
+    """Test creating several products in one batch."""
+    mock_repo = MockBulkProductRepository()
+    report = BulkCreateProductsUseCase(mock_repo).create_products([
+        {"name": "Laptop", "description": "Laptop", "price": Price(amount=999.99), "category_id": 1},
+        {"name": "Mouse", "description": "Mouse", "price": Price(amount=19.99), "category_id": 1},
+    ])
+    assert report.ok
+    assert [p.product_id for p in report.succeeded] == [1, 2]
+    assert mock_repo.add_many_calls == 1
+
+def test_bulk_create_products_reports_invalid_items():
+    """Test that invalid items are reported without aborting the batch."""
+    mock_repo = MockBulkProductRepository()
+    report = BulkCreateProductsUseCase(mock_repo).create_products([
+        {"name": "", "description": "Empty name", "price": Price(amount=1.00), "category_id": 1},
+        {"name": "Mouse", "description": "Mouse", "price": Price(amount=19.99), "category_id": 1},
+        {"name": "No price", "category_id": 1},
+        {"name": "Bad price", "price": 5.0, "category_id": 1},
+    ])
+    assert not report.ok
+    assert set(report.errors) == {0, 2, 3}
+    assert report.errors[2] == "Missing field: price"
+    assert [p.name for p in report.succeeded] == ["Mouse"]
+    assert len(mock_repo.products) == 1
+
+
+# --- BulkUpdatePricesUseCase Tests ---
+def test_bulk_update_prices():
+    """Test repricing several products, with one unknown ID."""
+    mock_repo = MockBulkProductRepository()
+    BulkCreateProductsUseCase(mock_repo).create_products([
+        {"name": "Laptop", "description": "Laptop", "price": Price(amount=999.99), "category_id": 1},
+        {"name": "Mouse", "description": "Mouse", "price": Price(amount=19.99), "category_id": 1},
+    ])
+    report = BulkUpdatePricesUseCase(mock_repo).update_prices({
+        1: Price(amount=899.99),
+        2: Price(amount=17.99),
+        99: Price(amount=1.00),
+    })
+    assert report.errors == {99: "Product with ID 99 not found."}
+    assert mock_repo.get_by_id(1).price == Price(amount=899.99)
+    assert mock_repo.get_by_id(2).price == Price(amount=17.99)
+    assert mock_repo.update_many_calls == 1
+
+def test_bulk_update_prices_invalid_price():
+    """Test that a non-Price value is reported for its product only."""
+    mock_repo = MockBulkProductRepository()
+    BulkCreateProductsUseCase(mock_repo).create_products([
+        {"name": "Laptop", "description": "Laptop", "price": Price(amount=999.99), "category_id": 1},
+    ])
+    report = BulkUpdatePricesUseCase(mock_repo).update_prices({1: 5.0})
+    assert set(report.errors) == {1}
+    assert mock_repo.get_by_id(1).price == Price(amount=999.99)
+
+
+# --- GetProductUseCase.get_products Tests ---
+def test_get_products_in_request_order():
+    """Test that products come back in request order, with None for unknown and repeated IDs kept."""
+    mock_repo = MockBulkProductRepository()
+    BulkCreateProductsUseCase(mock_repo).create_products([
+        {"name": "Laptop", "description": "Laptop", "price": Price(amount=999.99), "category_id": 1},
+        {"name": "Mouse", "description": "Mouse", "price": Price(amount=19.99), "category_id": 1},
+    ])
+    products = GetProductUseCase(mock_repo).get_products([2, 99, 1, 2])
+    assert [p.name if p else None for p in products] == ["Mouse", None, "Laptop", "Mouse"]
+    assert GetProductUseCase(mock_repo).get_products([]) == []
+
+def test_get_products_too_many_ids():
+    """Test that a multi-get is limited to MAX_PRODUCTS_PER_GET IDs."""
+    with pytest.raises(ValueError):
+        GetProductUseCase(MockBulkProductRepository()).get_products(list(range(MAX_PRODUCTS_PER_GET + 1)))
+
+
+# --- BatchProductsUseCase Tests ---
+def test_batch_creates_and_updates_in_one_unit_of_work():
+    """Test that creates and updates are stored in one commit, with an outcome per item in order."""
+    mock_repo = MockBulkProductRepository()
+    BulkCreateProductsUseCase(mock_repo).create_products([
+        {"name": "Laptop", "description": "Laptop", "price": Price(amount=999.99), "category_id": 1},
+    ])
+    unit_of_work = MockUnitOfWork(mock_repo)
+    listener = RecordingListener()
+    results = BatchProductsUseCase(unit_of_work, listeners=[listener]).apply_changes([
+        {"name": "Mouse", "description": "Mouse", "price": Price(amount=19.99), "category_id": 1},
+        {"product_id": 1, "price": Price(amount=899.99)},
+        {"product_id": 99, "name": "Ghost"},
+        {"name": "", "description": "", "price": Price(amount=1.00), "category_id": 1},
+        {"product_id": 1, "name": "Laptop Pro"},
+    ])
+    assert [result.outcome for result in results] == ["created", "updated", "not_found", "invalid", "invalid"]
+    assert results[4].message == "Product with ID 1 appears more than once in the batch."
+    assert unit_of_work.commits == 1
+    assert (mock_repo.add_many_calls, mock_repo.update_many_calls) == (2, 1)
+    assert (mock_repo.products[1].name, mock_repo.products[1].price) == ("Laptop", Price(amount=899.99))
+    assert mock_repo.products[2].name == "Mouse"
+    assert listener.events == [("created", 2), ("updated", "Laptop", "Laptop")]
+
+def test_batch_too_many_items():
+    """Test that a batch is limited to MAX_BATCH_SIZE items."""
+    unit_of_work = MockUnitOfWork(MockBulkProductRepository())
+    with pytest.raises(ValueError):
+        BatchProductsUseCase(unit_of_work).apply_changes([{"product_id": 1}] * (MAX_BATCH_SIZE + 1))
+    assert unit_of_work.commits == 0
@@ -0,0 +1,31 @@
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.application.usecases.export_products_usecase import ExportProductsUseCase
+
+# Mock ProductRepositoryPort that streams five products
+class MockProductRepository:
+    def __init__(self):
+        self.calls = []
+
+    def iter_all(self, batch_size=500, after_id=None, category_id=None, min_price=None, max_price=None):
+        self.calls.append((batch_size, after_id, category_id))
+        for product_id in range((after_id or 0) + 1, 6):
+            yield Product(product_id=product_id, name=f"Product {product_id}", description="A product",
+                          price=Price(amount=10.0), category_id=1)
+
+
+def test_export_products_batches_the_stream():
+    """Test that products are regrouped into batches of the requested size."""
+    repository = MockProductRepository()
+    batches = list(ExportProductsUseCase(repository).export_products(batch_size=2, after_id=0, category_id=1))
+    assert [[product.product_id for product in batch] for batch in batches] == [[1, 2], [3, 4], [5]]
+    assert repository.calls == [(2, 0, 1)]
+
+@pytest.mark.parametrize("batch_size, error", [(0, ValueError), ("10", TypeError)])
+def test_export_products_invalid_batch_size(batch_size, error):
+    """Test that the batch size is validated before anything is read."""
+    repository = MockProductRepository()
+    with pytest.raises(error):
+        ExportProductsUseCase(repository).export_products(batch_size=batch_size)
+    assert repository.calls == []
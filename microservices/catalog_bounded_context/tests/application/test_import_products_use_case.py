@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.application.ports.output.unit_of_work_port import UnitOfWorkPort
+from src.application.usecases.import_products_usecase import ImportProductsUseCase, RejectedRecord, ValidatedChunk
+
+# Mock ProductRepositoryPort that records the products of each add_many call
+class MockProductRepository:
+    def __init__(self):
+        self.batches = []
+
+    def add_many(self, products):
+        self.batches.append([product.name for product in products])
+
+# Mock ImportProgressPort over a dict
+class MockImportProgress:
+    def __init__(self):
+        self.positions = {}
+
+    def get_position(self, source):
+        return self.positions.get(source, 0)
+
+    def set_position(self, source, position):
+        self.positions[source] = position
+
+# Mock UnitOfWorkPort that records what each commit contained
+class MockUnitOfWork(UnitOfWorkPort):
+    def __init__(self):
+        self.products = MockProductRepository()
+        self.import_progress = MockImportProgress()
+        self.commits = []
+
+    def commit(self):
+        self.commits.append((len(self.products.batches), dict(self.import_progress.positions)))
+
+    def rollback(self):
+        pass
+
+
+def validate_names(records):
+    """Builds a product per non-empty name and rejects the others."""
+    products, rejected = [], []
+    for number, name in records:
+        try:
+            products.append(Product(product_id=None, name=name, description="", price=Price(amount=1.0), category_id=1))
+        except (TypeError, ValueError) as e:
+            rejected.append(RejectedRecord(number, name, str(e)))
+    return ValidatedChunk(products, rejected)
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(max_workers=2)])
+def test_import_products_stores_chunks_in_order(executor):
+    """Test that each chunk is stored in its own add_many call, in input order, with rejections reported."""
+    unit_of_work = MockUnitOfWork()
+    reports = []
+    progress = ImportProductsUseCase(unit_of_work).import_products(
+        ["a", "b", "", "c", "d", "e", "f"], validate_names, chunk_size=2, executor=executor, max_pending=1,
+        on_chunk=lambda progress, rejected: reports.append((progress.position, [r.number for r in rejected])),
+    )
+    assert unit_of_work.products.batches == [["a", "b"], ["c"], ["d", "e"], ["f"]]
+    assert len(unit_of_work.commits) == 4
+    assert reports == [(2, []), (4, [3]), (6, []), (7, [])]
+    assert (progress.position, progress.imported, progress.rejected) == (7, 6, 1)
+
+def test_import_products_resumes_after_start():
+    """Test that the records before start are skipped and numbering continues from the input."""
+    unit_of_work = MockUnitOfWork()
+    progress = ImportProductsUseCase(unit_of_work).import_products(["a", "b", "c", "d", "e"], validate_names,
+                                                                   chunk_size=2, start=3)
+    assert unit_of_work.products.batches == [["d", "e"]]
+    assert (progress.position, progress.imported) == (5, 2)
+
+def test_import_products_stores_the_position_with_each_chunk():
+    """Test that the position of a named import is committed together with the chunk it follows."""
+    unit_of_work = MockUnitOfWork()
+    use_case = ImportProductsUseCase(unit_of_work)
+    use_case.import_products(["a", "b", "", ""], validate_names, chunk_size=2, source="feed")
+    # The chunk without valid records still moves the position.
+    assert unit_of_work.commits == [(1, {"feed": 2}), (1, {"feed": 4})]
+    assert use_case.get_position("feed") == 4
+    assert use_case.get_position("other") == 0
+
+def test_import_products_notifies_listeners():
+    """Test that the listeners are told about every imported product, chunk by chunk."""
+    created = []
+
+    class RecordingListener:
+        def product_created(self, product):
+            created.append(product.name)
+
+    ImportProductsUseCase(MockUnitOfWork(), listeners=[RecordingListener()]).import_products(
+        ["a", "", "b", "c"], validate_names, chunk_size=2)
+    assert created == ["a", "b", "c"]
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"chunk_size": 0}, ValueError),
+    ({"start": -1}, ValueError),
+    ({"max_pending": "4"}, TypeError),
+])
+def test_import_products_invalid_request(kwargs, error):
+    """Test that invalid chunking options are rejected."""
+    with pytest.raises(error):
+        ImportProductsUseCase(MockUnitOfWork()).import_products(["a"], validate_names, **kwargs)
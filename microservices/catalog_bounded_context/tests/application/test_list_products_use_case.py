@@ -0,0 +1,53 @@
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.application.ports.output.product_listing_port import ProductPage
+from src.application.usecases.list_products_usecase import ListProductsUseCase
+
+# Mock ProductListingPort that records its calls
+class MockProductListing:
+    def __init__(self):
+        self.calls = []
+
+    def list_products(self, category_id=None, min_price=None, max_price=None, descending=False, limit=20, offset=0,
+                      after=None, count_total=True):
+        self.calls.append((category_id, min_price, max_price, descending, limit, offset, after))
+        product = Product(product_id=1, name="Laptop", description="A laptop", price=Price(amount=10.0), category_id=1)
+        return ProductPage([product], 41 if count_total else None)
+
+
+def test_list_products_translates_sort_and_pages():
+    """Test that sort becomes the direction and page and page_size become limit and offset."""
+    listing = MockProductListing()
+    use_case = ListProductsUseCase(listing)
+    assert use_case.list_products(category_id=1, min_price=5.0, sort="-price", page=3, page_size=10).total == 41
+    use_case.list_products()
+    assert listing.calls == [(1, 5.0, None, True, 10, 20, None), (None, None, None, False, 20, 0, None)]
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"page": 0}, ValueError),
+    ({"page_size": 101}, ValueError),
+    ({"sort": "name"}, ValueError),
+    ({"min_price": 10.0, "max_price": 5.0}, ValueError),
+    ({"page_size": "20"}, TypeError),
+    ({"cursor": "abc"}, ValueError),
+    ({"cursor": "100:-1"}, ValueError),
+    ({"cursor": "100:1", "page": 2}, ValueError),
+    ({"page": 2**62}, ValueError),
+    ({"cursor": f"1:{2**63}"}, ValueError),
+])
+def test_list_products_invalid_request(kwargs, error):
+    """Test that invalid pagination, sort orders and price ranges are rejected."""
+    with pytest.raises(error):
+        ListProductsUseCase(MockProductListing()).list_products(**kwargs)
+
+def test_list_products_follows_cursors():
+    """Test that a full page points to the next one and the cursor becomes a keyset position."""
+    listing = MockProductListing()
+    use_case = ListProductsUseCase(listing)
+    first = use_case.list_products(page_size=1)
+    assert first.next_cursor == "1000:1"
+    second = use_case.list_products(page_size=1, cursor=first.next_cursor)
+    assert (first.total, second.total, second.next_cursor) == (41, None, "1000:1")
+    assert listing.calls[-1] == (None, None, None, False, 1, 0, (1000, 1))
+    assert use_case.list_products(page_size=2).next_cursor is None
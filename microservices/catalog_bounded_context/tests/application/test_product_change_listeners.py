@@ -0,0 +1,93 @@
+import pytest
+from typing import Optional
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.product_table import PriceSummary
+from src.domain.models.value_objects.Price import Price
+from src.application.usecases.create_product_usecase import CreateProductUseCase
+from src.application.usecases.delete_category_usecase import DeleteCategoryUseCase
+from src.application.usecases.delete_product_usecase import DeleteProductUseCase
+from src.application.usecases.update_product_usecase import UpdateProductUseCase
+
+# Mock ProductRepositoryPort for testing
+class MockProductRepository:
+    def __init__(self):
+        self.products = {}
+        self.last_id = 0
+
+    def get_by_id(self, product_id: int) -> Optional[Product]:
+        return self.products.get(product_id)
+
+    def add(self, product: Product) -> None:
+        self.last_id += 1
+        product.product_id = self.last_id
+        self.products[product.product_id] = product
+
+    def update(self, product: Product) -> None:
+        self.products[product.product_id] = product
+
+    def delete(self, product_id: int) -> None:
+        if product_id not in self.products:
+            raise ValueError(f"Product with ID {product_id} not found")
+        del self.products[product_id]
+
+# Mock ProductChangeListenerPort that records the calls it receives
+class RecordingListener:
+    def __init__(self):
+        self.events = []
+
+    def product_created(self, product: Product) -> None:
+        self.events.append(("created", product.product_id))
+
+    def product_updated(self, before: Product, after: Product) -> None:
+        self.events.append(("updated", before.price.amount, after.price.amount))
+
+    def product_deleted(self, product: Product) -> None:
+        self.events.append(("deleted", product.product_id))
+
+
+def test_use_cases_notify_listeners():
+    """Test that the create, update and delete use cases notify their listeners."""
+    repo = MockProductRepository()
+    listener = RecordingListener()
+    product = CreateProductUseCase(repo, [listener]).create_product(
+        name="Laptop", description="A laptop", price=Price(amount=100.00), category_id=1
+    )
+    UpdateProductUseCase(repo, [listener]).update_product(product.product_id, price=Price(amount=80.00))
+    DeleteProductUseCase(repo, [listener]).delete_product(product.product_id)
+    assert listener.events == [("created", 1), ("updated", 100.00, 80.00), ("deleted", 1)]
+
+def test_failed_delete_does_not_notify():
+    """Test that listeners are not told about a product that was not deleted."""
+    listener = RecordingListener()
+    with pytest.raises(ValueError):
+        DeleteProductUseCase(MockProductRepository(), [listener]).delete_product(7)
+    assert listener.events == []
+
+
+# Mock CategoryRepositoryPort and CategoryStatisticsPort for testing
+class MockCategoryRepository:
+    def __init__(self):
+        self.categories = {1: Category(category_id=1, name="Electronics", description="Gadgets")}
+
+    def get_by_id(self, category_id: int) -> Optional[Category]:
+        return self.categories.get(category_id)
+
+    def delete(self, category_id: int) -> None:
+        del self.categories[category_id]
+
+class MockStatistics:
+    def __init__(self, counts):
+        self.counts = counts
+
+    def get(self, category_id: int) -> PriceSummary:
+        return PriceSummary(self.counts.get(category_id, 0), None, None, 0)
+
+
+def test_delete_category_with_products_is_rejected():
+    """Test that a category that still has products is not deleted."""
+    repo = MockCategoryRepository()
+    with pytest.raises(ValueError, match="Category with ID 1 still has 2 products"):
+        DeleteCategoryUseCase(repo, MockStatistics({1: 2})).delete_category(1)
+    DeleteCategoryUseCase(repo, MockStatistics({})).delete_category(1)
+    assert repo.categories == {}
@@ -0,0 +1,40 @@
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.application.ports.output.product_search_port import ProductSearchResult
+from src.application.usecases.search_products_usecase import SearchProductsUseCase
+
+# Mock ProductSearchPort that records its calls
+class MockProductSearch:
+    def __init__(self):
+        self.calls = []
+
+    def search(self, query, category_id=None, min_price=None, max_price=None, limit=20, offset=0):
+        self.calls.append((query, category_id, min_price, max_price, limit, offset))
+        product = Product(product_id=1, name="Laptop", description="A laptop", price=Price(amount=10.0), category_id=1)
+        return ProductSearchResult([product], 41)
+
+
+def test_search_products_translates_pages():
+    """Test that page and page_size become limit and offset."""
+    search = MockProductSearch()
+    result = SearchProductsUseCase(search).search_products("laptop", category_id=1, max_price=50.0, page=3, page_size=10)
+    assert result.total == 41
+    assert search.calls == [("laptop", 1, None, 50.0, 10, 20)]
+
+def test_search_products_blank_query():
+    """Test that a blank query returns no results without searching."""
+    search = MockProductSearch()
+    assert SearchProductsUseCase(search).search_products("   ") == ProductSearchResult([], 0)
+    assert search.calls == []
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"page": 0}, ValueError),
+    ({"page_size": 101}, ValueError),
+    ({"min_price": 10.0, "max_price": 5.0}, ValueError),
+    ({"page": "2"}, TypeError),
+])
+def test_search_products_invalid_request(kwargs, error):
+    """Test that invalid pagination and price ranges are rejected."""
+    with pytest.raises(error):
+        SearchProductsUseCase(MockProductSearch()).search_products("laptop", **kwargs)
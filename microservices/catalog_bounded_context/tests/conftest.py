@@ -1,4 +1,9 @@
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.infrastructure.secondary.sqlite_db.database import init_db
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
 
 @pytest.fixture
 def test_client():
@@ -7,3 +12,26 @@ def test_client():
     app.config['TESTING'] = True
     with app.test_client() as client:
         yield client
+
+@pytest.fixture
+def seed_products():
+    """The products stored before a test that uses client; override it with a module's own products."""
+    return []
+
+@pytest.fixture
+def app_session_factory(test_client, seed_products):
+    """An in-memory database with seed_products stored, used by the test client."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    init_db(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    with session_factory() as db:
+        ProductRepositoryAdapter(db).add_many(seed_products)
+    test_client.application.config["SESSION_FACTORY"] = session_factory
+    yield session_factory
+    test_client.application.config.pop("SESSION_FACTORY")
+    engine.dispose()
+
+@pytest.fixture
+def client(test_client, app_session_factory):
+    """The test client, backed by an in-memory database with seed_products stored."""
+    return test_client
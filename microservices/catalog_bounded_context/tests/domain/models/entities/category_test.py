@@ -50,3 +50,17 @@ def test_can_be_deleted():
     assert category.can_be_deleted(product_count=0) is True
     assert category.can_be_deleted(product_count=1) is False
     assert category.can_be_deleted(product_count=10) is False
+
+def test_from_storage_skips_validation():
+    """Test that from_storage rebuilds a category without running constructor checks."""
+    category = Category.from_storage(category_id=1, name="Electronics", description="Test")
+    assert category.category_id == 1
+    assert category.name == "Electronics"
+    assert not hasattr(category, "__dict__")
+
+def test_copy_is_independent():
+    """Test that changing a copy leaves the original category unchanged."""
+    category = Category.from_storage(category_id=1, name="Electronics", description="Test", version=3)
+    copy = category.copy()
+    copy.change_name("Gadgets")
+    assert (category.name, copy.name, copy.category_id, copy.version) == ("Electronics", "Gadgets", 1, 3)
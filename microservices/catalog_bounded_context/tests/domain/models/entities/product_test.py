@@ -111,3 +111,12 @@ def test_assign_to_category_invalid_input():
     product = Product(product_id=101, name="Laptop", description="Powerful laptop", price=price, category_id=1)
     with pytest.raises(TypeError):
         product.assign_to_category("invalid")  # Pass a string
+
+def test_from_storage_skips_validation():
+    """Test that from_storage rebuilds a product without running constructor checks."""
+    price = Price(amount=100.00, currency="USD")
+    product = Product.from_storage(product_id=101, name="Laptop", description="Powerful laptop", price=price, category_id=1)
+    assert product.product_id == 101
+    assert product.price == price
+    assert product.image_urls == []
+    assert not hasattr(product, "__dict__")
@@ -0,0 +1,74 @@
+import random
+from src.domain.models.inverted_index import InvertedIndex, PostingList, tokenize
+
+
+def test_tokenize_lowercases_and_strips_plurals():
+    """Test that text is split into lower-case terms with plural endings removed."""
+    assert tokenize("Gaming Laptops, 2 Chairs & glass status!") == ["gaming", "laptop", "2", "chair", "glass", "status"]
+
+def test_posting_list_round_trips_out_of_order_changes():
+    """Test that buffered additions and removals agree with a plain dict, before and after compaction."""
+    postings, expected = PostingList(), {}
+    rng = random.Random(7)
+    for doc_id in rng.sample(range(1, 5000), 1000):
+        frequency = rng.randint(1, 300)
+        postings.add(doc_id, frequency)
+        expected[doc_id] = frequency
+    for doc_id in rng.sample(sorted(expected), 300):
+        postings.remove(doc_id)
+        del expected[doc_id]
+    postings.add(3, 2)  # Re-adding a removed or new low ID goes through the buffer.
+    expected[3] = 2
+    assert list(postings) == sorted(expected.items())
+    assert len(postings) == len(expected)
+    postings.compact()
+    assert list(postings) == sorted(expected.items())
+    assert postings.nbytes < 4 * len(expected)
+
+def test_appended_postings_are_delta_encoded():
+    """Test that ascending IDs with small gaps take one byte per gap and per frequency."""
+    postings = PostingList()
+    for doc_id in range(1, 101):
+        postings.add(doc_id, 1)
+    assert postings.nbytes == 200
+
+def index_with_products():
+    index = InvertedIndex()
+    index.add(1, "Gaming Laptop", "Fast laptop with a dedicated GPU")
+    index.add(2, "Laptop Sleeve", "Neoprene sleeve")
+    index.add(3, "USB Mouse", "Works with any laptop")
+    index.add(4, "Office Chair", "Ergonomic chair")
+    return index
+
+def test_and_query_ranks_name_matches_first():
+    """Test that every word must match and that name hits rank above description hits."""
+    index = index_with_products()
+    ranked, total = index.search([["laptop"]])
+    assert (sorted(ranked[:2]), ranked[2], total) == ([1, 2], 3, 3)
+    assert index.search([["laptop", "gpu"]]) == ([1], 1)
+    assert index.search([["laptop", "chair"]]) == ([], 0)
+
+def test_or_query_prefix_and_stemming():
+    """Test alternatives, prefix matching of the last word and plural queries."""
+    index = index_with_products()
+    assert sorted(index.search([["mouse"], ["office", "chai"]])[0]) == [3, 4]
+    assert index.search([["ergo"]]) == ([4], 1)
+    assert index.search([["chairs"]]) == ([4], 1)
+    assert index.search([["chairs", "office"]]) == ([4], 1)
+
+def test_top_k_pagination_and_filter():
+    """Test that pages are slices of the ranking and that the filter applies to the total."""
+    index = index_with_products()
+    ranked, total = index.search([["laptop"]])
+    assert index.search([["laptop"]], limit=2, offset=1) == (ranked[1:3], total)
+    assert index.search([["laptop"]], accept=lambda doc_id: doc_id != 1) == ([2, 3], 2)
+
+def test_remove_and_re_add():
+    """Test that removed documents stop matching and can be indexed again with new text."""
+    index = index_with_products()
+    index.remove(4, "Office Chair", "Ergonomic chair")
+    assert 4 not in index and len(index) == 3
+    assert index.search([["chair"]]) == ([], 0)
+    index.add(4, "Standing Desk", "Adjustable desk")
+    assert index.search([["desk"]]) == ([4], 1)
+    assert index.terms_with_prefix("o") == []
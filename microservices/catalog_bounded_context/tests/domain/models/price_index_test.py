@@ -0,0 +1,62 @@
+import random
+import pytest
+from src.domain.models.price_index import PriceIndex
+
+
+def brute_force(entries, category_id=None, low=None, high=None, descending=False):
+    matches = sorted(
+        (price, product_id) for product_id, (entry_category_id, price) in entries.items()
+        if (category_id is None or entry_category_id == category_id)
+        and (low is None or price >= low) and (high is None or price <= high)
+    )
+    if descending:
+        matches.reverse()
+    return [product_id for _, product_id in matches]
+
+def test_select_matches_a_sorted_scan():
+    """Test pages of random ranges against filtering and sorting everything, across updates."""
+    rng = random.Random(3)
+    entries = {product_id: (rng.randint(1, 4), rng.randint(0, 50)) for product_id in range(1, 400)}
+    index = PriceIndex((product_id, *entry) for product_id, entry in entries.items())
+    for product_id in rng.sample(sorted(entries), 100):
+        category_id, price = entries.pop(product_id)
+        index.remove(product_id, category_id, price)
+        if rng.random() < 0.5:
+            entries[product_id] = (rng.randint(1, 4), rng.randint(0, 50))
+            index.add(product_id, *entries[product_id])
+    assert len(index) == len(entries)
+    for _ in range(200):
+        category_id = rng.choice([None, 1, 2, 3, 4, 5])
+        low, high = rng.choice([None, rng.randint(0, 50)]), rng.choice([None, rng.randint(0, 50)])
+        descending, limit, offset = rng.random() < 0.5, rng.randint(1, 30), rng.randint(0, 120)
+        expected = brute_force(entries, category_id, low, high, descending)
+        assert index.select(category_id, low, high, descending, limit, offset) == (
+            expected[offset:offset + limit], len(expected))
+
+def test_remove_requires_the_indexed_category_and_price():
+    """Test that removing with stale attributes fails instead of corrupting the index."""
+    index = PriceIndex([(1, 1, 100)])
+    with pytest.raises(KeyError):
+        index.remove(1, 1, 200)
+    with pytest.raises(KeyError):
+        index.remove(1, 2, 100)
+    index.remove(1, 1, 100)
+    assert index.select() == ([], 0)
+
+def test_out_of_range_keys_are_rejected():
+    """Test that IDs and prices that do not fit in a packed key are rejected."""
+    with pytest.raises(ValueError):
+        PriceIndex().add(2**32, 1, 100)
+    with pytest.raises(ValueError):
+        PriceIndex().add(1, 1, 2**32)
+
+def test_move_category_merges_the_lists():
+    """Test moving every product of a category into another one."""
+    index = PriceIndex([(1, 1, 300), (2, 1, 100), (3, 2, 200), (4, 3, 50)])
+    index.move_category(1, 2)
+    assert index.select(category_id=2) == ([2, 3, 1], 3)
+    assert index.select(category_id=1) == ([], 0)
+    index.move_category(3, 5)
+    assert index.select(category_id=5) == ([4], 1)
+    index.move_category(9, 2)
+    assert index.select() == ([4, 2, 3, 1], 4)
@@ -0,0 +1,157 @@
+import pytest
+from src.domain.models import product_table
+from src.domain.models.entities.Product import Product
+from src.domain.models.product_table import ProductTable
+from src.domain.models.value_objects.Price import Price
+
+
+@pytest.fixture(params=["numpy", "pure_python"])
+def table(request, monkeypatch):
+    """A small table, exercised both with and without NumPy."""
+    if request.param == "pure_python":
+        monkeypatch.setattr(product_table, "np", None)
+    elif product_table.np is None:
+        pytest.skip("NumPy is not installed")
+    return ProductTable([
+        Product(product_id=1, name="Laptop", description="Laptop", price=Price(amount=999.99), category_id=1,
+                image_urls=["http://example.com/laptop.jpg"]),
+        Product(product_id=2, name="Mouse", description="Mouse", price=Price(amount=19.99), category_id=1),
+        Product(product_id=3, name="Desk", description="Desk", price=Price(amount=250.00), category_id=2),
+        Product(product_id=4, name="Chair", description="Chair", price=Price(amount=120.00), category_id=2),
+    ])
+
+def test_get_materializes_product(table):
+    """Test that a row is materialized as an equivalent Product."""
+    product = table.get(1)
+    assert product.name == "Laptop"
+    assert product.price == Price(amount=999.99)
+    assert product.category_id == 1
+    assert product.image_urls == ["http://example.com/laptop.jpg"]
+    assert table.get(2).image_urls == []
+    assert table.get(99) is None
+
+def test_add_assigns_next_id(table):
+    """Test that adding a product without an ID assigns the next one."""
+    product = Product(product_id=1, name="Lamp", description="Lamp", price=Price(amount=30.00), category_id=2)
+    product.product_id = None
+    table.add(product)
+    assert product.product_id == 5
+    assert len(table) == 5
+
+def test_add_duplicate_id(table):
+    """Test that adding an existing ID is rejected."""
+    with pytest.raises(ValueError):
+        table.add(Product(product_id=2, name="Dup", description="Dup", price=Price(amount=1.00), category_id=1))
+
+def test_add_out_of_order_id(table):
+    """Test that a product with a lower ID is inserted in ID order."""
+    table.delete(2)
+    table.add(Product(product_id=2, name="Pen", description="Pen", price=Price(amount=2.00), category_id=1))
+    assert table.product_ids() == [1, 2, 3, 4]
+    assert table.get(2).name == "Pen"
+
+def test_update_and_delete(table):
+    """Test updating and deleting rows."""
+    product = table.get(3)
+    product.change_price(Price(amount=200.00))
+    table.update(product)
+    assert table.get(3).price == Price(amount=200.00)
+    table.delete(3)
+    assert 3 not in table
+    assert len(table) == 3
+    with pytest.raises(ValueError, match="Product with ID 3 not found"):
+        table.delete(3)
+
+def test_set_category(table):
+    """Test moving products by rewriting the category column."""
+    assert table.set_category([1, 3, 99], 7) == [99]
+    assert table.get(1).category_id == 7
+    assert table.get(3).category_id == 7
+    assert table.filter(category_id=7).product_ids() == [1, 3]
+
+def test_filter_by_category_and_price(table):
+    """Test filtering on category and price range."""
+    assert table.filter(category_id=1).product_ids() == [1, 2]
+    assert table.filter(min_price=100, max_price=250).product_ids() == [3, 4]
+    assert table.filter(category_id=2, max_price=200).product_ids() == [4]
+    assert [p.name for p in table.filter(category_id=2)] == ["Desk", "Chair"]
+
+def test_sort_by_price(table):
+    """Test sorting a selection by price."""
+    assert table.all().sort_by_price().product_ids() == [2, 4, 3, 1]
+    assert table.all().sort_by_price(descending=True).product_ids() == [1, 3, 4, 2]
+    assert table.all().sort_by_price()[0].name == "Mouse"
+
+def test_aggregates(table):
+    """Test price aggregates for a selection and per category."""
+    summary = table.filter(category_id=2).price_summary()
+    assert (summary.count, summary.min_minor_units, summary.max_minor_units) == (2, 12000, 25000)
+    assert summary.average == 185.0
+    by_category = table.summarize_by_category()
+    assert by_category[1].count == 2
+    assert by_category[1].total_minor_units == 101998
+    assert table.filter(category_id=9).price_summary().count == 0
+
+def test_compaction_keeps_rows(table):
+    """Test that compacting after many deletions keeps the remaining rows."""
+    table.delete(1)
+    table.delete(2)
+    table.delete(3)
+    assert table.product_ids() == [4]
+    assert table.get(4).name == "Chair"
+
+def test_iter_products_filters_and_resumes(table):
+    """Test streaming products with filters and a starting ID."""
+    assert [p.product_id for p in table.iter_products(batch_size=1)] == [1, 2, 3, 4]
+    assert [p.product_id for p in table.iter_products(after_id=2)] == [3, 4]
+    assert [p.product_id for p in table.iter_products(category_id=2, max_price=200)] == [4]
+
+def test_iter_products_survives_modification(table):
+    """Test that streaming keeps working while rows are deleted."""
+    seen = []
+    for product in table.iter_products(batch_size=1):
+        seen.append(product.product_id)
+        if product.product_id == 1:
+            table.delete(2)
+            table.delete(3)
+    assert seen == [1, 4]
+
+def test_versions_follow_changes(table):
+    """Test that every change gives the row a new version from a table-wide counter."""
+    assert [table.version(product_id) for product_id in (1, 2, 3, 4)] == [1, 2, 3, 4]
+    assert table.get(1).version == 1
+    laptop = table.get(1)
+    laptop.name = "Gaming Laptop"
+    table.update(laptop)
+    assert laptop.version == table.version(1) == 5
+    table.set_category([1], 3)
+    table.delete(2)
+    table.compact()
+    assert table.version(1) == 6
+    assert table.version(2) is None
+
+def test_deleted_ids_and_versions_are_not_reused(table):
+    """Test that a product added after deletes and compaction gets a fresh ID and version."""
+    seen = {(product_id, table.version(product_id)) for product_id in table.product_ids()}
+    table.delete(4)
+    table.delete(3)
+    table.delete(2)
+    table.compact()
+    product = Product(product_id=1, name="Lamp", description="Lamp", price=Price(amount=30.00), category_id=2)
+    product.product_id = None
+    table.add(product)
+    assert product.product_id == 5
+    table.add(Product(product_id=4, name="Stool", description="Stool", price=Price(amount=45.00), category_id=2))
+    assert (4, table.version(4)) not in seen
+    assert (5, table.version(5)) not in seen
+
+def test_move_category(table):
+    """Test moving every product of a category with new versions."""
+    versions = [table.version(product_id) for product_id in (3, 4)]
+    assert table.move_category(2, 1) == [3, 4]
+    assert table.filter(category_id=1).product_ids() == [1, 2, 3, 4]
+    assert all(table.version(product_id) > version for product_id, version in zip((3, 4), versions))
+    assert table.move_category(2, 1) == []
+    moved_versions = [table.version(product_id) for product_id in (3, 4)]
+    assert table.move_category(1, 1) == []
+    assert [table.version(product_id) for product_id in (3, 4)] == moved_versions
@@ -96,4 +96,41 @@ def test_price_hashing():
     assert len(prices) == 2
     assert price1 in prices
     assert price2 in prices
-    assert price3 in prices
\ No newline at end of file
+    assert price3 in prices
+
+def test_price_minor_units():
+    """Test that a Price stores its amount as integer minor units."""
+    price = Price(amount=19.99, currency="USD")
+    assert price.minor_units == 1999
+    assert price.amount == 19.99
+    assert Price.from_minor_units(1999, "USD") == price
+
+def test_price_from_minor_units_invalid():
+    """Test creating a Price from invalid minor units."""
+    with pytest.raises(TypeError):
+        Price.from_minor_units(19.99)
+    with pytest.raises(ValueError):
+        Price.from_minor_units(-1)
+
+def test_price_arithmetic_is_exact():
+    """Test that adding prices does not accumulate float error."""
+    assert Price(amount=0.10).add(Price(amount=0.20)) == Price(amount=0.30)
+
+def test_price_is_immutable_and_compact():
+    """Test that Price has no per-instance __dict__ and cannot be mutated."""
+    price = Price(amount=100.00, currency="USD")
+    assert not hasattr(price, "__dict__")
+    with pytest.raises(AttributeError):
+        price.amount = 50.00
+
+def test_price_hash_matches_equal_prices():
+    """Test that equal prices built different ways share a hash."""
+    price1 = Price(amount=150.00, currency="USD")
+    price2 = Price(amount=100.00, currency="USD").add(Price(amount=50.00, currency="USD"))
+    assert price1 == price2
+    assert hash(price1) == hash(price2)
+
+def test_price_vo_module_is_an_alias():
+    """Test that the legacy price_vo module exposes the same Price class."""
+    from src.domain.models.value_objects import price_vo
+    assert price_vo.Price is Price
@@ -1,3 +1,9 @@
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.domain.services import price_calculation_service
+from src.domain.services.price_calculation_service import PriceCalculationService
+
 # import pytest
 # from unittest.mock import MagicMock
 # from src.domain.models.entities.Category import Category
@@ -111,8 +117,6 @@
 #     assert final_price.amount == 0
 # #
 
-import pytest
-
 def test_addition():
     """
     This test checks if 2 + 2 equals 4.  It's a very basic example
@@ -121,3 +125,38 @@ def test_addition():
     """
     result = 2 + 2
     assert result == 4
+
+
+def _make_products(amounts):
+    return [
+        Product(product_id=i, name=f"Product {i}", description="Desc", price=Price(amount=amount, currency="EUR"), category_id=1)
+        for i, amount in enumerate(amounts, start=1)
+    ]
+
+def test_calculate_final_prices_matches_scalar():
+    """Test that batch pricing gives the same results as pricing line by line."""
+    service = PriceCalculationService()
+    products = _make_products([0.0, 5.5, 100.0, 19.99, 250])
+    quantities = [1, 11, 10, 50, 12]
+    expected = [service.calculate_final_price(p, q) for p, q in zip(products, quantities)]
+    assert service.calculate_final_prices(products, quantities) == expected
+
+def test_calculate_final_prices_keeps_currency():
+    """Test that batch pricing keeps the currency of each product."""
+    service = PriceCalculationService()
+    prices = service.calculate_final_prices(_make_products([10.0]), [20])
+    assert prices[0].currency == "EUR"
+    assert prices[0].amount == 9.0
+
+def test_calculate_final_prices_without_numpy(monkeypatch):
+    """Test that batch pricing falls back to the scalar path when NumPy is missing."""
+    monkeypatch.setattr(price_calculation_service, "np", None)
+    service = PriceCalculationService()
+    products = _make_products([100.0, 100.0])
+    assert [p.amount for p in service.calculate_final_prices(products, [1, 11])] == [100.0, 90.0]
+
+def test_calculate_final_prices_length_mismatch():
+    """Test that batch pricing rejects mismatched products and quantities."""
+    service = PriceCalculationService()
+    with pytest.raises(ValueError):
+        service.calculate_final_prices(_make_products([1.0, 2.0]), [1])
@@ -0,0 +1,140 @@
+import gzip
+import json
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from starlette.testclient import TestClient
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.primary.asgi_api.app import create_app
+from src.infrastructure.secondary.sqlite_db.category_repository_adapter import CategoryRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.database import init_db
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+
+@pytest.fixture
+def clients(tmp_path, test_client):
+    """ASGI and Flask test clients over the same database file, with three products and a category."""
+    url = f"sqlite:///{tmp_path / 'catalog.db'}"
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    init_db(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    with session_factory() as db:
+        ProductRepositoryAdapter(db).add_many([
+            Product(product_id=None, name="Gaming Laptop", description="Fast", price=Price(amount=1499.00), category_id=1),
+            Product(product_id=None, name="Office Laptop", description="Quiet", price=Price(amount=699.00), category_id=1),
+            Product(product_id=None, name="Laptop Sleeve", description="Soft", price=Price(amount=19.99), category_id=2),
+        ])
+        CategoryRepositoryAdapter(db).add(Category(category_id=None, name="Computers", description="Laptops"))
+    async_engine = create_async_engine(url.replace("sqlite://", "sqlite+aiosqlite://"), poolclass=NullPool)
+    app = create_app(async_sessionmaker(bind=async_engine, expire_on_commit=False), session_factory)
+    test_client.application.config["SESSION_FACTORY"] = session_factory
+    with TestClient(app) as asgi_client:
+        yield asgi_client, test_client
+    test_client.application.config.pop("SESSION_FACTORY")
+    engine.dispose()
+
+
+@pytest.mark.parametrize("path", [
+    "/products/1",
+    "/products/99",
+    "/products/10000000000000000000000",
+    "/products?ids=3,99,1",
+    "/products?ids=1,10000000000000000000000",
+    "/products?category_id=1&sort=-price",
+    "/products?sort=name",
+    "/products?category_id=abc",
+    "/products?page_size=1&cursor=1999:3",
+    "/products?min_price=inf",
+    "/products?page=10000000000000000000000",
+    "/products?cursor=1:10000000000000000000000",
+    "/products/search?q=laptop&max_price=1e400",
+    "/products/search?q=laptop",
+    "/categories/1",
+    "/categories/10000000000000000000000",
+])
+def test_same_responses_as_flask(clients, path):
+    """Test that the ASGI app answers GET routes like the Flask app."""
+    asgi_client, flask_client = clients
+    asgi, flask = asgi_client.get(path), flask_client.get(path)
+    assert asgi.status_code == flask.status_code
+    assert asgi.json() == flask.get_json()
+    assert asgi.headers.get("etag") == flask.headers.get("ETag")
+    assert asgi.headers.get("cache-control") == flask.headers.get("Cache-Control")
+
+def test_conditional_get(clients):
+    """Test that a current ETag is answered with 304 Not Modified."""
+    asgi_client, _ = clients
+    etag = asgi_client.get("/products/1").headers["etag"]
+    assert asgi_client.get("/products/1", headers={"If-None-Match": etag}).status_code == 304
+    assert asgi_client.get("/products/1", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+
+def test_batch_then_read(clients):
+    """Test that a batch runs in one transaction and its changes are visible to the async routes."""
+    asgi_client, _ = clients
+    response = asgi_client.post("/products/batch", json={"items": [
+        {"product_id": 1, "name": "Gaming Laptop Pro"},
+        {"name": "Dock", "description": "USB-C", "price": 99.0, "category_id": 1},
+        {"product_id": 99, "name": "Ghost"},
+    ]})
+    assert [item["status"] for item in response.json()["items"]] == [200, 201, 404]
+    assert asgi_client.get("/products/1").json()["name"] == "Gaming Laptop Pro"
+    assert asgi_client.post("/products/batch", content=b"not json").status_code == 400
+
+def test_export_streams_gzip(clients):
+    """Test that the export streams NDJSON, gzip compressed on request."""
+    asgi_client, _ = clients
+    response = asgi_client.get("/products/export?format=ndjson", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    # httpx decodes the body; the raw stream must be a single gzip layer.
+    assert len(response.text.splitlines()) == 3
+    assert asgi_client.get("/products/export?format=xml").status_code == 400
+
+def test_large_responses_are_compressed(clients):
+    """Test that bodies above the size threshold are gzip compressed."""
+    asgi_client, _ = clients
+    ids = ",".join(["1", "2", "3"] * 20)
+    response = asgi_client.get(f"/products?ids={ids}", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["items"]) == 60
+
+def test_compressed_entities_have_their_own_etag(clients):
+    """Test that a gzipped entity over the size threshold gets the same encoded ETag as from Flask."""
+    asgi_client, flask_client = clients
+    asgi_client.post("/products/batch", json={"items": [{"product_id": 1, "description": "Fast " * 300}]})
+    headers = {"Accept-Encoding": "gzip"}
+    asgi, flask = asgi_client.get("/products/1", headers=headers), flask_client.get("/products/1", headers=headers)
+    assert asgi.headers["content-encoding"] == flask.headers["Content-Encoding"] == "gzip"
+    assert asgi.headers["etag"] == flask.headers["ETag"] != asgi_client.get("/products/1").headers["etag"]
+    assert asgi.content == gzip.decompress(flask.data)  # httpx decodes the body; the Flask client does not.
+    revalidated = asgi_client.get("/products/1", headers={**headers, "If-None-Match": asgi.headers["etag"]})
+    assert revalidated.status_code == 304
+
+@pytest.mark.parametrize("path", ["/products/1", "/products?category_id=1", "/categories/1"])
+def test_instrumentation_reports_time_per_layer(clients, path):
+    """Test that a traced app reports use case and repository time, also for routes on the thread pool."""
+    state = clients[0].app.state
+    with TestClient(create_app(state.async_session_factory, state.session_factory, instrumentation=True)) as client:
+        response = client.get(path)
+    assert response.status_code == 200
+    layers = dict(entry.split(";dur=") for entry in response.headers["server-timing"].split(", "))
+    assert set(layers) == {"usecase", "repository"}
+    assert float(layers["usecase"]) >= float(layers["repository"]) > 0
+    assert "server-timing" not in clients[0].get(path).headers
+
+def test_instrumentation_profiles_slow_requests(clients, tmp_path):
+    """Test that a traced app writes the profile of a request slower than the threshold."""
+    state = clients[0].app.state
+    app = create_app(
+        state.async_session_factory, state.session_factory,
+        instrumentation=True, slow_request_seconds=0, profile_dir=str(tmp_path),
+    )
+    with TestClient(app) as client:
+        client.get("/products/1?fields=all")
+    [path] = tmp_path.glob("*.json")
+    profile = json.loads(path.read_text())
+    assert (profile["method"], profile["path"], profile["endpoint"]) == ("GET", "/products/1?fields=all", "get_product")
+    assert profile["calls"] == {"AsyncGetProductUseCase.get_product": 1, "AsyncProductRepositoryAdapter.get_by_id": 1}
@@ -0,0 +1,109 @@
+import io
+import json
+import pytest
+from click.testing import CliRunner
+from sqlalchemy.orm import sessionmaker
+from src.domain.models.entities.Product import Product
+from src.domain.models.product_table import PriceSummary
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.primary.cli import manage_catalog_cli
+from src.infrastructure.primary.cli.product_import import import_source, read_records, validate_records
+from src.infrastructure.primary.rest_api.serializers.export import encode_export
+from src.infrastructure.secondary.sqlite_db.category_statistics_adapter import CategoryStatisticsAdapter
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, init_db
+from src.infrastructure.secondary.sqlite_db.import_progress_adapter import ImportProgressAdapter
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+
+def test_csv_export_round_trips_through_import():
+    """Test that a file written by export-products validates back into the same products."""
+    product = Product(product_id=7, name="Laptop, 15\"", description="Fast", price=Price(amount=999.99),
+                      category_id=3, image_urls=["https://cdn.example.com/1.jpg", "https://cdn.example.com/2.jpg"])
+    text = b"".join(encode_export([[product]], "csv")).decode()
+    chunk = validate_records(list(enumerate(read_records(io.StringIO(text), "csv"), 1)), "csv")
+    assert chunk.rejected == []
+    imported, = chunk.products
+    assert imported.product_id is None
+    assert (imported.name, imported.price, imported.category_id, imported.image_urls) == \
+        (product.name, product.price, product.category_id, product.image_urls)
+
+@pytest.mark.parametrize("line, message", [
+    ('{"name": "", "price": 1, "category_id": 1}', "String cannot be empty"),
+    ('{"name": "Laptop", "category_id": 1}', "Missing field: price"),
+    ('{"name": "Laptop", "price": Infinity, "category_id": 1}', "infinity"),
+    ('[1, 2]', "JSON object"),
+    ('not json', "Expecting value"),
+])
+def test_invalid_ndjson_records_are_rejected(line, message):
+    """Test that invalid records are reported with their number instead of failing the chunk."""
+    records = list(read_records(io.StringIO('{"name": "Mouse", "price": 5, "category_id": 1}\n\n' + line + "\n"), "ndjson"))
+    chunk = validate_records(list(enumerate(records, 1)), "ndjson")
+    assert [product.name for product in chunk.products] == ["Mouse"]
+    rejected, = chunk.rejected
+    assert (rejected.number, rejected.record) == (2, line)
+    assert message in rejected.message
+
+def test_invalid_csv_values_are_rejected():
+    """Test that CSV values that are not numbers are rejected."""
+    text = "name,price,category_id\nMouse,cheap,1\nPad,5,one\n"
+    chunk = validate_records(list(enumerate(read_records(io.StringIO(text), "csv"), 1)), "csv")
+    assert [r.message for r in chunk.rejected] == ["Invalid price: 'cheap'", "Invalid category_id: 'one'"]
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    """A database file used by the CLI commands."""
+    engine = create_catalog_engine(f"sqlite:///{tmp_path / 'catalog.db'}")
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    monkeypatch.setattr(manage_catalog_cli, "SessionLocal", session_factory)
+    monkeypatch.setattr(manage_catalog_cli, "init_db", lambda: init_db(engine))
+    yield session_factory
+    engine.dispose()
+
+@pytest.fixture
+def feed(tmp_path):
+    """An NDJSON feed of five products in two categories."""
+    feed = tmp_path / "feed.ndjson"
+    feed.write_text("".join(json.dumps({"name": f"P{price}", "price": price, "category_id": price % 2 + 1}) + "\n"
+                            for price in range(1, 6)))
+    return feed
+
+def test_import_command_keeps_category_statistics_consistent(session_factory, feed):
+    """Test that every imported chunk updates the category statistics, also when an import is resumed."""
+    runner = CliRunner()
+    arguments = ["import-products", str(feed), "--workers", "0", "--chunk-size", "2"]
+    assert runner.invoke(manage_catalog_cli.cli, arguments).exit_code == 0
+    assert runner.invoke(manage_catalog_cli.cli, arguments + ["--resume"]).exit_code == 0
+    with session_factory() as db:
+        statistics = CategoryStatisticsAdapter(db)
+        assert statistics.get(1) == PriceSummary(2, 200, 400, 600)
+        assert statistics.get(2) == PriceSummary(3, 100, 500, 900)
+    result = runner.invoke(manage_catalog_cli.cli, ["check-category-statistics"])
+    assert (result.exit_code, result.output) == (0, "Category statistics are consistent.\n")
+
+def test_resume_after_a_crash_stores_every_record_once(session_factory, feed, monkeypatch):
+    """Test that an import stopped right after a chunk was committed resumes after that chunk."""
+    committed = []
+
+    def crash_after_second_chunk(rejected, file):
+        committed.append(rejected)
+        if len(committed) == 2:
+            raise RuntimeError("killed")
+    monkeypatch.setattr(manage_catalog_cli, "write_rejected", crash_after_second_chunk)
+    runner = CliRunner()
+    arguments = ["import-products", str(feed), "--workers", "0", "--chunk-size", "2"]
+    assert runner.invoke(manage_catalog_cli.cli, arguments).exit_code == 1
+    with session_factory() as db:
+        assert ImportProgressAdapter(db).get_position(import_source(str(feed), "ndjson")) == 4
+    assert runner.invoke(manage_catalog_cli.cli, arguments + ["--resume"]).exit_code == 0
+    with session_factory() as db:
+        assert [product.name for product in ProductRepositoryAdapter(db).get_all()] == ["P1", "P2", "P3", "P4", "P5"]
+        assert ImportProgressAdapter(db).get_position(import_source(str(feed), "csv")) == 0
+
+def test_trace_option_reports_time_per_layer(session_factory, feed):
+    """Test that --trace reports the instrumented use case and repository calls of a command."""
+    result = CliRunner().invoke(manage_catalog_cli.cli, ["--trace", "import-products", str(feed), "--workers", "0",
+                                                         "--chunk-size", "2"])
+    assert result.exit_code == 0
+    assert "usecase: " in result.stderr and "unit_of_work: " in result.stderr
+    assert "SqlAlchemyUnitOfWork.run: 3 calls" in result.stderr
+    assert "ImportProductsUseCase.import_products: 1 calls" in result.stderr
@@ -0,0 +1,105 @@
+import gzip
+import zlib
+import pytest
+from flask import Flask, Response
+from src.infrastructure.primary.rest_api.middlewares import compression
+from src.infrastructure.primary.rest_api.middlewares.compression import ResponseCompressor
+from src.infrastructure.primary.rest_api.middlewares.http_caching import not_modified
+
+BODY = b'{"items":[' + b",".join(b'{"name":"Laptop %d","price":999.99}' % n for n in range(200)) + b"]}"
+
+
+@pytest.fixture
+def app():
+    """A small app with a large JSON route, a small one, an already encoded one and a stream."""
+    app = Flask(__name__)
+    app.config["COMPRESSION_MIN_SIZE"] = 1024
+
+    @app.route("/large")
+    def large():
+        response = not_modified("page", 1, 7)
+        if response is None:
+            response = Response(BODY, mimetype="application/json")
+            response.set_etag("page-1-v7")
+        return response
+
+    @app.route("/small")
+    def small():
+        return Response(b'{"ok":true}', mimetype="application/json")
+
+    @app.route("/encoded")
+    def encoded():
+        return Response(gzip.compress(BODY), mimetype="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.route("/stream")
+    def stream():
+        return Response(iter([BODY]), mimetype="application/x-ndjson")
+
+    ResponseCompressor().init_app(app)
+    return app
+
+
+@pytest.mark.parametrize("accept, encoding, decode", [
+    ("gzip", "gzip", gzip.decompress),
+    ("deflate", "deflate", zlib.decompress),
+    ("gzip;q=0.5, deflate", "deflate", zlib.decompress),
+])
+def test_negotiates_the_encoding(app, accept, encoding, decode):
+    """Test that the encoding the client rates highest is used and the body decodes back."""
+    response = app.test_client().get("/large", headers={"Accept-Encoding": accept})
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert decode(response.get_data()) == BODY
+
+def test_prefers_brotli_when_installed(app):
+    """Test that brotli wins a tie when it is installed."""
+    brotli = pytest.importorskip("brotli")
+    response = app.test_client().get("/large", headers={"Accept-Encoding": "gzip, deflate, br"})
+    assert response.headers["Content-Encoding"] == "br"
+    assert brotli.decompress(response.get_data()) == BODY
+
+@pytest.mark.parametrize("path, accept", [
+    ("/large", "identity"),
+    ("/large", "gzip;q=0"),
+    ("/small", "gzip"),
+    ("/stream", "gzip"),
+])
+def test_leaves_responses_uncompressed(app, path, accept):
+    """Test that refused encodings, small bodies and streams are sent as they are."""
+    response = app.test_client().get(path, headers={"Accept-Encoding": accept})
+    assert "Content-Encoding" not in response.headers
+    assert response.get_data() == (BODY if path != "/small" else b'{"ok":true}')
+
+def test_does_not_compress_twice(app):
+    """Test that a body that already has a Content-Encoding is not compressed again."""
+    response = app.test_client().get("/encoded", headers={"Accept-Encoding": "gzip"})
+    assert gzip.decompress(response.get_data()) == BODY
+
+def test_threshold_is_configurable(app):
+    """Test that the size threshold comes from the app settings."""
+    app.config["COMPRESSION_MIN_SIZE"] = len(BODY) + 1
+    assert "Content-Encoding" not in app.test_client().get("/large", headers={"Accept-Encoding": "gzip"}).headers
+
+def test_compressed_bodies_are_cached_by_etag(app, monkeypatch):
+    """Test that a body is compressed once per ETag and encoding, and the stats count it."""
+    calls = []
+    encode = compression._ENCODERS["gzip"]
+    monkeypatch.setitem(compression._ENCODERS, "gzip", lambda body: calls.append(1) or encode(body))
+    client = app.test_client()
+    bodies = [client.get("/large", headers={"Accept-Encoding": "gzip"}).get_data() for _ in range(3)]
+    assert len(calls) == 1
+    assert bodies[0] == bodies[1] == bodies[2]
+    stats = app.extensions["compression"].stats()["large"]
+    assert (stats.responses, stats.cache_hits, stats.bytes_in) == (3, 2, 3 * len(BODY))
+    assert stats.bytes_saved > 2 * len(BODY)
+
+def test_each_encoding_gets_a_strong_etag(app):
+    """Test that a compressed response carries a strong tag of its encoding that answers If-None-Match."""
+    client = app.test_client()
+    assert client.get("/large", headers={"Accept-Encoding": "identity"}).headers["ETag"] == '"page-1-v7"'
+    assert client.get("/large", headers={"Accept-Encoding": "deflate"}).headers["ETag"] == '"page-1-v7-deflate"'
+    etag = client.get("/large", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+    assert etag == '"page-1-v7-gzip"'
+    response = client.get("/large", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert (response.status_code, response.headers["ETag"]) == (304, etag)
+    assert client.get("/large", headers={"If-None-Match": '"page-1-v6-gzip"'}).status_code == 200
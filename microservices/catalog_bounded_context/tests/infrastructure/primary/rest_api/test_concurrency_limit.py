@@ -0,0 +1,201 @@
+import threading
+import pytest
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+from src.infrastructure.primary.rest_api.middlewares.concurrency_limit import AimdLimiter, ConcurrencyLimiter
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_sheds_requests_over_the_limit(clock):
+    """Test that requests beyond the limit are rejected and counted."""
+    limiter = AimdLimiter(initial_limit=2, clock=clock)
+    assert limiter.try_acquire() is not None
+    assert limiter.try_acquire() is not None
+    assert limiter.try_acquire() is None
+    assert limiter.stats() == (2, 2, 2, 1)
+
+def test_fast_requests_grow_the_limit_additively(clock):
+    """Test that a full round of fast requests under load raises the limit by about one."""
+    limiter = AimdLimiter(initial_limit=4, max_limit=5, latency_target=0.1, clock=clock)
+    for _ in range(3):
+        started = [limiter.try_acquire() for _ in range(limiter.limit)]
+        clock.now += 0.01
+        for start in started:
+            limiter.release(start)
+    assert limiter.limit == 5  # Capped at max_limit.
+
+def test_idle_service_does_not_grow_the_limit(clock):
+    """Test that fast requests well under the limit leave it alone."""
+    limiter = AimdLimiter(initial_limit=10, clock=clock)
+    for _ in range(100):
+        limiter.release(limiter.try_acquire())
+    assert limiter.limit == 10
+
+def test_slow_round_decreases_the_limit_once(clock):
+    """Test that many slow requests of the same round back off only once, down to min_limit."""
+    limiter = AimdLimiter(initial_limit=10, min_limit=2, latency_target=0.1, backoff=0.5, clock=clock)
+    started = [limiter.try_acquire() for _ in range(10)]
+    clock.now += 1.0
+    for start in started:
+        limiter.release(start)
+    assert limiter.limit == 5
+    for _ in range(3):
+        start = limiter.try_acquire()
+        clock.now += 1.0
+        limiter.release(start)
+    assert limiter.limit == 2
+
+def test_overload_signal_decreases_the_limit(clock):
+    """Test that a failed request counts as overload even when fast."""
+    limiter = AimdLimiter(initial_limit=10, backoff=0.5, clock=clock)
+    limiter.release(limiter.try_acquire(), overloaded=True)
+    assert limiter.limit == 5
+
+def test_rejects_inconsistent_settings():
+    """Test that limits out of order and a backoff outside (0, 1) are refused."""
+    with pytest.raises(ValueError):
+        AimdLimiter(initial_limit=5, min_limit=10)
+    with pytest.raises(ValueError):
+        AimdLimiter(backoff=1.0)
+
+
+@pytest.fixture
+def app():
+    """An app whose routes block until released, with one slot per budget."""
+    app = Flask(__name__)
+    app.entered = threading.Event()
+    app.release = threading.Event()
+
+    @app.route("/slow", methods=["GET", "POST"])
+    def slow():
+        app.entered.set()
+        app.release.wait(5)
+        return {"ok": True}
+
+    @app.route("/fast", methods=["GET", "POST"])
+    def fast():
+        return {"ok": True}
+
+    @app.route("/broken")
+    def broken():
+        return {"message": "database is locked"}, 503
+
+    @app.route("/locked")
+    def locked():
+        raise OperationalError("UPDATE products", {}, Exception("database is locked"))
+
+    @app.route("/bug")
+    def bug():
+        raise KeyError("name")
+
+    @app.route("/download")
+    def download():
+        app.entered.set()
+        app.release.wait(5)
+        return {"ok": True}
+
+    ConcurrencyLimiter(
+        read=AimdLimiter(initial_limit=1, max_limit=1),
+        write=AimdLimiter(initial_limit=1, max_limit=1),
+        stream=AimdLimiter(initial_limit=1, max_limit=1, latency_target=float("inf")),
+        stream_endpoints=("download",),
+    ).init_app(app)
+    return app
+
+
+def _hold(app, method, path="/slow"):
+    """Starts a request to a blocking route in a thread and waits until it occupies its slot."""
+    thread = threading.Thread(target=lambda: app.test_client().open(path, method=method))
+    thread.start()
+    assert app.entered.wait(5)
+    return thread
+
+
+def test_sheds_with_503_and_retry_after(app):
+    """Test that a request over the limit gets a fast 503 with Retry-After."""
+    thread = _hold(app, "GET")
+    try:
+        response = app.test_client().get("/fast")
+    finally:
+        app.release.set()
+        thread.join()
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert "read" in response.get_json()["message"]
+    assert app.test_client().get("/fast").status_code == 200
+
+def test_writes_cannot_starve_reads(app):
+    """Test that a saturated write budget leaves reads unaffected, and the other way round."""
+    thread = _hold(app, "POST")
+    try:
+        read = app.test_client().get("/fast")
+        write = app.test_client().post("/fast")
+    finally:
+        app.release.set()
+        thread.join()
+    assert read.status_code == 200
+    assert write.status_code == 503
+    stats = app.extensions["concurrency_limiter"].stats()
+    assert (stats["write"].in_flight, stats["write"].rejected, stats["read"].rejected) == (0, 1, 0)
+
+def test_server_errors_count_as_overload(app):
+    """Test that a 503 response lowers the budget limit when the limit allows it."""
+    limiter = AimdLimiter(initial_limit=4, backoff=0.5)
+    app.extensions["concurrency_limiter"].budgets["read"] = limiter
+    assert app.test_client().get("/broken").status_code == 503
+    assert limiter.limit == 2
+    assert limiter.stats().in_flight == 0
+
+def test_locked_database_counts_as_overload(app):
+    """Test that an unhandled locked-database error lowers the budget limit."""
+    limiter = AimdLimiter(initial_limit=4, backoff=0.5)
+    app.extensions["concurrency_limiter"].budgets["read"] = limiter
+    assert app.test_client().get("/locked").status_code == 500
+    assert limiter.limit == 2
+
+def test_bugs_do_not_count_as_overload(app):
+    """Test that an unhandled error that is not an overload signal leaves the limit alone."""
+    limiter = AimdLimiter(initial_limit=4, backoff=0.5)
+    app.extensions["concurrency_limiter"].budgets["read"] = limiter
+    assert app.test_client().get("/bug").status_code == 500
+    assert limiter.limit == 4
+    assert limiter.stats().in_flight == 0
+
+def test_streams_have_their_own_budget(app):
+    """Test that a stream is admitted by the stream budget, never by the read one."""
+    thread = _hold(app, "GET", "/download")
+    try:
+        read = app.test_client().get("/fast")
+        stream = app.test_client().get("/download")
+    finally:
+        app.release.set()
+        thread.join()
+    assert (read.status_code, stream.status_code) == (200, 503)
+    assert "stream" in stream.get_json()["message"]
+    stats = app.extensions["concurrency_limiter"].stats()
+    assert (stats["read"].accepted, stats["read"].rejected) == (1, 0)
+    assert (stats["stream"].accepted, stats["stream"].rejected, stats["stream"].in_flight) == (1, 1, 0)
+
+def test_slow_streams_do_not_lower_the_limit(clock):
+    """Test that a budget without a latency target is only lowered by failures."""
+    limiter = AimdLimiter(initial_limit=4, max_limit=4, latency_target=float("inf"), backoff=0.5, clock=clock)
+    started = limiter.try_acquire()
+    clock.now += 3600
+    limiter.release(started)
+    assert limiter.limit == 4
+    limiter.release(limiter.try_acquire(), overloaded=True)
+    assert limiter.limit == 2
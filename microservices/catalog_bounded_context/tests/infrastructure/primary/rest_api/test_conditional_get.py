@@ -0,0 +1,88 @@
+import pytest
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.primary.rest_api.controllers import category_controller, product_controller
+from src.infrastructure.secondary.sqlite_db.category_repository_adapter import CategoryRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+
+@pytest.fixture
+def seed_products():
+    """One product."""
+    return [Product(product_id=None, name="Laptop", description="Fast", price=Price(amount=999.00), category_id=1)]
+
+@pytest.fixture
+def session_factory(app_session_factory):
+    """The test client's database, with the product's category stored."""
+    with app_session_factory() as db:
+        CategoryRepositoryAdapter(db).add(Category(category_id=None, name="Computers", description="Laptops and desktops"))
+    return app_session_factory
+
+
+def test_get_product_sends_etag_and_cache_control(test_client, session_factory):
+    """Test that a product is returned with a strong ETag and the route's Cache-Control."""
+    response = test_client.get("/products/1")
+    assert response.status_code == 200
+    assert response.get_json()["name"] == "Laptop"
+    assert response.headers["ETag"] == '"product-1-v1"'
+    assert response.headers["Cache-Control"] == "public, max-age=60, must-revalidate"
+    assert test_client.get("/products/2").status_code == 404
+
+@pytest.mark.parametrize("path", ["/products/10000000000000000000000", "/categories/10000000000000000000000"])
+def test_ids_beyond_storage_are_not_found(test_client, session_factory, path):
+    """Test that an ID no stored entity can have is a 404, also when revalidating."""
+    assert test_client.get(path).status_code == 404
+    assert test_client.get(path, headers={"If-None-Match": '"product-1-v1"'}).status_code == 404
+
+def test_not_modified_skips_loading_and_serializing(test_client, session_factory, monkeypatch):
+    """Test that a matching If-None-Match gets a 304 without the serializer or a full read."""
+    def fail(*args):
+        raise AssertionError("must not be called for a 304")
+    monkeypatch.setattr(product_controller, "encode_product", fail)
+    monkeypatch.setattr(category_controller, "encode_category", fail)
+    monkeypatch.setattr(ProductRepositoryAdapter, "get_by_id", fail)
+    monkeypatch.setattr(CategoryRepositoryAdapter, "get_by_id", fail)
+
+    response = test_client.get("/products/1", headers={"If-None-Match": '"other", "product-1-v1"'})
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == '"product-1-v1"'
+    assert response.headers["Cache-Control"] == "public, max-age=60, must-revalidate"
+    assert test_client.get("/categories/1", headers={"If-None-Match": '"category-1-v1"'}).status_code == 304
+    response = test_client.get("/products/1", headers={"If-None-Match": '"product-1-v1-gzip"'})
+    assert (response.status_code, response.headers["ETag"]) == (304, '"product-1-v1-gzip"')
+
+def test_update_changes_the_etag(test_client, session_factory):
+    """Test that a stale ETag gets the new representation after an update."""
+    with session_factory() as db:
+        repository = ProductRepositoryAdapter(db)
+        product = repository.get_by_id(1)
+        product.name = "Gaming Laptop"
+        repository.update(product)
+    response = test_client.get("/products/1", headers={"If-None-Match": '"product-1-v1"'})
+    assert response.status_code == 200
+    assert response.get_json()["name"] == "Gaming Laptop"
+    assert response.headers["ETag"] == '"product-1-v2"'
+
+def test_cache_control_is_configurable_per_route(test_client, session_factory):
+    """Test that the CACHE_CONTROL setting overrides the default of one endpoint only."""
+    test_client.application.config["CACHE_CONTROL"] = {"categories.get_category_route": "no-cache"}
+    try:
+        assert test_client.get("/categories/1").headers["Cache-Control"] == "no-cache"
+        assert test_client.get("/products/1").headers["Cache-Control"] == "public, max-age=60, must-revalidate"
+    finally:
+        test_client.application.config.pop("CACHE_CONTROL")
+
+def test_recreated_product_does_not_match_the_old_etag(test_client, session_factory):
+    """Test that a product created after a delete gets a new ID, so the old ETag is not revalidated."""
+    with session_factory() as db:
+        repository = ProductRepositoryAdapter(db)
+        repository.delete(1)
+        product = Product(product_id=None, name="Tablet", description="Light", price=Price(amount=499.00), category_id=1)
+        repository.add(product)
+    assert product.product_id == 2
+    assert test_client.get("/products/1", headers={"If-None-Match": '"product-1-v1"'}).status_code == 404
+    response = test_client.get("/products/2", headers={"If-None-Match": '"product-1-v1"'})
+    assert response.status_code == 200
+    assert response.get_json()["name"] == "Tablet"
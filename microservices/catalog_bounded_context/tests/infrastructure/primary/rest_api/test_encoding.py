@@ -0,0 +1,60 @@
+import json
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.primary.rest_api.serializers import encoding
+from src.infrastructure.primary.rest_api.serializers.encoding import EncodedEntityCache, dumps, encode_page, encode_product
+from src.infrastructure.primary.rest_api.serializers.product_serializer import serialize_product
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Runs a test with orjson and with the standard library fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(encoding, "orjson", None)
+    elif encoding.orjson is None:
+        pytest.skip("orjson is not installed")
+
+def make_product(version=1, name="Laptop"):
+    return Product.from_storage(product_id=7, name=name, description="Fäst", price=Price(amount=999.99),
+                                category_id=1, version=version)
+
+
+def test_dumps_encodes_prices(encoder):
+    """Test that Price objects are encoded natively and unknown objects are rejected."""
+    assert json.loads(dumps({"price": Price(amount=19.99, currency="EUR")})) == {
+        "price": {"amount": 19.99, "currency": "EUR"}}
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+def test_encode_product_matches_the_serializer(encoder):
+    """Test that the encoded bytes are the JSON of serialize_product."""
+    product = make_product()
+    assert json.loads(encode_product(product)) == serialize_product(product)
+
+def test_encoded_bytes_are_cached_per_version(encoder):
+    """Test that a version is encoded once, and a new version is encoded again."""
+    cache = EncodedEntityCache()
+    first = encode_product(make_product(), cache)
+    assert encode_product(make_product(), cache) is first
+    assert json.loads(encode_product(make_product(version=2, name="Gaming Laptop"), cache))["name"] == "Gaming Laptop"
+    assert encode_product(make_product(version=None), cache) is not encode_product(make_product(version=None), cache)
+    assert cache.stats().hits == 1
+
+def test_same_version_with_other_content_is_encoded_again(encoder):
+    """Test that an ID and version re-created with other content never get the old bytes."""
+    cache = EncodedEntityCache()
+    encode_product(make_product(), cache)
+    recreated = make_product(name="Tablet")
+    assert json.loads(encode_product(recreated, cache))["name"] == "Tablet"
+    assert encode_product(recreated, cache) is encode_product(recreated, cache)
+    with_images = make_product(name="Tablet")
+    with_images.image_urls = []
+    assert json.loads(encode_product(with_images, cache))["image_urls"] == []
+
+def test_encode_page_joins_fragments(encoder):
+    """Test that a page of encoded items is a valid document with the extra fields."""
+    products = [make_product(), make_product(version=2)]
+    body = encode_page((encode_product(product) for product in products), total=41, page=2)
+    assert json.loads(body) == {"items": [serialize_product(p) for p in products], "total": 41, "page": 2}
+    assert json.loads(encode_page([], total=0)) == {"items": [], "total": 0}
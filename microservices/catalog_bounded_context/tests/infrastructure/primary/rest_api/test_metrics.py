@@ -0,0 +1,124 @@
+import threading
+import pytest
+from flask import Blueprint, Flask
+from src.infrastructure.primary.rest_api.middlewares.compression import ResponseCompressor
+from src.infrastructure.primary.rest_api.middlewares.concurrency_limit import AimdLimiter, ConcurrencyLimiter
+from src.infrastructure.primary.rest_api.middlewares import metrics as metrics_module
+from src.infrastructure.primary.rest_api.middlewares.metrics import RequestMetrics
+
+
+@pytest.fixture
+def app():
+    """A small app with a blueprint route, an app route and a failing route, fully instrumented."""
+    app = Flask(__name__)
+    items = Blueprint("items", __name__, url_prefix="/items")
+
+    @items.route("/<int:item_id>", methods=["GET", "PUT"])
+    def item(item_id):
+        return {"id": item_id, "name": "x" * 2000}
+
+    @app.route("/boom")
+    def boom():
+        raise RuntimeError("database is locked")
+
+    app.register_blueprint(items)
+    RequestMetrics().init_app(app)
+    ConcurrencyLimiter(read=AimdLimiter(initial_limit=1, max_limit=1)).init_app(app)
+    ResponseCompressor().init_app(app)
+    return app
+
+
+def scrape(app):
+    """Returns the samples of /metrics as a dict from series to value."""
+    response = app.test_client().get("/metrics")
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    samples = {}
+    for line in response.get_data(as_text=True).splitlines():
+        if not line.startswith("#"):
+            series, value = line.rsplit(" ", 1)
+            samples[series] = float(value)
+    return samples
+
+
+def test_counts_requests_per_route_and_status(app):
+    """Test that requests are counted by blueprint, route template, method and status."""
+    client = app.test_client()
+    for item_id in (1, 2, 3):
+        client.get(f"/items/{item_id}")
+    client.put("/items/1")
+    client.get("/nowhere")
+    samples = scrape(app)
+    labels = 'blueprint="items",route="/items/<int:item_id>"'
+    assert samples[f'http_requests_total{{{labels},method="GET",status="200"}}'] == 3
+    assert samples[f'http_requests_total{{{labels},method="PUT",status="200"}}'] == 1
+    assert samples['http_requests_total{blueprint="",route="unmatched",method="GET",status="404"}'] == 1
+    assert samples[f'http_requests_in_flight{{{labels},method="GET"}}'] == 0
+
+def test_records_latency_and_size_histograms(app):
+    """Test that the histograms are cumulative and agree with the request count."""
+    client = app.test_client()
+    client.get("/items/1")
+    client.get("/items/2", headers={"Accept-Encoding": "gzip"})
+    samples = scrape(app)
+    labels = 'blueprint="items",route="/items/<int:item_id>",method="GET"'
+    assert samples[f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'] == 2
+    assert samples[f'http_request_duration_seconds_count{{{labels}}}'] == 2
+    assert samples[f'http_request_duration_seconds_bucket{{{labels},le="0.001"}}'] <= \
+        samples[f'http_request_duration_seconds_bucket{{{labels},le="10"}}']
+    # One body was sent compressed, below 1000 bytes; the other was not.
+    assert samples[f'http_response_size_bytes_bucket{{{labels},le="1000"}}'] == 1
+    assert samples[f'http_response_size_bytes_bucket{{{labels},le="10000"}}'] == 2
+    assert samples[f'http_request_size_bytes_sum{{{labels}}}'] == 0
+
+def test_unhandled_exceptions_count_as_500(app):
+    """Test that a view that raises is counted as a 500 with its exception type."""
+    app.config["PROPAGATE_EXCEPTIONS"] = False
+    assert app.test_client().get("/boom").status_code == 500
+    samples = scrape(app)
+    assert samples['http_requests_total{blueprint="",route="/boom",method="GET",status="500"}'] == 1
+    assert samples['http_request_exceptions_total{blueprint="",route="/boom",method="GET",'
+                   'exception="RuntimeError"}'] == 1
+
+def test_counts_from_every_thread(app):
+    """Test that requests served by threads that have since finished are still counted."""
+    def get():
+        app.test_client().put("/items/1")
+
+    for _ in range(3):
+        threads = [threading.Thread(target=get) for _ in range(40)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    metrics = app.extensions["metrics"]
+    assert len(metrics._shards) < 120
+    samples = scrape(app)
+    assert samples['http_requests_total{blueprint="items",route="/items/<int:item_id>",method="PUT",status="200"}'] == 120
+
+def test_snapshot_merges_under_the_lock(app, monkeypatch):
+    """Test that a scrape cannot interleave with a fold, which would count a retired shard twice."""
+    metrics = app.extensions["metrics"]
+    locked = []
+    merge = metrics_module._merge
+
+    def checked_merge(total, shard):
+        locked.append(metrics._lock.locked())
+        merge(total, shard)
+
+    monkeypatch.setattr(metrics_module, "_merge", checked_merge)
+    app.test_client().get("/items/1")
+    metrics.snapshot()
+    assert locked and all(locked)
+
+def test_reports_limiter_compression_and_caches(app):
+    """Test that the other middleware report through the same endpoint, and shed requests are counted."""
+    limiter = app.extensions["concurrency_limiter"]
+    limiter.budgets["read"].try_acquire()  # Fill the single read slot.
+    assert app.test_client().get("/items/1").status_code == 503
+    samples = scrape(app)  # Not shed: the metrics endpoint is exempt.
+    assert samples['http_requests_total{blueprint="items",route="/items/<int:item_id>",method="GET",status="503"}'] == 1
+    assert samples['catalog_concurrency_limit{budget="read"}'] == 1
+    assert samples['catalog_concurrency_requests_total{budget="read",decision="rejected"}'] == 1
+    assert samples['catalog_cache_size{cache="compressed_body"}'] == 0
+    assert 'catalog_cache_hits_total{cache="encoded_entity"}' in samples
@@ -0,0 +1,55 @@
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+
+
+@pytest.fixture
+def seed_products():
+    """Two products."""
+    return [
+        Product(product_id=None, name="Gaming Laptop", description="Fast", price=Price(amount=1499.00), category_id=1),
+        Product(product_id=None, name="Laptop Sleeve", description="Soft", price=Price(amount=19.99), category_id=2),
+    ]
+
+
+def test_multi_get_keeps_request_order(client):
+    """Test that GET /products?ids= returns products in request order with null for unknown IDs."""
+    body = client.get("/products?ids=2,99,1").get_json()
+    assert [item and item["name"] for item in body["items"]] == ["Laptop Sleeve", None, "Gaming Laptop"]
+    assert body["not_found"] == [99]
+    assert client.get("/products?ids=1&ids=2").get_json()["not_found"] == []
+
+@pytest.mark.parametrize("query", ["ids=1,x", "ids=1,10000000000000000000000", "ids=" + ",".join(str(n) for n in range(251))])
+def test_multi_get_rejects_bad_ids(client, query):
+    """Test that non-integer IDs and too many IDs are client errors."""
+    assert client.get(f"/products?{query}").status_code == 400
+
+def test_batch_reports_a_status_per_item(client):
+    """Test that POST /products/batch creates and updates in one request with a status per item."""
+    response = client.post("/products/batch", json={"items": [
+        {"name": "Office Laptop", "description": "Quiet", "price": 699.0, "category_id": 1},
+        {"product_id": 2, "price": 17.99},
+        {"product_id": 99, "name": "Ghost"},
+        {"name": "No price", "category_id": 1},
+        {"product_id": 1, "currency": "EUR"},
+    ]})
+    assert response.status_code == 200
+    items = response.get_json()["items"]
+    assert [item["status"] for item in items] == [201, 200, 404, 400, 400]
+    assert items[0]["product"]["product_id"] == 3
+    assert items[3]["message"] == "Missing field: price"
+    body = client.get("/products?ids=3,2").get_json()
+    assert [(item["name"], item["price"]) for item in body["items"]] == [("Office Laptop", 699.0), ("Laptop Sleeve", 17.99)]
+
+def test_batch_update_changes_the_etag(client):
+    """Test that products updated in a batch get a new version."""
+    etag = client.get("/products/1").headers["ETag"]
+    client.post("/products/batch", json={"items": [{"product_id": 1, "name": "Gaming Laptop Pro"}]})
+    response = client.get("/products/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.get_json()["name"] == "Gaming Laptop Pro"
+
+@pytest.mark.parametrize("payload", [[{"name": "x"}], {"items": "x"}, {"items": [{}] * 251}])
+def test_batch_rejects_bad_envelopes(client, payload):
+    """Test that a body without an items list, or with too many items, is a client error."""
+    assert client.post("/products/batch", json=payload).status_code == 400
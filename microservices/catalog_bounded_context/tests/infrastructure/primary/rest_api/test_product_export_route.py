@@ -0,0 +1,72 @@
+import csv
+import gzip
+import io
+import json
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.primary.rest_api.serializers.export import gzip_stream, write_export
+
+
+@pytest.fixture
+def seed_products():
+    """Three products, one with images and a description that needs quoting."""
+    return [
+        Product(product_id=None, name="Gaming Laptop", description="Fast, \"RGB\"", price=Price(amount=1499.00),
+                category_id=1, image_urls=["https://cdn.example.com/1.jpg", "https://cdn.example.com/2.jpg"]),
+        Product(product_id=None, name="Office Laptop", description="Quiet", price=Price(amount=699.00), category_id=1),
+        Product(product_id=None, name="Laptop Sleeve", description="Soft", price=Price(amount=19.99), category_id=2),
+    ]
+
+
+def test_export_ndjson(client):
+    """Test that the default export is one JSON product per line, in ID order."""
+    response = client.get("/products/export")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert "products.ndjson" in response.headers["Content-Disposition"]
+    products = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [product["name"] for product in products] == ["Gaming Laptop", "Office Laptop", "Laptop Sleeve"]
+    assert (products[0]["price"], products[0]["currency"]) == (1499.0, "USD")
+
+def test_export_csv_by_category(client):
+    """Test that the CSV export has a header row, quotes fields and filters by category."""
+    response = client.get("/products/export?format=csv&category_id=1")
+    assert response.mimetype == "text/csv"
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [row["name"] for row in rows] == ["Gaming Laptop", "Office Laptop"]
+    assert rows[0]["description"] == "Fast, \"RGB\""
+    assert rows[0]["price"] == "1499.00"
+    assert rows[0]["image_urls"].split() == ["https://cdn.example.com/1.jpg", "https://cdn.example.com/2.jpg"]
+    assert client.get("/products/export?category_id=abc").status_code == 400
+    assert client.get("/products/export?category_id=10000000000000000000000").status_code == 400
+
+def test_export_gzip(client):
+    """Test that the export is gzip compressed when the client accepts it."""
+    response = client.get("/products/export?format=csv", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    lines = gzip.decompress(response.get_data()).decode().splitlines()
+    assert lines[0] == "product_id,name,description,price,currency,category_id,image_urls"
+    assert len(lines) == 4
+
+def test_export_uses_the_stream_budget(client):
+    """Test that an export is admitted by the stream budget and releases it when the body is read."""
+    limiter = client.application.extensions["concurrency_limiter"]
+    before = limiter.stats()
+    client.get("/products/export").get_data()
+    after = limiter.stats()
+    assert after["stream"].accepted == before["stream"].accepted + 1
+    assert (after["read"].accepted, after["stream"].in_flight) == (before["read"].accepted, 0)
+
+def test_export_rejects_unknown_format(client):
+    """Test that an unknown export format is a client error."""
+    assert client.get("/products/export?format=xml").status_code == 400
+
+def test_write_export_round_trip(tmp_path):
+    """Test that a compressed stream written in blocks decompresses to the input."""
+    chunks = [f"line {n}\n".encode() for n in range(10_000)]
+    path = tmp_path / "products.ndjson.gz"
+    with open(path, "wb") as file:
+        written = write_export(gzip_stream(iter(chunks)), file)
+    assert written == path.stat().st_size
+    assert gzip.decompress(path.read_bytes()) == b"".join(chunks)
@@ -0,0 +1,49 @@
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+
+
+@pytest.fixture
+def seed_products():
+    """Three products."""
+    return [
+        Product(product_id=None, name="Gaming Laptop", description="Fast", price=Price(amount=1499.00), category_id=1),
+        Product(product_id=None, name="Office Laptop", description="Quiet", price=Price(amount=699.00), category_id=1),
+        Product(product_id=None, name="Laptop Sleeve", description="Soft", price=Price(amount=19.99), category_id=2),
+    ]
+
+
+def test_list_route_filters_and_sorts(client):
+    """Test that GET /products lists a category by price, most expensive first."""
+    response = client.get("/products?category_id=1&sort=-price")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["total"] == 2
+    assert [item["name"] for item in body["items"]] == ["Gaming Laptop", "Office Laptop"]
+    assert client.get("/products/?max_price=20").get_json()["total"] == 1
+
+def test_list_route_rejects_unknown_sort(client):
+    """Test that an unknown sort order is a client error."""
+    assert client.get("/products?sort=name").status_code == 400
+
+@pytest.mark.parametrize("query", [
+    "category_id=abc", "min_price=cheap", "page=two", "cursor=x",
+    "min_price=inf", "max_price=nan", "max_price=1e400", "min_price=1e300",
+    "page=10000000000000000000000", "page=4611686018427387904", "category_id=10000000000000000000000", "cursor=1:10000000000000000000000",
+])
+def test_list_route_rejects_unparsable_arguments(client, query):
+    """Test that a filter that does not parse is a client error rather than silently ignored."""
+    response = client.get(f"/products?{query}")
+    assert response.status_code == 400
+    assert "message" in response.get_json()
+
+def test_list_route_pages_with_cursors(client):
+    """Test walking the listing by following next_cursor."""
+    names, totals, cursor = [], [], ""
+    while cursor is not None:
+        body = client.get(f"/products?page_size=2{cursor and '&cursor=' + cursor}").get_json()
+        names.extend(item["name"] for item in body["items"])
+        totals.append(body["total"])
+        cursor = body["next_cursor"]
+    assert names == ["Laptop Sleeve", "Office Laptop", "Gaming Laptop"]
+    assert totals == [3, None]  # Pages after a cursor are not counted.
@@ -0,0 +1,31 @@
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+
+
+@pytest.fixture
+def seed_products():
+    """Two products."""
+    return [
+        Product(product_id=None, name="Gaming Laptop", description="Fast", price=Price(amount=1499.00), category_id=1),
+        Product(product_id=None, name="Laptop Sleeve", description="Soft", price=Price(amount=19.99), category_id=2),
+    ]
+
+
+def test_search_route_returns_ranked_page(client):
+    """Test that GET /products/search returns matching products as JSON."""
+    response = client.get("/products/search?q=laptop&max_price=100")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["total"] == 1
+    assert body["page"] == 1
+    assert body["items"][0]["name"] == "Laptop Sleeve"
+    assert body["items"][0]["price"] == 19.99
+
+def test_search_route_rejects_invalid_page_size(client):
+    """Test that an out-of-range page size is a client error."""
+    response = client.get("/products/search?q=laptop&page_size=1000")
+    assert response.status_code == 400
+    assert client.get("/products/search?q=laptop&category_id=abc").status_code == 400
+    assert client.get("/products/search?q=laptop&max_price=1e400").status_code == 400
+    assert client.get("/products/search?q=laptop&page=10000000000000000000000").status_code == 400
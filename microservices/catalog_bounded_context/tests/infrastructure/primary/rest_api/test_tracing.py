@@ -0,0 +1,114 @@
+import json
+import time
+import pytest
+from flask import Flask
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.primary import tracing
+from src.infrastructure.primary.rest_api.middlewares.tracing import RequestTracing
+from src.infrastructure.primary.tracing import Traced, instrument
+
+
+@pytest.fixture
+def seed_products():
+    """One product."""
+    return [Product(product_id=None, name="Gaming Laptop", description="Fast", price=Price(amount=1499.00), category_id=1)]
+
+@pytest.fixture
+def client(client, tmp_path):
+    """The test client with instrumentation on."""
+    config = client.application.config
+    config.update(INSTRUMENTATION=True, PROFILE_DIR=str(tmp_path))
+    yield client
+    for key in ("INSTRUMENTATION", "PROFILE_DIR", "SLOW_REQUEST_SECONDS"):
+        config.pop(key, None)
+
+
+def profiles(directory):
+    return [json.loads(path.read_text()) for path in sorted(directory.iterdir())]
+
+
+def test_instrument_is_a_no_op_outside_traced_requests():
+    """Test that objects are returned unwrapped when no request is traced."""
+    repository = object()
+    assert instrument(repository, "repository") is repository
+
+def test_reports_time_per_layer(client, tmp_path):
+    """Test that a traced request reports use case and repository time in Server-Timing."""
+    response = client.get("/products/1")
+    assert response.status_code == 200
+    layers = dict(entry.split(";dur=") for entry in response.headers["Server-Timing"].split(", "))
+    assert set(layers) == {"usecase", "repository"}
+    assert float(layers["usecase"]) >= float(layers["repository"])
+    assert profiles(tmp_path) == []  # Not slow enough.
+
+def test_saves_profiles_of_slow_requests(client, tmp_path):
+    """Test that a request over the threshold is saved with its spans and call counts."""
+    client.application.config["SLOW_REQUEST_SECONDS"] = 0
+    client.get("/products/1")
+    [profile] = profiles(tmp_path)
+    assert (profile["method"], profile["endpoint"]) == ("GET", "products.get_product_route")
+    assert profile["calls"] == {"GetProductUseCase.get_product": 1, "ProductRepositoryAdapter.get_by_id": 1}
+    spans = {span["name"]: span for span in profile["spans"]}
+    assert spans["GetProductUseCase.get_product"]["depth"] == 0
+    assert spans["ProductRepositoryAdapter.get_by_id"]["depth"] == 1
+
+def test_limits_the_number_of_profiles(client, tmp_path):
+    """Test that no more profiles are written than allowed."""
+    client.application.config["SLOW_REQUEST_SECONDS"] = 0
+    tracing = client.application.extensions["tracing"]
+    tracing.max_profiles, tracing.profiles_written = 2, 0
+    try:
+        for _ in range(4):
+            client.get("/products/1")
+    finally:
+        tracing.max_profiles, tracing.profiles_written = 100, 0
+    assert len(profiles(tmp_path)) == 2
+
+def test_off_by_default(client, tmp_path):
+    """Test that nothing is traced without the INSTRUMENTATION setting."""
+    client.application.config.update(INSTRUMENTATION=False, SLOW_REQUEST_SECONDS=0)
+    response = client.get("/products/1")
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+    assert profiles(tmp_path) == []
+
+def test_samples_the_stack_of_slow_requests(tmp_path):
+    """Test that the stack sampler catches where a slow request spends its time."""
+    app = Flask(__name__)
+    app.config.update(INSTRUMENTATION=True, SLOW_REQUEST_SECONDS=0.05, PROFILE_DIR=str(tmp_path))
+
+    def sleep_in_storage():
+        time.sleep(0.1)
+
+    @app.route("/slow")
+    def slow():
+        sleep_in_storage()
+        return {"ok": True}
+
+    RequestTracing(sample_interval=0.001).init_app(app)
+    app.test_client().get("/slow")
+    [profile] = profiles(tmp_path)
+    assert profile["duration"] >= 0.1
+    assert any("sleep_in_storage" in stack.rsplit(";", 1)[-1] for stack in profile["stacks"])
+
+def test_traced_proxy_times_nested_calls_once_per_layer():
+    """Test that a layer calling itself is not counted twice in the layer time."""
+    class Repository:
+        def outer(self):
+            return self_proxy.inner()
+
+        def inner(self):
+            return 42
+
+    self_proxy = Traced(Repository(), "repository")
+    trace = tracing.RequestTrace()
+    token = tracing._current_trace.set(trace)
+    try:
+        assert self_proxy.outer() == 42
+    finally:
+        tracing._current_trace.reset(token)
+    outer, inner = sorted(trace.spans, key=lambda span: span.depth)
+    assert (outer.depth, inner.depth) == (0, 1)
+    assert trace.layer_seconds["repository"] == pytest.approx(outer.duration)
+    assert trace.calls == {"Repository.inner": 1, "Repository.outer": 1}
@@ -0,0 +1,134 @@
+import pytest
+from unittest.mock import MagicMock
+from src.application.usecases.get_category_usecase import GetCategoryUseCase
+from src.application.usecases.get_product_usecase import GetProductUseCase
+from src.application.usecases.update_product_usecase import UpdateProductUseCase
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.cache.caching_category_repository import CachingCategoryRepository
+from src.infrastructure.secondary.cache.caching_product_repository import CachingProductRepository
+from src.infrastructure.secondary.in_memory.product_table_repository_adapter import ProductTableRepositoryAdapter
+from src.utils.lru_ttl_cache import LruTtlCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_repository(cache=None):
+    inner = MagicMock(wraps=ProductTableRepositoryAdapter())
+    inner.add(Product(product_id=1, name="Laptop", description="Laptop", price=Price(amount=999.99), category_id=1))
+    return inner, CachingProductRepository(inner, cache)
+
+
+# --- LruTtlCache Tests ---
+def test_cache_evicts_least_recently_used():
+    """Test that the oldest entry is evicted once the cache is full."""
+    cache = LruTtlCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.stats().evictions == 1
+
+def test_cache_expires_entries():
+    """Test that entries and remembered misses expire after their TTL."""
+    clock = FakeClock()
+    cache = LruTtlCache(ttl_seconds=10, negative_ttl_seconds=1, clock=clock)
+    cache.put("a", 1)
+    cache.put("missing", None)
+    assert cache.get("missing") == (True, None)
+    clock.now = 2
+    assert cache.get("missing") == (False, None)
+    assert cache.get("a") == (True, 1)
+    clock.now = 11
+    assert cache.get("a") == (False, None)
+    assert cache.stats().expirations == 2
+
+def test_cache_drops_stale_put():
+    """Test that a value loaded before an invalidation is not stored."""
+    cache = LruTtlCache()
+    epoch = cache.epoch()
+    cache.invalidate("a")
+    cache.put("a", "stale", epoch)
+    assert cache.get("a") == (False, None)
+
+def test_cache_keeps_put_of_other_key():
+    """Test that invalidating one key does not drop a concurrent load of another."""
+    cache = LruTtlCache()
+    epoch = cache.epoch()
+    cache.invalidate(1)
+    cache.put(2, "fresh", epoch)
+    assert cache.get(2) == (True, "fresh")
+    cache.clear()
+    cache.put(3, "stale", epoch)
+    assert cache.get(3) == (False, None)
+
+
+# --- CachingProductRepository Tests ---
+def test_get_by_id_is_read_through():
+    """Test that repeated reads hit the wrapped repository once."""
+    inner, repo = make_repository()
+    use_case = GetProductUseCase(repo)
+    assert use_case.get_product(1).name == "Laptop"
+    assert use_case.get_product(1).name == "Laptop"
+    assert inner.get_by_id.call_count == 1
+    stats = repo.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+def test_missing_ids_are_cached():
+    """Test that unknown IDs are remembered."""
+    inner, repo = make_repository()
+    assert repo.get_by_id(42) is None
+    assert repo.get_by_id(42) is None
+    assert inner.get_by_id.call_count == 1
+
+def test_writes_invalidate():
+    """Test that updates, adds and deletes through the wrapper invalidate cached entries."""
+    inner, repo = make_repository()
+    assert repo.get_by_id(2) is None
+    repo.add(Product(product_id=2, name="Mouse", description="Mouse", price=Price(amount=19.99), category_id=1))
+    assert repo.get_by_id(2).name == "Mouse"
+
+    UpdateProductUseCase(repo).update_product(product_id=1, name="Notebook")
+    assert repo.get_by_id(1).name == "Notebook"
+
+    repo.delete(1)
+    assert repo.get_by_id(1) is None
+
+def test_returned_products_are_copies():
+    """Test that mutating a returned product does not change the cached one."""
+    inner, repo = make_repository()
+    repo.get_by_id(1).name = "Changed"
+    assert repo.get_by_id(1).name == "Laptop"
+
+
+# --- CachingCategoryRepository Tests ---
+def test_category_get_by_id_is_read_through():
+    """Test that category reads are cached and invalidated on update."""
+    inner = MagicMock()
+    inner.get_by_id.return_value = Category(category_id=1, name="Electronics", description="Gadgets")
+    repo = CachingCategoryRepository(inner)
+    use_case = GetCategoryUseCase(repo)
+    assert use_case.get_category(1).name == "Electronics"
+    assert use_case.get_category(1).name == "Electronics"
+    assert inner.get_by_id.call_count == 1
+    repo.update(Category(category_id=1, name="Devices", description="Gadgets"))
+    use_case.get_category(1)
+    assert inner.get_by_id.call_count == 2
+
+def test_get_many_only_loads_misses():
+    """Test that get_many serves cached IDs and loads the rest in one call."""
+    inner, repo = make_repository()
+    repo.get_by_id(1)
+    assert sorted(repo.get_many([1, 7])) == [1]
+    inner.get_many.assert_called_once_with([7])
+    assert sorted(repo.get_many([1, 7])) == [1]
+    assert inner.get_many.call_count == 1
@@ -0,0 +1,48 @@
+from src.application.usecases.delete_product_usecase import DeleteProductUseCase
+from src.application.usecases.update_product_usecase import UpdateProductUseCase
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.in_memory.inverted_index_search_adapter import InvertedIndexSearchAdapter
+from src.infrastructure.secondary.in_memory.product_table_repository_adapter import ProductTableRepositoryAdapter
+
+
+def make_search():
+    repository = ProductTableRepositoryAdapter()
+    repository.add_many([
+        Product(product_id=product_id, name=name, description=description, price=Price(amount=amount), category_id=category_id)
+        for product_id, name, description, amount, category_id in (
+            (1, "Gaming Laptop", "Fast laptop with a dedicated GPU", 1499.00, 1),
+            (2, "Laptop Sleeve", "Neoprene sleeve", 19.99, 2),
+            (3, "USB Mouse", "Works with any laptop", 9.99, 2),
+            (4, "Office Chair", "Ergonomic chair", 199.00, 3),
+        )
+    ])
+    search = InvertedIndexSearchAdapter(repository)
+    assert search.rebuild() == 4
+    return repository, search
+
+def names(result):
+    return [product.name for product in result.products]
+
+
+def test_search_with_filters_and_or():
+    """Test ranking, the category and price filters, and alternatives."""
+    _, search = make_search()
+    assert names(search.search("laptop"))[2] == "USB Mouse"
+    assert names(search.search("laptop", category_id=2, max_price=15.00)) == ["USB Mouse"]
+    assert search.search("laptop", min_price=2000.00).total == 0
+    assert set(names(search.search("mouse OR office chai"))) == {"USB Mouse", "Office Chair"}
+    assert search.search("  -- ") == ([], 0)
+
+def test_index_follows_the_product_use_cases():
+    """Test that registered as a listener, the index sees updates, moves and deletes."""
+    repository, search = make_search()
+    UpdateProductUseCase(repository, listeners=[search]).update_product(4, name="Standing Desk", price=Price(amount=250.00))
+    assert names(search.search("desk", min_price=200.00)) == ["Standing Desk"]
+    assert search.search("chair").total == 1  # Still in the description.
+    search.products_reassigned([repository.get_by_id(1)], 5)
+    assert names(search.search("laptop", category_id=5)) == ["Gaming Laptop"]
+    search.category_moved(2, 6, repository.move_category(2, 6))
+    assert set(names(search.search("laptop", category_id=6))) == {"Laptop Sleeve", "USB Mouse"}
+    DeleteProductUseCase(repository, listeners=[search]).delete_product(4)
+    assert search.search("desk").total == 0
@@ -0,0 +1,46 @@
+from src.application.usecases.bulk_create_products_usecase import BulkCreateProductsUseCase
+from src.application.usecases.bulk_update_prices_usecase import BulkUpdatePricesUseCase
+from src.application.usecases.create_product_usecase import CreateProductUseCase
+from src.application.usecases.delete_product_usecase import DeleteProductUseCase
+from src.application.usecases.update_product_usecase import UpdateProductUseCase
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.in_memory.price_index_listing_adapter import PriceIndexListingAdapter
+from src.infrastructure.secondary.in_memory.product_table_repository_adapter import ProductTableRepositoryAdapter
+
+
+def names(page):
+    return [product.name for product in page.products]
+
+
+def test_index_follows_the_product_use_cases():
+    """Test that registered as a listener, the index sees creates, price changes, moves and deletes."""
+    repository = ProductTableRepositoryAdapter()
+    listing = PriceIndexListingAdapter(repository)
+    create = CreateProductUseCase(repository, listeners=[listing])
+    laptop = create.create_product("Laptop", "Fast", Price(amount=999.00), 1)
+    mouse = create.create_product("Mouse", "Wireless", Price(amount=19.99), 1)
+    assert names(listing.list_products(category_id=1)) == ["Mouse", "Laptop"]
+
+    UpdateProductUseCase(repository, listeners=[listing]).update_product(mouse.product_id, price=Price(amount=1999.00))
+    assert names(listing.list_products(category_id=1)) == ["Laptop", "Mouse"]
+    listing.products_reassigned([repository.get_by_id(laptop.product_id)], 2)
+    assert names(listing.list_products(category_id=2)) == ["Laptop"]
+    listing.category_moved(2, 3, [laptop.product_id])
+    assert names(listing.list_products(category_id=3)) == ["Laptop"]
+    DeleteProductUseCase(repository, listeners=[listing]).delete_product(mouse.product_id)
+    assert listing.list_products(category_id=1).total == 0
+    assert listing.rebuild() == 1
+    assert names(listing.list_products(category_id=1)) == ["Laptop"]  # The repository was not reassigned.
+
+def test_index_follows_the_bulk_use_cases():
+    """Test that the index sees products created and repriced in bulk."""
+    repository = ProductTableRepositoryAdapter()
+    listing = PriceIndexListingAdapter(repository)
+    BulkCreateProductsUseCase(repository, listeners=[listing]).create_products([
+        {"name": "Laptop", "description": "Fast", "price": Price(amount=999.00), "category_id": 1},
+        {"name": "Mouse", "description": "Wireless", "price": Price(amount=19.99), "category_id": 1},
+    ])
+    assert names(listing.list_products(category_id=1)) == ["Mouse", "Laptop"]
+    BulkUpdatePricesUseCase(repository, listeners=[listing]).update_prices({2: Price(amount=1999.00), 99: Price(amount=1.00)})
+    assert names(listing.list_products(category_id=1)) == ["Laptop", "Mouse"]
+    assert names(listing.list_products(category_id=1, max_price=1000.00)) == ["Laptop"]
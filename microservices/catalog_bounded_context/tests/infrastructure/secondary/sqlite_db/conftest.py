@@ -0,0 +1,26 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.infrastructure.secondary.sqlite_db.database import init_db
+
+
+@pytest.fixture
+def engine():
+    """An engine on a fresh in-memory SQLite database, shared by all of its sessions."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    init_db(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def session_factory(engine):
+    """Creates sessions on the engine."""
+    return sessionmaker(bind=engine, autoflush=False)
+
+@pytest.fixture
+def db(session_factory):
+    """A session on the engine."""
+    session = session_factory()
+    yield session
+    session.close()
@@ -0,0 +1,112 @@
+import asyncio
+import pytest
+from sqlalchemy.pool import StaticPool
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.product_table import PriceSummary
+from src.domain.models.value_objects.Price import Price
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from src.infrastructure.secondary.sqlite_db.async_database import init_async_db, to_async_url  # noqa: E402
+from src.infrastructure.secondary.sqlite_db.async_category_repository_adapter import AsyncCategoryRepositoryAdapter  # noqa: E402
+from src.infrastructure.secondary.sqlite_db.async_product_repository_adapter import AsyncProductRepositoryAdapter  # noqa: E402
+from src.infrastructure.secondary.sqlite_db.category_statistics_adapter import CategoryStatisticsAdapter  # noqa: E402
+
+
+def run_with_session(scenario):
+    """Runs scenario(session) against a fresh in-memory SQLite database."""
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        await init_async_db(engine)
+        try:
+            async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+                return await scenario(session)
+        finally:
+            await engine.dispose()
+    return asyncio.run(main())
+
+def make_product(product_id=None, name="Laptop", amount=999.99, category_id=1):
+    return Product(product_id=product_id, name=name, description=name, price=Price(amount=amount),
+                   category_id=category_id)
+
+
+def test_to_async_url():
+    """Test converting synchronous SQLite URLs to aiosqlite ones."""
+    assert to_async_url("sqlite:///./catalog.db") == "sqlite+aiosqlite:///./catalog.db"
+    assert to_async_url("sqlite+aiosqlite://") == "sqlite+aiosqlite://"
+
+
+# --- AsyncProductRepositoryAdapter Tests ---
+def test_async_product_round_trip():
+    """Test storing, reading, updating and deleting a product."""
+    async def scenario(session):
+        repo = AsyncProductRepositoryAdapter(session)
+        product = make_product()
+        await repo.add(product)
+        assert product.product_id == 1
+
+        loaded = await repo.get_by_id(1)
+        assert loaded.price == Price(amount=999.99)
+        loaded.change_price(Price(amount=899.00))
+        await repo.update(loaded)
+        assert (await repo.get_by_id(1)).price == Price(amount=899.00)
+
+        await repo.delete(1)
+        assert await repo.get_all() == []
+        with pytest.raises(ValueError, match="Product with ID 1 not found"):
+            await repo.delete(1)
+
+    run_with_session(scenario)
+
+def test_async_product_writes_keep_statistics():
+    """Test that the async repository maintains the category statistics too."""
+    async def scenario(session):
+        def statistics(sync_session):
+            return CategoryStatisticsAdapter(sync_session).get_all()
+
+        repo = AsyncProductRepositoryAdapter(session)
+        product = make_product(amount=10.00)
+        await repo.add(product)
+        await repo.add(make_product(name="Mouse", amount=20.00))
+        assert await session.run_sync(statistics) == {1: PriceSummary(2, 1000, 2000, 3000)}
+        product.category_id = 2
+        await repo.update(product)
+        await repo.delete(2)
+        assert await session.run_sync(statistics) == {2: PriceSummary(1, 1000, 1000, 1000)}
+
+    run_with_session(scenario)
+
+def test_async_product_get_many_and_iter_all():
+    """Test bulk reads and keyset iteration."""
+    async def scenario(session):
+        repo = AsyncProductRepositoryAdapter(session)
+        for i in range(1, 8):
+            await repo.add(make_product(name=f"P{i}", amount=float(i), category_id=i % 2))
+        assert sorted(await repo.get_many([1, 3, 99])) == [1, 3]
+        ids = [product.product_id async for product in repo.iter_all(batch_size=2, category_id=1)]
+        assert ids == [1, 3, 5, 7]
+        ids = [product.product_id async for product in repo.iter_all(batch_size=3, after_id=4, max_price=6.0)]
+        assert ids == [5, 6]
+
+    run_with_session(scenario)
+
+
+# --- AsyncCategoryRepositoryAdapter Tests ---
+def test_async_category_round_trip():
+    """Test storing, reading, updating and deleting a category."""
+    async def scenario(session):
+        repo = AsyncCategoryRepositoryAdapter(session)
+        await repo.add(Category(category_id=None, name="Electronics", description="Gadgets"))
+        await repo.add(Category(category_id=None, name="Books", description="Paper"))
+        category = await repo.get_by_id(1)
+        category.change_name("Devices")
+        await repo.update(category)
+        assert [c.name async for c in repo.iter_all(batch_size=1)] == ["Devices", "Books"]
+        await repo.delete(2)
+        assert list(await repo.get_many([1, 2])) == [1]
+        with pytest.raises(ValueError, match="Category with ID 2 not found"):
+            await repo.delete(2)
+
+    run_with_session(scenario)
@@ -0,0 +1,113 @@
+import pytest
+from src.domain.models.entities.Product import Product
+from src.domain.models.product_table import PriceSummary
+from src.domain.models.value_objects.Price import Price
+from src.application.usecases.batch_products_usecase import BATCH_CREATED, BATCH_INVALID, BATCH_UPDATED, BatchProductsUseCase
+from src.application.usecases.create_product_usecase import CreateProductUseCase
+from src.application.usecases.delete_product_usecase import DeleteProductUseCase
+from src.application.usecases.update_product_usecase import UpdateProductUseCase
+from src.infrastructure.secondary.sqlite_db.category_statistics_adapter import CategoryStatisticsAdapter
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.unit_of_work import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def use_cases(db):
+    repository = ProductRepositoryAdapter(db)
+    return (
+        CategoryStatisticsAdapter(db),
+        CreateProductUseCase(repository),
+        UpdateProductUseCase(repository),
+        DeleteProductUseCase(repository),
+    )
+
+def create(create_use_case, amount, category_id=1):
+    return create_use_case.create_product(name="P", description="D", price=Price(amount=amount), category_id=category_id)
+
+
+def test_statistics_follow_create_update_delete(use_cases):
+    """Test that count, min, max and total follow the writes of the use cases."""
+    statistics, create_use_case, update_use_case, delete_use_case = use_cases
+    cheap = create(create_use_case, 5.00)
+    middle = create(create_use_case, 10.00)
+    expensive = create(create_use_case, 20.00)
+    assert statistics.get(1) == PriceSummary(3, 500, 2000, 3500)
+    assert statistics.get(1).average == pytest.approx(35.00 / 3)
+
+    delete_use_case.delete_product(cheap.product_id)  # Removes the minimum.
+    assert statistics.get(1) == PriceSummary(2, 1000, 2000, 3000)
+
+    update_use_case.update_product(expensive.product_id, category_id=2)  # Moves the maximum.
+    assert statistics.get(1) == PriceSummary(1, 1000, 1000, 1000)
+    assert statistics.get(2) == PriceSummary(1, 2000, 2000, 2000)
+
+    update_use_case.update_product(middle.product_id, price=Price(amount=12.50))
+    assert statistics.get(1) == PriceSummary(1, 1250, 1250, 1250)
+
+    delete_use_case.delete_product(middle.product_id)
+    assert statistics.get(1) == PriceSummary(0, None, None, 0)
+    assert statistics.get_all() == {2: PriceSummary(1, 2000, 2000, 2000)}
+    assert statistics.find_inconsistencies() == {}
+
+def test_find_inconsistencies_and_rebuild(db, use_cases):
+    """Test that changes made around the statistics are detected and repaired."""
+    statistics, create_use_case, _, _ = use_cases
+    create(create_use_case, 5.00)
+    # Written without statistics, so they miss it.
+    ProductRepositoryAdapter(db, maintain_statistics=False).add(
+        Product(product_id=None, name="P", description="D", price=Price(amount=7.00), category_id=3)
+    )
+    assert statistics.find_inconsistencies() == {
+        3: (PriceSummary(0, None, None, 0), PriceSummary(1, 700, 700, 700)),
+    }
+    assert statistics.rebuild() == 2
+    assert statistics.find_inconsistencies() == {}
+    assert statistics.get(3) == PriceSummary(1, 700, 700, 700)
+
+def test_bulk_writes_keep_statistics(db):
+    """Test that the bulk write paths of the repository maintain the statistics too."""
+    repository = ProductRepositoryAdapter(db)
+    statistics = CategoryStatisticsAdapter(db)
+    products = [
+        Product(product_id=None, name="P", description="D", price=Price(amount=float(amount)), category_id=category_id)
+        for amount, category_id in ((1, 1), (2, 1), (3, 2), (4, 2))
+    ]
+    repository.add_many(products)
+    assert statistics.get_all() == {1: PriceSummary(2, 100, 200, 300), 2: PriceSummary(2, 300, 400, 700)}
+
+    products[0].change_price(Price(amount=5.00))
+    products[2].category_id = 1
+    assert repository.update_many([products[0], products[2]]) == []
+    assert statistics.get_all() == {1: PriceSummary(3, 200, 500, 1000), 2: PriceSummary(1, 400, 400, 400)}
+
+    assert repository.reassign_category([products[1].product_id, products[3].product_id], 3) == []
+    assert statistics.get_all() == {1: PriceSummary(2, 300, 500, 800), 3: PriceSummary(2, 200, 400, 600)}
+
+    assert repository.delete_many([products[0].product_id, products[3].product_id, 99]) == [99]
+    assert statistics.get_all() == {1: PriceSummary(1, 300, 300, 300), 3: PriceSummary(1, 200, 200, 200)}
+    assert statistics.find_inconsistencies() == {}
+
+def test_batch_changes_keep_statistics_and_return_new_versions(db, session_factory):
+    """Test that a product batch updates the statistics, reports the versions it stored and rejects repeated IDs."""
+    repository = ProductRepositoryAdapter(db)
+    repository.add(Product(product_id=None, name="P", description="D", price=Price(amount=1.00), category_id=1))
+    results = BatchProductsUseCase(SqlAlchemyUnitOfWork(session_factory)).apply_changes([
+        {"product_id": 1, "price": Price(amount=2.00)},
+        {"name": "Q", "description": "D", "price": Price(amount=3.00), "category_id": 2},
+        {"product_id": 1, "category_id": 2},
+    ])
+    assert [(result.outcome, result.product and result.product.version) for result in results] == [
+        (BATCH_UPDATED, 2), (BATCH_CREATED, 1), (BATCH_INVALID, None)]
+    assert repository.get_version(1) == 2
+    statistics = CategoryStatisticsAdapter(db)
+    assert statistics.get_all() == {1: PriceSummary(1, 200, 200, 200), 2: PriceSummary(1, 300, 300, 300)}
+    assert statistics.find_inconsistencies() == {}
+
+def test_statistics_roll_back_with_the_products(db):
+    """Test that the statistics are written in the same transaction as the products."""
+    repository = ProductRepositoryAdapter(db, autocommit=False)
+    repository.add(Product(product_id=None, name="P", description="D", price=Price(amount=7.00), category_id=1))
+    assert CategoryStatisticsAdapter(db).get(1).count == 1
+    db.rollback()
+    assert CategoryStatisticsAdapter(db).get_all() == {}
+    assert repository.get_all() == []
@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool, QueuePool, SingletonThreadPool
+from src.config.config import Config
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, engine_options, init_db
+
+
+class Settings(Config):
+    SQLITE_CACHE_SIZE = -2048
+    SQLITE_BUSY_TIMEOUT_MS = 1234
+    DB_POOL_SIZE = 3
+    SQLITE_CACHED_STATEMENTS = 64
+    SQL_COMPILED_CACHE_SIZE = 50
+
+
+def test_pragmas_applied_on_connect(tmp_path):
+    """Test that every new connection gets the configured pragmas."""
+    engine = create_catalog_engine(f"sqlite:///{tmp_path / 'catalog.db'}", Settings)
+    init_db(engine)
+    with engine.connect() as connection:
+        pragma = lambda name: connection.execute(text(f"PRAGMA {name}")).scalar()
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == 1234
+        assert pragma("cache_size") == -2048
+        assert pragma("temp_store") == 2  # MEMORY
+        assert pragma("mmap_size") == Settings.SQLITE_MMAP_SIZE
+    engine.dispose()
+
+def test_engine_options_for_file_database():
+    """Test the pool and statement cache settings for a file database."""
+    options = engine_options("sqlite:///./catalog.db", Settings)
+    assert options["poolclass"] is QueuePool
+    assert options["pool_size"] == 3
+    assert options["query_cache_size"] == 50
+    assert options["connect_args"] == {"check_same_thread": False, "cached_statements": 64}
+
+@pytest.mark.parametrize("pool, pool_class", [("thread", SingletonThreadPool), ("null", NullPool)])
+def test_engine_options_pool_choice(pool, pool_class):
+    """Test selecting the pool class through DB_POOL."""
+    settings = type("PoolSettings", (Settings,), {"DB_POOL": pool})
+    assert engine_options("sqlite:///./catalog.db", settings)["poolclass"] is pool_class
+
+def test_engine_options_in_memory_keeps_default_pool():
+    """Test that in-memory databases keep SQLAlchemy's own pool choice."""
+    assert "poolclass" not in engine_options("sqlite://", Settings)
+
+def test_engine_options_unknown_pool():
+    """Test that an unknown DB_POOL is rejected."""
+    settings = type("BadSettings", (Settings,), {"DB_POOL": "fancy"})
+    with pytest.raises(ValueError, match="Unknown DB_POOL 'fancy'"):
+        engine_options("sqlite:///./catalog.db", settings)
+
+def test_init_db_adds_new_columns_and_indexes_to_existing_tables(tmp_path):
+    """Test that init_db upgrades a database created before the version column and price indexes."""
+    engine = create_catalog_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE products (product_id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+            "description TEXT NOT NULL, price_minor_units INTEGER NOT NULL, currency VARCHAR(3) NOT NULL, "
+            "category_id INTEGER NOT NULL, image_urls TEXT)"
+        )
+        connection.exec_driver_sql("INSERT INTO products VALUES (1, 'Laptop', '', 99900, 'USD', 1, NULL)")
+    init_db(engine)
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT version FROM products").scalar_one() == 1
+        indexes = {row[1] for row in connection.exec_driver_sql("PRAGMA index_list(products)")}
+    assert {"ix_products_category_id_price", "ix_products_price"} <= indexes
+    engine.dispose()
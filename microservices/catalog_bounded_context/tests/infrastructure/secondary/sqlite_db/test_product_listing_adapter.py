@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import select, tuple_
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.in_memory.price_index_listing_adapter import PriceIndexListingAdapter
+from src.infrastructure.secondary.in_memory.product_table_repository_adapter import ProductTableRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.models import ProductModel
+from src.infrastructure.secondary.sqlite_db.product_listing_adapter import ProductListingAdapter
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+PRODUCTS = [
+    Product(product_id=product_id, name=name, description="", price=Price(amount=amount), category_id=category_id)
+    for product_id, name, amount, category_id in (
+        (1, "Gaming Laptop", 1499.00, 1),
+        (2, "Office Laptop", 699.00, 1),
+        (3, "Budget Laptop", 699.00, 1),
+        (4, "Laptop Sleeve", 19.99, 2),
+        (5, "USB Mouse", 9.99, 2),
+    )
+]
+
+
+@pytest.fixture
+def db(db):
+    """The shared session, with PRODUCTS stored."""
+    ProductRepositoryAdapter(db).add_many([product.copy() for product in PRODUCTS])
+    return db
+
+@pytest.fixture(params=["sqlite", "in_memory"])
+def listing(request, db):
+    """Both listing adapters, over the same products."""
+    if request.param == "sqlite":
+        return ProductListingAdapter(db)
+    adapter = PriceIndexListingAdapter(ProductTableRepositoryAdapter())
+    adapter.repository.add_many([product.copy() for product in PRODUCTS])
+    adapter.rebuild()
+    return adapter
+
+def ids(page):
+    return [product.product_id for product in page.products]
+
+
+def test_list_by_category_and_price_range(listing):
+    """Test filtering by category and price range, cheapest first with ties by ID."""
+    assert ids(listing.list_products(category_id=1)) == [2, 3, 1]
+    assert ids(listing.list_products(category_id=1, max_price=699.00)) == [2, 3]
+    assert ids(listing.list_products(min_price=10.00, max_price=700.00)) == [4, 2, 3]
+    assert listing.list_products(category_id=3).total == 0
+
+def test_list_descending_pages(listing):
+    """Test that descending pages are slices of the reversed order with the full total."""
+    first = listing.list_products(descending=True, limit=2)
+    second = listing.list_products(descending=True, limit=2, offset=2)
+    assert (ids(first), first.total) == ([1, 3], 5)
+    assert (ids(second), second.total) == ([2, 4], 5)
+
+def test_keyset_pages_follow_the_last_position(listing):
+    """Test that pages after a (price, ID) position continue the order, ties included, with the full total."""
+    first = listing.list_products(category_id=1, limit=1)
+    second = listing.list_products(category_id=1, limit=1, after=(69900, 2))
+    assert (ids(first), ids(second), second.total) == ([2], [3], 3)
+    assert ids(listing.list_products(category_id=1, after=(69900, 3))) == [1]
+    assert ids(listing.list_products(descending=True, limit=2, after=(69900, 3))) == [2, 4]
+    assert ids(listing.list_products(after=(149900, 1))) == []
+
+def test_total_is_only_counted_on_request(listing):
+    """Test that a page without count_total has the same products and no total."""
+    page = listing.list_products(category_id=1, limit=1, after=(69900, 2), count_total=False)
+    assert (ids(page), page.total) == ([3], None)
+
+def test_keyset_query_seeks_in_the_composite_index(db):
+    """Test that a keyset page is read from the index after its start position."""
+    statement = (
+        select(ProductModel.product_id)
+        .where(ProductModel.category_id == 1,
+               tuple_(ProductModel.price_minor_units, ProductModel.product_id) > tuple_(69900, 2))
+        .order_by(ProductModel.price_minor_units, ProductModel.product_id)
+        .limit(20)
+        .compile(compile_kwargs={"literal_binds": True})
+    )
+    plan = " ".join(row[-1] for row in db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}"))
+    assert "ix_products_category_id_price" in plan
+    assert "TEMP B-TREE" not in plan
+
+def test_listing_query_reads_the_composite_index(db):
+    """Test that SQLite answers a filtered, ordered page from the index without sorting."""
+    statement = (
+        select(ProductModel.product_id)
+        .where(ProductModel.category_id == 1, ProductModel.price_minor_units.between(100, 100_000))
+        .order_by(ProductModel.price_minor_units, ProductModel.product_id)
+        .limit(20)
+        .compile(compile_kwargs={"literal_binds": True})
+    )
+    plan = " ".join(row[-1] for row in db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}"))
+    assert "ix_products_category_id_price" in plan
+    assert "TEMP B-TREE" not in plan
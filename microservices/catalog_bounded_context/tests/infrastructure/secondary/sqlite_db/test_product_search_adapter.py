@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import text
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.sqlite_db.database import init_db
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.product_search_adapter import ProductSearchAdapter, to_match_expression
+
+
+@pytest.fixture
+def db(db):
+    """The shared session, with a few searchable products."""
+    ProductRepositoryAdapter(db).add_many([
+        Product(product_id=None, name=name, description=description, price=Price(amount=amount), category_id=category_id)
+        for name, description, amount, category_id in (
+            ("Gaming Laptop", "Fast laptop with a dedicated GPU", 1499.00, 1),
+            ("Laptop Sleeve", "Neoprene sleeve", 19.99, 2),
+            ("USB Mouse", "Works with any laptop", 9.99, 2),
+            ("Office Chair", "Ergonomic chair", 199.00, 3),
+        )
+    ])
+    return db
+
+def names(result):
+    return [product.name for product in result.products]
+
+
+def test_to_match_expression():
+    """Test that free text becomes a quoted, prefix-matching FTS5 query."""
+    assert to_match_expression("Gaming lap") == '"gaming" "lap"*'
+    assert to_match_expression('laptop" or name:*') == '"laptop" "or" "name"*'
+    assert to_match_expression('laptop" OR name:*') == '("laptop") OR ("name"*)'
+    assert to_match_expression("OR gaming laptop OR OR") == '"gaming" "laptop"*'
+    assert to_match_expression("  -- ") is None
+
+def test_search_ranks_name_matches_first(db):
+    """Test that products with the term in their name rank above description hits."""
+    result = ProductSearchAdapter(db).search("laptop")
+    assert result.total == 3
+    assert set(names(result)[:2]) == {"Gaming Laptop", "Laptop Sleeve"}
+    assert names(result)[2] == "USB Mouse"
+
+def test_search_prefix_stemming_and_filters(db):
+    """Test prefix matching, stemming and the category and price filters."""
+    search = ProductSearchAdapter(db)
+    assert names(search.search("ergo")) == ["Office Chair"]
+    assert names(search.search("chairs")) == ["Office Chair"]
+    assert names(search.search("laptop", category_id=2, max_price=15.00)) == ["USB Mouse"]
+    assert search.search("laptop", min_price=2000.00).total == 0
+    assert set(names(search.search("mouse OR office chai"))) == {"USB Mouse", "Office Chair"}
+
+def test_search_pagination(db):
+    """Test that pages are slices of the ranked result with the full total."""
+    search = ProductSearchAdapter(db)
+    first, second = search.search("laptop", limit=2), search.search("laptop", limit=2, offset=2)
+    assert (len(first.products), first.total) == (2, 3)
+    assert (len(second.products), second.total) == (1, 3)
+    assert names(second) == ["USB Mouse"]
+
+def test_index_follows_updates_and_deletes(db):
+    """Test that the triggers keep the index in step with the products table."""
+    repository, search = ProductRepositoryAdapter(db), ProductSearchAdapter(db)
+    chair = search.search("chair").products[0]
+    chair.name = "Standing Desk"
+    repository.update(chair)
+    assert search.search("chair").total == 1  # Still in the description.
+    assert names(search.search("desk")) == ["Standing Desk"]
+    repository.delete(chair.product_id)
+    assert search.search("desk").total == 0
+    repository.reassign_category([1], 5)  # Category changes do not touch the index.
+    assert names(search.search("gaming")) == ["Gaming Laptop"]
+
+def test_index_built_for_existing_products(db):
+    """Test that creating the index on an existing database indexes its products."""
+    db.execute(text("DROP TABLE products_fts"))
+    db.commit()
+    init_db(db.get_bind())
+    assert ProductSearchAdapter(db).search("laptop").total == 3
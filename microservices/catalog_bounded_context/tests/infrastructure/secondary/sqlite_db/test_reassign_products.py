@@ -0,0 +1,107 @@
+import pytest
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.product_table import PriceSummary
+from src.domain.models.value_objects.Price import Price
+from src.application.usecases.reassign_products_usecase import ReassignProductsUseCase
+from src.infrastructure.secondary.sqlite_db.category_statistics_adapter import CategoryStatisticsAdapter
+from src.infrastructure.secondary.sqlite_db import product_repository_adapter
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, init_db
+from src.infrastructure.secondary.sqlite_db.unit_of_work import SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """An engine on a SQLite file, so that each unit of work has its own connection."""
+    engine = create_catalog_engine(f"sqlite:///{tmp_path / 'catalog.db'}")
+    init_db(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture(autouse=True)
+def products(session_factory):
+    """Three categories and five products."""
+    with SqlAlchemyUnitOfWork(session_factory) as unit_of_work:
+        for name in ("Electronics", "Computers", "Phones"):
+            unit_of_work.categories.add(Category(category_id=None, name=name, description=name))
+        unit_of_work.products.add_many([
+            Product(product_id=None, name=f"P{i}", description="D", price=Price(amount=float(i)), category_id=category_id)
+            for i, category_id in ((1, 0), (2, 0), (3, 1), (4, 2), (5, 2))
+        ])
+        unit_of_work.commit()
+
+def categories_of(session_factory):
+    with SqlAlchemyUnitOfWork(session_factory) as unit_of_work:
+        return {product.product_id: product.category_id for product in unit_of_work.products.get_all()}
+
+
+def test_assign_products_to_category_reports_per_id(session_factory):
+    """Test that eligible products are moved and the others are reported."""
+    with session_factory() as db:
+        statistics = CategoryStatisticsAdapter(db)
+        use_case = ReassignProductsUseCase(SqlAlchemyUnitOfWork(session_factory))
+        report = use_case.assign_products_to_category([1, 2, 3, 99], category_id=3)
+        assert report.succeeded == [1, 2]
+        assert report.errors == {
+            3: "Product with ID 3 already belongs to a category.",
+            99: "Product with ID 99 does not exist.",
+        }
+        assert statistics.get(3) == PriceSummary(2, 100, 200, 300)
+        assert statistics.find_inconsistencies() == {}
+    assert categories_of(session_factory) == {1: 3, 2: 3, 3: 1, 4: 2, 5: 2}
+
+def test_assign_products_to_missing_category(session_factory):
+    """Test that nothing is moved when the category does not exist."""
+    use_case = ReassignProductsUseCase(SqlAlchemyUnitOfWork(session_factory))
+    with pytest.raises(ValueError, match="Category with ID 9 does not exist"):
+        use_case.assign_products_to_category([1, 2], category_id=9)
+    assert categories_of(session_factory)[1] == 0
+
+def test_move_all_merges_categories(session_factory):
+    """Test moving every product of a category, including its statistics."""
+    with session_factory() as db:
+        statistics = CategoryStatisticsAdapter(db)
+        use_case = ReassignProductsUseCase(SqlAlchemyUnitOfWork(session_factory))
+        report = use_case.move_all(from_category_id=2, to_category_id=1)
+        assert report.ok
+        assert report.succeeded == [4, 5]
+        assert statistics.get(1) == PriceSummary(3, 300, 500, 1200)
+        assert statistics.get(2) == PriceSummary(0, None, None, 0)
+        assert statistics.find_inconsistencies() == {}
+        with pytest.raises(ValueError, match="different category"):
+            use_case.move_all(from_category_id=1, to_category_id=1)
+    assert categories_of(session_factory) == {1: 0, 2: 0, 3: 1, 4: 1, 5: 1}
+
+def test_move_all_updates_in_chunks(session_factory, monkeypatch):
+    """Test that move_all moves a category in several set-based chunks without loading the products."""
+    monkeypatch.setattr(product_repository_adapter, "_CHUNK_SIZE", 1)
+    monkeypatch.setattr(product_repository_adapter.ProductRepositoryAdapter, "iter_all", None)
+    report = ReassignProductsUseCase(SqlAlchemyUnitOfWork(session_factory)).move_all(from_category_id=0, to_category_id=2)
+    assert report.succeeded == [1, 2]
+    with SqlAlchemyUnitOfWork(session_factory) as unit_of_work:
+        assert [product.version for product in unit_of_work.products.get_all()] == [2, 2, 1, 1, 1]
+    assert categories_of(session_factory) == {1: 2, 2: 2, 3: 1, 4: 2, 5: 2}
+    with session_factory() as db:
+        assert CategoryStatisticsAdapter(db).get(2) == PriceSummary(4, 100, 500, 1200)
+        assert CategoryStatisticsAdapter(db).find_inconsistencies() == {}
+
+def test_move_category_into_itself_moves_nothing(session_factory, monkeypatch):
+    """Test that the adapter returns at once when both categories are the same."""
+    monkeypatch.setattr(product_repository_adapter, "_CHUNK_SIZE", 1)
+    with session_factory() as db:
+        assert product_repository_adapter.ProductRepositoryAdapter(db).move_category(2, 2) == []
+    with SqlAlchemyUnitOfWork(session_factory) as unit_of_work:
+        assert [product.version for product in unit_of_work.products.get_all()] == [1, 1, 1, 1, 1]
+
+def test_update_many_writes_repeated_products_once(session_factory):
+    """Test that a product given twice is updated once, with its last state and one statistics change."""
+    with session_factory() as db:
+        repository = product_repository_adapter.ProductRepositoryAdapter(db)
+        first, last = repository.get_by_id(4), repository.get_by_id(4)
+        first.price, last.price = Price(amount=40.00), Price(amount=6.00)
+        assert repository.update_many([first, last, repository.get_by_id(5)]) == []
+        assert (first.version, last.version) == (2, 2)
+        assert repository.get_by_id(4).price == Price(amount=6.00)
+        statistics = CategoryStatisticsAdapter(db)
+        assert statistics.get(2) == PriceSummary(2, 500, 600, 1100)
+        assert statistics.find_inconsistencies() == {}
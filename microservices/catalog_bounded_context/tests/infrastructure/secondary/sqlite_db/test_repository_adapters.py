@@ -0,0 +1,119 @@
+import pytest
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.sqlite_db.category_repository_adapter import CategoryRepositoryAdapter
+from src.infrastructure.secondary.sqlite_db.product_repository_adapter import ProductRepositoryAdapter
+
+
+def make_product(product_id=1, name="Laptop", amount=999.99, category_id=1, image_urls=None):
+    return Product(product_id=product_id, name=name, description=name, price=Price(amount=amount),
+                   category_id=category_id, image_urls=image_urls)
+
+
+# --- ProductRepositoryAdapter Tests ---
+def test_product_round_trip(db):
+    """Test that a stored product is loaded back unchanged."""
+    repo = ProductRepositoryAdapter(db)
+    repo.add(make_product(image_urls=["http://example.com/laptop.jpg"]))
+    loaded = repo.get_by_id(1)
+    assert loaded.name == "Laptop"
+    assert loaded.price == Price(amount=999.99)
+    assert loaded.image_urls == ["http://example.com/laptop.jpg"]
+    assert repo.get_by_id(2) is None
+
+def test_product_update_and_delete(db):
+    """Test updating and deleting a stored product."""
+    repo = ProductRepositoryAdapter(db)
+    repo.add(make_product())
+    product = repo.get_by_id(1)
+    product.change_price(Price(amount=899.00))
+    repo.update(product)
+    assert repo.get_by_id(1).price == Price(amount=899.00)
+    repo.delete(1)
+    assert repo.get_all() == []
+    with pytest.raises(ValueError, match="Product with ID 1 not found"):
+        repo.delete(1)
+
+
+# --- CategoryRepositoryAdapter Tests ---
+def test_category_round_trip(db):
+    """Test storing, updating and deleting a category."""
+    repo = CategoryRepositoryAdapter(db)
+    repo.add(Category(category_id=1, name="Electronics", description="Gadgets"))
+    category = repo.get_by_id(1)
+    category.change_name("Devices")
+    repo.update(category)
+    assert [c.name for c in repo.get_all()] == ["Devices"]
+    repo.delete(1)
+    assert repo.get_by_id(1) is None
+
+
+# --- Bulk operation Tests ---
+def test_product_bulk_operations(db):
+    """Test adding, loading, updating and deleting products in bulk."""
+    repo = ProductRepositoryAdapter(db)
+    products = [make_product(product_id=None, name=f"Product {i}", amount=i) for i in range(1, 1201)]
+    repo.add_many(products)
+    assert [p.product_id for p in products[:3]] == [1, 2, 3]
+
+    loaded = repo.get_many([1, 600, 1200, 5000])
+    assert sorted(loaded) == [1, 600, 1200]
+    assert loaded[600].name == "Product 600"
+
+    loaded[600].change_price(Price(amount=1.00))
+    ghost = make_product(product_id=5000)
+    assert repo.update_many([loaded[600], ghost]) == [5000]
+    assert repo.get_by_id(600).price == Price(amount=1.00)
+
+    assert repo.delete_many(list(range(1, 1001)) + [5000]) == [5000]
+    assert len(repo.get_all()) == 200
+
+def test_category_bulk_operations(db):
+    """Test adding, loading, updating and deleting categories in bulk."""
+    repo = CategoryRepositoryAdapter(db)
+    categories = [Category(category_id=None, name=f"Category {i}", description="") for i in range(1, 4)]
+    repo.add_many(categories)
+    assert [c.category_id for c in categories] == [1, 2, 3]
+    categories[0].change_name("Renamed")
+    assert repo.update_many(categories[:1]) == []
+    assert repo.get_many([1, 2])[1].name == "Renamed"
+    assert repo.delete_many([2, 9]) == [9]
+    assert sorted(repo.get_many([1, 2, 3])) == [1, 3]
+
+
+# --- Keyset iteration Tests ---
+def test_product_iter_all_pages_with_filters(db):
+    """Test that iter_all walks every page in ID order and applies filters."""
+    repo = ProductRepositoryAdapter(db)
+    repo.add_many([make_product(product_id=None, name=f"Product {i}", amount=i, category_id=i % 2) for i in range(1, 11)])
+    assert [p.product_id for p in repo.iter_all(batch_size=3)] == list(range(1, 11))
+    assert [p.product_id for p in repo.iter_all(batch_size=3, after_id=7)] == [8, 9, 10]
+    assert [p.product_id for p in repo.iter_all(batch_size=2, category_id=1, min_price=3, max_price=8)] == [3, 5, 7]
+
+def test_category_iter_all(db):
+    """Test that category iteration pages through every category."""
+    repo = CategoryRepositoryAdapter(db)
+    repo.add_many([Category(category_id=None, name=f"Category {i}", description="") for i in range(5)])
+    assert [c.category_id for c in repo.iter_all(batch_size=2)] == [1, 2, 3, 4, 5]
+
+def test_versions_increment_on_every_write(db):
+    """Test that adds start at version 1 and every kind of update increments the stored version."""
+    products, categories = ProductRepositoryAdapter(db), CategoryRepositoryAdapter(db)
+    product, category = make_product(), Category(category_id=None, name="Computers", description="")
+    products.add(product)
+    categories.add(category)
+    assert (product.version, category.version) == (1, 1)
+    product.name = "Gaming Laptop"
+    products.update(product)
+    assert product.version == products.get_version(1) == products.get_by_id(1).version == 2
+    products.update_many([product])
+    assert product.version == products.get_version(1) == 3
+    products.reassign_category([1], 2)
+    assert products.get_version(1) == 4
+    category.name = "Laptops"
+    categories.update(category)
+    assert category.version == categories.get_version(category.category_id) == 2
+    categories.update_many([category])
+    assert category.version == categories.get_version(category.category_id) == 3
+    assert products.get_version(99) is None and categories.get_version(99) is None
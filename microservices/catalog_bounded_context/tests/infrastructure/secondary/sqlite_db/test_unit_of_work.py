@@ -0,0 +1,91 @@
+import threading
+import pytest
+from sqlalchemy import event
+from src.domain.models.entities.Category import Category
+from src.domain.models.entities.Product import Product
+from src.domain.models.value_objects.Price import Price
+from src.infrastructure.secondary.sqlite_db.database import create_catalog_engine, init_db
+from src.infrastructure.secondary.sqlite_db.unit_of_work import GroupCommitUnitOfWork, SqlAlchemyUnitOfWork
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """An engine on a fresh SQLite file, counting the commits it performs."""
+    engine = create_catalog_engine(f"sqlite:///{tmp_path / 'catalog.db'}")
+    init_db(engine)
+    engine.commits = 0
+
+    @event.listens_for(engine, "commit")
+    def count_commit(connection):
+        engine.commits += 1
+
+    yield engine
+    engine.dispose()
+
+def make_product(name="Laptop", category_id=0):
+    return Product(product_id=None, name=name, description=name, price=Price(amount=10.0), category_id=category_id)
+
+
+# --- SqlAlchemyUnitOfWork Tests ---
+def test_unit_of_work_commits_both_repositories_once(engine, session_factory):
+    """Test that changes to products and categories are committed together."""
+    engine.commits = 0
+    with SqlAlchemyUnitOfWork(session_factory) as unit_of_work:
+        unit_of_work.categories.add(Category(category_id=None, name="Electronics", description="Gadgets"))
+        unit_of_work.products.add(make_product(category_id=1))
+        unit_of_work.commit()
+    assert engine.commits == 1
+    with SqlAlchemyUnitOfWork(session_factory) as unit_of_work:
+        assert unit_of_work.products.get_by_id(1).category_id == 1
+        assert unit_of_work.categories.get_by_id(1).name == "Electronics"
+
+def test_unit_of_work_rolls_back_without_commit(session_factory):
+    """Test that leaving the block on an error discards every change."""
+    with pytest.raises(ValueError):
+        with SqlAlchemyUnitOfWork(session_factory) as unit_of_work:
+            unit_of_work.categories.add(Category(category_id=None, name="Electronics", description="Gadgets"))
+            unit_of_work.products.delete(42)  # Raises: the product does not exist.
+    with SqlAlchemyUnitOfWork(session_factory) as unit_of_work:
+        assert unit_of_work.categories.get_all() == []
+
+
+# --- GroupCommitUnitOfWork Tests ---
+def test_group_commit_merges_concurrent_work(engine, session_factory):
+    """Test that concurrent callers share a commit and a failing caller is isolated."""
+    unit_of_work = GroupCommitUnitOfWork(session_factory, window_seconds=0.2)
+    start = threading.Barrier(8)
+    results = {}
+
+    def add_product(index):
+        def work(uow):
+            uow.products.add(make_product(name=f"P{index}"))
+            if index == 3:
+                raise ValueError("rejected")
+            return index
+        start.wait()
+        try:
+            results[index] = unit_of_work.run(work)
+        except ValueError as error:
+            results[index] = str(error)
+
+    engine.commits = 0
+    threads = [threading.Thread(target=add_product, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    unit_of_work.close()
+
+    assert results == {i: ("rejected" if i == 3 else i) for i in range(8)}
+    assert engine.commits == 1
+    with SqlAlchemyUnitOfWork(session_factory) as reader:
+        names = sorted(product.name for product in reader.products.get_all())
+    assert names == [f"P{i}" for i in range(8) if i != 3]
+
+def test_group_commit_rejects_work_after_close(session_factory):
+    """Test that a closed group commit refuses new work."""
+    unit_of_work = GroupCommitUnitOfWork(session_factory)
+    assert unit_of_work.run(lambda uow: uow.categories.get_all()) == []
+    unit_of_work.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        unit_of_work.run(lambda uow: None)